@@ -8,19 +8,64 @@ quality, and inform harmonization strategy.
 
 import click
 from pathlib import Path
+import csv
+import json
 import sys
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from core.tabular import analyze_tabular_file
 from core.file_discovery import discover_files
+from core.inventory import scan_inventory
 from core.semistructured import analyze_semistructured_file
+from core.corpus import expand_corpus_pattern, analyze_corpus
+from core.xml_split import analyze_xml_records
+from core.shredder import shred_file, SHRED_INPUT_ERRORS
+from core.record_index import build_record_index, lookup_record_bytes, RecordIndex
+from core.path_trie import PathTrie
+from core.field_profile import FieldTable
+from core.cross_source import suggest_field_mappings, calculate_identifier_row_coverage
+from core.sketches import collect_column_sketches, rank_value_overlaps
+from core.entity_sets import (
+    EntityInterner,
+    extract_source_entity_sets,
+    save_entity_sets,
+    load_entity_sets,
+)
+from core.overlap import analyze_entity_overlap
+from core.hgnc import load_hgnc_resolver
+from core.mondo import load_mondo_matcher, DEFAULT_MIN_SCORE
+from core.hgvs import parse_hgvs, hgvs_keys
+from core.entity_index import EntityIndex
+from core.variant_join import join_variant_files, VARIANT_PRESETS, DEFAULT_CHUNK_SIZE
 from reports.summary import generate_summary_report
 from reports.json_report import generate_json_report
-from reports.markdown_report import generate_markdown_report
-from reports.tsv_reports import generate_all_tsv_reports, generate_individual_field_tsv
-from visualizations.plots import generate_all_plots
+from reports.binary_profile import (
+    BinaryProfileReader,
+    write_binary_profile,
+    read_binary_profile,
+    BINARY_PROFILE_SUFFIX,
+)
+from reports.markdown_report import generate_markdown_report, FIELDS_PER_PAGE
+from reports.html_report import generate_html_report
+from reports.profile_catalog import ProfileCatalog
+from reports.profile_store import ProfileStore, STORE_FILENAME
+from reports.data_dictionary import generate_data_dictionary
+from reports.profile_diff import diff_profiles, summarize_diff, write_profile_diff, DEFAULT_THRESHOLDS
+from reports.profile_drift import check_drift, PSI_THRESHOLD, KS_THRESHOLD
+from reports.tsv_reports import (
+    generate_all_tsv_reports,
+    update_all_tsv_reports,
+    generate_individual_field_tsv,
+    generate_path_coverage_tsv,
+)
+from visualizations.plots import generate_all_plots, plan_plots, render_plots
+
+
+DEFAULT_INVENTORY_CACHE = "output/preliminary-analysis/data_inventory.pkl"
 
 
 @click.group()
@@ -52,7 +97,7 @@ def all(output_dir, sample, fast):
     click.echo("🔍 Starting comprehensive data analysis...")
 
     # Discover all files
-    files = discover_files("data/sources")
+    files = discover_files("data/sources", cache_path=Path(output_dir) / Path(DEFAULT_INVENTORY_CACHE).name)
     click.echo(f"Found {len(files)} files to analyze")
 
     # TODO: Analyze each file
@@ -106,7 +151,43 @@ def source(name, file, output_dir):
     type=int,
     help="Sample N rows",
 )
-def file(filepath, output_dir, sample):
+@click.option(
+    "--record-tag",
+    help="Split XML on this repeated record element (e.g. VariationArchive) and parse records in parallel",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Worker processes for --record-tag parsing (default: CPU count)",
+)
+@click.option(
+    "--entity-index",
+    default=None,
+    help="SQLite entity index to add this file's gene/disease/variant locations to",
+)
+@click.option(
+    "--store/--no-store",
+    default=True,
+    help=f"Also write the profile to <output-dir>/{STORE_FILENAME} (--no-store drops a stored copy)",
+)
+@click.option(
+    "--profile-format",
+    type=click.Choice(["json", "binary"]),
+    default="json",
+    help=f"Write the profile as *_profile.json or as *_profile{BINARY_PROFILE_SUFFIX} with per-field random access",
+)
+@click.option(
+    "--plots/--no-plots",
+    default=True,
+    help="Render the field plots now (--no-plots leaves them to the 'plots' command)",
+)
+@click.option(
+    "--html",
+    is_flag=True,
+    help="Also write an HTML report that loads field details on demand",
+)
+def file(filepath, output_dir, sample, record_tag, workers, entity_index, store, profile_format, plots, html):
     """Analyze a specific file"""
     filepath = Path(filepath)
     click.echo(f"📄 Analyzing {filepath.name}...")
@@ -121,7 +202,11 @@ def file(filepath, output_dir, sample):
 
     # Determine file type and analyze
     if filepath.suffix in [".tsv", ".csv", ".txt"]:
-        result = analyze_tabular_file(filepath, sample_size=sample)
+        if entity_index:
+            with EntityIndex(Path(entity_index)) as index:
+                result = analyze_tabular_file(filepath, sample_size=sample, entity_index=index)
+        else:
+            result = analyze_tabular_file(filepath, sample_size=sample)
 
         # Save results - organize by source if known
         if source_name:
@@ -130,25 +215,31 @@ def file(filepath, output_dir, sample):
             output_path = Path(output_dir) / filepath.stem
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Save JSON report
-        json_path = output_path / f"{filepath.stem}_profile.json"
-        generate_json_report(result, json_path)
+        # Save profile
+        profile_path = write_profile(result, output_path / f"{filepath.stem}_profile", profile_format)
+        store_profile(result, profile_path, Path(output_dir), store)
 
         # Generate markdown report
         md_path = output_path / f"{filepath.stem}_profile.md"
         generate_markdown_report(result, md_path)
+        if html:
+            generate_html_report(result, output_path / f"{filepath.stem}_profile.html")
 
         # Generate TSV field report
         tsv_path = output_path / f"{filepath.stem}_fields.tsv"
-        generate_individual_field_tsv(json_path, tsv_path)
+        generate_individual_field_tsv(profile_path, tsv_path, result)
 
-        # Create visualizations
-        viz_dir = output_path / "visualizations"
-        generate_all_plots(result, viz_dir)
+        # Create visualizations (unchanged plots are skipped)
+        if plots:
+            generate_all_plots(result, output_path / "visualizations")
 
         click.echo(f"✅ Analysis complete. Results in {output_path}/")
-    elif filepath.suffix in [".json", ".xml"]:
-        result = analyze_semistructured_file(filepath)
+    elif filepath.suffix in [".json", ".xml"] or (record_tag and filepath.suffix == ".gz"):
+        if record_tag:
+            # Uncompressed or BGZF-compressed record-oriented XML, e.g. ClinVar VCV
+            result = analyze_xml_records(filepath, record_tag=record_tag, workers=workers)
+        else:
+            result = analyze_semistructured_file(filepath)
 
         # Save results - organize by source if known
         if source_name:
@@ -157,17 +248,19 @@ def file(filepath, output_dir, sample):
             output_path = Path(output_dir) / filepath.stem
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Save JSON report
-        json_path = output_path / f"{filepath.stem}_profile.json"
-        generate_json_report(result, json_path)
+        # Save profile
+        profile_path = write_profile(result, output_path / f"{filepath.stem}_profile", profile_format)
+        store_profile(result, profile_path, Path(output_dir), store)
 
         # Generate markdown report
         md_path = output_path / f"{filepath.stem}_profile.md"
         generate_markdown_report(result, md_path)
+        if html:
+            generate_html_report(result, output_path / f"{filepath.stem}_profile.html")
 
         # Generate TSV field report
         tsv_path = output_path / f"{filepath.stem}_fields.tsv"
-        generate_individual_field_tsv(json_path, tsv_path)
+        generate_individual_field_tsv(profile_path, tsv_path, result)
 
         click.echo(f"✅ Analysis complete. Results in {output_path}/")
     else:
@@ -175,6 +268,468 @@ def file(filepath, output_dir, sample):
         sys.exit(1)
 
 
+def write_profile(result, base_path, profile_format):
+    """Write a profile as <base_path>.json or .hqprof, removing one in the other format."""
+    json_path = base_path.with_name(base_path.name + ".json")
+    binary_path = base_path.with_name(base_path.name + BINARY_PROFILE_SUFFIX)
+    if profile_format == "binary":
+        write_binary_profile(result, binary_path)
+        json_path.unlink(missing_ok=True)
+        return binary_path
+    generate_json_report(result, json_path)
+    binary_path.unlink(missing_ok=True)
+    return json_path
+
+
+def store_profile(result, profile_file, output_dir, store=True):
+    """
+    Bring the output directory's profile store in line with a newly written profile file.
+
+    The profile is stored keyed like its profile file (or, with store=False,
+    its stored row is dropped), and a row of the same file in the other profile
+    format is removed, so the store never serves an older profile than the file.
+    """
+    store_path = output_dir / STORE_FILENAME
+    if not store and not store_path.exists():
+        return
+    profile_path = profile_file.relative_to(output_dir)
+    other_suffix = ".json" if profile_path.suffix == BINARY_PROFILE_SUFFIX else BINARY_PROFILE_SUFFIX
+    with ProfileStore(store_path) as profile_store:
+        profile_store.remove_profile(profile_path.with_suffix(other_suffix).as_posix())
+        if store:
+            profile_store.write_profile(profile_path.parts[0], profile_path.as_posix(), result)
+        else:
+            profile_store.remove_profile(profile_path.as_posix())
+
+
+@cli.command()
+@click.option(
+    "--sources-dir",
+    default="output/preliminary-analysis/sources",
+    help="Directory with per-file analysis profiles",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Rendering processes (default: CPU count)",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Re-render plots whose input is unchanged",
+)
+def plots(sources_dir, workers, force):
+    """Render the field plots of every tabular profile, skipping unchanged ones"""
+    sources_path = Path(sources_dir)
+    if not sources_path.exists():
+        click.echo(f"❌ Error: {sources_path} does not exist", err=True)
+        sys.exit(1)
+
+    click.echo("📈 Planning plots...")
+    catalog = ProfileCatalog.load(sources_path, workers=workers)
+    plans = []
+    for entry in catalog.tabular():
+        plans.extend(plan_plots(entry.metadata, entry.json_path.parent / "visualizations", force, entry.field_table))
+
+    click.echo(f"🎨 Rendering {len(plans)} plots...")
+    rendered = render_plots(plans, workers)
+
+    click.echo(f"✅ Rendered {rendered} plots for {len(catalog.tabular())} tabular profiles")
+
+
+@cli.command("export-profiles")
+@click.option(
+    "--sources-dir",
+    default="output/preliminary-analysis/sources",
+    help="Directory holding the profile store; JSON reports are written below it",
+)
+def export_profiles(sources_dir):
+    """Write every stored or binary profile back out as its *_profile.json report"""
+    sources_path = Path(sources_dir)
+    store_path = sources_path / STORE_FILENAME
+    binary_paths = sorted(sources_path.rglob(f"*_profile{BINARY_PROFILE_SUFFIX}")) if sources_path.exists() else []
+    if not store_path.exists() and not binary_paths:
+        click.echo(f"❌ Error: no {STORE_FILENAME} or *_profile{BINARY_PROFILE_SUFFIX} files in {sources_dir}", err=True)
+        sys.exit(1)
+
+    count, stored = 0, set()
+    if store_path.exists():
+        with ProfileStore(store_path) as profile_store:
+            count = profile_store.export_json(sources_path)
+            stored = {sources_path / profile_path for profile_path in profile_store.profile_paths()}
+
+    for binary_path in binary_paths:
+        if binary_path in stored:
+            continue
+        generate_json_report(read_binary_profile(binary_path), binary_path.with_suffix(".json"))
+        count += 1
+
+    click.echo(f"✅ Exported {count} profiles to {sources_dir}/")
+
+
+@cli.command("profile-field")
+@click.argument("profile", type=click.Path(exists=True))
+@click.argument("field_name")
+def profile_field(profile, field_name):
+    """Print one field analysis of a binary profile as JSON, without decoding the others"""
+    try:
+        with BinaryProfileReader(Path(profile)) as reader:
+            field = reader.field(field_name)
+    except ValueError as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    if field is None:
+        click.echo(f"❌ Error: {field_name} is not a field of {profile}", err=True)
+        sys.exit(1)
+    click.echo(json.dumps(field, indent=2))
+
+
+@cli.group("profile")
+def profile_group():
+    """Profile comparison commands"""
+    pass
+
+
+@profile_group.command()
+@click.argument("old_sources_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("new_sources_dir", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/profile_diff.tsv",
+    help="Output path (.tsv, or .json for a summary plus per-field records)",
+)
+@click.option(
+    "--changed-only",
+    is_flag=True,
+    help="Only write added, removed and flagged fields",
+)
+@click.option(
+    "--null-threshold",
+    type=float,
+    default=DEFAULT_THRESHOLDS["null_percentage"][1],
+    help="Flag null percentage shifts of at least this many points",
+)
+@click.option(
+    "--cardinality-threshold",
+    type=float,
+    default=DEFAULT_THRESHOLDS["unique_count"][1],
+    help="Flag unique count changes of at least this fraction",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Profile decoding processes (default: CPU count)",
+)
+def diff(old_sources_dir, new_sources_dir, output, changed_only, null_threshold, cardinality_threshold, workers):
+    """Compare field statistics of two analysis runs on (source, file, field)"""
+    click.echo(f"🔍 Comparing {old_sources_dir} -> {new_sources_dir}...")
+
+    thresholds = {
+        **DEFAULT_THRESHOLDS,
+        "null_percentage": (DEFAULT_THRESHOLDS["null_percentage"][0], null_threshold, False),
+        "unique_count": (DEFAULT_THRESHOLDS["unique_count"][0], cardinality_threshold, True),
+    }
+    profile_diff = diff_profiles(Path(old_sources_dir), Path(new_sources_dir), thresholds, workers)
+    summary = summarize_diff(profile_diff)
+    if changed_only:
+        profile_diff = profile_diff[profile_diff["status"] != "unchanged"]
+    write_profile_diff(profile_diff, Path(output))
+
+    click.echo(f"📊 {summary['fields']:,} fields: " + ", ".join(
+        f"{count:,} {status}" for status, count in summary["status"].items()))
+    for flag, count in summary["flags"].items():
+        click.echo(f"  {flag}: {count:,}")
+    click.echo(f"✅ Profile diff saved to {output}")
+
+
+@profile_group.command()
+@click.argument("old_sources_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("new_sources_dir", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/profile_drift.tsv",
+    help="Output path (.tsv, or .json for a summary plus per-field records)",
+)
+@click.option(
+    "--drifted-only",
+    is_flag=True,
+    help="Only write fields whose distribution drifted",
+)
+@click.option(
+    "--psi-threshold",
+    type=float,
+    default=PSI_THRESHOLD,
+    help="Flag fields with at least this population stability index",
+)
+@click.option(
+    "--ks-threshold",
+    type=float,
+    default=KS_THRESHOLD,
+    help="Flag fields with at least this KS-style distance",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Profile decoding processes (default: CPU count)",
+)
+def drift(old_sources_dir, new_sources_dir, output, drifted_only, psi_threshold, ks_threshold, workers):
+    """Check field distributions of two analysis runs for drift, from stored sketches"""
+    click.echo(f"🔍 Checking distribution drift {old_sources_dir} -> {new_sources_dir}...")
+
+    profile_drift = check_drift(Path(old_sources_dir), Path(new_sources_dir), psi_threshold, ks_threshold, workers)
+    summary = summarize_diff(profile_drift)
+    drifted = profile_drift[profile_drift["status"] == "drifted"]
+    write_profile_diff(drifted if drifted_only else profile_drift, Path(output))
+
+    click.echo(f"📊 {summary['fields']:,} fields compared, {len(drifted):,} drifted")
+    for row in drifted.sort_values("psi", ascending=False).head(10).itertuples():
+        click.echo(f"  ⚠️  {row.source}/{row.filename}: {row.field_name} (PSI {row.psi:.3f}, KS {row.ks:.3f})")
+    click.echo(f"✅ Drift report saved to {output}")
+
+
+@cli.command()
+@click.argument("pattern")
+@click.option(
+    "--name",
+    help="Corpus name used for the output directory (default: derived from pattern)",
+)
+@click.option(
+    "--output-dir",
+    default="output/preliminary-analysis/sources",
+    help="Output directory",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (default: CPU count)",
+)
+def corpus(pattern, name, output_dir, workers):
+    """Analyze a corpus of many small JSON/XML files as one profile"""
+    filepaths = expand_corpus_pattern(pattern)
+    if not filepaths:
+        click.echo(f"❌ Error: no JSON/XML files match {pattern}", err=True)
+        sys.exit(1)
+
+    click.echo(f"📚 Analyzing corpus of {len(filepaths)} files...")
+
+    # Determine source name from the pattern
+    source_name = None
+    path_parts = Path(pattern).parts
+    if "sources" in path_parts:
+        idx = path_parts.index("sources")
+        if idx + 1 < len(path_parts):
+            source_name = path_parts[idx + 1]
+
+    if not name:
+        literal_parts = [part for part in path_parts if not any(c in part for c in "*?[")]
+        name = f"{literal_parts[-1]}-corpus" if literal_parts else "corpus"
+
+    result = analyze_corpus(filepaths, workers=workers)
+    result = {"filepath": pattern, "filename": name, **result}
+
+    if source_name:
+        output_path = Path(output_dir) / source_name / name
+    else:
+        output_path = Path(output_dir) / name
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Save JSON report
+    json_path = output_path / f"{name}_profile.json"
+    generate_json_report(result, json_path)
+
+    # Generate markdown report
+    md_path = output_path / f"{name}_profile.md"
+    generate_markdown_report(result, md_path)
+
+    # Generate path coverage TSV
+    tsv_path = output_path / f"{name}_path_coverage.tsv"
+    generate_path_coverage_tsv(result, tsv_path)
+
+    if result["error_count"]:
+        click.echo(f"⚠️  {result['error_count']} files could not be parsed", err=True)
+
+    click.echo(f"✅ Corpus analysis complete. Results in {output_path}/")
+
+
+@cli.command()
+@click.argument("config", type=click.Path(exists=True))
+@click.argument("filepath", type=click.Path(exists=True))
+@click.argument("output")
+def shred(config, filepath, output):
+    """Shred XML/JSON records into a Parquet/Arrow table using a path-to-column CONFIG"""
+    click.echo(f"🧱 Shredding {Path(filepath).name}...")
+
+    try:
+        result = shred_file(Path(filepath), Path(config), Path(output))
+    except (ValueError, *SHRED_INPUT_ERRORS) as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"✅ Wrote {result['record_count']:,} rows x {len(result['columns'])} columns "
+        f"in {result['row_groups']} row groups to {output}"
+    )
+
+
+@cli.command()
+@click.argument("profile", type=click.Path(exists=True))
+@click.option(
+    "--prefix",
+    default="",
+    help="Only list paths starting with this prefix",
+)
+def paths(profile, prefix):
+    """List the path catalogue of a JSON/XML PROFILE with occurrence counts"""
+    if Path(profile).suffix == BINARY_PROFILE_SUFFIX:
+        data = read_binary_profile(Path(profile))
+    else:
+        with open(profile, "r") as f:
+            data = json.load(f)
+
+    if "path_trie" not in data:
+        click.echo(f"❌ Error: {profile} has no path catalogue; re-run the analysis", err=True)
+        sys.exit(1)
+
+    click.echo("path\toccurrences\tparent_count\tfile_count")
+    for entry in PathTrie.from_dict(data["path_trie"]).items(prefix):
+        click.echo(f"{entry['path']}\t{entry['occurrences']}\t{entry['parent_count']}\t{entry['file_count']}")
+
+
+@cli.group()
+def records():
+    """Random access to records of large XML files"""
+    pass
+
+
+@records.command(name="index")
+@click.argument("xml_path", type=click.Path(exists=True))
+@click.option(
+    "--index-path",
+    help="Index file to write (default: <xml_path>.ridx)",
+)
+@click.option(
+    "--record-tag",
+    default="VariationArchive",
+    help="Repeated record element",
+)
+@click.option(
+    "--key-attribute",
+    default="Accession",
+    help="Record attribute used as the lookup key",
+)
+def index_records(xml_path, index_path, record_tag, key_attribute):
+    """Build a byte-offset index of the records in XML_PATH"""
+    click.echo(f"🗂️  Indexing {record_tag} records in {Path(xml_path).name}...")
+
+    try:
+        path = build_record_index(Path(xml_path), index_path and Path(index_path),
+                                  record_tag=record_tag, key_attribute=key_attribute)
+    except ValueError as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✅ Indexed {len(RecordIndex(path)):,} records in {path}")
+
+
+@records.command(name="lookup")
+@click.argument("xml_path", type=click.Path(exists=True))
+@click.argument("keys", nargs=-1, required=True)
+@click.option(
+    "--index-path",
+    help="Index file (default: <xml_path>.ridx)",
+)
+def lookup_records(xml_path, keys, index_path):
+    """Print the XML of records in XML_PATH by key (e.g. VCV accession)"""
+    try:
+        results = lookup_record_bytes(Path(xml_path), list(keys), index_path and Path(index_path))
+    except (ValueError, FileNotFoundError) as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    missing = 0
+    for key, data in zip(keys, results):
+        if data is None:
+            click.echo(f"❌ {key} not found", err=True)
+            missing += 1
+        else:
+            click.echo(data.decode("utf-8"))
+
+    if missing:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("identifiers", nargs=-1, required=True)
+@click.option(
+    "--hgnc",
+    required=True,
+    type=click.Path(exists=True),
+    help="HGNC complete set TSV (hgnc_complete_set.txt)",
+)
+@click.option(
+    "--prefix",
+    is_flag=True,
+    help="List symbols and aliases starting with each identifier instead",
+)
+def genes(identifiers, hgnc, prefix):
+    """Resolve gene symbols, aliases and IDs to approved HGNC genes"""
+    resolver = load_hgnc_resolver(Path(hgnc))
+
+    if prefix:
+        click.echo("query\tkey\tkind\thgnc_id\tsymbol")
+        for identifier in identifiers:
+            for match in resolver.search_prefix(identifier):
+                click.echo(f"{identifier}\t{match['key']}\t{match['kind']}\t{match['hgnc_id']}\t{match['symbol']}")
+        return
+
+    click.echo("input\thgnc_id\tsymbol\tmatch_type")
+    for row in resolver.resolve(list(identifiers)).itertuples(index=False):
+        click.echo(f"{row.input}\t{row.hgnc_id or ''}\t{row.symbol or ''}\t{row.match_type}")
+
+
+@cli.command()
+@click.argument("expressions", nargs=-1, required=True)
+def hgvs(expressions):
+    """Parse HGVS expressions into their components"""
+    parsed = parse_hgvs(list(expressions))
+    parsed.insert(0, 'input', list(expressions))
+    parsed['key'] = hgvs_keys(parsed)
+
+    parsed = parsed.astype(object).where(parsed.notna(), '')
+
+    click.echo("\t".join(parsed.columns))
+    for row in parsed.itertuples(index=False):
+        click.echo("\t".join(str(value) for value in row))
+
+
+@cli.command()
+@click.argument("names", nargs=-1, required=True)
+@click.option(
+    "--mondo",
+    required=True,
+    type=click.Path(exists=True),
+    help="MONDO OBO file (mondo.obo) or TSV with id, label and synonyms columns",
+)
+@click.option(
+    "--min-score",
+    type=float,
+    default=DEFAULT_MIN_SCORE,
+    help="Minimum similarity (0-100) of a fuzzy match",
+)
+def diseases(names, mondo, min_score):
+    """Match disease names to MONDO terms"""
+    matcher = load_mondo_matcher(Path(mondo))
+
+    click.echo("input\tmondo_id\tlabel\tmatch_type\tscore")
+    for row in matcher.match(list(names), min_score=min_score).itertuples(index=False):
+        click.echo(f"{row.input}\t{row.mondo_id or ''}\t{row.label or ''}\t{row.match_type}\t{row.score:.1f}")
+
+
 @cli.command()
 @click.option(
     "--sources-dir",
@@ -191,7 +746,17 @@ def file(filepath, output_dir, sample):
     default="output/preliminary-analysis/reports",
     help="Output directory for TSV reports",
 )
-def generate_reports(sources_dir, data_dir, output_dir):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only re-read profiles that changed since the last --incremental run",
+)
+@click.option(
+    "--inventory-cache",
+    default=DEFAULT_INVENTORY_CACHE,
+    help="Cached inventory of --data-dir (only changed directories are re-listed)",
+)
+def generate_reports(sources_dir, data_dir, output_dir, incremental, inventory_cache):
     """Generate aggregated TSV reports from all analyses"""
     sources_path = Path(sources_dir)
     data_path = Path(data_dir)
@@ -202,7 +767,56 @@ def generate_reports(sources_dir, data_dir, output_dir):
         click.echo("Run analysis first with 'make preliminary-analysis'", err=True)
         sys.exit(1)
 
-    generate_all_tsv_reports(sources_path, data_path, output_path)
+    if incremental:
+        counts = update_all_tsv_reports(sources_path, data_path, output_path, Path(inventory_cache))
+        click.echo(f"✅ TSV reports updated in {output_path}/ ({counts['changed']} changed, "
+                   f"{counts['removed']} removed, {counts['unchanged']} unchanged profiles)")
+    else:
+        generate_all_tsv_reports(sources_path, data_path, output_path, inventory_cache=Path(inventory_cache))
+
+
+@cli.command()
+@click.option(
+    "--data-dir",
+    default="data/sources",
+    help="Data directory to inventory",
+)
+@click.option(
+    "--inventory-cache",
+    default=DEFAULT_INVENTORY_CACHE,
+    help="Cached inventory to reuse and update",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-list every directory instead of only changed ones",
+)
+@click.option(
+    "--output",
+    default=None,
+    help="Write the full inventory as TSV",
+)
+def inventory(data_dir, inventory_cache, refresh, output):
+    """List data files with their detected type and compression"""
+    entries = scan_inventory(Path(data_dir), cache_path=Path(inventory_cache), refresh=refresh)
+
+    counts = {}
+    for entry in entries:
+        key = (entry['filetype'] or 'other', entry['compression'] or 'none')
+        counts[key] = counts.get(key, 0) + 1
+
+    click.echo(f"🗂️  {len(entries)} files in {data_dir}")
+    for (filetype, compression), count in sorted(counts.items()):
+        click.echo(f"  {filetype:<8} {compression:<6} {count}")
+
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['path', 'size', 'mtime_ns', 'inode', 'filetype', 'compression'],
+                                    delimiter='\t')
+            writer.writeheader()
+            writer.writerows(entries)
+        click.echo(f"✅ Inventory written to {output}")
 
 
 @cli.group()
@@ -211,54 +825,418 @@ def cross_source():
     pass
 
 
+def load_source_catalog(sources_dir):
+    """Load the profile catalog of a sources directory, exiting if it does not exist."""
+    sources_path = Path(sources_dir)
+    if not sources_path.exists():
+        click.echo(f"❌ Error: {sources_path} does not exist", err=True)
+        click.echo("Run analysis first with 'make preliminary-analysis'", err=True)
+        sys.exit(1)
+
+    return ProfileCatalog.load(sources_path)
+
+
+def load_source_profiles(sources_dir):
+    """Load every profile JSON below a sources directory, grouped by source."""
+    return load_source_catalog(sources_dir).by_source()
+
+
+def merge_source_fields(catalog):
+    """Combine the field tables of each source's files (first file wins per field)."""
+    tables = {}
+    for entry in catalog.tabular():
+        tables.setdefault(entry.source, []).append(entry.field_table)
+
+    sources_data = {}
+    for source_name, source_tables in tables.items():
+        fields = FieldTable.concat(source_tables)
+        _, first = np.unique(fields.names.astype(str), return_index=True)
+        sources_data[source_name] = fields.take(np.sort(first))
+    return sources_data
+
+
+@cross_source.command()
+@click.option(
+    "--sources-dir",
+    default="output/preliminary-analysis/sources",
+    help="Sources directory containing analysis JSON files",
+)
+@click.option(
+    "--data-dir",
+    default="data/sources",
+    help="Data directory the profiled files live in",
+)
+@click.option(
+    "--mirror-dir",
+    default=None,
+    help="Directory of Parquet mirrors (<file>.parquet) read instead of the source files",
+)
+@click.option(
+    "--hgnc",
+    default=None,
+    type=click.Path(exists=True),
+    help="HGNC complete set TSV used to map aliases/previous symbols to approved symbols",
+)
+@click.option(
+    "--mondo",
+    default=None,
+    type=click.Path(exists=True),
+    help="MONDO OBO file or label TSV used to map disease names to MONDO terms",
+)
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/cross-source/entity_sets.npz",
+    help="Output file for the entity sets",
+)
+def entities(sources_dir, data_dir, mirror_dir, hgnc, mondo, output):
+    """Extract complete entity sets from the source columns"""
+    source_profiles = load_source_profiles(sources_dir)
+    resolver = load_hgnc_resolver(Path(hgnc)) if hgnc else None
+    disease_matcher = load_mondo_matcher(Path(mondo)) if mondo else None
+
+    click.echo(f"🧬 Extracting entity sets for {len(source_profiles)} sources...")
+    interner = EntityInterner()
+    source_sets, missing = extract_source_entity_sets(
+        source_profiles,
+        interner,
+        data_dir=Path(data_dir),
+        mirror_dir=Path(mirror_dir) if mirror_dir else None,
+        resolver=resolver,
+        disease_matcher=disease_matcher,
+    )
+
+    for data_path in missing:
+        click.echo(f"⚠️  Data file not found: {data_path}", err=True)
+
+    for source_name, entity_sets in source_sets.items():
+        counts = ", ".join(
+            f"{kind}={len(ids):,}"
+            for kinds in entity_sets.values()
+            for kind, ids in kinds.items()
+            if len(ids)
+        )
+        click.echo(f"   {source_name}: {counts or 'no entities'}")
+
+    save_entity_sets(Path(output), source_sets, interner)
+    click.echo(f"✅ {len(interner):,} distinct entities saved to {output}")
+
+
 @cross_source.command()
 @click.option(
     "--entities",
     default="genes,diseases,variants",
     help="Comma-separated list of entities to analyze",
 )
-def overlap(entities):
+@click.option(
+    "--entity-sets",
+    default="output/preliminary-analysis/cross-source/entity_sets.npz",
+    help="Entity sets built by 'cross-source entities'",
+)
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/cross-source/entity_overlap.tsv",
+    help="Output TSV of intersection regions",
+)
+def overlap(entities, entity_sets, output):
     """Calculate entity overlap across sources"""
     entity_list = entities.split(",")
     click.echo(f"🔗 Analyzing overlap for: {', '.join(entity_list)}")
 
-    # TODO: Extract entities from each source
-    # TODO: Calculate overlaps
-    # TODO: Generate Venn diagram data
-    # TODO: Create visualization
+    entity_sets_path = Path(entity_sets)
+    if not entity_sets_path.exists():
+        click.echo(f"❌ Error: {entity_sets_path} does not exist", err=True)
+        click.echo("Build entity sets first with 'cross-source entities'", err=True)
+        sys.exit(1)
 
-    click.echo("✅ Overlap analysis complete")
+    source_sets, interner = load_entity_sets(entity_sets_path)
+    results = analyze_entity_overlap(source_sets, len(interner), entity_list)
+
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fields = ["entity_type", "kind", "sources", "degree", "exclusive_count", "intersection_count"]
+    with open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, delimiter="\t")
+        writer.writeheader()
+        for entity_type, kinds in results.items():
+            for kind, result in kinds.items():
+                click.echo(
+                    f"   {entity_type}/{kind}: {result['total_unique_entities']:,} entities, "
+                    f"{len(result['regions'])} regions across {len(result['sources'])} sources"
+                )
+                for region in result["regions"]:
+                    writer.writerow({
+                        "entity_type": entity_type,
+                        "kind": kind,
+                        "sources": "&".join(region["sources"]),
+                        "degree": region["degree"],
+                        "exclusive_count": region["exclusive_count"],
+                        "intersection_count": region["intersection_count"],
+                    })
+
+    click.echo(f"✅ Overlap regions written to {output_path}")
 
 
 @cross_source.command()
-def identifiers():
+@click.argument("value")
+@click.option(
+    "--entity-index",
+    default="output/preliminary-analysis/cross-source/entity_index.sqlite",
+    help="SQLite entity index built with 'file --entity-index'",
+)
+@click.option(
+    "--entity-type",
+    type=click.Choice(["genes", "diseases", "variants"]),
+    default=None,
+    help="Restrict to one entity type",
+)
+@click.option(
+    "--max-rows",
+    type=int,
+    default=20,
+    help="Row offsets to print per occurrence",
+)
+def locate(value, entity_index, entity_type, max_rows):
+    """Show the sources, files, columns and rows containing an entity"""
+    index_path = Path(entity_index)
+    if not index_path.exists():
+        click.echo(f"❌ Error: {index_path} does not exist", err=True)
+        click.echo("Build it while profiling with 'file <path> --entity-index <db>'", err=True)
+        sys.exit(1)
+
+    with EntityIndex(index_path) as index:
+        occurrences = index.lookup(value, entity_type=entity_type)
+
+    if not occurrences:
+        click.echo(f"❌ {value} not found", err=True)
+        sys.exit(1)
+
+    click.echo("source\tfilepath\tcolumn\tkind\trow_count\trows")
+    for occurrence in occurrences:
+        rows = ",".join(str(row) for row in occurrence["rows"][:max_rows])
+        if occurrence["row_count"] > max_rows:
+            rows += ",..."
+        click.echo(
+            f"{occurrence['source']}\t{occurrence['filepath']}\t{occurrence['column']}\t"
+            f"{occurrence['kind']}\t{occurrence['row_count']}\t{rows}"
+        )
+
+
+@cross_source.command()
+@click.option(
+    "--sources-dir",
+    default="output/preliminary-analysis/sources",
+    help="Sources directory containing analysis JSON files",
+)
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/cross-source/identifier_coverage.tsv",
+    help="Output TSV file path",
+)
+def identifiers(sources_dir, output):
     """Analyze identifier coverage across sources"""
     click.echo("🏷️  Analyzing identifier coverage...")
 
-    # TODO: Extract identifiers (HGNC, MONDO, dbSNP, etc.)
-    # TODO: Calculate coverage matrix
-    # TODO: Generate heatmap
-
-    click.echo("✅ Identifier analysis complete")
+    coverage = calculate_identifier_row_coverage(load_source_profiles(sources_dir))
+    if not coverage:
+        click.echo("⚠️  No identifier columns found (profiles may predate row coverage; re-run the analysis)")
+
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fields = ["source", "file", "identifier_type", "rows", "row_count", "fraction",
+              "resolvable_fraction", "columns"]
+    with open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, delimiter="\t")
+        writer.writeheader()
+        for entry in coverage:
+            resolvable = entry['resolvable_fraction']
+            writer.writerow({
+                **entry,
+                "fraction": f"{entry['fraction']:.4f}",
+                "resolvable_fraction": f"{resolvable:.3f}" if resolvable is not None else "",
+                "columns": ",".join(entry['columns']),
+            })
+
+    for entry in coverage:
+        resolvable = entry['resolvable_fraction']
+        click.echo(
+            f"  {entry['source']}/{entry['file']} {entry['identifier_type']}: "
+            f"{entry['rows']:,}/{entry['row_count']:,} rows ({entry['fraction']:.1%})"
+            + (f", {resolvable:.1%} resolvable in other sources" if resolvable is not None else "")
+        )
+
+    click.echo(f"✅ Identifier coverage written to {output_path}")
 
 
 @cross_source.command()
+@click.option(
+    "--sources-dir",
+    default="output/preliminary-analysis/sources",
+    help="Sources directory containing analysis JSON files",
+)
 @click.option(
     "--confidence",
     type=click.Choice(["high", "medium", "low", "all"]),
     default="all",
     help="Minimum confidence level for suggestions",
 )
-def field_mapping(confidence):
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.7,
+    help="Minimum field name similarity",
+)
+@click.option(
+    "--exhaustive",
+    is_flag=True,
+    help="Compare every pair of fields instead of using the n-gram index",
+)
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/cross-source/field_mappings.tsv",
+    help="Output TSV of suggested mappings",
+)
+def field_mapping(sources_dir, confidence, threshold, exhaustive, output):
     """Suggest field mappings across sources"""
     click.echo(f"🗺️  Generating field mapping suggestions (confidence: {confidence})...")
 
-    # TODO: Extract all fields from all sources
-    # TODO: Fuzzy match field names
-    # TODO: Sample values for overlap detection
-    # TODO: Generate mapping suggestions CSV
+    sources_data = merge_source_fields(load_source_catalog(sources_dir))
+    mappings = suggest_field_mappings(
+        sources_data,
+        similarity_threshold=threshold,
+        method="exhaustive" if exhaustive else "indexed",
+    )
+
+    allowed = {
+        "high": {"high"},
+        "medium": {"high", "medium"},
+        "low": {"high", "medium", "low"},
+        "all": {"high", "medium", "low"},
+    }[confidence]
+    mappings = [m for m in mappings if m["confidence"] in allowed]
+
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    columns = ["source1", "field1", "source2", "field2", "similarity", "confidence",
+               "type_compatible", "pattern_match", "type1", "type2"]
+    with open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, delimiter="\t", extrasaction="ignore")
+        writer.writeheader()
+        for mapping in mappings:
+            writer.writerow(dict(mapping, similarity=f"{mapping['similarity']:.3f}"))
+
+    click.echo(f"✅ {len(mappings)} field mappings written to {output_path}")
 
-    click.echo("✅ Field mapping complete")
+
+@cross_source.command()
+@click.option(
+    "--sources-dir",
+    default="output/preliminary-analysis/sources",
+    help="Sources directory containing analysis JSON files",
+)
+@click.option(
+    "--min-containment",
+    type=float,
+    default=0.5,
+    help="Minimum estimated containment (either direction) to report a pair",
+)
+@click.option(
+    "--min-distinct",
+    type=int,
+    default=10,
+    help="Skip columns with fewer distinct values",
+)
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/cross-source/value_overlap.tsv",
+    help="Output TSV of ranked column pairs",
+)
+def value_overlap(sources_dir, min_containment, min_distinct, output):
+    """Rank column pairs by value overlap using profile sketches"""
+    click.echo("🔍 Ranking column pairs by value overlap...")
+
+    columns = collect_column_sketches(load_source_profiles(sources_dir))
+    if not columns:
+        click.echo("❌ Error: no value sketches found; re-run the analysis", err=True)
+        sys.exit(1)
+
+    pairs = rank_value_overlaps(columns, min_containment=min_containment, min_distinct=min_distinct)
+
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fields = ["source1", "file1", "field1", "source2", "file2", "field2",
+              "containment_1", "containment_2", "jaccard", "distinct_1", "distinct_2"]
+    with open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, delimiter="\t")
+        writer.writeheader()
+        for pair in pairs:
+            writer.writerow({
+                **pair,
+                "containment_1": f"{pair['containment_1']:.3f}",
+                "containment_2": f"{pair['containment_2']:.3f}",
+                "jaccard": f"{pair['jaccard']:.3f}",
+            })
+
+    click.echo(f"✅ {len(pairs)} column pairs from {len(columns)} columns written to {output_path}")
+
+
+@cross_source.command("variant-join")
+@click.argument("left", type=click.Path(exists=True))
+@click.argument("right", type=click.Path(exists=True))
+@click.option(
+    "--left-format",
+    type=click.Choice(list(VARIANT_PRESETS)),
+    default="clinvar",
+    help="Layout of the left file",
+)
+@click.option(
+    "--right-format",
+    type=click.Choice(list(VARIANT_PRESETS)),
+    default="maf",
+    help="Layout of the right file",
+)
+@click.option(
+    "--chunksize",
+    type=int,
+    default=DEFAULT_CHUNK_SIZE,
+    help="Rows per sorted run (bounds memory use)",
+)
+@click.option(
+    "--tmp-dir",
+    type=click.Path(file_okay=False),
+    help="Directory for temporary sorted runs (default: system temp)",
+)
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/cross-source/variant_join.json",
+    help="Output JSON file path",
+)
+def variant_join(left, right, left_format, right_format, chunksize, tmp_dir, output):
+    """Join two variant files on (assembly, chrom, pos, ref, alt)"""
+    click.echo(f"🧬 Joining {left} ({left_format}) with {right} ({right_format})...")
+
+    if tmp_dir:
+        Path(tmp_dir).mkdir(parents=True, exist_ok=True)
+    try:
+        result = join_variant_files(left, right, left_format, right_format,
+                                    chunksize=chunksize, tmp_dir=tmp_dir)
+    except ValueError as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(result, f, indent=2)
+
+    for side in ("left", "right"):
+        stats = result[side]
+        click.echo(f"  {side}: {stats['rows']:,} rows, {stats['records']:,} variant records "
+                   f"({stats['invalid_rows']:,} rows not normalized)")
+    click.echo(f"  matched: {result['matched_variants']:,} variants "
+               f"({result['matched_pairs']:,} row pairs)")
+    click.echo(f"  left only: {result['left_only_variants']:,}")
+    click.echo(f"  right only: {result['right_only_variants']:,}")
+    click.echo(f"✅ Join summary written to {output_path}")
 
 
 @cli.group()
@@ -283,14 +1261,58 @@ def summary(output):
 
 
 @report.command()
-def data_dictionary():
+@click.option(
+    "--sources-dir",
+    default="output/preliminary-analysis/sources",
+    help="Directory containing analysis profiles",
+)
+@click.option(
+    "--output",
+    default="output/preliminary-analysis/data_dictionary.csv",
+    help="Output CSV path",
+)
+def data_dictionary(sources_dir, output):
     """Generate comprehensive data dictionary"""
     click.echo("📚 Generating data dictionary...")
 
-    # TODO: Compile all field statistics
-    # TODO: Generate CSV data dictionary
+    sources_data = merge_source_fields(load_source_catalog(sources_dir))
+    generate_data_dictionary(sources_data, Path(output))
+
+    click.echo(f"✅ Data dictionary saved to {output}")
+
+
+@report.command()
+@click.argument("profile_path", type=click.Path(exists=True))
+@click.option(
+    "--format",
+    "report_format",
+    type=click.Choice(["markdown", "html"]),
+    default="markdown",
+    help="Markdown with paginated field sections, or HTML with lazily loaded field chunks",
+)
+@click.option(
+    "--fields-per-page",
+    type=int,
+    default=FIELDS_PER_PAGE,
+    help="Fields per markdown page or HTML chunk",
+)
+def profile(profile_path, report_format, fields_per_page):
+    """Re-generate the report of a *_profile.json or *_profile.hqprof next to it"""
+    profile_path = Path(profile_path)
+    if profile_path.suffix == BINARY_PROFILE_SUFFIX:
+        result = read_binary_profile(profile_path)
+    else:
+        with open(profile_path) as f:
+            result = json.load(f)
+
+    if report_format == "html":
+        output_path = profile_path.with_suffix(".html")
+        generate_html_report(result, output_path, fields_per_page)
+    else:
+        output_path = profile_path.with_suffix(".md")
+        generate_markdown_report(result, output_path, fields_per_page)
 
-    click.echo("✅ Data dictionary generated")
+    click.echo(f"✅ Report saved to {output_path}")
 
 
 @report.command()
@@ -0,0 +1,198 @@
+"""Parallel structural analysis for corpora of many small JSON/XML files."""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import os
+
+from .semistructured import (
+    parse_json,
+    parse_xml,
+    calculate_json_depth,
+    calculate_xml_depth,
+    count_nodes,
+    count_xml_nodes,
+    summarize_path_trie,
+)
+from .path_trie import PathTrie
+
+
+def expand_corpus_pattern(pattern: str) -> List[Path]:
+    """
+    Expand a glob pattern (or directory) into a sorted list of JSON/XML files.
+
+    Args:
+        pattern: Glob pattern such as ``data/sources/tcga/**/*.xml``, or a
+            directory, in which case all JSON/XML files below it are used
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '**', '*')
+
+    files = []
+    for match in glob.glob(pattern, recursive=True):
+        path = Path(match)
+        if path.is_file() and path.suffix.lower() in ('.json', '.xml'):
+            files.append(path)
+
+    return sorted(files)
+
+
+def profile_structure(filepath: Path) -> Dict[str, Any]:
+    """
+    Compute the structural statistics of a single JSON/XML file.
+
+    This is the per-file unit of work for corpus analysis; it returns only
+    what is needed for merging so results are cheap to send between processes.
+
+    Args:
+        filepath: Path to JSON or XML file
+
+    Returns:
+        Dictionary with format, root tag, depth, node count and serialized
+        path trie, or an ``error`` entry if the file could not be parsed
+    """
+    filepath = Path(filepath)
+    suffix = filepath.suffix.lower()
+
+    result = {
+        "filepath": str(filepath),
+        "file_size_mb": filepath.stat().st_size / (1024 * 1024),
+    }
+
+    try:
+        if suffix == '.xml':
+            root = parse_xml(filepath)
+            result.update({
+                "format": "xml",
+                "root_tag": root.tag.split('}')[-1] if '}' in root.tag else root.tag,
+                "max_depth": calculate_xml_depth(root),
+                "node_count": count_xml_nodes(root),
+                "path_trie": PathTrie.from_xml(root).to_dict(),
+            })
+        elif suffix == '.json':
+            data = parse_json(filepath)
+            result.update({
+                "format": "json",
+                "root_tag": None,
+                "max_depth": calculate_json_depth(data),
+                "node_count": count_nodes(data),
+                "path_trie": PathTrie.from_json(data).to_dict(),
+            })
+        else:
+            result["error"] = f"Unsupported file type: {suffix}"
+    except Exception as e:
+        result["error"] = str(e)
+
+    return result
+
+
+def merge_structure_profiles(profiles: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-file structural statistics into a single corpus profile.
+
+    Profiles are merged in filepath order so the result does not depend on
+    the order in which workers finished.
+
+    Args:
+        profiles: Per-file results from ``profile_structure``
+
+    Returns:
+        Corpus-level statistics with the merged ``path_trie`` (see ``path_coverage``)
+    """
+    profiles = sorted(profiles, key=lambda p: p["filepath"])
+
+    path_trie = PathTrie()
+    format_counter = Counter()
+    root_tag_counter = Counter()
+    errors = []
+    node_counts = []
+    max_depth = 0
+    total_size_mb = 0.0
+
+    for profile in profiles:
+        total_size_mb += profile.get("file_size_mb", 0)
+
+        if "error" in profile:
+            errors.append({"filepath": profile["filepath"], "error": profile["error"]})
+            continue
+
+        format_counter[profile["format"]] += 1
+        if profile.get("root_tag"):
+            root_tag_counter[profile["root_tag"]] += 1
+        max_depth = max(max_depth, profile["max_depth"])
+        node_counts.append(profile["node_count"])
+        path_trie.merge(PathTrie.from_dict(profile["path_trie"]))
+
+    parsed_count = len(node_counts)
+
+    return {
+        "format": format_counter.most_common(1)[0][0] if format_counter else None,
+        "file_count": len(profiles),
+        "parsed_count": parsed_count,
+        "error_count": len(errors),
+        "errors": errors,
+        "file_size_mb": total_size_mb,
+        "formats": dict(sorted(format_counter.items())),
+        "root_tags": dict(root_tag_counter.most_common()),
+        "max_depth": max_depth,
+        "node_count": sum(node_counts),
+        "node_count_min": min(node_counts) if node_counts else 0,
+        "node_count_max": max(node_counts) if node_counts else 0,
+        "node_count_mean": (sum(node_counts) / parsed_count) if parsed_count else 0,
+        **summarize_path_trie(path_trie),
+        "path_trie": path_trie.to_dict(),
+    }
+
+
+def path_coverage(corpus_profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Share of the parsed files of a corpus profile that contain each path.
+
+    Args:
+        corpus_profile: Result of ``merge_structure_profiles``
+
+    Returns:
+        One dict per path of the ``path_trie`` with path, file_count and file_percentage
+    """
+    parsed_count = corpus_profile["parsed_count"]
+    return [
+        {
+            "path": entry["path"],
+            "file_count": entry["file_count"],
+            "file_percentage": (entry["file_count"] / parsed_count * 100) if parsed_count else 0,
+        }
+        for entry in PathTrie.from_dict(corpus_profile["path_trie"]).items()
+    ]
+
+
+def analyze_corpus(
+    filepaths: List[Path],
+    workers: Optional[int] = None,
+    chunksize: int = 32,
+) -> Dict[str, Any]:
+    """
+    Analyze many small JSON/XML files on a process pool and merge the results.
+
+    Args:
+        filepaths: Files making up the corpus
+        workers: Number of worker processes (default: CPU count); 1 runs inline
+        chunksize: Number of files handed to a worker per task
+
+    Returns:
+        Corpus profile (see ``merge_structure_profiles``)
+    """
+    filepaths = [Path(p) for p in filepaths]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(filepaths) <= 1:
+        profiles = [profile_structure(path) for path in filepaths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            profiles = list(executor.map(profile_structure, filepaths, chunksize=chunksize))
+
+    return merge_structure_profiles(profiles)
@@ -6,6 +6,21 @@ import re
 from collections import defaultdict, Counter
 from difflib import SequenceMatcher
 
+import numpy as np
+
+from .entity_sets import calculate_id_overlap
+from .field_profile import FieldTable
+from .sketches import decode_value_sketch, merge_value_sketches, estimate_overlap
+
+# Field pattern -> identifier type reported by analyze_identifier_coverage
+PATTERN_IDENTIFIER_TYPES = {
+    'HGNC ID': 'hgnc_ids',
+    'MONDO ID': 'mondo_ids',
+    'OMIM ID': 'omim_ids',
+    'dbSNP rsID': 'dbsnp_ids',
+    'ClinVar ID': 'clinvar_ids',
+}
+
 
 def extract_genes(analysis_data: Dict[str, Any]) -> Dict[str, Set[str]]:
     """
@@ -25,28 +40,27 @@ def extract_genes(analysis_data: Dict[str, Any]) -> Dict[str, Set[str]]:
     if 'field_analyses' not in analysis_data:
         return genes
 
-    for field_analysis in analysis_data['field_analyses']:
-        field_name = field_analysis.get('field_name', '').lower()
-        pattern = field_analysis.get('pattern')
+    for field in analysis_data['field_analyses']:
+        field_name = (field.get('field_name') or '').lower()
+        pattern = field.get('pattern')
+        top_values = field.get('top_values') or []
 
         # Look for HGNC ID fields
         if pattern == 'HGNC ID':
             # Get top values if available
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    if value and value.startswith('HGNC:'):
-                        genes['hgnc_ids'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                if value and value.startswith('HGNC:'):
+                    genes['hgnc_ids'].add(value)
 
         # Look for gene symbol fields
         if any(term in field_name for term in ['gene', 'symbol', 'hgnc']):
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    # Simple heuristic: gene symbols are uppercase, 1-20 chars, alphanumeric
-                    if value and value.isupper() and 1 <= len(value) <= 20:
-                        if re.match(r'^[A-Z0-9-]+$', value):
-                            genes['symbols'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                # Simple heuristic: gene symbols are uppercase, 1-20 chars, alphanumeric
+                if value and value.isupper() and 1 <= len(value) <= 20:
+                    if re.match(r'^[A-Z0-9-]+$', value):
+                        genes['symbols'].add(value)
 
     return genes
 
@@ -70,34 +84,32 @@ def extract_diseases(analysis_data: Dict[str, Any]) -> Dict[str, Set[str]]:
     if 'field_analyses' not in analysis_data:
         return diseases
 
-    for field_analysis in analysis_data['field_analyses']:
-        field_name = field_analysis.get('field_name', '').lower()
-        pattern = field_analysis.get('pattern')
+    for field in analysis_data['field_analyses']:
+        field_name = (field.get('field_name') or '').lower()
+        pattern = field.get('pattern')
+        top_values = field.get('top_values') or []
 
         # Look for MONDO ID fields
         if pattern == 'MONDO ID':
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    if value and value.startswith('MONDO:'):
-                        diseases['mondo_ids'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                if value and value.startswith('MONDO:'):
+                    diseases['mondo_ids'].add(value)
 
         # Look for OMIM ID fields
         if pattern == 'OMIM ID':
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    if value and re.match(r'^\d{6}$', value):
-                        diseases['omim_ids'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                if value and re.match(r'^\d{6}$', value):
+                    diseases['omim_ids'].add(value)
 
         # Look for disease name fields
         if any(term in field_name for term in ['disease', 'phenotype', 'condition', 'diagnosis']):
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    # Disease names are typically longer phrases
-                    if value and len(value) > 3 and not value.startswith(('MONDO:', 'OMIM:')):
-                        diseases['names'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                # Disease names are typically longer phrases
+                if value and len(value) > 3 and not value.startswith(('MONDO:', 'OMIM:')):
+                    diseases['names'].add(value)
 
     return diseases
 
@@ -121,32 +133,30 @@ def extract_variants(analysis_data: Dict[str, Any]) -> Dict[str, Set[str]]:
     if 'field_analyses' not in analysis_data:
         return variants
 
-    for field_analysis in analysis_data['field_analyses']:
-        pattern = field_analysis.get('pattern')
+    for field in analysis_data['field_analyses']:
+        pattern = field.get('pattern')
+        top_values = field.get('top_values') or []
 
         # Look for dbSNP rs IDs
         if pattern == 'dbSNP rsID':
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    if value and value.startswith('rs'):
-                        variants['dbsnp_ids'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                if value and value.startswith('rs'):
+                    variants['dbsnp_ids'].add(value)
 
         # Look for ClinVar IDs
         if pattern == 'ClinVar ID':
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    if value and value.startswith('VCV'):
-                        variants['clinvar_ids'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                if value and value.startswith('VCV'):
+                    variants['clinvar_ids'].add(value)
 
         # Look for HGVS notation
         if pattern == 'HGVS':
-            if 'top_values' in field_analysis:
-                for val_info in field_analysis['top_values']:
-                    value = val_info['value']
-                    if value:
-                        variants['hgvs'].add(value)
+            for val_info in top_values:
+                value = val_info['value']
+                if value:
+                    variants['hgvs'].add(value)
 
     return variants
 
@@ -219,36 +229,155 @@ def calculate_field_name_similarity(name1: str, name2: str) -> float:
     return SequenceMatcher(None, norm1, norm2).ratio()
 
 
-def suggest_field_mappings(sources_data: Dict[str, Dict[str, Any]],
-                          similarity_threshold: float = 0.7) -> List[Dict[str, Any]]:
+def _field_name_ngrams(name: str, n: int = 3) -> List[str]:
+    """Character n-grams of a normalized, space-padded field name."""
+    norm = ' ' + name.lower().replace('_', ' ').replace('-', ' ') + ' '
+    if len(norm) <= n:
+        return [norm]
+    return [norm[i:i + n] for i in range(len(norm) - n + 1)]
+
+
+def build_field_name_index(names: List[str], n: int = 3) -> Dict[str, Any]:
+    """
+    Build an L2-normalized character n-gram TF-IDF matrix of field names.
+
+    Args:
+        names: Field names (all sources, so IDF weights are shared)
+        n: N-gram length
+
+    Returns:
+        Dictionary with the sparse ``matrix`` (one row per name) and ``rows``
+        mapping each name to its row
+    """
+    from scipy import sparse
+
+    vocabulary = {}
+    rows, cols, counts = [], [], []
+    for row, name in enumerate(names):
+        for gram, count in Counter(_field_name_ngrams(name, n)).items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(gram, len(vocabulary)))
+            counts.append(count)
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), (rows, cols)),
+        shape=(len(names), len(vocabulary)),
+    )
+
+    # Smoothed IDF, then L2-normalize rows so dot products are cosines
+    document_frequency = np.bincount(matrix.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(names)) / (1 + document_frequency)) + 1
+    matrix = matrix.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    matrix = sparse.diags(1 / norms) @ matrix
+
+    return {
+        'matrix': matrix.tocsr(),
+        'rows': {name: row for row, name in enumerate(names)},
+    }
+
+
+def find_candidate_field_pairs(index: Dict[str, Any], names1: List[str], names2: List[str],
+                               min_cosine: float = 0.2,
+                               block_size: int = 1000) -> List[tuple]:
+    """
+    Find field name pairs whose n-gram TF-IDF cosine reaches ``min_cosine``.
+
+    Only non-zero entries of the sparse product are visited, so unrelated
+    names are never compared.
+
+    Args:
+        index: Result of ``build_field_name_index`` containing all names
+        names1: Field names of the first source
+        names2: Field names of the second source
+        min_cosine: Minimum cosine similarity of a candidate pair
+        block_size: Rows of ``names1`` multiplied at a time (bounds memory)
+
+    Returns:
+        List of (name1, name2, cosine) tuples
+    """
+    matrix = index['matrix']
+    rows = index['rows']
+    right = matrix[[rows[name] for name in names2]].T.tocsc()
+
+    candidates = []
+    for start in range(0, len(names1), block_size):
+        block_names = names1[start:start + block_size]
+        product = (matrix[[rows[name] for name in block_names]] @ right).tocoo()
+        keep = product.data >= min_cosine
+        for i, j, cosine in zip(product.row[keep], product.col[keep], product.data[keep]):
+            candidates.append((block_names[i], names2[j], float(cosine)))
+
+    return candidates
+
+
+def _mapping_fields(analysis_data: Any) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Data type, pattern and cardinality by field name, from a FieldTable or analysis data."""
+    if isinstance(analysis_data, FieldTable):
+        columns = analysis_data.columns
+        return {
+            field_name: {'data_type': data_type, 'pattern': pattern, 'cardinality': cardinality}
+            for field_name, data_type, pattern, cardinality in zip(
+                columns['field_name'].tolist(), columns['data_type'].tolist(),
+                columns['pattern'].tolist(), columns['cardinality'].tolist(),
+            )
+            if field_name
+        }
+
+    if 'field_analyses' not in analysis_data:
+        return None
+
+    fields = {}
+    for field in analysis_data['field_analyses']:
+        field_name = field.get('field_name')
+        if field_name:
+            fields[field_name] = {
+                'data_type': field.get('data_type'),
+                'pattern': field.get('pattern'),
+                'cardinality': field.get('cardinality'),
+            }
+    return fields
+
+
+def suggest_field_mappings(sources_data: Dict[str, Any],
+                          similarity_threshold: float = 0.7,
+                          method: str = 'indexed',
+                          min_cosine: float = 0.2) -> List[Dict[str, Any]]:
     """
     Suggest field mappings across sources based on name similarity and data type.
 
+    With ``method='indexed'`` (default), candidate pairs come from a character
+    n-gram TF-IDF index and only those are scored; ``'exhaustive'`` scores
+    every pair of fields. Either way the reported similarity is the
+    ``calculate_field_name_similarity`` score.
+
     Args:
-        sources_data: Dictionary mapping source names to analysis data
+        sources_data: Dictionary mapping source names to analysis data, or to
+            a ``FieldTable`` of the source's fields (as read from a profile store)
         similarity_threshold: Minimum similarity score for suggesting mapping
+        method: ``'indexed'`` or ``'exhaustive'``
+        min_cosine: Minimum n-gram cosine for a pair to be scored (indexed only)
 
     Returns:
         List of suggested field mappings
     """
+    if method not in ('indexed', 'exhaustive'):
+        raise ValueError(f"Unknown field mapping method: {method}")
+
     mappings = []
 
     # Extract all fields from all sources
     source_fields = {}
     for source_name, analysis_data in sources_data.items():
-        if 'field_analyses' not in analysis_data:
-            continue
+        fields = _mapping_fields(analysis_data)
+        if fields is not None:
+            source_fields[source_name] = fields
 
-        fields = {}
-        for field_analysis in analysis_data['field_analyses']:
-            field_name = field_analysis.get('field_name')
-            if field_name:
-                fields[field_name] = {
-                    'data_type': field_analysis.get('data_type'),
-                    'pattern': field_analysis.get('pattern'),
-                    'cardinality': field_analysis.get('cardinality'),
-                }
-        source_fields[source_name] = fields
+    index = None
+    if method == 'indexed':
+        all_names = sorted({name for fields in source_fields.values() for name in fields})
+        index = build_field_name_index(all_names)
 
     # Compare fields across sources
     sources = list(source_fields.keys())
@@ -257,31 +386,45 @@ def suggest_field_mappings(sources_data: Dict[str, Dict[str, Any]],
             fields1 = source_fields[source1]
             fields2 = source_fields[source2]
 
-            for field1_name, field1_info in fields1.items():
-                for field2_name, field2_info in fields2.items():
-                    # Calculate name similarity
-                    similarity = calculate_field_name_similarity(field1_name, field2_name)
-
-                    if similarity >= similarity_threshold:
-                        # Check if data types are compatible
-                        type_compatible = field1_info['data_type'] == field2_info['data_type']
-                        pattern_match = field1_info.get('pattern') == field2_info.get('pattern')
-
-                        confidence = 'high' if similarity >= 0.9 and type_compatible else \
-                                   'medium' if similarity >= 0.8 and type_compatible else 'low'
-
-                        mappings.append({
-                            'source1': source1,
-                            'field1': field1_name,
-                            'source2': source2,
-                            'field2': field2_name,
-                            'similarity': similarity,
-                            'type_compatible': type_compatible,
-                            'pattern_match': pattern_match,
-                            'confidence': confidence,
-                            'type1': field1_info['data_type'],
-                            'type2': field2_info['data_type'],
-                        })
+            if index is not None:
+                # Keep field order so results match the exhaustive method
+                order1 = {name: k for k, name in enumerate(fields1)}
+                order2 = {name: k for k, name in enumerate(fields2)}
+                candidates = find_candidate_field_pairs(index, list(fields1), list(fields2), min_cosine)
+                pairs = sorted(
+                    ((field1_name, field2_name) for field1_name, field2_name, _ in candidates),
+                    key=lambda pair: (order1[pair[0]], order2[pair[1]]),
+                )
+            else:
+                pairs = [(field1_name, field2_name) for field1_name in fields1 for field2_name in fields2]
+
+            for field1_name, field2_name in pairs:
+                field1_info = fields1[field1_name]
+                field2_info = fields2[field2_name]
+
+                # Calculate name similarity
+                similarity = calculate_field_name_similarity(field1_name, field2_name)
+
+                if similarity >= similarity_threshold:
+                    # Check if data types are compatible
+                    type_compatible = field1_info['data_type'] == field2_info['data_type']
+                    pattern_match = field1_info.get('pattern') == field2_info.get('pattern')
+
+                    confidence = 'high' if similarity >= 0.9 and type_compatible else \
+                               'medium' if similarity >= 0.8 and type_compatible else 'low'
+
+                    mappings.append({
+                        'source1': source1,
+                        'field1': field1_name,
+                        'source2': source2,
+                        'field2': field2_name,
+                        'similarity': similarity,
+                        'type_compatible': type_compatible,
+                        'pattern_match': pattern_match,
+                        'confidence': confidence,
+                        'type1': field1_info['data_type'],
+                        'type2': field2_info['data_type'],
+                    })
 
     # Sort by similarity descending
     mappings.sort(key=lambda x: x['similarity'], reverse=True)
@@ -312,19 +455,15 @@ def analyze_identifier_coverage(sources_data: Dict[str, Dict[str, Any]]) -> Dict
             continue
 
         # Check which identifier types are present
-        identifier_types = set()
-        for field_analysis in analysis_data['field_analyses']:
-            pattern = field_analysis.get('pattern')
-            if pattern == 'HGNC ID':
-                identifier_types.add('hgnc_ids')
-            elif pattern == 'MONDO ID':
-                identifier_types.add('mondo_ids')
-            elif pattern == 'OMIM ID':
-                identifier_types.add('omim_ids')
-            elif pattern == 'dbSNP rsID':
-                identifier_types.add('dbsnp_ids')
-            elif pattern == 'ClinVar ID':
-                identifier_types.add('clinvar_ids')
+        identifier_types = {
+            id_type for id_type, counts in
+            analysis_data.get('identifier_coverage', {}).get('types', {}).items()
+            if counts.get('rows')
+        }
+        patterns = {field.get('pattern') for field in analysis_data['field_analyses']}
+        identifier_types.update(
+            id_type for pattern, id_type in PATTERN_IDENTIFIER_TYPES.items() if pattern in patterns
+        )
 
         # Record presence for each type
         for id_type in coverage.keys():
@@ -333,12 +472,76 @@ def analyze_identifier_coverage(sources_data: Dict[str, Dict[str, Any]]) -> Dict
     return coverage
 
 
-def analyze_cross_source(sources_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+def calculate_identifier_row_coverage(source_profiles: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Report per source and file how many rows carry each identifier type.
+
+    Uses the ``identifier_coverage`` recorded while profiling, so no data file
+    is re-read. The resolvable fraction is the estimated share of a file's
+    distinct identifier values that also occur in at least one other source,
+    from the union of the other sources' value sketches.
+
+    Args:
+        source_profiles: Dictionary mapping source names to their file profiles
+
+    Returns:
+        One row per (source, file, identifier type) present, with rows,
+        row_count, fraction, columns and resolvable_fraction (None when no
+        other source carries the type)
+    """
+    entries = []
+    for source_name, profiles in source_profiles.items():
+        for analysis_data in profiles:
+            coverage = analysis_data.get('identifier_coverage')
+            if not coverage:
+                continue
+            filepath = analysis_data.get('file_metadata', {}).get('filepath', '')
+            for id_type, counts in coverage['types'].items():
+                entries.append({
+                    'source': source_name,
+                    'file': Path(filepath).name,
+                    'identifier_type': id_type,
+                    'rows': counts['rows'],
+                    'row_count': coverage['row_count'],
+                    'fraction': counts['fraction'],
+                    'columns': counts['columns'],
+                    'sketch': counts.get('value_sketch'),
+                })
+
+    # Union of each source's identifier values per type
+    source_sketches = defaultdict(list)
+    for entry in entries:
+        source_sketches[(entry['identifier_type'], entry['source'])].append(entry['sketch'])
+    merged = {key: merge_value_sketches(sketches) for key, sketches in source_sketches.items()}
+
+    results = []
+    for entry in entries:
+        sketch = entry.pop('sketch')
+        others = merge_value_sketches([
+            other for (id_type, source_name), other in merged.items()
+            if id_type == entry['identifier_type'] and source_name != entry['source']
+        ])
+        resolvable = None
+        if others:
+            resolvable = 0.0
+            if sketch:
+                resolvable = estimate_overlap(decode_value_sketch(sketch), decode_value_sketch(others))['containment_1']
+        entry['resolvable_fraction'] = resolvable
+        results.append(entry)
+
+    return results
+
+
+def analyze_cross_source(sources_data: Dict[str, Dict[str, Any]],
+                         entity_sets: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
     """
     Main entry point for cross-source analysis.
 
     Args:
         sources_data: Dictionary mapping source names to analysis data
+        entity_sets: Optional complete entity sets per source (see
+            ``entity_sets.extract_entity_sets``). When given, gene and disease
+            overlaps use them instead of the profile top values.
 
     Returns:
         Complete cross-source analysis results
@@ -369,6 +572,22 @@ def analyze_cross_source(sources_data: Dict[str, Dict[str, Any]]) -> Dict[str, A
     }
     disease_overlap = calculate_overlap(disease_name_sets) if disease_name_sets else {}
 
+    # Full entity sets replace the top-value samples
+    if entity_sets:
+        gene_id_sets = {
+            source: sets['genes']['symbols']
+            for source, sets in entity_sets.items()
+            if len(sets['genes']['symbols'])
+        }
+        gene_overlap = calculate_id_overlap(gene_id_sets) if gene_id_sets else {}
+
+        disease_id_sets = {
+            source: sets['diseases']['names']
+            for source, sets in entity_sets.items()
+            if len(sets['diseases']['names'])
+        }
+        disease_overlap = calculate_id_overlap(disease_id_sets) if disease_id_sets else {}
+
     # Suggest field mappings
     field_mappings = suggest_field_mappings(sources_data)
 
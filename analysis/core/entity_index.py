@@ -0,0 +1,208 @@
+"""Persistent SQLite index of entity locations across sources.
+
+Maps each gene, disease and variant value to the source, file and column it
+appears in, together with the data row offsets (0-based, header and comment
+lines excluded) where it occurs. The index is filled while files are profiled,
+one transaction per file, so "where does BRCA1 appear?" is an indexed lookup.
+
+Schema::
+
+    files(file_id, source, filepath UNIQUE, row_count, indexed_date)
+    entities(entity_id, entity_type, kind, value, UNIQUE(entity_type, kind, value))
+    occurrences(entity_id, file_id, column_name, row_count, rows)
+
+``rows`` is a BLOB of little-endian ``uint32`` row offsets.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from .entity_sets import select_entity_columns, VALUE_PATTERNS
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    filepath TEXT NOT NULL UNIQUE,
+    row_count INTEGER NOT NULL,
+    indexed_date TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (
+    entity_id INTEGER PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    UNIQUE (entity_type, kind, value)
+);
+CREATE TABLE IF NOT EXISTS occurrences (
+    entity_id INTEGER NOT NULL REFERENCES entities(entity_id),
+    file_id INTEGER NOT NULL REFERENCES files(file_id),
+    column_name TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    rows BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS occurrences_entity ON occurrences (entity_id);
+CREATE INDEX IF NOT EXISTS occurrences_file ON occurrences (file_id);
+CREATE INDEX IF NOT EXISTS entities_value ON entities (value);
+"""
+
+
+class EntityIndex:
+    """SQLite-backed entity → (source, file, column, rows) index."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> 'EntityIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def index_dataframe(self, df: pd.DataFrame, analysis_data: Dict[str, Any],
+                        source: str, filepath: str) -> int:
+        """
+        Index the entity columns of a loaded file, replacing earlier entries.
+
+        Args:
+            df: File contents as read by the profiler
+            analysis_data: Profile of the file, used to select entity columns
+            source: Source name
+            filepath: File path as stored in the profile
+
+        Returns:
+            Number of (entity, column) occurrences written
+        """
+        selected = select_entity_columns(analysis_data)
+        written = 0
+
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM occurrences WHERE file_id IN (SELECT file_id FROM files WHERE filepath = ?)",
+                (filepath,),
+            )
+            self.conn.execute(
+                "INSERT INTO files (source, filepath, row_count, indexed_date) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (filepath) DO UPDATE SET source = excluded.source, "
+                "row_count = excluded.row_count, indexed_date = excluded.indexed_date",
+                (source, filepath, len(df), datetime.now().isoformat()),
+            )
+            file_id = self.conn.execute(
+                "SELECT file_id FROM files WHERE filepath = ?", (filepath,)
+            ).fetchone()[0]
+
+            for column, kinds in selected.items():
+                if column not in df.columns:
+                    continue
+                values = df[column].dropna().astype(str).str.strip()
+                values = values[values != '']
+                # Re-label with positional row offsets
+                values = pd.Series(values.to_numpy(), index=df.index.get_indexer(values.index))
+
+                for entity_type, kind in kinds:
+                    matched = values[values.str.contains(VALUE_PATTERNS[kind], regex=True)]
+                    if len(matched):
+                        written += self._write_occurrences(matched, entity_type, kind, file_id, column)
+
+        return written
+
+    def _write_occurrences(self, values: pd.Series, entity_type: str, kind: str,
+                           file_id: int, column: str) -> int:
+        """Write one occurrence row per distinct value, with its row offsets."""
+        codes, uniques = pd.factorize(values)
+        order = np.argsort(codes, kind='stable')
+        boundaries = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+        row_groups = np.split(values.index.to_numpy()[order], boundaries)
+
+        uniques = [str(value) for value in uniques]
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO entities (entity_type, kind, value) VALUES (?, ?, ?)",
+            [(entity_type, kind, value) for value in uniques],
+        )
+
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS batch_values (value TEXT PRIMARY KEY)")
+        self.conn.execute("DELETE FROM batch_values")
+        self.conn.executemany("INSERT INTO batch_values (value) VALUES (?)", [(value,) for value in uniques])
+        entity_ids = dict(self.conn.execute(
+            "SELECT e.value, e.entity_id FROM entities e JOIN batch_values b ON e.value = b.value "
+            "WHERE e.entity_type = ? AND e.kind = ?",
+            (entity_type, kind),
+        ))
+
+        self.conn.executemany(
+            "INSERT INTO occurrences (entity_id, file_id, column_name, row_count, rows) VALUES (?, ?, ?, ?, ?)",
+            [
+                (entity_ids[value], file_id, column, len(rows), rows.astype('<u4').tobytes())
+                for value, rows in zip(uniques, row_groups)
+            ],
+        )
+        return len(uniques)
+
+    def lookup(self, value: str, entity_type: Optional[str] = None,
+               include_rows: bool = True) -> List[Dict[str, Any]]:
+        """
+        Find where an entity value occurs.
+
+        Args:
+            value: Entity value, e.g. ``BRCA1`` or ``HGNC:1100``
+            entity_type: Restrict to ``genes``, ``diseases`` or ``variants``
+            include_rows: Decode and return the row offsets
+
+        Returns:
+            One dict per (file, column, kind) occurrence, ordered by source and file
+        """
+        query = (
+            "SELECT e.entity_type, e.kind, f.source, f.filepath, o.column_name, o.row_count, o.rows "
+            "FROM entities e JOIN occurrences o ON o.entity_id = e.entity_id "
+            "JOIN files f ON f.file_id = o.file_id WHERE e.value = ?"
+        )
+        params = [value]
+        if entity_type:
+            query += " AND e.entity_type = ?"
+            params.append(entity_type)
+        query += " ORDER BY f.source, f.filepath, o.column_name, e.kind"
+
+        results = []
+        for entity_type_, kind, source, filepath, column, row_count, rows in self.conn.execute(query, params):
+            result = {
+                'entity_type': entity_type_,
+                'kind': kind,
+                'source': source,
+                'filepath': filepath,
+                'column': column,
+                'row_count': row_count,
+            }
+            if include_rows:
+                result['rows'] = np.frombuffer(rows, dtype='<u4').tolist()
+            results.append(result)
+        return results
+
+    def remove_file(self, filepath: str) -> None:
+        """Drop a file and its occurrences from the index."""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM occurrences WHERE file_id IN (SELECT file_id FROM files WHERE filepath = ?)",
+                (filepath,),
+            )
+            self.conn.execute("DELETE FROM files WHERE filepath = ?", (filepath,))
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts of the index tables."""
+        return {
+            table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('files', 'entities', 'occurrences')
+        }
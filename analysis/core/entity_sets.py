@@ -0,0 +1,429 @@
+"""Full-value entity extraction from source columns into interned ID sets.
+
+``extract_genes``/``extract_diseases``/``extract_variants`` only see the top
+values stored in a profile. This module uses the profile to decide which
+columns hold entities (same field-name and pattern rules), then streams those
+columns from the data file itself, or from a Parquet mirror, and collects every
+distinct value.
+
+Values are interned to dense integers shared across sources, and each entity
+set is kept as a sorted ``int64`` NumPy array, so overlaps reduce to
+``np.intersect1d`` on sorted arrays.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .tabular import detect_encoding, infer_delimiter, detect_null_values
+
+
+# Entity kinds per entity type, in the order of the extract_* functions
+ENTITY_KINDS = {
+    'genes': ['symbols', 'hgnc_ids'],
+    'diseases': ['names', 'mondo_ids', 'omim_ids'],
+    'variants': ['dbsnp_ids', 'clinvar_ids', 'hgvs'],
+}
+
+# Value filters equivalent to the per-value checks of the extract_* functions
+VALUE_PATTERNS = {
+    'symbols': r'^(?=.*[A-Z])[A-Z0-9-]{1,20}$',
+    'hgnc_ids': r'^HGNC:',
+    'names': r'^(?!MONDO:|OMIM:).{4,}$',
+    'mondo_ids': r'^MONDO:',
+    'omim_ids': r'^\d{6}$',
+    'dbsnp_ids': r'^rs',
+    'clinvar_ids': r'^VCV',
+    'hgvs': r'.',
+}
+
+_PATTERN_KINDS = {
+    'HGNC ID': ('genes', 'hgnc_ids'),
+    'MONDO ID': ('diseases', 'mondo_ids'),
+    'OMIM ID': ('diseases', 'omim_ids'),
+    'dbSNP rsID': ('variants', 'dbsnp_ids'),
+    'ClinVar ID': ('variants', 'clinvar_ids'),
+    'HGVS': ('variants', 'hgvs'),
+}
+
+DEFAULT_CHUNK_SIZE = 200000
+
+
+class EntityInterner:
+    """Map entity strings to dense integer IDs shared across sources."""
+
+    def __init__(self, vocabulary: Optional[List[str]] = None):
+        self.vocabulary = list(vocabulary or [])
+        self._ids = {value: i for i, value in enumerate(self.vocabulary)}
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+    def intern(self, values) -> np.ndarray:
+        """
+        Intern values and return their sorted, distinct IDs.
+
+        Args:
+            values: Iterable of strings
+
+        Returns:
+            Sorted ``int64`` array of distinct IDs
+        """
+        ids = self._ids
+        vocabulary = self.vocabulary
+        result = []
+        for value in values:
+            entity_id = ids.get(value)
+            if entity_id is None:
+                entity_id = ids[value] = len(vocabulary)
+                vocabulary.append(value)
+            result.append(entity_id)
+        return np.unique(np.asarray(result, dtype=np.int64))
+
+    def lookup(self, values) -> np.ndarray:
+        """Return the IDs of known values (unknown values are skipped)."""
+        ids = [self._ids[value] for value in values if value in self._ids]
+        return np.unique(np.asarray(ids, dtype=np.int64))
+
+    def values(self, ids: np.ndarray) -> List[str]:
+        """Translate IDs back to entity strings."""
+        return [self.vocabulary[i] for i in ids]
+
+
+def select_entity_columns(analysis_data: Dict[str, Any]) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Decide which columns of a profiled file hold which entities.
+
+    Uses the same rules as the ``extract_*`` functions in ``cross_source``.
+
+    Args:
+        analysis_data: Profile with ``field_analyses``
+
+    Returns:
+        Dictionary mapping column name to a list of (entity_type, kind)
+    """
+    columns = {}
+
+    for field_analysis in analysis_data.get('field_analyses', []):
+        field_name = field_analysis.get('field_name', '')
+        lowered = field_name.lower()
+        pattern = field_analysis.get('pattern')
+        kinds = []
+
+        if pattern in _PATTERN_KINDS:
+            kinds.append(_PATTERN_KINDS[pattern])
+        if any(term in lowered for term in ['gene', 'symbol', 'hgnc']):
+            kinds.append(('genes', 'symbols'))
+        if any(term in lowered for term in ['disease', 'phenotype', 'condition', 'diagnosis']):
+            kinds.append(('diseases', 'names'))
+
+        if kinds:
+            columns[field_name] = kinds
+
+    return columns
+
+
+def resolve_data_path(analysis_data: Dict[str, Any], data_dir: Path = Path('data/sources'),
+                      mirror_dir: Optional[Path] = None) -> Path:
+    """
+    Locate the data file a profile was computed from.
+
+    Tabular profiles store the path relative to ``data/sources``; other
+    profiles store it as given on the command line.
+
+    Args:
+        analysis_data: Profile of the file
+        data_dir: Root the tabular file paths are relative to
+        mirror_dir: Optional root of Parquet mirrors laid out like ``data_dir``;
+            ``<mirror_dir>/<filepath>.parquet`` is used when it exists
+
+    Returns:
+        Path to read entity columns from
+    """
+    file_metadata = analysis_data.get('file_metadata', {})
+    if not file_metadata.get('filepath'):
+        return Path(analysis_data.get('filepath', ''))
+
+    relative = Path(file_metadata['filepath'])
+    if mirror_dir is not None:
+        mirror = Path(mirror_dir) / relative.with_name(relative.name + '.parquet')
+        if mirror.exists():
+            return mirror
+    return Path(data_dir) / relative
+
+
+def iter_column_chunks(data_path: Path, columns: List[str],
+                       analysis_data: Optional[Dict[str, Any]] = None,
+                       chunksize: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Stream selected columns of a delimited or Parquet file as string chunks.
+
+    Args:
+        data_path: CSV/TSV file, or a Parquet mirror
+        columns: Columns to read
+        analysis_data: Profile of the file, used for its encoding and delimiter
+        chunksize: Rows per chunk
+
+    Yields:
+        DataFrames holding only ``columns``, with nulls as NaN
+    """
+    data_path = Path(data_path)
+
+    if data_path.suffix.lower() == '.parquet':
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(data_path)
+        present = [c for c in columns if c in parquet_file.schema_arrow.names]
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=present):
+            yield batch.to_pandas().astype('string').astype(object)
+        return
+
+    file_metadata = (analysis_data or {}).get('file_metadata', {})
+    encoding = file_metadata.get('encoding') or detect_encoding(data_path)
+    delimiter = file_metadata.get('delimiter') or infer_delimiter(data_path, encoding)
+
+    wanted = set(columns)
+    reader = pd.read_csv(
+        data_path,
+        sep=delimiter,
+        encoding=encoding,
+        na_values=detect_null_values(),
+        usecols=lambda column: column in wanted,
+        dtype=str,
+        chunksize=chunksize,
+        on_bad_lines='warn',
+        comment='#',
+    )
+    for chunk in reader:
+        yield chunk
+
+
+def extract_entity_sets(
+    data_path: Path,
+    analysis_data: Dict[str, Any],
+    interner: EntityInterner,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    resolver=None,
+    disease_matcher=None,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Collect complete entity sets from one data file.
+
+    Args:
+        data_path: Data file (CSV/TSV or Parquet mirror)
+        analysis_data: Profile of the file, used to select entity columns
+        interner: Shared interner assigning entity IDs
+        chunksize: Rows read per chunk
+        resolver: Optional ``hgnc.HgncResolver``; gene symbols, aliases and
+            previous symbols are then replaced by the approved symbol, so the
+            same gene matches across sources
+        disease_matcher: Optional ``mondo.MondoMatcher``; matched disease
+            names are replaced by the MONDO label and their MONDO IDs are
+            added to ``mondo_ids``
+
+    Returns:
+        ``{entity_type: {kind: sorted int64 ID array}}`` for every type/kind
+    """
+    selected = select_entity_columns(analysis_data)
+    collected = {
+        entity_type: {kind: [] for kind in kinds}
+        for entity_type, kinds in ENTITY_KINDS.items()
+    }
+
+    if selected:
+        for chunk in iter_column_chunks(data_path, list(selected), analysis_data, chunksize):
+            for column in chunk.columns:
+                values = chunk[column].dropna().astype(str).str.strip()
+                values = pd.unique(values[values != ''])
+                if len(values) == 0:
+                    continue
+                values = pd.Series(values)
+                for entity_type, kind in selected.get(column, []):
+                    if resolver is not None and kind == 'symbols':
+                        matched = canonical_gene_symbols(values, resolver)
+                    elif disease_matcher is not None and kind == 'names':
+                        matched, mondo_ids = canonical_disease_names(values, disease_matcher)
+                        if len(mondo_ids):
+                            collected['diseases']['mondo_ids'].append(interner.intern(mondo_ids))
+                    else:
+                        matched = values[values.str.contains(VALUE_PATTERNS[kind], regex=True)]
+                    if len(matched):
+                        collected[entity_type][kind].append(interner.intern(matched))
+
+    return {
+        entity_type: {
+            kind: (np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype=np.int64))
+            for kind, arrays in kinds.items()
+        }
+        for entity_type, kinds in collected.items()
+    }
+
+
+def canonical_gene_symbols(values: pd.Series, resolver) -> pd.Series:
+    """
+    Map gene values to approved HGNC symbols.
+
+    Values the resolver cannot resolve unambiguously are kept as-is when they
+    look like gene symbols.
+    """
+    resolved = resolver.resolve(values)
+    symbols = pd.Series(resolved['symbol'].to_numpy(), index=values.index)
+    unresolved = symbols.isna()
+    fallback = values[unresolved]
+    fallback = fallback[fallback.str.contains(VALUE_PATTERNS['symbols'], regex=True)]
+    return pd.Series(pd.unique(pd.concat([symbols[~unresolved], fallback])))
+
+
+def canonical_disease_names(values: pd.Series, matcher) -> Tuple[pd.Series, pd.Series]:
+    """
+    Map disease names to MONDO labels.
+
+    Unmatched values are kept as-is when they look like disease names.
+
+    Returns:
+        Tuple of (distinct names, distinct MONDO IDs of the matched names)
+    """
+    matches = matcher.match(values)
+    accepted = matches['match_type'].isin(['exact', 'fuzzy']).to_numpy()
+    labels = pd.Series(matches['label'].to_numpy()[accepted])
+    fallback = values[~accepted]
+    fallback = fallback[fallback.str.contains(VALUE_PATTERNS['names'], regex=True)]
+    names = pd.Series(pd.unique(pd.concat([labels, fallback], ignore_index=True)))
+    return names, pd.Series(pd.unique(matches['mondo_id'].to_numpy()[accepted]))
+
+
+def merge_entity_sets(sets: List[Dict[str, Dict[str, np.ndarray]]]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Union several ``extract_entity_sets`` results (e.g. all files of a source)."""
+    merged = {}
+    for entity_type, kinds in ENTITY_KINDS.items():
+        merged[entity_type] = {}
+        for kind in kinds:
+            arrays = [s[entity_type][kind] for s in sets if entity_type in s and kind in s[entity_type]]
+            merged[entity_type][kind] = (
+                np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype=np.int64)
+            )
+    return merged
+
+
+def extract_source_entity_sets(
+    source_profiles: Dict[str, List[Dict[str, Any]]],
+    interner: EntityInterner,
+    data_dir: Path = Path('data/sources'),
+    mirror_dir: Optional[Path] = None,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    resolver=None,
+    disease_matcher=None,
+) -> Tuple[Dict[str, Dict[str, Dict[str, np.ndarray]]], List[Path]]:
+    """
+    Collect complete entity sets for every source from its profiled files.
+
+    Args:
+        source_profiles: Dictionary mapping source names to file profiles
+        interner: Shared interner assigning entity IDs
+        data_dir: Root the tabular file paths are relative to
+        mirror_dir: Optional root of Parquet mirrors (see ``resolve_data_path``)
+        chunksize: Rows read per chunk
+        resolver: Optional ``hgnc.HgncResolver`` (see ``extract_entity_sets``)
+        disease_matcher: Optional ``mondo.MondoMatcher`` (see ``extract_entity_sets``)
+
+    Returns:
+        Tuple of (per-source entity sets, data files that could not be found)
+    """
+    source_sets = {}
+    missing = []
+
+    for source_name in sorted(source_profiles):
+        file_sets = []
+        for analysis_data in source_profiles[source_name]:
+            if not select_entity_columns(analysis_data):
+                continue
+            data_path = resolve_data_path(analysis_data, data_dir, mirror_dir)
+            if not data_path.is_file():
+                missing.append(data_path)
+                continue
+            file_sets.append(extract_entity_sets(
+                data_path, analysis_data, interner, chunksize, resolver, disease_matcher))
+        source_sets[source_name] = merge_entity_sets(file_sets)
+
+    return source_sets, missing
+
+
+def calculate_id_overlap(id_sets: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """
+    Calculate overlap statistics for sorted ID arrays.
+
+    Returns the same structure as ``cross_source.calculate_overlap``.
+
+    Args:
+        id_sets: Dictionary mapping source names to sorted, distinct ID arrays
+
+    Returns:
+        Overlap statistics including counts and intersection data
+    """
+    sources = list(id_sets.keys())
+
+    overlaps = {}
+    for i, source1 in enumerate(sources):
+        for source2 in sources[i+1:]:
+            ids1 = id_sets[source1]
+            ids2 = id_sets[source2]
+
+            intersection_count = len(np.intersect1d(ids1, ids2, assume_unique=True))
+            union_count = len(ids1) + len(ids2) - intersection_count
+
+            overlaps[f"{source1}_vs_{source2}"] = {
+                'source1': source1,
+                'source2': source2,
+                'source1_count': len(ids1),
+                'source2_count': len(ids2),
+                'intersection_count': intersection_count,
+                'union_count': union_count,
+                'jaccard_similarity': intersection_count / union_count if union_count else 0,
+                'overlap_percentage_1': (intersection_count / len(ids1) * 100) if len(ids1) else 0,
+                'overlap_percentage_2': (intersection_count / len(ids2) * 100) if len(ids2) else 0,
+            }
+
+    all_ids = np.unique(np.concatenate(list(id_sets.values()))) if id_sets else np.empty(0)
+
+    return {
+        'total_unique_entities': len(all_ids),
+        'source_counts': {source: len(ids) for source, ids in id_sets.items()},
+        'pairwise_overlaps': overlaps,
+    }
+
+
+def save_entity_sets(output_path: Path, source_sets: Dict[str, Dict[str, Dict[str, np.ndarray]]],
+                     interner: EntityInterner) -> None:
+    """
+    Save per-source entity sets and the shared vocabulary to an ``.npz`` file.
+
+    Args:
+        output_path: Output ``.npz`` path
+        source_sets: ``{source: extract_entity_sets result}``
+        interner: Interner holding the vocabulary the IDs refer to
+    """
+    arrays = {'vocabulary': np.asarray(interner.vocabulary, dtype=str)}
+    for source, entity_sets in source_sets.items():
+        for entity_type, kinds in entity_sets.items():
+            for kind, ids in kinds.items():
+                arrays[f"{source}/{entity_type}/{kind}"] = ids
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+
+
+def load_entity_sets(path: Path) -> Tuple[Dict[str, Dict[str, Dict[str, np.ndarray]]], EntityInterner]:
+    """Load entity sets written by ``save_entity_sets``."""
+    source_sets = {}
+    with np.load(path) as data:
+        interner = EntityInterner(data['vocabulary'].tolist())
+        for key in data.files:
+            if key == 'vocabulary':
+                continue
+            source, entity_type, kind = key.split('/')
+            source_sets.setdefault(source, {}).setdefault(entity_type, {})[kind] = data[key]
+    return source_sets, interner
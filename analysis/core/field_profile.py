@@ -0,0 +1,279 @@
+"""Compact field profiles for report code.
+
+``analyze_field`` describes every column as a dictionary, and that is what the
+JSON, binary and SQLite profile formats store. Reports, plots and cross-source
+checks that walk every field of a wide matrix pay for a string-keyed lookup per
+statistic per field; they read the same analyses through
+
+* ``FieldProfile``: one field as a slotted record with typed attributes
+  (counts are ints even where the JSON report holds them as strings), and
+* ``FieldTable``: all fields of a file as one NumPy column per statistic, so
+  whole-file questions (null percentages, type and pattern counts) are
+  answered with array operations.
+
+Missing statistics are None on a ``FieldProfile``; in a ``FieldTable`` they
+are -1 in count columns, NaN in float columns and None in label columns.
+A table read from a stored profile may leave its nested-value columns to be
+decoded when first indexed, so statistics-only readers never decode them.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+COUNT_COLUMNS = ('total_count', 'non_null_count', 'null_count', 'unique_count', 'min_length', 'max_length')
+FLOAT_COLUMNS = ('null_percentage', 'mean_length', 'min', 'max', 'mean', 'median', 'std', 'q1', 'q3')
+LABEL_COLUMNS = ('field_name', 'data_type', 'cardinality', 'pattern')
+# Per-field nested values, kept as Python objects
+OBJECT_COLUMNS = ('top_values', 'identifiers', 'extra')
+
+_KNOWN_KEYS = set(COUNT_COLUMNS + FLOAT_COLUMNS + LABEL_COLUMNS + ('top_values', 'identifiers'))
+
+
+def _float(value: Any) -> Optional[float]:
+    if value is None or value == '':
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if np.isnan(value) else value
+
+
+def _count(value: Any) -> Optional[int]:
+    """Integer count, also from the numeric strings JSON reports hold for NumPy counts."""
+    value = _float(value)
+    return None if value is None else int(value)
+
+
+def _float_column(values: List[Any]) -> np.ndarray:
+    """Float array of statistic values, NaN where missing or not numeric."""
+    try:
+        # Converts None to NaN and numeric strings in one pass
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array([np.nan if v is None else v for v in map(_float, values)], dtype=np.float64)
+
+
+def object_column(values: List[Any]) -> np.ndarray:
+    """Object array of per-field values."""
+    # Filled element by element so nested lists are not broadcast into extra dimensions
+    column = np.empty(len(values), dtype=object)
+    for position, value in enumerate(values):
+        column[position] = value
+    return column
+
+
+@dataclass(slots=True)
+class FieldProfile:
+    """One field analysis with typed attributes; unknown keys are kept in ``extra``."""
+
+    # Declared in FieldTable column order: labels, counts, floats, nested values
+
+    field_name: str = ''
+    data_type: Optional[str] = None
+    cardinality: Optional[str] = None
+    pattern: Optional[str] = None
+    total_count: Optional[int] = None
+    non_null_count: Optional[int] = None
+    null_count: Optional[int] = None
+    unique_count: Optional[int] = None
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    null_percentage: Optional[float] = None
+    mean_length: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    std: Optional[float] = None
+    q1: Optional[float] = None
+    q3: Optional[float] = None
+    top_values: List[Dict[str, Any]] = field(default_factory=list)
+    identifiers: List[str] = field(default_factory=list)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, analysis: Dict[str, Any]) -> 'FieldProfile':
+        """Build from an ``analyze_field`` dictionary (as stored in a profile)."""
+        return cls(
+            field_name=analysis.get('field_name') or '',
+            data_type=analysis.get('data_type'),
+            cardinality=analysis.get('cardinality'),
+            pattern=analysis.get('pattern'),
+            **{name: _count(analysis.get(name)) for name in COUNT_COLUMNS},
+            **{name: _float(analysis.get(name)) for name in FLOAT_COLUMNS},
+            top_values=analysis.get('top_values') or [],
+            identifiers=analysis.get('identifiers') or [],
+            extra={key: value for key, value in analysis.items() if key not in _KNOWN_KEYS},
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary of the statistics that are present, in ``analyze_field`` key style."""
+        analysis = {}
+        for attribute in fields(self):
+            value = getattr(self, attribute.name)
+            if attribute.name == 'extra':
+                analysis.update(value)
+            elif value is not None and value != []:
+                analysis[attribute.name] = value
+        return analysis
+
+
+class _Columns(dict):
+    """Column arrays, where columns given as loaders are built on first access."""
+
+    __slots__ = ('_loaders',)
+
+    def __init__(self, columns: Dict[str, np.ndarray], loaders: Dict[str, Callable[[], np.ndarray]]):
+        super().__init__(columns)
+        self._loaders = dict(loaders)
+
+    def __missing__(self, name: str) -> np.ndarray:
+        if name not in self._loaders:
+            raise KeyError(name)
+        column = self[name] = self._loaders.pop(name)()
+        return column
+
+
+class FieldTable:
+    """Struct-of-arrays form of a file's field analyses, one NumPy column per statistic."""
+
+    __slots__ = ('columns', '_positions')
+
+    def __init__(self, columns: Dict[str, np.ndarray],
+                 loaders: Optional[Dict[str, Callable[[], np.ndarray]]] = None):
+        """
+        Args:
+            columns: Column arrays by statistic name
+            loaders: Functions building further columns (such as the nested
+                values of a stored profile) when they are first indexed
+        """
+        self.columns = _Columns(columns, loaders) if loaders else columns
+        self._positions = None
+
+    @classmethod
+    def from_records(cls, analyses: Iterable[Dict[str, Any]]) -> 'FieldTable':
+        """Build from ``analyze_field`` dictionaries (a profile's ``field_analyses``)."""
+        analyses = list(analyses)
+        values = {
+            name: [analysis.get(name) for analysis in analyses]
+            for name in COUNT_COLUMNS + FLOAT_COLUMNS + LABEL_COLUMNS
+        }
+        for name in ('top_values', 'identifiers'):
+            values[name] = [analysis.get(name) or None for analysis in analyses]
+        values['extra'] = [
+            {key: value for key, value in analysis.items() if key not in _KNOWN_KEYS} or None
+            for analysis in analyses
+        ]
+        return cls.from_columns(values)
+
+    @classmethod
+    def from_columns(cls, values: Dict[str, List[Any]],
+                     loaders: Optional[Dict[str, Callable[[], np.ndarray]]] = None) -> 'FieldTable':
+        """
+        Build from one list of values per statistic, None where missing (such as a SQL scan).
+
+        Args:
+            values: Lists for every count, float and label column, and for
+                the nested-value columns not given in ``loaders``
+            loaders: Functions building nested-value columns on first access
+        """
+        columns = {}
+        for name in COUNT_COLUMNS:
+            counts = _float_column(values[name])
+            columns[name] = np.where(np.isnan(counts), -1, counts).astype(np.int64)
+        for name in FLOAT_COLUMNS:
+            columns[name] = _float_column(values[name])
+        for name in LABEL_COLUMNS:
+            columns[name] = object_column(values[name])
+        columns['field_name'] = object_column([name or '' for name in values['field_name']])
+        for name in OBJECT_COLUMNS:
+            if name in values:
+                columns[name] = object_column(values[name])
+        return cls(columns, loaders)
+
+    @classmethod
+    def concat(cls, tables: List['FieldTable']) -> 'FieldTable':
+        """Fields of several tables, in order; nested-value columns are joined on first access."""
+        if not tables:
+            return cls.from_records([])
+
+        def joined(name):
+            return lambda: np.concatenate([table.columns[name] for table in tables])
+
+        return cls(
+            {name: joined(name)() for name in COUNT_COLUMNS + FLOAT_COLUMNS + LABEL_COLUMNS},
+            {name: joined(name) for name in OBJECT_COLUMNS},
+        )
+
+    def take(self, positions: Iterable[int]) -> 'FieldTable':
+        """Table of the fields at these positions; nested-value columns are taken on first access."""
+        positions = np.asarray(list(positions), dtype=np.int64)
+
+        def taken(name):
+            return lambda: self.columns[name][positions]
+
+        return FieldTable(
+            {name: self.columns[name][positions] for name in COUNT_COLUMNS + FLOAT_COLUMNS + LABEL_COLUMNS},
+            {name: taken(name) for name in OBJECT_COLUMNS},
+        )
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[FieldProfile]) -> 'FieldTable':
+        """Build from ``FieldProfile`` records."""
+        return cls.from_records(profile.to_dict() for profile in profiles)
+
+    def __len__(self) -> int:
+        return len(self.columns['field_name'])
+
+    def __getitem__(self, position: int) -> FieldProfile:
+        columns = self.columns
+        counts = {name: int(columns[name][position]) for name in COUNT_COLUMNS}
+        values = {name: float(columns[name][position]) for name in FLOAT_COLUMNS}
+        return FieldProfile(
+            **{name: columns[name][position] for name in LABEL_COLUMNS},
+            **{name: None if count < 0 else count for name, count in counts.items()},
+            **{name: None if np.isnan(value) else value for name, value in values.items()},
+            top_values=columns['top_values'][position] or [],
+            identifiers=columns['identifiers'][position] or [],
+            extra=columns['extra'][position] or {},
+        )
+
+    def __iter__(self) -> Iterator[FieldProfile]:
+        # Columns converted to lists once, instead of indexing NumPy scalars per field
+        columns = self.columns
+        counts = [[None if c < 0 else c for c in columns[name].tolist()] for name in COUNT_COLUMNS]
+        values = [[None if v != v else v for v in columns[name].tolist()] for name in FLOAT_COLUMNS]
+        labels = [columns[name].tolist() for name in LABEL_COLUMNS]
+        nested = [columns[name].tolist() for name in OBJECT_COLUMNS]
+        for row in zip(*labels, *counts, *values, *nested):
+            top_values, identifiers, extra = row[-3:]
+            yield FieldProfile(*row[:-3], top_values or [], identifiers or [], extra or {})
+
+    @property
+    def names(self) -> np.ndarray:
+        return self.columns['field_name']
+
+    def field(self, name: str) -> Optional[FieldProfile]:
+        """Profile of the first field with this name, or None."""
+        if self._positions is None:
+            self._positions = {}
+            for position, field_name in enumerate(self.names):
+                self._positions.setdefault(field_name, position)
+        position = self._positions.get(name)
+        return None if position is None else self[position]
+
+    def label_counts(self, column: str, missing: str = 'unknown') -> Dict[str, int]:
+        """Number of fields per value of a label column, in order of first appearance."""
+        if not len(self):
+            return {}
+        labels = np.array([missing if label is None else str(label) for label in self.columns[column]])
+        values, first, counts = np.unique(labels, return_index=True, return_counts=True)
+        order = np.argsort(first)
+        return {str(values[i]): int(counts[i]) for i in order}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Field analyses as dictionaries of the statistics that are present."""
+        return [profile.to_dict() for profile in self]
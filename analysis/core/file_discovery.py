@@ -1,61 +1,51 @@
 """File discovery utilities for finding data files."""
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
+from .inventory import scan_inventory
 
-def discover_files(base_path: str = "data/sources") -> List[Dict[str, str]]:
+
+def discover_files(base_path: str = "data/sources", cache_path: Optional[Path] = None) -> List[Dict[str, str]]:
     """
     Discover all analyzable files in the data sources directory.
 
+    File types come from the file inventory (extension inside any
+    compression suffix, or sniffed content), so ``.gz`` files are recognized
+    by their gzip magic bytes.
+
+    Args:
+        base_path: Data sources directory
+        cache_path: Pickled inventory to reuse, so unchanged directories are not re-listed
+
     Returns list of dicts with:
     - source: Source name (gencc, clingen, etc.)
     - filepath: Full path to file
-    - filetype: tsv, csv, json, xml, etc.
+    - filetype: tabular, json or xml
+    - extension: Last file suffix (e.g. .gz)
+    - compression: gzip, bgzf, bzip2, zip or None
     """
     base = Path(base_path)
     files = []
 
-    # File extensions to analyze
-    tabular_exts = {'.tsv', '.csv', '.txt'}
-    json_exts = {'.json'}
-    xml_exts = {'.xml'}
+    for entry in scan_inventory(base, cache_path=cache_path):
+        filepath = Path(entry['path'])
+        relative_parts = filepath.relative_to(base).parts
+
+        # Only files inside a source directory
+        if len(relative_parts) < 2 or not entry['filetype']:
+            continue
 
-    for source_dir in base.iterdir():
-        if not source_dir.is_dir():
+        # Skip hidden files and manifests
+        if filepath.name.startswith('.') or filepath.name == 'manifest.json':
             continue
 
-        source_name = source_dir.name
-
-        # Recursively find files
-        for filepath in source_dir.rglob('*'):
-            if not filepath.is_file():
-                continue
-
-            # Skip hidden files and manifests
-            if filepath.name.startswith('.') or filepath.name == 'manifest.json':
-                continue
-
-            # Determine file type
-            suffix = filepath.suffix.lower()
-            if suffix == '.gz':
-                # Check the extension before .gz
-                suffix = '.' + filepath.stem.split('.')[-1] if '.' in filepath.stem else suffix
-
-            filetype = None
-            if suffix in tabular_exts:
-                filetype = 'tabular'
-            elif suffix in json_exts:
-                filetype = 'json'
-            elif suffix in xml_exts:
-                filetype = 'xml'
-
-            if filetype:
-                files.append({
-                    'source': source_name,
-                    'filepath': str(filepath),
-                    'filetype': filetype,
-                    'extension': filepath.suffix,
-                })
+        files.append({
+            'source': relative_parts[0],
+            'filepath': str(filepath),
+            'filetype': entry['filetype'],
+            'extension': filepath.suffix,
+            'compression': entry['compression'],
+        })
 
     return files
@@ -0,0 +1,205 @@
+"""Local HGNC identifier resolution.
+
+Resolves gene symbols, aliases, previous symbols, HGNC IDs, Entrez IDs and
+Ensembl gene IDs to the approved HGNC record, using the HGNC complete set TSV
+(``hgnc_complete_set.txt`` from genenames.org) and no network access.
+
+Exact lookups use dictionaries keyed by upper-cased identifiers; prefix search
+uses a sorted key array (a flattened trie) searched with ``bisect``. Built
+indexes are pickled next to the TSV so later runs start without re-parsing it.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .pickle_cache import cache_signature, read_pickle_cache, write_pickle_cache
+
+
+HGNC_COLUMNS = ['hgnc_id', 'symbol', 'alias_symbol', 'prev_symbol', 'entrez_id', 'ensembl_gene_id']
+
+# Lookup order: unambiguous identifiers first, then previous symbols and aliases
+MATCH_ORDER = ['hgnc_id', 'symbol', 'entrez_id', 'ensembl_gene_id', 'prev_symbol', 'alias_symbol']
+
+CACHE_SUFFIX = '.pkl'
+CACHE_VERSION = 1
+DEFAULT_CACHE_SIZE = 65536
+
+
+def _normalize(value: str) -> str:
+    """Upper-case, strip, and drop Ensembl version suffixes."""
+    value = value.strip().upper()
+    if value.startswith('ENSG') and '.' in value:
+        return value.split('.')[0]
+    return value
+
+
+class HgncResolver:
+    """In-memory HGNC identifier indexes with a vectorized ``resolve``."""
+
+    def __init__(self, records: List[Tuple[str, str]], indexes: Dict[str, Dict[str, List[int]]],
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            records: (HGNC ID, approved symbol) per gene
+            indexes: Per identifier type, normalized key -> record positions
+            cache_size: Size of the LRU cache of single lookups
+        """
+        self.records = records
+        self.indexes = indexes
+        self._sorted_keys = sorted(
+            (key, kind) for kind in ('symbol', 'prev_symbol', 'alias_symbol')
+            for key in indexes.get(kind, {})
+        )
+        self._cache_size = cache_size
+        self._lookup = lru_cache(maxsize=cache_size)(self._lookup_uncached)
+
+    @classmethod
+    def from_tsv(cls, tsv_path: Path, cache_size: int = DEFAULT_CACHE_SIZE) -> 'HgncResolver':
+        """
+        Build the indexes from an HGNC complete set TSV.
+
+        Multi-valued columns (aliases, previous symbols) are ``|``-separated.
+        """
+        df = pd.read_csv(
+            tsv_path,
+            sep='\t',
+            dtype=str,
+            usecols=lambda column: column in HGNC_COLUMNS,
+            keep_default_na=False,
+        )
+        missing = {'hgnc_id', 'symbol'} - set(df.columns)
+        if missing:
+            raise ValueError(f"{tsv_path} is not an HGNC complete set (missing {', '.join(sorted(missing))})")
+
+        records = list(zip(df['hgnc_id'], df['symbol']))
+        indexes = {kind: {} for kind in MATCH_ORDER}
+        for kind in MATCH_ORDER:
+            if kind not in df.columns:
+                continue
+            index = indexes[kind]
+            for position, cell in enumerate(df[kind]):
+                for value in cell.strip('"').split('|'):
+                    if value.strip():
+                        index.setdefault(_normalize(value), []).append(position)
+
+        return cls(records, indexes, cache_size)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _lookup_uncached(self, key: str) -> Tuple[Optional[int], str]:
+        for kind in MATCH_ORDER:
+            positions = self.indexes[kind].get(key)
+            if positions:
+                distinct = sorted(set(positions))
+                if len(distinct) == 1:
+                    return distinct[0], kind
+                return None, 'ambiguous'
+        return None, 'unresolved'
+
+    def resolve_one(self, value: str) -> Dict[str, Optional[str]]:
+        """
+        Resolve a single identifier.
+
+        Returns:
+            Dict with input, hgnc_id, symbol and match_type (the index that
+            matched, ``ambiguous`` or ``unresolved``)
+        """
+        position, match_type = self._lookup(_normalize(value)) if value else (None, 'unresolved')
+        hgnc_id, symbol = self.records[position] if position is not None else (None, None)
+        return {'input': value, 'hgnc_id': hgnc_id, 'symbol': symbol, 'match_type': match_type}
+
+    def resolve(self, values) -> pd.DataFrame:
+        """
+        Resolve an array of identifiers.
+
+        Each distinct value is looked up once; results are broadcast back.
+
+        Args:
+            values: List, NumPy array or Series of strings (nulls allowed)
+
+        Returns:
+            DataFrame with input, hgnc_id, symbol and match_type per value
+        """
+        series = pd.Series(values, dtype=object)
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+
+        positions = []
+        match_types = []
+        for value in uniques:
+            position, match_type = self._lookup(_normalize(str(value)))
+            positions.append(position)
+            match_types.append(match_type)
+
+        hgnc_ids = [self.records[p][0] if p is not None else None for p in positions] + [None]
+        symbols = [self.records[p][1] if p is not None else None for p in positions] + [None]
+        match_types.append('unresolved')
+
+        # Null inputs have code -1, which picks the trailing "unresolved" entry
+        return pd.DataFrame({
+            'input': series.to_numpy(),
+            'hgnc_id': np.array(hgnc_ids, dtype=object)[codes],
+            'symbol': np.array(symbols, dtype=object)[codes],
+            'match_type': np.array(match_types, dtype=object)[codes],
+        })
+
+    def search_prefix(self, prefix: str, limit: int = 20) -> List[Dict[str, str]]:
+        """
+        Find symbols, previous symbols and aliases starting with ``prefix``.
+
+        Returns:
+            Up to ``limit`` dicts with the matched key, its kind, and the HGNC
+            ID and approved symbol it points to
+        """
+        prefix = _normalize(prefix)
+        start = bisect_left(self._sorted_keys, (prefix, ''))
+        matches = []
+        for key, kind in self._sorted_keys[start:]:
+            if not key.startswith(prefix) or len(matches) >= limit:
+                break
+            for position in sorted(set(self.indexes[kind][key])):
+                hgnc_id, symbol = self.records[position]
+                matches.append({'key': key, 'kind': kind, 'hgnc_id': hgnc_id, 'symbol': symbol})
+        return matches[:limit]
+
+    def cache_info(self):
+        """Statistics of the single-lookup LRU cache."""
+        return self._lookup.cache_info()
+
+
+def default_cache_path(tsv_path: Path) -> Path:
+    """Return the conventional pickled index location next to the TSV."""
+    tsv_path = Path(tsv_path)
+    return tsv_path.with_name(tsv_path.name + CACHE_SUFFIX)
+
+
+def load_hgnc_resolver(tsv_path: Path, cache_path: Optional[Path] = None,
+                       cache_size: int = DEFAULT_CACHE_SIZE) -> HgncResolver:
+    """
+    Load the resolver from its pickled index, rebuilding it if the TSV changed.
+
+    Args:
+        tsv_path: HGNC complete set TSV
+        cache_path: Pickled index path (default: ``<tsv_path>.pkl``)
+        cache_size: Size of the LRU cache of single lookups
+
+    Returns:
+        Ready-to-use resolver
+    """
+    tsv_path = Path(tsv_path)
+    cache_path = Path(cache_path) if cache_path else default_cache_path(tsv_path)
+    signature = cache_signature(tsv_path, CACHE_VERSION)
+
+    cached = read_pickle_cache(cache_path, signature)
+    if cached is not None:
+        records, indexes = cached
+        return HgncResolver(records, indexes, cache_size)
+
+    resolver = HgncResolver.from_tsv(tsv_path, cache_size)
+    write_pickle_cache(cache_path, signature, (resolver.records, resolver.indexes))
+    return resolver
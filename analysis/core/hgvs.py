@@ -0,0 +1,233 @@
+"""Vectorized HGVS parsing into structured variant components.
+
+Splits expressions such as ``NM_000059.4(BRCA2):c.68-7T>A``,
+``NC_000017.11:g.43045705C>T`` or a bare MAF ``HGVSc`` value ``c.35G>A``
+into reference accession, version, gene, coordinate type, start/end positions
+(with intronic offsets and 3' UTR ``*`` markers) and the edit.
+
+Parsing runs as three Arrow ``extract_regex`` passes over the whole array
+(prefix, positions, edit), so NumPy, Arrow and pandas string arrays are parsed
+without a Python loop. Rows that do not parse keep null components and get an error
+code naming the stage that failed.
+"""
+
+from typing import Dict, Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# Error codes (stored as int8 in ``error_code``)
+HGVS_ERROR_CODES = {
+    'ok': 0,
+    'empty': 1,
+    'no_coordinate_type': 2,
+    'unsupported': 3,
+    'bad_position': 4,
+    'bad_edit': 5,
+}
+HGVS_ERRORS = {code: name for name, code in HGVS_ERROR_CODES.items()}
+
+NUCLEOTIDE_TYPES = ['c', 'g', 'm', 'n', 'r']
+
+_PREFIX = (
+    r'^(?:(?P<reference>[A-Z]{1,6}_?\d+)(?:\.(?P<version>\d+))?(?:\((?P<gene>[^()]+)\))?:)?'
+    r'(?P<coordinate_type>[cgmnrp])\.(?P<body>\S+)(?:\s+\(p\.[^)]*\))?$'
+)
+_POSITIONS = (
+    r'^(?P<start_utr3>\*)?(?P<start>-?\d+)(?P<start_offset>[+-]\d+)?'
+    r'(?:_(?P<end_utr3>\*)?(?P<end>-?\d+)(?P<end_offset>[+-]\d+)?)?(?P<edit>\D.*)$'
+)
+_EDIT = (
+    r'^(?:(?P<sub_ref>[ACGTUN]+)>(?P<sub_alt>[ACGTUN]+)'
+    r'|(?P<operation>delins|del|dup|ins|inv|=)(?P<sequence>[ACGTUN]*))$'
+)
+
+# Uncertain positions, alleles and protein descriptions are not parsed
+_UNSUPPORTED = r'[?\[\]()]'
+
+
+def _to_arrow(values) -> pa.Array:
+    """Convert a list, NumPy array, Series or Arrow array to an Arrow string array."""
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if isinstance(values, pa.Array):
+        return values.cast(pa.string())
+    if isinstance(values, pd.Series):
+        values = values.to_numpy(dtype=object)
+    return pa.array(values, type=pa.string(), from_pandas=True)
+
+
+def _group(struct: pa.Array, name: str) -> pa.Array:
+    """A named group of ``extract_regex`` output, null where it did not take part."""
+    field = pc.struct_field(struct, name)
+    return pc.if_else(pc.equal(field, ''), pa.scalar(None, pa.string()), field)
+
+
+def _mask(condition: pa.Array) -> np.ndarray:
+    return condition.fill_null(False).to_numpy(zero_copy_only=False)
+
+
+def _integers(values: pa.Array) -> pd.Series:
+    """Signed decimal strings to a nullable ``Int64`` Series."""
+    return pd.Series(pc.cast(pc.replace_substring(values, '+', ''), pa.int64()).to_pandas(), dtype='Int64')
+
+
+def _strings(values: pa.Array, keep: np.ndarray) -> pd.Series:
+    """Arrow-backed string Series, null outside ``keep``."""
+    return pd.Series(pd.arrays.ArrowStringArray(pc.if_else(pa.array(keep), values, pa.scalar(None, pa.string()))))
+
+
+def parse_hgvs(values) -> pd.DataFrame:
+    """
+    Parse HGVS expressions into components.
+
+    Args:
+        values: List, NumPy array, pyarrow (Chunked)Array or Series of strings
+
+    Returns:
+        DataFrame with one row per input: reference, version, gene,
+        coordinate_type, start, start_offset, start_utr3, end, end_offset,
+        end_utr3, edit_type (sub, del, dup, ins, delins, inv, identity), ref,
+        alt, error (categorical name) and error_code (int8). String columns
+        are Arrow-backed and null where the row did not parse; single-position
+        edits have ``end == start``.
+    """
+    text = pc.utf8_trim_whitespace(_to_arrow(values))
+
+    prefix = pc.extract_regex(text, _PREFIX)
+    coordinate_type = _group(prefix, 'coordinate_type')
+    body = _group(prefix, 'body')
+    positions = pc.extract_regex(body, _POSITIONS)
+    edit = pc.extract_regex(_group(positions, 'edit'), '(?i)' + _EDIT)
+
+    sub_ref = pc.utf8_upper(_group(edit, 'sub_ref'))
+    operation = pc.if_else(
+        pc.is_valid(sub_ref), 'sub', pc.replace_substring(pc.utf8_lower(_group(edit, 'operation')), '=', 'identity'))
+    sequence = pc.utf8_upper(_group(edit, 'sequence'))
+    has_range = _mask(pc.is_valid(_group(positions, 'end')))
+    operation_np = operation.to_numpy(zero_copy_only=False)
+    no_sequence = ~_mask(pc.is_valid(sequence))
+
+    # The first failing stage names the error
+    error_code = np.select(
+        [
+            ~_mask(pc.greater(pc.utf8_length(text), 0)),
+            ~_mask(pc.is_valid(coordinate_type)),
+            _mask(pc.equal(coordinate_type, 'p')) | _mask(pc.match_substring_regex(body, _UNSUPPORTED)),
+            ~_mask(pc.is_valid(positions)),
+            pd.isna(operation_np)
+            | (np.isin(operation_np, ['ins', 'delins']) & no_sequence)
+            | ((operation_np == 'ins') & ~has_range)
+            | ((operation_np == 'sub') & has_range),
+        ],
+        [HGVS_ERROR_CODES[name] for name in ('empty', 'no_coordinate_type', 'unsupported', 'bad_position', 'bad_edit')],
+        HGVS_ERROR_CODES['ok'],
+    ).astype(np.int8)
+    ok = error_code == 0
+
+    start = _integers(_group(positions, 'start')).where(ok)
+    end = _integers(_group(positions, 'end')).where(has_range, start).where(ok)
+    start_offset = _integers(_group(positions, 'start_offset')).fillna(0)
+    end_offset = _integers(_group(positions, 'end_offset')).fillna(0).where(has_range, start_offset)
+    start_utr3 = _mask(pc.is_valid(_group(positions, 'start_utr3')))
+    end_utr3 = np.where(has_range, _mask(pc.is_valid(_group(positions, 'end_utr3'))), start_utr3)
+
+    ref = pc.if_else(pc.is_valid(sub_ref), sub_ref,
+                     pc.if_else(pc.is_in(operation, pa.array(['del', 'dup'])), sequence, pa.scalar(None, pa.string())))
+    alt = pc.if_else(pc.is_valid(sub_ref), pc.utf8_upper(_group(edit, 'sub_alt')),
+                     pc.if_else(pc.is_in(operation, pa.array(['ins', 'delins'])), sequence, pa.scalar(None, pa.string())))
+
+    return pd.DataFrame({
+        'reference': _strings(_group(prefix, 'reference'), ok),
+        'version': _integers(_group(prefix, 'version')).where(ok),
+        'gene': _strings(_group(prefix, 'gene'), ok),
+        'coordinate_type': _strings(coordinate_type, ok),
+        'start': start,
+        'start_offset': start_offset.where(ok),
+        'start_utr3': start_utr3 & ok,
+        'end': end,
+        'end_offset': end_offset.where(ok),
+        'end_utr3': end_utr3 & ok,
+        'edit_type': _strings(operation, ok),
+        'ref': _strings(ref, ok),
+        'alt': _strings(alt, ok),
+        'error': pd.Categorical.from_codes(error_code, [HGVS_ERRORS[code] for code in sorted(HGVS_ERRORS)]),
+        'error_code': error_code,
+    })
+
+
+def _text(values: pd.Series) -> pa.Array:
+    """Series to an Arrow string array with nulls as empty strings."""
+    return pc.cast(pa.array(values, from_pandas=True), pa.string()).fill_null('')
+
+
+def _format_position(position: pd.Series, offset: pd.Series, utr3: pd.Series) -> pa.Array:
+    offsets = _text(offset.where(offset != 0))
+    sign = pc.if_else(_mask(pc.greater(pc.cast(offset.fillna(0).to_numpy(), pa.int64()), 0)), '+', '')
+    return pc.binary_join_element_wise(
+        pc.if_else(utr3.to_numpy(), '*', ''), _text(position), sign, offsets, '')
+
+
+def hgvs_keys(parsed: pd.DataFrame, include_version: bool = False) -> pd.Series:
+    """
+    Render parsed components as canonical expressions for indexing and joins.
+
+    Gene names and protein consequences are dropped, and the accession
+    version is omitted unless ``include_version`` is set, so ClinVar
+    ``NM_000059.4(BRCA2):c.68-7T>A`` and ``NM_000059.3:c.68-7T>A`` share the
+    key ``NM_000059:c.68-7T>A``. Rows that did not parse get null keys.
+
+    Args:
+        parsed: Result of ``parse_hgvs``
+        include_version: Keep the ``.version`` suffix of the accession
+
+    Returns:
+        Series of keys aligned with ``parsed``
+    """
+    reference = _text(parsed['reference'])
+    if include_version:
+        version = _text(parsed['version'])
+        reference = pc.binary_join_element_wise(
+            reference, pc.if_else(pc.equal(version, ''), '', '.'), version, '')
+    reference = pc.binary_join_element_wise(reference, pc.if_else(pc.equal(reference, ''), '', ':'), '')
+
+    start = _format_position(parsed['start'], parsed['start_offset'], parsed['start_utr3'])
+    end = _format_position(parsed['end'], parsed['end_offset'], parsed['end_utr3'])
+    edit_type = _text(parsed['edit_type'])
+    is_range = pc.or_(pc.not_equal(start, end), pc.equal(edit_type, 'ins'))
+    positions = pc.if_else(is_range, pc.binary_join_element_wise(start, '_', end, ''), start)
+
+    ref = _text(parsed['ref'])
+    alt = _text(parsed['alt'])
+    edit = pc.case_when(
+        pc.make_struct(pc.equal(edit_type, 'sub'), pc.equal(edit_type, 'identity')),
+        pc.binary_join_element_wise(ref, '>', alt, ''),
+        pa.scalar('='),
+        pc.binary_join_element_wise(edit_type, alt, ''),
+    )
+
+    keys = pc.binary_join_element_wise(reference, _text(parsed['coordinate_type']), '.', positions, edit, '')
+    keys = pc.if_else(pa.array(parsed['error_code'].to_numpy() == 0), keys, pa.scalar(None, pa.string()))
+    return pd.Series(keys.to_numpy(zero_copy_only=False), index=parsed.index, dtype=object)
+
+
+def summarize_hgvs(series: pd.Series) -> Dict[str, Any]:
+    """
+    Summarize how the values of an HGVS column parse, for field profiles.
+
+    Returns:
+        Dictionary with the parsed fraction and counts per coordinate type,
+        edit type and error
+    """
+    values = series.dropna()
+    parsed = parse_hgvs(values.to_numpy(dtype=object))
+    ok = parsed['error_code'] == 0
+    return {
+        'parsed_fraction': float(ok.mean()) if len(parsed) else 0.0,
+        'coordinate_types': parsed.loc[ok, 'coordinate_type'].value_counts().to_dict(),
+        'edit_types': parsed.loc[ok, 'edit_type'].value_counts().to_dict(),
+        'errors': {name: count for name, count in parsed.loc[~ok, 'error'].value_counts().items() if count},
+    }
@@ -0,0 +1,217 @@
+"""Cached inventory of the files below a data directory.
+
+Walks the tree breadth-first with ``os.scandir`` on a thread pool (one task
+per directory, so wide trees such as TCGA's per-case UUID directories are
+listed concurrently) and detects each file's type from its leading bytes:
+gzip, BGZF, bzip2 and zip compression are recognized by their magic numbers
+regardless of the file name, and the content type comes from the extension
+inside any compression suffix, or is sniffed from the (decompressed) first
+bytes when the name has no extension.
+
+The inventory is pickled together with each directory's modification time.
+A later scan re-lists only directories whose mtime changed (files were
+added, removed or renamed in them) and reads leading bytes only of files whose
+size, mtime or inode changed. Files rewritten in place without a rename do
+not change their directory's mtime; use ``refresh=True`` to re-stat everything.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import bz2
+import os
+import pickle
+import zlib
+
+CACHE_VERSION = 1
+DEFAULT_WORKERS = 16
+SNIFF_BYTES = 4096
+
+TABULAR_EXTENSIONS = {'.tsv', '.csv', '.txt'}
+JSON_EXTENSIONS = {'.json'}
+XML_EXTENSIONS = {'.xml'}
+COMPRESSION_EXTENSIONS = {'.gz', '.bgz', '.bz2', '.zip'}
+
+_MAGIC = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bzip2'),
+    (b'PK\x03\x04', 'zip'),
+]
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """Compression named by the leading bytes (``bgzf`` is a gzip variant), or None."""
+    for magic, compression in _MAGIC:
+        if head.startswith(magic):
+            # BGZF: gzip member with the FEXTRA flag and a 'BC' subfield
+            if compression == 'gzip' and len(head) >= 14 and head[3] & 4 and head[12:14] == b'BC':
+                return 'bgzf'
+            return compression
+    return None
+
+
+def _decompressed_head(head: bytes, compression: Optional[str]) -> Optional[bytes]:
+    """First bytes of the decompressed content, if they can be read from ``head``."""
+    try:
+        if compression in ('gzip', 'bgzf'):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head, SNIFF_BYTES)
+        if compression == 'bzip2':
+            return bz2.BZ2Decompressor().decompress(head, SNIFF_BYTES)
+    except (zlib.error, OSError, EOFError):
+        return None
+    return head if compression is None else None
+
+
+def _sniff(content: Optional[bytes]) -> Optional[str]:
+    """File type of extension-less content: xml, json, tabular or None."""
+    if not content or b'\x00' in content:
+        return None
+    text = content.lstrip(b'\xef\xbb\xbf \t\r\n')
+    if text.startswith(b'<'):
+        return 'xml'
+    if text[:1] in (b'{', b'['):
+        return 'json'
+    first_line = text.split(b'\n', 1)[0]
+    if b'\t' in first_line or b',' in first_line:
+        try:
+            first_line.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+        return 'tabular'
+    return None
+
+
+def detect_file_type(path: Path, head: Optional[bytes] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Detect the content type and compression of a file.
+
+    Args:
+        path: File path
+        head: Leading bytes, if already read
+
+    Returns:
+        (filetype, compression): filetype is ``tabular``, ``json``, ``xml`` or
+        None; compression is ``gzip``, ``bgzf``, ``bzip2``, ``zip`` or None
+    """
+    path = Path(path)
+    if head is None:
+        with open(path, 'rb') as f:
+            head = f.read(SNIFF_BYTES)
+    compression = detect_compression(head)
+
+    # Extension inside compression suffixes: data.txt.gz -> .txt
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    while suffixes and suffixes[-1] in COMPRESSION_EXTENSIONS:
+        suffixes.pop()
+    suffix = suffixes[-1] if suffixes else ''
+
+    if suffix in TABULAR_EXTENSIONS:
+        return 'tabular', compression
+    if suffix in JSON_EXTENSIONS:
+        return 'json', compression
+    if suffix in XML_EXTENSIONS:
+        return 'xml', compression
+    if suffix and not suffix[1:].isdigit():
+        # Known non-data extension (.md, .pdf, .png, ...); version-like suffixes are sniffed
+        return None, compression
+    return _sniff(_decompressed_head(head, compression)), compression
+
+
+def _scan_directory(dirpath: str, cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    List one directory, reusing the cached listing if the directory is unchanged.
+
+    Returns:
+        Dictionary with the directory ``mtime_ns``, ``subdirs`` and ``files``
+        (name -> (size, mtime_ns, inode, filetype, compression))
+    """
+    mtime_ns = os.stat(dirpath).st_mtime_ns
+    if cached is not None and cached['mtime_ns'] == mtime_ns:
+        return cached
+
+    previous_files = cached['files'] if cached else {}
+    subdirs, files = [], {}
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.name)
+                continue
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            key = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            previous = previous_files.get(entry.name)
+            if previous is not None and previous[:3] == key:
+                files[entry.name] = previous
+                continue
+            try:
+                filetype, compression = detect_file_type(Path(entry.path))
+            except OSError:
+                filetype, compression = None, None
+            files[entry.name] = (*key, filetype, compression)
+
+    return {'mtime_ns': mtime_ns, 'subdirs': sorted(subdirs), 'files': files}
+
+
+def scan_inventory(base_path: Path, cache_path: Optional[Path] = None,
+                   workers: int = DEFAULT_WORKERS, refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Inventory every file below ``base_path``.
+
+    Args:
+        base_path: Directory to walk (e.g., data/sources)
+        cache_path: Pickled inventory to reuse and update (default: not persisted)
+        workers: Directories listed concurrently
+        refresh: Ignore the cached listings and re-stat every directory
+
+    Returns:
+        One dict per file, sorted by path: path, size, mtime_ns, inode,
+        filetype and compression
+    """
+    base_path = Path(base_path)
+    if not base_path.is_dir():
+        return []
+    root = str(base_path)
+
+    directories = {}
+    if cache_path and Path(cache_path).exists() and not refresh:
+        try:
+            with open(cache_path, 'rb') as f:
+                version, cached_root, directories = pickle.load(f)
+            if (version, cached_root) != (CACHE_VERSION, root):
+                directories = {}
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            directories = {}
+
+    scanned = {}
+    pending = [root]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending:
+            listings = list(executor.map(lambda d: _scan_directory(d, directories.get(d)), pending))
+            next_level = []
+            for dirpath, listing in zip(pending, listings):
+                scanned[dirpath] = listing
+                next_level.extend(os.path.join(dirpath, name) for name in listing['subdirs'])
+            pending = next_level
+
+    if cache_path:
+        cache_path = Path(cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((CACHE_VERSION, root, scanned), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+
+    inventory = []
+    for dirpath, listing in scanned.items():
+        for name, (size, mtime_ns, inode, filetype, compression) in listing['files'].items():
+            inventory.append({
+                'path': os.path.join(dirpath, name),
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'inode': inode,
+                'filetype': filetype,
+                'compression': compression,
+            })
+    inventory.sort(key=lambda entry: entry['path'])
+    return inventory
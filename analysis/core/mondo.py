@@ -0,0 +1,283 @@
+"""Local disease-name matching against MONDO labels and synonyms.
+
+Free-text disease names ("Breast carcinoma", "carcinoma of the breast") are
+normalized to lower-case ASCII tokens without stop words. A name whose
+normalized form equals a MONDO label or exact synonym matches directly;
+otherwise candidates are blocked with an inverted token index (only labels
+sharing a reasonably specific token are considered) and scored in one
+vectorized call with rapidfuzz's ``token_sort_ratio`` (rapidfuzz >= 3.6 for
+``process.cpdist``).
+
+The MONDO file is either the OBO release (``mondo.obo``) or a TSV with
+``id``, ``label`` and ``|``-separated ``synonyms`` columns. Parsed terms are
+pickled next to the file so later runs start without re-parsing it.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+
+from .pickle_cache import cache_signature, read_pickle_cache, write_pickle_cache
+
+
+STOPWORDS = {'a', 'an', 'and', 'by', 'due', 'for', 'in', 'of', 'or', 's', 'the', 'to', 'with'}
+SYNONYM_SCOPES = ('EXACT',)
+
+DEFAULT_MIN_SCORE = 85.0
+DEFAULT_MAX_CANDIDATES = 50
+# Tokens shared by more entries than this ("syndrome", "disease") do not block
+DEFAULT_MAX_POSTINGS = 2000
+
+CACHE_SUFFIX = '.pkl'
+CACHE_VERSION = 1
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_SYNONYM = re.compile(r'^synonym: "((?:[^"\\]|\\.)*)" (\w+)')
+
+
+def disease_tokens(name: str) -> List[str]:
+    """Lower-case ASCII tokens of a disease name, without stop words."""
+    text = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().lower()
+    return [token for token in _TOKEN.findall(text) if token not in STOPWORDS]
+
+
+def normalize_disease_name(name: str) -> str:
+    """Normalized form used for exact matching and scoring."""
+    return ' '.join(disease_tokens(name))
+
+
+def parse_mondo_obo(obo_path: Path, synonym_scopes=SYNONYM_SCOPES) -> List[Tuple[str, str, List[str]]]:
+    """
+    Read (MONDO ID, label, synonyms) of every non-obsolete term of an OBO file.
+
+    Args:
+        obo_path: MONDO OBO release
+        synonym_scopes: Synonym scopes to keep (``EXACT`` by default)
+    """
+    terms = []
+    term = None
+
+    def flush():
+        if term and term.get('id', '').startswith('MONDO:') and term.get('name') and not term.get('obsolete'):
+            terms.append((term['id'], term['name'], term['synonyms']))
+
+    with open(obo_path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line.startswith('['):
+                flush()
+                term = {'synonyms': []} if line == '[Term]' else None
+            elif term is None:
+                continue
+            elif line.startswith('id: '):
+                term['id'] = line[4:].strip()
+            elif line.startswith('name: '):
+                term['name'] = line[6:].strip()
+            elif line.startswith('is_obsolete: true'):
+                term['obsolete'] = True
+            elif line.startswith('synonym: '):
+                match = _SYNONYM.match(line)
+                if match and match.group(2) in synonym_scopes:
+                    term['synonyms'].append(match.group(1).replace('\\"', '"'))
+    flush()
+
+    return terms
+
+
+def parse_mondo_tsv(tsv_path: Path) -> List[Tuple[str, str, List[str]]]:
+    """Read (MONDO ID, label, synonyms) from an ``id``/``label``/``synonyms`` TSV."""
+    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False)
+    missing = {'id', 'label'} - set(df.columns)
+    if missing:
+        raise ValueError(f"{tsv_path} is not a MONDO label file (missing {', '.join(sorted(missing))})")
+
+    synonyms = df['synonyms'] if 'synonyms' in df.columns else pd.Series([''] * len(df))
+    return [
+        (term_id, label, [s.strip() for s in cell.split('|') if s.strip()])
+        for term_id, label, cell in zip(df['id'], df['label'], synonyms)
+    ]
+
+
+def _pairwise_scores(queries: List[str], candidates: List[str]) -> np.ndarray:
+    """Token-sort similarity (0-100) of aligned query/candidate pairs."""
+    if not queries:
+        return np.zeros(0)
+    return process.cpdist(queries, candidates, scorer=fuzz.token_sort_ratio, workers=-1).astype(np.float64)
+
+
+class MondoMatcher:
+    """Exact and blocked fuzzy matching of disease names to MONDO terms."""
+
+    def __init__(self, terms: List[Tuple[str, str, List[str]]],
+                 max_postings: int = DEFAULT_MAX_POSTINGS):
+        """
+        Args:
+            terms: (MONDO ID, label, synonyms) per term
+            max_postings: Tokens in more entries than this are not used for
+                blocking unless a name has no more specific token
+        """
+        self.terms = [(term_id, label) for term_id, label, _ in terms]
+        self.max_postings = max_postings
+
+        # One entry per normalized label or synonym; labels come first
+        entry_text, entry_term, entry_synonym = [], [], []
+        seen = set()
+        for is_synonym in (False, True):
+            for position, (_, label, synonyms) in enumerate(terms):
+                for text in (synonyms if is_synonym else [label]):
+                    normalized = normalize_disease_name(text)
+                    if normalized and (normalized, position) not in seen:
+                        seen.add((normalized, position))
+                        entry_text.append(normalized)
+                        entry_term.append(position)
+                        entry_synonym.append(is_synonym)
+
+        self.entry_text = entry_text
+        self.entry_term = np.asarray(entry_term, dtype=np.int64)
+        self.entry_synonym = np.asarray(entry_synonym, dtype=bool)
+
+        # Exact index: a label wins over synonyms; synonyms of several terms are ambiguous
+        self.exact = {}
+        for entry, text in enumerate(entry_text):
+            current = self.exact.get(text)
+            if current is None:
+                self.exact[text] = entry
+            elif current >= 0 and entry_synonym[entry] and self.entry_synonym[current] \
+                    and entry_term[entry] != entry_term[current]:
+                self.exact[text] = -1
+
+        postings = {}
+        for entry, text in enumerate(entry_text):
+            for token in set(text.split()):
+                postings.setdefault(token, []).append(entry)
+        self.postings = {token: np.asarray(entries, dtype=np.int64) for token, entries in postings.items()}
+
+    @classmethod
+    def from_file(cls, path: Path, **kwargs) -> 'MondoMatcher':
+        """Build from a MONDO OBO file or label TSV (chosen by extension)."""
+        path = Path(path)
+        terms = parse_mondo_obo(path) if path.suffix == '.obo' else parse_mondo_tsv(path)
+        return cls(terms, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _candidates(self, tokens: List[str], max_candidates: int) -> np.ndarray:
+        """Entries sharing the most specific tokens of a name."""
+        lists = [self.postings[token] for token in tokens if token in self.postings]
+        if not lists:
+            return np.empty(0, dtype=np.int64)
+        specific = [entries for entries in lists if len(entries) <= self.max_postings]
+        if not specific:
+            specific = [min(lists, key=len)[:self.max_postings]]
+
+        entries, shared = np.unique(np.concatenate(specific), return_counts=True)
+        if len(entries) > max_candidates:
+            entries = entries[np.argpartition(-shared, max_candidates)[:max_candidates]]
+        return entries
+
+    def match(self, names, min_score: float = DEFAULT_MIN_SCORE,
+              max_candidates: int = DEFAULT_MAX_CANDIDATES) -> pd.DataFrame:
+        """
+        Match disease names to MONDO terms.
+
+        Each distinct name is matched once; results are broadcast back.
+
+        Args:
+            names: List, NumPy array or Series of names (nulls allowed)
+            min_score: Minimum similarity (0-100) of a fuzzy match
+            max_candidates: Entries scored per name after blocking
+
+        Returns:
+            DataFrame with input, mondo_id, label, matched (the normalized
+            label or synonym), match_type (``exact``, ``fuzzy``,
+            ``ambiguous`` or ``unmatched``) and score per name
+        """
+        series = pd.Series(names, dtype=object)
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+
+        best_entry = np.full(len(uniques), -1, dtype=np.int64)
+        scores = np.zeros(len(uniques))
+        match_types = np.array(['unmatched'] * len(uniques), dtype=object)
+
+        pair_query, pair_entry, query_text = [], [], []
+        for position, name in enumerate(uniques):
+            normalized = normalize_disease_name(str(name))
+            entry = self.exact.get(normalized)
+            if entry is not None:
+                best_entry[position] = entry
+                scores[position] = 100.0
+                match_types[position] = 'exact' if entry >= 0 else 'ambiguous'
+                continue
+            candidates = self._candidates(normalized.split(), max_candidates)
+            pair_query.extend([position] * len(candidates))
+            pair_entry.extend(candidates.tolist())
+            query_text.extend([normalized] * len(candidates))
+
+        if pair_entry:
+            pair_query = np.asarray(pair_query, dtype=np.int64)
+            pair_entry = np.asarray(pair_entry, dtype=np.int64)
+            pair_scores = _pairwise_scores(query_text, [self.entry_text[e] for e in pair_entry])
+
+            # Best candidate per name: highest score, then labels before synonyms
+            order = np.lexsort((pair_entry, self.entry_synonym[pair_entry], -pair_scores, pair_query))
+            queries, first = np.unique(pair_query[order], return_index=True)
+            best = order[first]
+            accepted = pair_scores[best] >= min_score
+
+            best_entry[queries[accepted]] = pair_entry[best][accepted]
+            scores[queries] = pair_scores[best]
+            match_types[queries[accepted]] = 'fuzzy'
+
+        terms = [self.terms[self.entry_term[e]] if e >= 0 else (None, None) for e in best_entry]
+        mondo_ids = np.array([t[0] for t in terms] + [None], dtype=object)
+        labels = np.array([t[1] for t in terms] + [None], dtype=object)
+        matched = np.array([self.entry_text[e] if e >= 0 else None for e in best_entry] + [None], dtype=object)
+        match_types = np.append(match_types, 'unmatched')
+        scores = np.append(scores, 0.0)
+
+        # Null inputs have code -1, which picks the trailing "unmatched" entry
+        # Object dtype keeps None for missing values instead of NaN
+        return pd.DataFrame({
+            'input': pd.Series(series.to_numpy(), dtype=object),
+            'mondo_id': pd.Series(mondo_ids[codes], dtype=object),
+            'label': pd.Series(labels[codes], dtype=object),
+            'matched': pd.Series(matched[codes], dtype=object),
+            'match_type': pd.Series(match_types[codes], dtype=object),
+            'score': scores[codes],
+        })
+
+
+def default_cache_path(mondo_path: Path) -> Path:
+    """Return the conventional pickled terms location next to the MONDO file."""
+    mondo_path = Path(mondo_path)
+    return mondo_path.with_name(mondo_path.name + CACHE_SUFFIX)
+
+
+def load_mondo_matcher(mondo_path: Path, cache_path: Optional[Path] = None,
+                       max_postings: int = DEFAULT_MAX_POSTINGS) -> MondoMatcher:
+    """
+    Load the matcher from pickled terms, re-parsing the file if it changed.
+
+    Args:
+        mondo_path: MONDO OBO file or label TSV
+        cache_path: Pickled terms path (default: ``<mondo_path>.pkl``)
+        max_postings: See ``MondoMatcher``
+
+    Returns:
+        Ready-to-use matcher
+    """
+    mondo_path = Path(mondo_path)
+    cache_path = Path(cache_path) if cache_path else default_cache_path(mondo_path)
+    signature = cache_signature(mondo_path, CACHE_VERSION)
+
+    terms = read_pickle_cache(cache_path, signature)
+    if terms is None:
+        terms = parse_mondo_obo(mondo_path) if mondo_path.suffix == '.obo' else parse_mondo_tsv(mondo_path)
+        write_pickle_cache(cache_path, signature, terms)
+    return MondoMatcher(terms, max_postings)
@@ -0,0 +1,125 @@
+"""N-way entity overlap (UpSet intersection regions) using per-source bitsets.
+
+Entities are the dense integer IDs produced by ``entity_sets.EntityInterner``.
+Each source becomes one packed bitset over the ID universe. A single pass ORs
+the bitsets into a per-entity membership mask (bit ``i`` set when source ``i``
+has the entity), and counting the distinct masks gives every exclusive region
+of the Venn/UpSet diagram at once.
+"""
+
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+
+MAX_SOURCES = 64
+
+
+def build_source_bitsets(id_sets: Dict[str, np.ndarray], universe_size: int) -> Dict[str, np.ndarray]:
+    """
+    Build one packed bitset per source.
+
+    Args:
+        id_sets: Dictionary mapping source names to entity ID arrays
+        universe_size: Number of interned entities (IDs are ``0..universe_size-1``)
+
+    Returns:
+        Dictionary mapping source names to ``np.packbits`` arrays
+    """
+    bitsets = {}
+    for source, ids in id_sets.items():
+        present = np.zeros(universe_size, dtype=bool)
+        present[ids] = True
+        bitsets[source] = np.packbits(present)
+    return bitsets
+
+
+def compute_overlap_regions(bitsets: Dict[str, np.ndarray], universe_size: int) -> Dict[str, Any]:
+    """
+    Count every non-empty intersection region across sources.
+
+    Args:
+        bitsets: Dictionary mapping source names to packed bitsets
+        universe_size: Number of bits used in each bitset
+
+    Returns:
+        Dictionary with ``sources``, ``source_counts``, ``total_unique_entities``
+        and ``regions``. Each region lists its sources, the number of entities
+        found in exactly those sources (``exclusive_count``) and the number
+        found in at least those sources (``intersection_count``).
+
+    Raises:
+        ValueError: If there are more sources than mask bits
+    """
+    sources = list(bitsets)
+    if len(sources) > MAX_SOURCES:
+        raise ValueError(f"At most {MAX_SOURCES} sources are supported, got {len(sources)}")
+
+    masks = np.zeros(universe_size, dtype=np.uint64)
+    source_counts = {}
+    for bit, source in enumerate(sources):
+        present = np.unpackbits(bitsets[source], count=universe_size).astype(bool)
+        masks[present] |= np.uint64(1) << np.uint64(bit)
+        source_counts[source] = int(np.count_nonzero(present))
+
+    codes, exclusive = np.unique(masks[masks != 0], return_counts=True)
+
+    # Intersection count of a region = entities whose mask contains the region's mask
+    intersection = np.array([
+        int(exclusive[(codes & code) == code].sum()) for code in codes
+    ], dtype=np.int64)
+
+    regions = []
+    for code, exclusive_count, intersection_count in zip(codes, exclusive, intersection):
+        members = [source for bit, source in enumerate(sources) if int(code) >> bit & 1]
+        regions.append({
+            'sources': members,
+            'degree': len(members),
+            'exclusive_count': int(exclusive_count),
+            'intersection_count': int(intersection_count),
+        })
+
+    regions.sort(key=lambda r: (-r['exclusive_count'], r['degree'], r['sources']))
+
+    return {
+        'sources': sources,
+        'source_counts': source_counts,
+        'total_unique_entities': int(exclusive.sum()),
+        'regions': regions,
+    }
+
+
+def analyze_entity_overlap(
+    source_sets: Dict[str, Dict[str, Dict[str, np.ndarray]]],
+    universe_size: int,
+    entity_types: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Compute N-way overlap regions for every entity type and kind.
+
+    Args:
+        source_sets: ``{source: {entity_type: {kind: ID array}}}`` as produced
+            by ``entity_sets.extract_source_entity_sets``
+        universe_size: Number of interned entities
+        entity_types: Entity types to include (default: all)
+
+    Returns:
+        ``{entity_type: {kind: compute_overlap_regions result}}``; sources
+        without entities of a kind are left out of that kind's regions
+    """
+    results = {}
+    for source, entity_sets in source_sets.items():
+        for entity_type, kinds in entity_sets.items():
+            if entity_types and entity_type not in entity_types:
+                continue
+            for kind, ids in kinds.items():
+                if len(ids):
+                    results.setdefault(entity_type, {}).setdefault(kind, {})[source] = ids
+
+    return {
+        entity_type: {
+            kind: compute_overlap_regions(build_source_bitsets(id_sets, universe_size), universe_size)
+            for kind, id_sets in kinds.items()
+        }
+        for entity_type, kinds in results.items()
+    }
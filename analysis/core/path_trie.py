@@ -0,0 +1,245 @@
+"""Path frequency trie for the full structural catalogue of JSON/XML files.
+
+Paths follow the conventions of ``extract_xml_paths`` (``root/child``) and
+``extract_json_paths`` (``key.child``, ``key[]``). Each trie node is one path
+segment as it appears in the path string (``/child``, ``.child``, ``[]``), so
+concatenating segments from the root gives the full path back.
+
+Every path carries three counts:
+
+- ``occurrences``: number of elements/values at this path
+- ``parent_count``: number of parent elements containing the path at least
+  once (the document counts as the parent of the root)
+- ``file_count``: number of files containing the path
+"""
+
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+import xml.etree.ElementTree as ET
+
+
+class _Node:
+    __slots__ = ('children', 'occurrences', 'parent_count', 'file_count')
+
+    def __init__(self):
+        self.children = {}
+        self.occurrences = 0
+        self.parent_count = 0
+        self.file_count = 0
+
+
+class PathTrie:
+    """Trie of paths with occurrence, parent and file counts."""
+
+    def __init__(self, format: Optional[str] = None):
+        self.format = format
+        self._root = _Node()
+
+    def _node(self, segments: Tuple[str, ...]) -> _Node:
+        node = self._root
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+        return node
+
+    def add(self, segments: Tuple[str, ...], occurrences: int = 0,
+            parent_count: int = 0, file_count: int = 0) -> None:
+        """Add counts to the path made of ``segments``."""
+        node = self._node(tuple(segments))
+        node.occurrences += occurrences
+        node.parent_count += parent_count
+        node.file_count += file_count
+
+    @classmethod
+    def from_xml(cls, root: ET.Element) -> 'PathTrie':
+        """Build the trie of one XML document."""
+        trie = cls('xml')
+        tag = root.tag.split('}')[-1] if '}' in root.tag else root.tag
+        trie.add_xml(root, (tag,))
+        trie.add((tag,), parent_count=1)
+        trie.mark_file()
+        return trie
+
+    def add_xml(self, element: ET.Element, segments: Tuple[str, ...]) -> None:
+        """
+        Count ``element`` (located at ``segments``) and its subtree.
+
+        The caller accounts for the parent count of ``element`` itself.
+        """
+        node = self._node(segments)
+        node.occurrences += 1
+
+        seen = set()
+        for child in element:
+            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+            child_segments = segments + ('/' + tag,)
+            if tag not in seen:
+                seen.add(tag)
+                self._node(child_segments).parent_count += 1
+            self.add_xml(child, child_segments)
+
+    @classmethod
+    def from_json(cls, data: Any) -> 'PathTrie':
+        """Build the trie of one JSON document, visiting every array element."""
+        trie = cls('json')
+        trie._add_json(data, ())
+        trie.mark_file()
+        return trie
+
+    def _add_json(self, data: Any, segments: Tuple[str, ...]) -> None:
+        if isinstance(data, dict):
+            for key, value in data.items():
+                child_segments = segments + (('.' + key) if segments else key,)
+                node = self._node(child_segments)
+                node.occurrences += 1
+                node.parent_count += 1
+                self._add_json(value, child_segments)
+        elif isinstance(data, list) and data:
+            child_segments = segments + ('[]',)
+            node = self._node(child_segments)
+            node.occurrences += len(data)
+            node.parent_count += 1
+            for item in data:
+                self._add_json(item, child_segments)
+
+    def mark_file(self) -> None:
+        """Set the file count of every path to one (a single-file trie)."""
+        stack = list(self._root.children.values())
+        while stack:
+            node = stack.pop()
+            node.file_count = 1
+            stack.extend(node.children.values())
+
+    def merge(self, other: 'PathTrie', prefix: Tuple[str, ...] = ()) -> 'PathTrie':
+        """
+        Add all counts of ``other`` into this trie and return it.
+
+        Args:
+            other: Trie to merge in
+            prefix: Segments of the path under which ``other`` is grafted
+        """
+        stack = [(self._node(tuple(prefix)), other._root)]
+        while stack:
+            target, source = stack.pop()
+            for segment, source_child in source.children.items():
+                target_child = target.children.get(segment)
+                if target_child is None:
+                    target_child = target.children[segment] = _Node()
+                target_child.occurrences += source_child.occurrences
+                target_child.parent_count += source_child.parent_count
+                target_child.file_count += source_child.file_count
+                stack.append((target_child, source_child))
+        if self.format is None:
+            self.format = other.format
+        return self
+
+    def _walk(self, node: _Node, path: str) -> Iterator[Tuple[str, _Node]]:
+        for segment in sorted(node.children):
+            child = node.children[segment]
+            child_path = path + segment
+            yield child_path, child
+            yield from self._walk(child, child_path)
+
+    def items(self, prefix: str = '') -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over paths starting with ``prefix``, in sorted preorder.
+
+        Only the branches compatible with the prefix are visited.
+
+        Yields:
+            Dicts with path, occurrences, parent_count and file_count
+        """
+        stack = [(self._root, '')]
+        matches = []
+        while stack:
+            node, path = stack.pop()
+            for segment, child in node.children.items():
+                child_path = path + segment
+                if child_path.startswith(prefix):
+                    matches.append((child_path, child))
+                elif prefix.startswith(child_path):
+                    stack.append((child, child_path))
+
+        for path, node in sorted(matches, key=lambda m: m[0]):
+            yield self._entry(path, node)
+            for child_path, child in self._walk(node, path):
+                yield self._entry(child_path, child)
+
+    @staticmethod
+    def _entry(path: str, node: _Node) -> Dict[str, Any]:
+        return {
+            'path': path,
+            'occurrences': node.occurrences,
+            'parent_count': node.parent_count,
+            'file_count': node.file_count,
+        }
+
+    def paths(self, prefix: str = '') -> List[str]:
+        """Return all paths starting with ``prefix``."""
+        return [entry['path'] for entry in self.items(prefix)]
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the counts of an exact path, or None."""
+        for entry in self.items(path):
+            return entry if entry['path'] == path else None
+        return None
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._walk(self._root, ''))
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path) is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize as parallel preorder arrays.
+
+        Each node contributes its segment, its number of children and its
+        three counts; no path string is stored more than once.
+        """
+        result = {
+            'format': self.format,
+            'segments': [],
+            'child_counts': [],
+            'occurrences': [],
+            'parent_counts': [],
+            'file_counts': [],
+        }
+
+        def visit(node: _Node) -> None:
+            for segment in sorted(node.children):
+                child = node.children[segment]
+                result['segments'].append(segment)
+                result['child_counts'].append(len(child.children))
+                result['occurrences'].append(child.occurrences)
+                result['parent_counts'].append(child.parent_count)
+                result['file_counts'].append(child.file_count)
+                visit(child)
+
+        visit(self._root)
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PathTrie':
+        """Rebuild a trie serialized with ``to_dict``."""
+        trie = cls(data.get('format'))
+        # Stack of (node, remaining children to read)
+        stack = [(trie._root, None)]
+        for i, segment in enumerate(data['segments']):
+            while stack[-1][1] == 0:
+                stack.pop()
+            parent, remaining = stack.pop()
+            if remaining is not None:
+                stack.append((parent, remaining - 1))
+            else:
+                stack.append((parent, None))
+
+            node = _Node()
+            node.occurrences = data['occurrences'][i]
+            node.parent_count = data['parent_counts'][i]
+            node.file_count = data['file_counts'][i]
+            parent.children[segment] = node
+            stack.append((node, data['child_counts'][i]))
+
+        return trie
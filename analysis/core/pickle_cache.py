@@ -0,0 +1,56 @@
+"""Pickled caches of indexes built from reference files.
+
+Parsing a reference file (HGNC complete set, MONDO ontology) and building its
+indexes takes seconds; the result is pickled next to the file and reused
+while the file keeps its size and modification time. Only plain containers
+should be cached, so a cache does not depend on whether the building module
+was imported as ``core.x`` or ``analysis.core.x``.
+"""
+
+from pathlib import Path
+from typing import Any, Optional, Tuple
+import os
+import pickle
+
+
+def cache_signature(source_path: Path, version: int) -> Tuple[int, int, int]:
+    """(cache format version, size, mtime in ns) of the file a cache is built from."""
+    stat = os.stat(source_path)
+    return (version, stat.st_size, stat.st_mtime_ns)
+
+
+def read_pickle_cache(cache_path: Path, signature: Tuple[int, int, int]) -> Optional[Any]:
+    """
+    Load a cached payload if it was written for the same signature.
+
+    Args:
+        cache_path: Pickled cache file
+        signature: Current ``cache_signature`` of the source file
+
+    Returns:
+        The cached payload, or None when the cache is missing, stale or unreadable
+    """
+    cache_path = Path(cache_path)
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_signature, payload = pickle.load(f)
+    except (pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    return payload if cached_signature == signature else None
+
+
+def write_pickle_cache(cache_path: Path, signature: Tuple[int, int, int], payload: Any) -> None:
+    """
+    Pickle a payload with its signature.
+
+    The cache is written to a temporary file and moved into place, so a
+    concurrent reader never sees a partial pickle.
+    """
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        pickle.dump((signature, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
@@ -0,0 +1,196 @@
+"""Random-access byte-offset index for record-oriented XML files.
+
+The index maps a record key (by default the ClinVar ``Accession`` attribute
+of ``<VariationArchive>``) to the record's uncompressed byte offset and length.
+Entries are fixed-width and sorted by key, so a lookup is a binary search over
+a memory-mapped file followed by a single seek into the XML.
+
+Index layout (little-endian)::
+
+    magic (8 bytes) | key width (uint16) | entry count (uint64) | source size (uint64)
+    entries: key (key width bytes, NUL-padded) | offset (uint64) | length (uint32)
+"""
+
+from pathlib import Path
+from typing import Optional, Tuple, List
+import re
+import struct
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from .xml_split import (
+    DEFAULT_RECORD_TAG,
+    open_xml_reader,
+    iter_record_boundaries,
+    read_document_header,
+    parse_record,
+)
+
+
+INDEX_MAGIC = b'HQRIDX1\x00'
+INDEX_SUFFIX = '.ridx'
+DEFAULT_KEY_ATTRIBUTE = 'Accession'
+
+_HEADER = struct.Struct('<8sHQQ')
+
+
+def default_index_path(xml_path: Path) -> Path:
+    """Return the conventional index location next to the XML file."""
+    xml_path = Path(xml_path)
+    return xml_path.with_name(xml_path.name + INDEX_SUFFIX)
+
+
+def _entry_dtype(key_width: int) -> np.dtype:
+    return np.dtype([('key', f'S{key_width}'), ('offset', '<u8'), ('length', '<u4')])
+
+
+def normalize_record_key(key: str) -> str:
+    """Strip a version suffix, so ``VCV000012345.3`` finds ``VCV000012345``."""
+    return key.strip().split('.')[0]
+
+
+def build_record_index(
+    xml_path: Path,
+    index_path: Optional[Path] = None,
+    record_tag: str = DEFAULT_RECORD_TAG,
+    key_attribute: str = DEFAULT_KEY_ATTRIBUTE,
+) -> Path:
+    """
+    Scan an XML file once and write a sorted (key, offset, length) index.
+
+    Args:
+        xml_path: Uncompressed or BGZF-compressed XML file
+        index_path: Output index path (default: ``<xml_path>.ridx``)
+        record_tag: Tag name of the repeated record element
+        key_attribute: Attribute of the record start tag used as the key
+
+    Returns:
+        Path of the written index
+
+    Raises:
+        ValueError: If a record has no key attribute
+    """
+    xml_path = Path(xml_path)
+    index_path = Path(index_path) if index_path else default_index_path(xml_path)
+    attribute = re.compile(rb'\s' + re.escape(key_attribute.encode()) + rb'\s*=\s*["\']([^"\']*)["\']')
+
+    reader = open_xml_reader(xml_path)
+    keys = []
+    offsets = []
+    lengths = []
+
+    for start, end, start_tag in iter_record_boundaries(reader, record_tag):
+        match = attribute.search(start_tag)
+        if not match:
+            raise ValueError(f"Record at byte {start} has no {key_attribute} attribute")
+        keys.append(normalize_record_key(match.group(1).decode()).encode())
+        offsets.append(start)
+        lengths.append(end - start)
+
+    key_width = max((len(key) for key in keys), default=1)
+    entries = np.empty(len(keys), dtype=_entry_dtype(key_width))
+    entries['key'] = keys
+    entries['offset'] = offsets
+    entries['length'] = lengths
+    entries.sort(order='key', kind='stable')
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(index_path, 'wb') as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, key_width, len(entries), reader.size))
+        f.write(entries.tobytes())
+
+    return index_path
+
+
+class RecordIndex:
+    """Memory-mapped, sorted record index."""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        with open(self.index_path, 'rb') as f:
+            magic, key_width, count, source_size = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{self.index_path} is not a record index")
+
+        self.key_width = key_width
+        self.source_size = source_size
+        if count:
+            self.entries = np.memmap(self.index_path, dtype=_entry_dtype(key_width), mode='r',
+                                     offset=_HEADER.size, shape=(count,))
+        else:
+            self.entries = np.empty(0, dtype=_entry_dtype(key_width))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def locate(self, key: str) -> Optional[Tuple[int, int]]:
+        """
+        Find a record by key.
+
+        Returns:
+            (offset, length) of the record, or None if the key is not indexed
+        """
+        needle = normalize_record_key(key).encode()
+        if len(needle) > self.key_width:
+            return None
+
+        keys = self.entries['key']
+        position = int(np.searchsorted(keys, needle))
+        if position < len(keys) and keys[position] == needle:
+            entry = self.entries[position]
+            return int(entry['offset']), int(entry['length'])
+        return None
+
+
+def lookup_record_bytes(xml_path: Path, keys: List[str],
+                        index_path: Optional[Path] = None) -> List[Optional[bytes]]:
+    """
+    Fetch the raw XML of records by key without scanning the file.
+
+    Args:
+        xml_path: Indexed XML file
+        keys: Record keys, e.g. VCV accessions
+        index_path: Index path (default: ``<xml_path>.ridx``)
+
+    Returns:
+        Raw record bytes per key, or None for keys not in the index
+
+    Raises:
+        ValueError: If the XML file does not match the one the index was built from
+    """
+    xml_path = Path(xml_path)
+    index = RecordIndex(index_path or default_index_path(xml_path))
+    reader = open_xml_reader(xml_path)
+    if reader.size != index.source_size:
+        raise ValueError(f"Index {index.index_path} is stale for {xml_path}; rebuild it")
+
+    results = []
+    for key in keys:
+        location = index.locate(key)
+        if location is None:
+            results.append(None)
+            continue
+        offset, length = location
+        results.append(reader.read_range(offset, offset + length))
+    return results
+
+
+def lookup_record(xml_path: Path, key: str, index_path: Optional[Path] = None) -> Optional[ET.Element]:
+    """
+    Fetch and parse a single record by key.
+
+    Args:
+        xml_path: Indexed XML file
+        key: Record key, e.g. ``VCV000012345``
+        index_path: Index path (default: ``<xml_path>.ridx``)
+
+    Returns:
+        Parsed record element, or None if the key is not in the index
+    """
+    data = lookup_record_bytes(xml_path, [key], index_path)[0]
+    if data is None:
+        return None
+
+    _, namespaces = read_document_header(open_xml_reader(Path(xml_path)))
+    return parse_record(data, namespaces)
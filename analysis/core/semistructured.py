@@ -6,6 +6,11 @@ import json
 import xml.etree.ElementTree as ET
 from collections import Counter, defaultdict
 
+from .path_trie import PathTrie
+
+# Paths listed in a profile for readability; ``path_trie`` holds the full catalogue
+PATH_PREVIEW_LIMIT = 50
+
 
 def parse_json(filepath: Path) -> Dict[str, Any]:
     """
@@ -208,6 +213,16 @@ def infer_json_schema(data: Any, path: str = "root") -> Dict[str, Any]:
         return {"type": "unknown"}
 
 
+def summarize_path_trie(path_trie: PathTrie) -> Dict[str, Any]:
+    """
+    Path count and sorted ``paths`` preview of a path catalogue.
+
+    Both come from the trie, so they agree with the full catalogue a profile stores.
+    """
+    paths = sorted(entry['path'] for entry in path_trie.items())
+    return {"unique_paths": len(paths), "paths": paths[:PATH_PREVIEW_LIMIT]}
+
+
 def analyze_json_structure(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyze JSON structure and return statistics.
@@ -218,7 +233,7 @@ def analyze_json_structure(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary of structural statistics
     """
-    paths = extract_json_paths(data)
+    path_trie = PathTrie.from_json(data)
     depth = calculate_json_depth(data)
     node_count = count_nodes(data)
     schema = infer_json_schema(data)
@@ -227,8 +242,8 @@ def analyze_json_structure(data: Dict[str, Any]) -> Dict[str, Any]:
         "format": "json",
         "max_depth": depth,
         "node_count": node_count,
-        "unique_paths": len(paths),
-        "paths": sorted(list(paths)),
+        **summarize_path_trie(path_trie),
+        "path_trie": path_trie.to_dict(),
         "schema": schema,
     }
 
@@ -243,7 +258,7 @@ def analyze_xml_structure(root: ET.Element) -> Dict[str, Any]:
     Returns:
         Dictionary of structural statistics
     """
-    paths = extract_xml_paths(root)
+    path_trie = PathTrie.from_xml(root)
     depth = calculate_xml_depth(root)
     node_count = count_xml_nodes(root)
 
@@ -263,8 +278,8 @@ def analyze_xml_structure(root: ET.Element) -> Dict[str, Any]:
         "root_tag": root.tag.split('}')[-1] if '}' in root.tag else root.tag,
         "max_depth": depth,
         "node_count": node_count,
-        "unique_paths": len(paths),
-        "paths": sorted(list(paths))[:50],  # Limit to top 50 for readability
+        **summarize_path_trie(path_trie),
+        "path_trie": path_trie.to_dict(),  # Full path catalogue
         "tag_frequencies": dict(tag_counter.most_common(20)),
     }
 
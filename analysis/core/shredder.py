@@ -0,0 +1,297 @@
+"""Config-driven shredding of XML/JSON records into columnar tables.
+
+A shred config maps output columns to paths in the source document. Paths use
+the same conventions as ``extract_xml_paths`` and ``extract_json_paths``, so
+paths can be copied straight from a profile:
+
+- XML: ``/``-separated local tag names rooted at the document root, e.g.
+  ``ClinVarVariationRelease/VariationArchive/ClassifiedRecord``. A final
+  ``@name`` step selects an attribute instead of element text.
+- JSON: ``.``-separated keys with ``[]`` for array elements, e.g. ``rows[]``.
+  ``[N]`` selects a single array position.
+
+Example config for the ClinVar VCV release::
+
+    {
+      "record_path": "ClinVarVariationRelease/VariationArchive",
+      "columns": {
+        "accession": "ClinVarVariationRelease/VariationArchive/@Accession",
+        "variation_type": "ClinVarVariationRelease/VariationArchive/@VariationType",
+        "gene_symbol": "ClinVarVariationRelease/VariationArchive/ClassifiedRecord/SimpleAllele/GeneList/Gene/@Symbol"
+      }
+    }
+
+Each record yields one row. A path matching several values is joined with
+``multi_value_separator`` (default ``|``); a path with no match gives null.
+Input is streamed (``iterparse`` for XML, ``ijson`` for JSON) and rows are
+written as Parquet row groups, or Arrow IPC batches, as they fill up.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Union
+import gzip
+import json
+import re
+import xml.etree.ElementTree as ET
+import zlib
+
+import ijson
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+DEFAULT_ROW_GROUP_SIZE = 50000
+
+# Raised while streaming a malformed, truncated or unreadable input
+SHRED_INPUT_ERRORS = (ET.ParseError, ijson.JSONError, OSError, EOFError, zlib.error)
+
+_JSON_TOKEN = re.compile(r'\[(\d*)\]|([^.\[\]]+)')
+
+
+def load_shred_config(config: Union[Path, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Load and validate a shred config.
+
+    Args:
+        config: Path to a JSON config file, or an already-loaded config dict
+
+    Returns:
+        Validated config dictionary
+
+    Raises:
+        ValueError: If required keys are missing or a column path lies
+            outside the record path
+    """
+    if not isinstance(config, dict):
+        with open(config, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+
+    for key in ('record_path', 'columns'):
+        if key not in config:
+            raise ValueError(f"Shred config is missing '{key}'")
+
+    if not config['columns']:
+        raise ValueError("Shred config must define at least one column")
+
+    record_path = config['record_path']
+    for column, path in config['columns'].items():
+        if path != record_path and not (
+            path.startswith(record_path + '/') or path.startswith(record_path + '.')
+            or path.startswith(record_path + '[')
+        ):
+            raise ValueError(f"Column '{column}' path {path} is not inside record path {record_path}")
+
+    return config
+
+
+def _open_input(filepath: Path):
+    """Open a possibly gzip/BGZF-compressed input for streaming."""
+    with open(filepath, 'rb') as f:
+        magic = f.read(2)
+    if magic == b'\x1f\x8b':
+        return gzip.open(filepath, 'rb')
+    return open(filepath, 'rb')
+
+
+def _detect_format(filepath: Path) -> str:
+    suffixes = [s.lower() for s in filepath.suffixes]
+    if '.xml' in suffixes:
+        return 'xml'
+    if '.json' in suffixes:
+        return 'json'
+    raise ValueError(f"Cannot infer shred format from {filepath.name}; set 'format' in the config")
+
+
+def _local_name(tag: str) -> str:
+    return tag.split('}')[-1] if '}' in tag else tag
+
+
+def _xml_values(record: ET.Element, relative_path: str) -> List[str]:
+    """Evaluate a record-relative XML path to a list of string values."""
+    steps = [step for step in relative_path.split('/') if step]
+    attribute = None
+    if steps and steps[-1].startswith('@'):
+        attribute = steps.pop()[1:]
+
+    nodes = [record]
+    for step in steps:
+        nodes = [child for node in nodes for child in node if _local_name(child.tag) == step]
+
+    values = []
+    for node in nodes:
+        if attribute is not None:
+            for key, value in node.attrib.items():
+                if _local_name(key) == attribute:
+                    values.append(value)
+        else:
+            text = (node.text or '').strip()
+            if text:
+                values.append(text)
+    return values
+
+
+def _json_values(record: Any, relative_path: str) -> List[str]:
+    """Evaluate a record-relative JSON path to a list of string values."""
+    nodes = [record]
+    for index, key in _JSON_TOKEN.findall(relative_path):
+        next_nodes = []
+        for node in nodes:
+            if key:
+                if isinstance(node, dict) and key in node:
+                    next_nodes.append(node[key])
+            elif isinstance(node, list):
+                if index == '':
+                    next_nodes.extend(node)
+                elif int(index) < len(node):
+                    next_nodes.append(node[int(index)])
+        nodes = next_nodes
+
+    values = []
+    for node in nodes:
+        if node is None:
+            continue
+        values.append(json.dumps(node) if isinstance(node, (dict, list)) else str(node))
+    return values
+
+
+def iter_xml_records(filepath: Path, record_path: str) -> Iterator[ET.Element]:
+    """
+    Stream record elements matching ``record_path`` from an XML file.
+
+    Each record is detached from its parent after it is yielded, so memory
+    stays bounded by the size of one record.
+    """
+    target = record_path.split('/')
+    tags = []
+    elements = []
+
+    with _open_input(filepath) as f:
+        for event, element in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                tags.append(_local_name(element.tag))
+                elements.append(element)
+                continue
+
+            tags_match = tags == target
+            tags.pop()
+            elements.pop()
+            if tags_match:
+                yield element
+                if elements:
+                    elements[-1].remove(element)
+                element.clear()
+
+
+def iter_json_records(filepath: Path, record_path: str) -> Iterator[Any]:
+    """Stream records matching ``record_path`` (e.g. ``rows[]``) from a JSON file."""
+    prefix = []
+    for index, key in _JSON_TOKEN.findall(record_path):
+        prefix.append(key if key else 'item')
+
+    with _open_input(filepath) as f:
+        yield from ijson.items(f, '.'.join(prefix), use_float=True)
+
+
+class _ColumnarWriter:
+    """Write string columns as Parquet row groups or Arrow IPC record batches."""
+
+    def __init__(self, output_path: Path, columns: List[str]):
+        self.output_path = output_path
+        self.schema = pa.schema([(column, pa.string()) for column in columns])
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if output_path.suffix.lower() in ('.arrow', '.feather', '.ipc'):
+            self._sink = pa.OSFile(str(output_path), 'wb')
+            self._writer = pa.ipc.new_file(self._sink, self.schema)
+        else:
+            self._sink = None
+            self._writer = pq.ParquetWriter(str(output_path), self.schema)
+
+    def write(self, buffers: Dict[str, List[Optional[str]]]) -> None:
+        batch = pa.record_batch(
+            [pa.array(buffers[field.name], type=pa.string()) for field in self.schema],
+            schema=self.schema,
+        )
+        if self._sink is None:
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+
+def shred_file(
+    filepath: Path,
+    config: Union[Path, Dict[str, Any]],
+    output_path: Path,
+) -> Dict[str, Any]:
+    """
+    Shred an XML or JSON file into a Parquet (or Arrow IPC) table.
+
+    Args:
+        filepath: Input XML/JSON file, optionally gzip/BGZF-compressed
+        config: Shred config or path to one (see module docstring)
+        output_path: Output table; ``.arrow``/``.feather`` writes Arrow IPC,
+            anything else Parquet
+
+    Returns:
+        Summary with record, row group and column counts
+    """
+    filepath = Path(filepath)
+    output_path = Path(output_path)
+    config = load_shred_config(config)
+
+    file_format = config.get('format') or _detect_format(filepath)
+    record_path = config['record_path']
+    row_group_size = config.get('row_group_size', DEFAULT_ROW_GROUP_SIZE)
+    separator = config.get('multi_value_separator', '|')
+
+    columns = list(config['columns'])
+    relative_paths = {
+        column: path[len(record_path):]
+        for column, path in config['columns'].items()
+    }
+
+    if file_format == 'xml':
+        records = iter_xml_records(filepath, record_path)
+        evaluate = _xml_values
+    elif file_format == 'json':
+        records = iter_json_records(filepath, record_path)
+        evaluate = _json_values
+    else:
+        raise ValueError(f"Unsupported shred format: {file_format}")
+
+    writer = _ColumnarWriter(output_path, columns)
+    buffers = {column: [] for column in columns}
+    record_count = 0
+    row_groups = 0
+
+    try:
+        for record in records:
+            for column in columns:
+                values = evaluate(record, relative_paths[column])
+                buffers[column].append(separator.join(values) if values else None)
+            record_count += 1
+
+            if record_count % row_group_size == 0:
+                writer.write(buffers)
+                row_groups += 1
+                buffers = {column: [] for column in columns}
+
+        if buffers[columns[0]]:
+            writer.write(buffers)
+            row_groups += 1
+    finally:
+        writer.close()
+
+    return {
+        'input': str(filepath),
+        'output': str(output_path),
+        'format': file_format,
+        'record_count': record_count,
+        'row_groups': row_groups,
+        'columns': columns,
+    }
@@ -0,0 +1,448 @@
+"""Compact column sketches stored in profiles.
+
+A string column is summarized by a MinHash signature (Jaccard similarity of
+distinct values) and a HyperLogLog register array (distinct count). Both are
+small, fixed-size and mergeable, so columns of different sources can be
+compared for value overlap from their profiles alone, without re-reading data.
+
+Distribution sketches describe how values are spread: a numeric column keeps
+its quantiles, a categorical column its most frequent values with counts and
+the count of all others. Two profiles of the same column (e.g. two releases of
+a source) are compared with the population stability index and a KS-style
+distance computed from these sketches alone.
+
+Sketches are serialized as base64 strings of little-endian arrays.
+"""
+
+from typing import Dict, Any, List, Optional
+import base64
+
+import numpy as np
+import pandas as pd
+
+
+MINHASH_PERMUTATIONS = 128
+HLL_PRECISION = 10
+DISTRIBUTION_QUANTILES = 20
+DISTRIBUTION_TOP_K = 20
+
+# Probability floor for bins that are empty in one distribution
+_PSI_EPSILON = 1e-4
+
+# Fixed key so value hashes are identical across runs and machines
+_HASH_KEY = '0123456789abcdef'
+_HASH_BLOCK = 8192
+
+# Multiply-shift hash functions h(x) = (a * x + b) >> 32 with odd multipliers
+_RNG = np.random.default_rng(20240601)
+_MULTIPLIERS = _RNG.integers(1, np.iinfo(np.uint64).max, size=MINHASH_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_OFFSETS = _RNG.integers(0, np.iinfo(np.uint64).max, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """Hash values (as strings) to deterministic 64-bit integers."""
+    return pd.util.hash_pandas_object(
+        values.astype(str), index=False, hash_key=_HASH_KEY
+    ).to_numpy(dtype=np.uint64)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer (wrapping uint64 arithmetic)."""
+    with np.errstate(over='ignore'):
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+        return x ^ (x >> np.uint64(31))
+
+
+def minhash_signature(hashes: np.ndarray, num_perm: int = MINHASH_PERMUTATIONS) -> np.ndarray:
+    """
+    MinHash signature of a set of 64-bit value hashes.
+
+    Args:
+        hashes: Distinct value hashes
+        num_perm: Number of hash functions (signature length)
+
+    Returns:
+        ``uint32`` array of length ``num_perm``
+    """
+    signature = np.full(num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+    multipliers = _MULTIPLIERS[:num_perm]
+    offsets = _OFFSETS[:num_perm]
+    with np.errstate(over='ignore'):
+        for start in range(0, len(hashes), _HASH_BLOCK):
+            block = hashes[start:start + _HASH_BLOCK]
+            permuted = (block[:, None] * multipliers[None, :] + offsets[None, :]) >> np.uint64(32)
+            signature = np.minimum(signature, permuted.min(axis=0).astype(np.uint32))
+    return signature
+
+
+def hll_registers(hashes: np.ndarray, precision: int = HLL_PRECISION) -> np.ndarray:
+    """
+    HyperLogLog registers of a set of 64-bit value hashes.
+
+    Args:
+        hashes: Value hashes (duplicates are harmless)
+        precision: Number of index bits; ``2**precision`` registers
+
+    Returns:
+        ``uint8`` register array
+    """
+    registers = np.zeros(1 << precision, dtype=np.uint8)
+    if len(hashes) == 0:
+        return registers
+
+    mixed = _mix(hashes)
+    index = (mixed >> np.uint64(64 - precision)).astype(np.int64)
+    remainder = mixed << np.uint64(precision)
+
+    # Rank = position of the leftmost 1-bit in the remaining bits (1-based)
+    width = 64 - precision
+    rank = np.full(len(mixed), width + 1, dtype=np.uint8)
+    nonzero = remainder != 0
+    leading_zeros = 63 - np.floor(np.log2(remainder[nonzero].astype(np.float64))).astype(np.int64)
+    rank[nonzero] = np.minimum(leading_zeros + 1, width + 1)
+
+    np.maximum.at(registers, index, rank)
+    return registers
+
+
+def hll_estimate(registers: np.ndarray) -> float:
+    """Estimate the distinct count from HyperLogLog registers."""
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.exp2(-registers.astype(np.float64)))
+
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return float(estimate)
+
+
+def _encode(array: np.ndarray) -> str:
+    return base64.b64encode(array.tobytes()).decode('ascii')
+
+
+def _decode(text: str, dtype) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(text), dtype=dtype)
+
+
+def compute_value_sketch(series: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Compute the MinHash/HyperLogLog sketch of a column's distinct values.
+
+    Args:
+        series: Column values; nulls and blank strings are ignored
+
+    Returns:
+        Serializable sketch dictionary, or None for an empty column
+    """
+    values = series.dropna().astype(str).str.strip()
+    values = pd.Series(pd.unique(values[values != '']))
+    if len(values) == 0:
+        return None
+
+    hashes = hash_values(values)
+    return {
+        'minhash': _encode(minhash_signature(hashes).astype('<u4')),
+        'hll': _encode(hll_registers(hashes)),
+        'distinct_count': int(len(hashes)),
+    }
+
+
+def decode_value_sketch(sketch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode a stored sketch into its signature, registers and distinct count.
+
+    The exact ``distinct_count`` recorded at profiling time is used when
+    present; otherwise the count is estimated from the HyperLogLog registers.
+    """
+    registers = _decode(sketch['hll'], np.uint8)
+    distinct = sketch.get('distinct_count')
+    return {
+        'minhash': _decode(sketch['minhash'], '<u4'),
+        'hll': registers,
+        'distinct_estimate': float(distinct) if distinct is not None else hll_estimate(registers),
+    }
+
+
+def merge_value_sketches(sketches: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Merge stored sketches into the sketch of the union of their values.
+
+    Used to combine the same column across the files of a source; the
+    distinct count of the union is the HyperLogLog estimate.
+    """
+    sketches = [s for s in sketches if s]
+    if not sketches:
+        return None
+    if len(sketches) == 1:
+        return sketches[0]
+
+    signature = np.minimum.reduce([_decode(s['minhash'], '<u4') for s in sketches])
+    registers = np.maximum.reduce([_decode(s['hll'], np.uint8) for s in sketches])
+    return {
+        'minhash': _encode(signature.astype('<u4')),
+        'hll': _encode(registers),
+        'distinct_count': int(round(hll_estimate(registers))),
+    }
+
+
+def estimate_overlap(sketch1: Dict[str, Any], sketch2: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Estimate Jaccard similarity and containment of two decoded sketches.
+
+    Containment of A in B is ``|A ∩ B| / |A|``; the intersection size comes
+    from the MinHash Jaccard and the HyperLogLog cardinalities.
+    """
+    jaccard = float(np.mean(sketch1['minhash'] == sketch2['minhash']))
+    size1 = sketch1['distinct_estimate']
+    size2 = sketch2['distinct_estimate']
+    intersection = jaccard / (1 + jaccard) * (size1 + size2)
+
+    return {
+        'jaccard': jaccard,
+        'intersection_estimate': intersection,
+        'containment_1': min(intersection / size1, 1.0) if size1 else 0.0,
+        'containment_2': min(intersection / size2, 1.0) if size2 else 0.0,
+    }
+
+
+def collect_column_sketches(source_profiles: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Gather the value sketches of every profiled column, one entry per source field.
+
+    A field present in several files of a source is merged into one sketch.
+
+    Args:
+        source_profiles: Dictionary mapping source names to file profiles
+
+    Returns:
+        List of dicts with source, file, field and sketch
+    """
+    columns = []
+    for source_name in sorted(source_profiles):
+        field_sketches = {}
+        field_files = {}
+        for analysis_data in source_profiles[source_name]:
+            filename = analysis_data.get('file_metadata', {}).get('filename', '')
+            for field in analysis_data.get('field_analyses', []):
+                sketch = field.get('value_sketch')
+                if not sketch:
+                    continue
+                field_sketches.setdefault(field['field_name'], []).append(sketch)
+                field_files.setdefault(field['field_name'], []).append(filename)
+
+        for field_name, sketches in field_sketches.items():
+            files = field_files[field_name]
+            columns.append({
+                'source': source_name,
+                'file': files[0] if len(files) == 1 else f"{len(files)} files",
+                'field': field_name,
+                'sketch': merge_value_sketches(sketches),
+            })
+
+    return columns
+
+
+def rank_value_overlaps(
+    columns: List[Dict[str, Any]],
+    min_containment: float = 0.5,
+    min_distinct: int = 10,
+    block_size: int = 64,
+) -> List[Dict[str, Any]]:
+    """
+    Rank column pairs of different sources by estimated value overlap.
+
+    Args:
+        columns: Dicts with ``source``, ``file``, ``field`` and a stored ``sketch``
+        min_containment: Minimum containment (either direction) to report a pair
+        min_distinct: Columns with fewer distinct values are skipped
+        block_size: Columns compared against all others at a time
+
+    Returns:
+        Pairs sorted by containment then Jaccard, best first
+    """
+    decoded = []
+    for column in columns:
+        sketch = column.get('sketch')
+        if not sketch or sketch.get('distinct_count', 0) < min_distinct:
+            continue
+        decoded.append((column, decode_value_sketch(sketch)))
+
+    if not decoded:
+        return []
+
+    signatures = np.stack([sketch['minhash'] for _, sketch in decoded])
+    sizes = np.array([sketch['distinct_estimate'] for _, sketch in decoded])
+    sources = np.array([column['source'] for column, _ in decoded])
+
+    pairs = []
+    for start in range(0, len(decoded), block_size):
+        stop = min(start + block_size, len(decoded))
+        # Jaccard of each block column against every later column
+        jaccard = (signatures[start:stop, None, :] == signatures[None, start:, :]).mean(axis=2)
+        for offset, i in enumerate(range(start, stop)):
+            j = np.arange(i + 1, len(decoded))
+            j = j[sources[j] != sources[i]]
+            if len(j) == 0:
+                continue
+            row = jaccard[offset, j - start]
+            intersection = row / (1 + row) * (sizes[i] + sizes[j])
+            containment_1 = np.minimum(intersection / sizes[i], 1.0)
+            containment_2 = np.minimum(intersection / sizes[j], 1.0)
+            keep = np.maximum(containment_1, containment_2) >= min_containment
+
+            column1 = decoded[i][0]
+            for k in np.flatnonzero(keep):
+                column2 = decoded[j[k]][0]
+                pairs.append({
+                    'source1': column1['source'],
+                    'file1': column1.get('file'),
+                    'field1': column1['field'],
+                    'source2': column2['source'],
+                    'file2': column2.get('file'),
+                    'field2': column2['field'],
+                    'jaccard': float(row[k]),
+                    'containment_1': float(containment_1[k]),
+                    'containment_2': float(containment_2[k]),
+                    'distinct_1': int(round(sizes[i])),
+                    'distinct_2': int(round(sizes[j[k]])),
+                })
+
+    pairs.sort(key=lambda p: (max(p['containment_1'], p['containment_2']), p['jaccard']), reverse=True)
+    return pairs
+
+
+def compute_quantile_sketch(values: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Compute the quantile sketch of a numeric column.
+
+    Args:
+        values: Non-null numeric values
+
+    Returns:
+        Serializable sketch with ``DISTRIBUTION_QUANTILES + 1`` equally spaced
+        quantiles (minimum to maximum), or None for an empty column
+    """
+    values = pd.to_numeric(values, errors='coerce').dropna()
+    if len(values) == 0:
+        return None
+
+    quantiles = np.quantile(values.to_numpy(dtype=np.float64), np.linspace(0, 1, DISTRIBUTION_QUANTILES + 1))
+    return {'kind': 'quantiles', 'count': int(len(values)), 'quantiles': _encode(quantiles.astype('<f8'))}
+
+
+def compute_top_k_sketch(value_counts: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Compute the top-k sketch of a categorical column.
+
+    Args:
+        value_counts: Counts of the non-null values, most frequent first
+            (as from ``Series.value_counts``)
+
+    Returns:
+        Serializable sketch with the ``DISTRIBUTION_TOP_K`` most frequent
+        values, their counts and the count of all other values, or None for an
+        empty column
+    """
+    total = int(value_counts.sum())
+    if total == 0:
+        return None
+
+    top = value_counts.head(DISTRIBUTION_TOP_K)
+    return {
+        'kind': 'top_k',
+        'count': total,
+        'values': [str(value) for value in top.index],
+        'counts': [int(count) for count in top.to_numpy()],
+        'other': total - int(top.sum()),
+    }
+
+
+def _quantile_cdf(quantiles: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Right-continuous CDF of a quantile sketch, linear between quantiles.
+
+    Repeated quantiles (a value holding several bins' worth of rows) make a
+    step, so point masses are kept.
+    """
+    bins = len(quantiles) - 1
+    upper = np.searchsorted(quantiles, x, side='right')
+    lower = np.clip(upper - 1, 0, bins)
+    start = quantiles[lower]
+    width = quantiles[np.clip(upper, 0, bins)] - start
+    with np.errstate(divide='ignore', invalid='ignore'):
+        within = np.where((upper > 0) & (upper <= bins) & (width > 0), (x - start) / width, 0.0)
+    return np.clip((lower + within) / bins, 0.0, 1.0) * (upper > 0)
+
+
+def _psi(expected: np.ndarray, actual: np.ndarray) -> float:
+    """Population stability index of two bin probability vectors."""
+    expected = np.maximum(expected, _PSI_EPSILON)
+    actual = np.maximum(actual, _PSI_EPSILON)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def _quantile_drift(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """PSI over the old sketch's quantile bins and the largest CDF difference."""
+    old_quantiles = _decode(old['quantiles'], '<f8')
+    new_quantiles = _decode(new['quantiles'], '<f8')
+
+    # Bins (b_i, b_i+1] between the distinct inner quantiles of the old sketch
+    edges = np.concatenate([[-np.inf], np.unique(old_quantiles[1:-1]), [np.inf]])
+    psi = _psi(np.diff(_quantile_cdf(old_quantiles, edges)), np.diff(_quantile_cdf(new_quantiles, edges)))
+
+    # The CDFs are piecewise linear, so the largest difference is at a
+    # quantile of either sketch or just below one (the left side of a step)
+    points = np.union1d(old_quantiles, new_quantiles)
+    points = np.concatenate([points, np.nextafter(points, -np.inf)])
+    ks = float(np.max(np.abs(_quantile_cdf(old_quantiles, points) - _quantile_cdf(new_quantiles, points))))
+    return {'psi': psi, 'ks': ks}
+
+
+def _top_k_drift(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    PSI and total variation distance over the values of both sketches.
+
+    Values missing from one sketch's top-k count as 0 there and the rest of
+    each distribution forms an "other" bin, so the result is exact when the
+    top-k covers the whole vocabulary (and both sketches then report added and
+    removed values).
+    """
+    values = list(dict.fromkeys(old['values'] + new['values']))
+    probabilities = []
+    for sketch in (old, new):
+        counts = dict(zip(sketch['values'], sketch['counts']))
+        bins = np.array([counts.get(value, 0) for value in values] + [sketch['other']], dtype=np.float64)
+        probabilities.append(bins / sketch['count'])
+
+    drift = {
+        'psi': _psi(*probabilities),
+        'ks': float(np.abs(probabilities[0] - probabilities[1]).sum() / 2),
+    }
+    if not old['other'] and not new['other']:
+        old_values, new_values = set(old['values']), set(new['values'])
+        drift['added_values'] = [value for value in new['values'] if value not in old_values]
+        drift['removed_values'] = [value for value in old['values'] if value not in new_values]
+    return drift
+
+
+def distribution_drift(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Compare two distribution sketches of the same column.
+
+    Args:
+        old: Sketch of the earlier profile
+        new: Sketch of the later profile
+
+    Returns:
+        ``psi`` (population stability index) and ``ks`` (largest CDF
+        difference for quantiles, total variation distance for top-k values),
+        plus ``added_values``/``removed_values`` for complete top-k sketches;
+        None when the sketches are of different kinds
+    """
+    if old.get('kind') != new.get('kind'):
+        return None
+    if old['kind'] == 'quantiles':
+        return _quantile_drift(old, new)
+    return _top_k_drift(old, new)
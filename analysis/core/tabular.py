@@ -9,6 +9,9 @@ import pandas as pd
 import numpy as np
 import chardet
 
+from .sketches import compute_value_sketch, compute_quantile_sketch, compute_top_k_sketch
+from .hgvs import summarize_hgvs
+
 
 def detect_encoding(filepath: Path) -> str:
     """Detect file encoding using chardet."""
@@ -100,6 +103,28 @@ def infer_data_type(series: pd.Series) -> str:
     return 'string'
 
 
+IDENTIFIER_PATTERNS = {
+    'HGNC ID': r'^HGNC:\d+$',
+    'MONDO ID': r'^MONDO:\d{7}$',
+    'OMIM ID': r'^\d{6}$',
+    'dbSNP rsID': r'^rs\d+$',
+    'ClinVar ID': r'^VCV\d+$',
+    'HGVS': r'^[A-Z]{2,3}_\d+\.\d+:',
+    'Email': r'^[\w\.-]+@[\w\.-]+\.\w+$',
+    'URL': r'^https?://',
+    'UUID': r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+}
+
+# Identifier types tracked for coverage, keyed like analyze_identifier_coverage
+IDENTIFIER_TYPES = {
+    'hgnc_ids': 'HGNC ID',
+    'mondo_ids': 'MONDO ID',
+    'omim_ids': 'OMIM ID',
+    'dbsnp_ids': 'dbSNP rsID',
+    'clinvar_ids': 'ClinVar ID',
+}
+
+
 def detect_identifier_pattern(series: pd.Series) -> Optional[str]:
     """Detect if field appears to be an identifier based on patterns."""
     non_null = series.dropna().astype(str)
@@ -110,19 +135,7 @@ def detect_identifier_pattern(series: pd.Series) -> Optional[str]:
     # Sample up to 100 values
     sample = non_null.head(100)
 
-    patterns = {
-        'HGNC ID': r'^HGNC:\d+$',
-        'MONDO ID': r'^MONDO:\d{7}$',
-        'OMIM ID': r'^\d{6}$',
-        'dbSNP rsID': r'^rs\d+$',
-        'ClinVar ID': r'^VCV\d+$',
-        'HGVS': r'^[A-Z]{2,3}_\d+\.\d+:',
-        'Email': r'^[\w\.-]+@[\w\.-]+\.\w+$',
-        'URL': r'^https?://',
-        'UUID': r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-    }
-
-    for pattern_name, regex in patterns.items():
+    for pattern_name, regex in IDENTIFIER_PATTERNS.items():
         matches = sample.str.match(regex, case=False).sum()
         if matches / len(sample) > 0.8:  # 80% match threshold
             return pattern_name
@@ -132,10 +145,11 @@ def detect_identifier_pattern(series: pd.Series) -> Optional[str]:
 
 def calculate_basic_stats(series: pd.Series) -> Dict[str, Any]:
     """Calculate basic statistics for any field."""
+    # Plain ints, so stored profiles hold JSON numbers rather than stringified NumPy scalars
     total_count = len(series)
-    null_count = series.isna().sum()
+    null_count = int(series.isna().sum())
     non_null_count = total_count - null_count
-    unique_count = series.nunique(dropna=True)
+    unique_count = int(series.nunique(dropna=True))
 
     return {
         'total_count': total_count,
@@ -169,14 +183,14 @@ def calculate_string_stats(series: pd.Series) -> Dict[str, Any]:
     lengths = non_null.str.len()
 
     # Top values
-    value_counts = series.value_counts(dropna=True).head(10)
+    value_counts = series.value_counts(dropna=True)
     top_values = [
         {
             'value': str(val),
             'count': int(count),
             'percentage': float(count / len(series) * 100)
         }
-        for val, count in value_counts.items()
+        for val, count in value_counts.head(10).items()
     ]
 
     return {
@@ -185,6 +199,7 @@ def calculate_string_stats(series: pd.Series) -> Dict[str, Any]:
         'mean_length': float(lengths.mean()),
         'top_values': top_values,
         'pattern': detect_identifier_pattern(series),
+        'distribution_sketch': compute_top_k_sketch(value_counts),
     }
 
 
@@ -228,6 +243,7 @@ def calculate_numeric_stats(series: pd.Series) -> Dict[str, Any]:
 
     stats['skewness'] = skewness
     stats['distribution_type'] = distribution
+    stats['distribution_sketch'] = compute_quantile_sketch(non_null)
 
     return stats
 
@@ -269,6 +285,7 @@ def calculate_boolean_stats(series: pd.Series) -> Dict[str, Any]:
         'true_count': int(true_count),
         'false_count': int(false_count),
         'true_percentage': float(true_count / len(bool_series) * 100) if len(bool_series) > 0 else 0,
+        'distribution_sketch': compute_top_k_sketch(bool_series.map({True: 'true', False: 'false'}).value_counts()),
     }
 
 
@@ -287,6 +304,12 @@ def analyze_field(series: pd.Series, field_name: str) -> Dict[str, Any]:
     # Type-specific stats
     if data_type == 'string':
         stats.update(calculate_string_stats(series))
+        # Value sketch for overlap-based join discovery across sources
+        value_sketch = compute_value_sketch(series)
+        if value_sketch:
+            stats['value_sketch'] = value_sketch
+        if stats.get('pattern') == 'HGVS':
+            stats['hgvs_summary'] = summarize_hgvs(series)
     elif data_type in ['integer', 'float']:
         stats.update(calculate_numeric_stats(series))
     elif data_type == 'date':
@@ -297,9 +320,54 @@ def analyze_field(series: pd.Series, field_name: str) -> Dict[str, Any]:
     return stats
 
 
+def calculate_identifier_coverage(df: pd.DataFrame, field_analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Count the rows carrying each identifier type.
+
+    A row carries a type when any column detected as that pattern holds a
+    value matching it. The distinct identifier values are sketched so that
+    cross-source resolvability can be estimated from profiles alone.
+
+    Args:
+        df: Loaded file
+        field_analyses: Field analyses of ``df`` (for the detected patterns)
+
+    Returns:
+        Dictionary with the row count and, per identifier type present, the
+        matching rows, fraction, columns and value sketch
+    """
+    patterns = {field['field_name']: field.get('pattern') for field in field_analyses}
+    coverage = {'row_count': len(df), 'types': {}}
+
+    for id_type, pattern_name in IDENTIFIER_TYPES.items():
+        columns = [column for column in df.columns if patterns.get(column) == pattern_name]
+        if not columns:
+            continue
+
+        regex = IDENTIFIER_PATTERNS[pattern_name]
+        row_mask = np.zeros(len(df), dtype=bool)
+        matched_values = []
+        for column in columns:
+            values = df[column].astype(str).str.strip()
+            matches = (values.str.match(regex, case=False) & df[column].notna()).to_numpy()
+            row_mask |= matches
+            matched_values.append(values[matches])
+
+        rows = int(row_mask.sum())
+        coverage['types'][id_type] = {
+            'rows': rows,
+            'fraction': rows / len(df) if len(df) else 0.0,
+            'columns': columns,
+            'value_sketch': compute_value_sketch(pd.concat(matched_values)),
+        }
+
+    return coverage
+
+
 def analyze_tabular_file(
     filepath: Path,
-    sample_size: Optional[int] = None
+    sample_size: Optional[int] = None,
+    entity_index=None,
 ) -> Dict[str, Any]:
     """
     Comprehensive analysis of a tabular file (CSV/TSV).
@@ -307,6 +375,8 @@ def analyze_tabular_file(
     Args:
         filepath: Path to the file
         sample_size: Optional number of rows to sample
+        entity_index: Optional ``entity_index.EntityIndex``; the file's entity
+            columns are added to it from the already-loaded data
 
     Returns:
         Dictionary containing analysis results
@@ -360,7 +430,14 @@ def analyze_tabular_file(
         field_stats = analyze_field(df[col], col)
         field_analyses.append(field_stats)
 
-    return {
+    result = {
         'file_metadata': file_stats.to_dict('records')[0],
         'field_analyses': field_analyses,
+        'identifier_coverage': calculate_identifier_coverage(df, field_analyses),
     }
+
+    if entity_index is not None:
+        relative_path = result['file_metadata']['filepath']
+        entity_index.index_dataframe(df, result, Path(relative_path).parts[0], relative_path)
+
+    return result
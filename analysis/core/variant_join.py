@@ -0,0 +1,421 @@
+"""Sort-based variant join across sources.
+
+Each side is normalized to two unsigned 64-bit integers per variant:
+
+- a packed locus key ``assembly << 60 | chromosome << 52 | position``, whose
+  numeric order is (assembly, chromosome, position) order;
+- an allele hash of the trimmed ``REF>ALT`` string.
+
+Files are read in chunks; every chunk is sorted and written as a run file.
+The runs of each side are k-way merged and the two sorted streams are merge
+joined block by block, so memory is bounded by the chunk and block sizes
+rather than the file sizes.
+
+Alleles are trimmed to their minimal form (shared prefix, with the position
+shifted past it, then shared suffix) so VCF-style anchored
+indels and MAF-style ``-`` alleles compare equal. Indels are not left-aligned.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Iterator, Optional, Tuple
+import re
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .sketches import hash_values
+
+
+DEFAULT_CHUNK_SIZE = 1000000
+DEFAULT_BLOCK_SIZE = 262144
+
+VARIANT_DTYPE = np.dtype([('locus', '<u8'), ('allele', '<u8')])
+
+ASSEMBLIES = {'GRCH37': 1, 'HG19': 1, '37': 1, 'GRCH38': 2, 'HG38': 2, '38': 2}
+ASSEMBLY_NAMES = {1: 'GRCh37', 2: 'GRCh38'}
+
+CHROMOSOMES = {**{str(i): i for i in range(1, 23)}, 'X': 23, 'Y': 24, 'M': 25, 'MT': 25}
+CHROMOSOME_NAMES = {code: name for name, code in CHROMOSOMES.items() if name != 'M'}
+
+_POSITION_BITS = 52
+_CHROMOSOME_BITS = 8
+
+# RefSeq chromosome accession versions of GRCh38 (GRCh37 is one lower for each)
+GRCH38_REFSEQ_VERSIONS = {
+    1: 11, 2: 12, 3: 12, 4: 12, 5: 10, 6: 12, 7: 14, 8: 11, 9: 12, 10: 11, 11: 10, 12: 12,
+    13: 11, 14: 9, 15: 10, 16: 10, 17: 11, 18: 10, 19: 10, 20: 11, 21: 9, 22: 11, 23: 11, 24: 10,
+}
+
+_GENOMIC_SNV = re.compile(r'NC_0000(?P<chrom>\d{2})\.(?P<version>\d+):g\.(?P<pos>\d+)(?P<ref>[ACGT])>(?P<alt>[ACGT])')
+
+# Column layouts of the supported sources
+VARIANT_PRESETS = {
+    'clinvar': {
+        'description': 'ClinVar variant_summary.txt (VCF-style columns)',
+        'sep': '\t',
+        'columns': {
+            'assembly': 'Assembly',
+            'chrom': 'Chromosome',
+            'pos': 'PositionVCF',
+            'ref': 'ReferenceAlleleVCF',
+            'alt': 'AlternateAlleleVCF',
+        },
+    },
+    'maf': {
+        'description': 'TCGA/GDC Mutation Annotation Format',
+        'sep': '\t',
+        'comment': '#',
+        'columns': {
+            'assembly': 'NCBI_Build',
+            'chrom': 'Chromosome',
+            'pos': 'Start_Position',
+            'ref': 'Reference_Allele',
+            'alt': 'Tumor_Seq_Allele2',
+        },
+        # MAF insertions are positioned on the base before the inserted sequence
+        'maf_alleles': True,
+    },
+    'clingen': {
+        'description': 'ClinGen variant-pathogenicity.csv (genomic HGVS substitutions)',
+        'sep': ',',
+        'hgvs_column': 'HGVS Expressions',
+    },
+}
+
+
+def pack_locus(assembly: np.ndarray, chromosome: np.ndarray, position: np.ndarray) -> np.ndarray:
+    """Pack assembly, chromosome and position codes into sortable 64-bit keys."""
+    return (
+        (assembly.astype(np.uint64) << np.uint64(_POSITION_BITS + _CHROMOSOME_BITS))
+        | (chromosome.astype(np.uint64) << np.uint64(_POSITION_BITS))
+        | position.astype(np.uint64)
+    )
+
+
+def unpack_locus(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split packed keys back into (assembly, chromosome, position) codes."""
+    keys = np.asarray(keys, dtype=np.uint64)
+    position = keys & np.uint64((1 << _POSITION_BITS) - 1)
+    chromosome = (keys >> np.uint64(_POSITION_BITS)) & np.uint64((1 << _CHROMOSOME_BITS) - 1)
+    assembly = keys >> np.uint64(_POSITION_BITS + _CHROMOSOME_BITS)
+    return assembly, chromosome, position
+
+
+def _encode_codes(values: pd.Series, codes: Dict[str, int], strip_prefix: str = '') -> np.ndarray:
+    """Map labels to integer codes (0 when unknown)."""
+    labels = values.fillna('').astype(str).str.strip().str.upper()
+    if strip_prefix:
+        labels = labels.str.replace(f'^{strip_prefix.upper()}', '', regex=True)
+    return labels.map(codes).fillna(0).to_numpy(dtype=np.int64)
+
+
+def trim_alleles(position: np.ndarray, ref: pd.Series, alt: pd.Series) -> Tuple[np.ndarray, pd.Series, pd.Series]:
+    """
+    Reduce alleles to their minimal representation.
+
+    The shared prefix is trimmed first, moving the position past each
+    trimmed base, then the shared suffix. Trimming the prefix first drops the
+    VCF anchor base of an indel, so VCF and MAF (``-``) spellings of the same
+    homopolymer indel end at the same position. Each pass is vectorized and
+    the number of passes is bounded by the longest shared affix.
+    """
+    position = position.copy()
+    ref = ref.reset_index(drop=True)
+    alt = alt.reset_index(drop=True)
+
+    while True:
+        shared = (ref.str.len() > 0) & (alt.str.len() > 0) & (ref.str[:1] == alt.str[:1])
+        if not shared.any():
+            break
+        ref[shared] = ref[shared].str[1:]
+        alt[shared] = alt[shared].str[1:]
+        position[shared.to_numpy()] += 1
+
+    while True:
+        shared = (ref.str.len() > 0) & (alt.str.len() > 0) & (ref.str[-1:] == alt.str[-1:])
+        if not shared.any():
+            break
+        ref[shared] = ref[shared].str[:-1]
+        alt[shared] = alt[shared].str[:-1]
+
+    return position, ref, alt
+
+
+def allele_hashes(ref: pd.Series, alt: pd.Series) -> np.ndarray:
+    """Hash ``REF>ALT`` strings to 64-bit integers."""
+    return hash_values(ref + '>' + alt)
+
+
+def _normalize_columns(df: pd.DataFrame, preset: Dict[str, Any]) -> Tuple[np.ndarray, int]:
+    """Normalize a chunk with assembly/chrom/pos/ref/alt columns."""
+    columns = preset['columns']
+    assembly = _encode_codes(df[columns['assembly']], ASSEMBLIES)
+    chromosome = _encode_codes(df[columns['chrom']], CHROMOSOMES, strip_prefix='chr')
+    position = pd.to_numeric(df[columns['pos']], errors='coerce').fillna(-1).to_numpy(dtype=np.int64, copy=True)
+
+    ref = df[columns['ref']].fillna('').astype(str).str.strip().str.upper().reset_index(drop=True)
+    alt = df[columns['alt']].fillna('').astype(str).str.strip().str.upper().reset_index(drop=True)
+
+    valid_alleles = ref.str.fullmatch(r'[ACGTN]*|-') & alt.str.fullmatch(r'[ACGTN]*|-') & ((ref != '') | (alt != ''))
+    if preset.get('maf_alleles'):
+        insertion = (ref == '-').to_numpy()
+        position[insertion] += 1
+        ref = ref.replace('-', '')
+        alt = alt.replace('-', '')
+
+    valid = (assembly > 0) & (chromosome > 0) & (position > 0) & valid_alleles.to_numpy() & (ref != alt).to_numpy()
+    position, ref, alt = trim_alleles(position[valid], ref[valid], alt[valid])
+
+    records = np.empty(len(position), dtype=VARIANT_DTYPE)
+    records['locus'] = pack_locus(assembly[valid], chromosome[valid], position)
+    records['allele'] = allele_hashes(ref, alt)
+    return records, int((~valid).sum())
+
+
+def _normalize_hgvs(df: pd.DataFrame, preset: Dict[str, Any]) -> Tuple[np.ndarray, int]:
+    """Normalize a chunk from genomic HGVS substitutions (one record per assembly)."""
+    expressions = df[preset['hgvs_column']].fillna('').astype(str).reset_index(drop=True)
+    matches = expressions.str.extractall(_GENOMIC_SNV)
+
+    chromosome = matches['chrom'].astype(np.int64).to_numpy()
+    version = matches['version'].astype(np.int64).to_numpy()
+    grch38 = pd.Series(chromosome).map(GRCH38_REFSEQ_VERSIONS).fillna(-10).to_numpy(dtype=np.int64)
+    assembly = np.where(version == grch38, 2, np.where(version == grch38 - 1, 1, 0))
+
+    known = assembly > 0
+    records = np.empty(int(known.sum()), dtype=VARIANT_DTYPE)
+    records['locus'] = pack_locus(assembly[known], chromosome[known], matches['pos'].astype(np.int64).to_numpy()[known])
+    records['allele'] = allele_hashes(matches['ref'][known], matches['alt'][known])
+
+    # De-duplicate expressions repeated on one row (e.g. NC_ and CM accessions)
+    row = matches.index.get_level_values(0).to_numpy()[known]
+    _, first = np.unique(np.stack([row.astype(np.uint64), records['locus'], records['allele']]), axis=1, return_index=True)
+    records = records[np.sort(first)]
+
+    parsed_rows = np.unique(row)
+    return records, len(expressions) - len(parsed_rows)
+
+
+def normalize_variants(df: pd.DataFrame, preset: Dict[str, Any]) -> Tuple[np.ndarray, int]:
+    """
+    Normalize a chunk of a variant file to (locus key, allele hash) records.
+
+    Args:
+        df: Chunk read with the preset's columns
+        preset: Entry of ``VARIANT_PRESETS``
+
+    Returns:
+        Tuple of (records with ``VARIANT_DTYPE``, number of rows that could
+        not be normalized)
+    """
+    if 'hgvs_column' in preset:
+        return _normalize_hgvs(df, preset)
+    return _normalize_columns(df, preset)
+
+
+def _preset_columns(preset: Dict[str, Any]) -> List[str]:
+    if 'hgvs_column' in preset:
+        return [preset['hgvs_column']]
+    return list(preset['columns'].values())
+
+
+def write_sorted_runs(data_path: Path, preset: Dict[str, Any], run_dir: Path,
+                      chunksize: int = DEFAULT_CHUNK_SIZE) -> Tuple[List[Path], Dict[str, int]]:
+    """
+    Normalize a variant file chunk by chunk into sorted run files.
+
+    Args:
+        data_path: Variant file (compression inferred from the extension)
+        preset: Entry of ``VARIANT_PRESETS``
+        run_dir: Directory for the ``.npy`` run files
+        chunksize: Rows per chunk (and at most records per run)
+
+    Returns:
+        Tuple of (run paths, counts of rows, invalid rows and records)
+    """
+    run_dir = Path(run_dir)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    stats = {'rows': 0, 'invalid_rows': 0, 'records': 0}
+    runs = []
+
+    reader = pd.read_csv(
+        data_path,
+        sep=preset['sep'],
+        usecols=_preset_columns(preset),
+        dtype=str,
+        keep_default_na=False,
+        comment=preset.get('comment'),
+        chunksize=chunksize,
+        low_memory=False,
+    )
+    for chunk in reader:
+        records, invalid = normalize_variants(chunk, preset)
+        stats['rows'] += len(chunk)
+        stats['invalid_rows'] += invalid
+        stats['records'] += len(records)
+        if not len(records):
+            continue
+        records.sort(order=['locus', 'allele'])
+        run_path = run_dir / f"run_{len(runs):05d}.npy"
+        np.save(run_path, records)
+        runs.append(run_path)
+
+    return runs, stats
+
+
+def _count_below(block: np.ndarray, locus: np.uint64, allele: np.uint64, inclusive: bool = False) -> int:
+    """Number of records of a sorted block before (or up to) a key."""
+    side = 'right' if inclusive else 'left'
+    start = int(np.searchsorted(block['locus'], locus, 'left'))
+    end = int(np.searchsorted(block['locus'], locus, 'right'))
+    return start + int(np.searchsorted(block['allele'][start:end], allele, side))
+
+
+def _last_key(block: np.ndarray) -> Tuple[np.uint64, np.uint64]:
+    # Kept as uint64: Python ints above 2**63 are compared as floats by searchsorted
+    return block['locus'][-1], block['allele'][-1]
+
+
+def merge_runs(run_paths: List[Path], block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[np.ndarray]:
+    """
+    K-way merge sorted run files into a stream of sorted blocks.
+
+    Each step takes the next ``block_size`` records of every run, emits all
+    records up to the smallest last key among them, and advances the runs.
+    """
+    runs = [np.load(path, mmap_mode='r') for path in run_paths]
+    offsets = [0] * len(runs)
+
+    while True:
+        windows = [
+            (index, run[offsets[index]:offsets[index] + block_size])
+            for index, run in enumerate(runs) if offsets[index] < len(run)
+        ]
+        if not windows:
+            return
+
+        bound = min(_last_key(window) for _, window in windows)
+        parts = []
+        for index, window in windows:
+            count = _count_below(window, *bound, inclusive=True)
+            parts.append(window[:count])
+            offsets[index] += count
+
+        block = np.concatenate(parts)
+        block.sort(order=['locus', 'allele'])
+        yield block
+
+
+def _group_counts(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct keys of a sorted block and their multiplicities."""
+    if not len(block):
+        return block, np.zeros(0, dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate((
+        [True],
+        (block['locus'][1:] != block['locus'][:-1]) | (block['allele'][1:] != block['allele'][:-1]),
+    )))
+    counts = np.diff(np.append(starts, len(block)))
+    return block[starts], counts
+
+
+def merge_join(left: Iterator[np.ndarray], right: Iterator[np.ndarray]) -> Dict[str, int]:
+    """
+    Merge join two sorted record streams and count matched and unmatched variants.
+
+    Keys below the smaller of the two buffered last keys are complete on both
+    sides, so they are joined and dropped; the rest stays buffered.
+
+    Returns:
+        Distinct variant counts (matched, left_only, right_only), the rows of
+        each side in matched variants, and the number of joined row pairs
+    """
+    counts = {
+        'matched_variants': 0,
+        'left_only_variants': 0,
+        'right_only_variants': 0,
+        'matched_left_records': 0,
+        'matched_right_records': 0,
+        'matched_pairs': 0,
+    }
+    streams = [left, right]
+    buffers = [np.empty(0, dtype=VARIANT_DTYPE), np.empty(0, dtype=VARIANT_DTYPE)]
+    done = [False, False]
+
+    def refill(side: int) -> None:
+        block = next(streams[side], None)
+        if block is None:
+            done[side] = True
+        else:
+            buffers[side] = np.concatenate((buffers[side], block))
+
+    while True:
+        for side in (0, 1):
+            if not done[side] and not len(buffers[side]):
+                refill(side)
+        if all(done) and not any(len(buffer) for buffer in buffers):
+            break
+
+        open_sides = [side for side in (0, 1) if not done[side]]
+        if open_sides:
+            bound = min(_last_key(buffers[side]) for side in open_sides)
+            cut = [_count_below(buffer, *bound) for buffer in buffers]
+            if not any(cut):
+                for side in open_sides:
+                    if _last_key(buffers[side]) == bound:
+                        refill(side)
+                continue
+        else:
+            cut = [len(buffer) for buffer in buffers]
+
+        left_keys, left_counts = _group_counts(buffers[0][:cut[0]])
+        right_keys, right_counts = _group_counts(buffers[1][:cut[1]])
+        _, left_index, right_index = np.intersect1d(left_keys, right_keys, assume_unique=True, return_indices=True)
+
+        counts['matched_variants'] += len(left_index)
+        counts['left_only_variants'] += len(left_keys) - len(left_index)
+        counts['right_only_variants'] += len(right_keys) - len(right_index)
+        counts['matched_left_records'] += int(left_counts[left_index].sum())
+        counts['matched_right_records'] += int(right_counts[right_index].sum())
+        counts['matched_pairs'] += int((left_counts[left_index] * right_counts[right_index]).sum())
+
+        buffers = [buffers[0][cut[0]:], buffers[1][cut[1]:]]
+
+    return counts
+
+
+def join_variant_files(left_path: Path, right_path: Path, left_format: str, right_format: str,
+                       chunksize: int = DEFAULT_CHUNK_SIZE, block_size: int = DEFAULT_BLOCK_SIZE,
+                       tmp_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Join two variant files on (assembly, chromosome, position, ref, alt).
+
+    Args:
+        left_path: Left variant file
+        right_path: Right variant file
+        left_format: ``VARIANT_PRESETS`` key of the left file
+        right_format: ``VARIANT_PRESETS`` key of the right file
+        chunksize: Rows per sorted run
+        block_size: Records per merge block and run window
+        tmp_dir: Parent directory of the temporary run files
+
+    Returns:
+        Dictionary with the per-side row counts and the join counts
+    """
+    for name in (left_format, right_format):
+        if name not in VARIANT_PRESETS:
+            raise ValueError(f"Unknown variant format: {name} (expected one of {', '.join(VARIANT_PRESETS)})")
+
+    with tempfile.TemporaryDirectory(prefix='variant-join-', dir=tmp_dir) as work_dir:
+        left_runs, left_stats = write_sorted_runs(
+            left_path, VARIANT_PRESETS[left_format], Path(work_dir) / 'left', chunksize)
+        right_runs, right_stats = write_sorted_runs(
+            right_path, VARIANT_PRESETS[right_format], Path(work_dir) / 'right', chunksize)
+
+        counts = merge_join(merge_runs(left_runs, block_size), merge_runs(right_runs, block_size))
+
+    return {
+        'left': {'path': str(left_path), 'format': left_format, **left_stats},
+        'right': {'path': str(right_path), 'format': right_format, **right_stats},
+        **counts,
+    }
@@ -0,0 +1,523 @@
+"""Record-boundary splitting of large XML files for multi-core parsing.
+
+Large release files such as the ClinVar VCV XML are a single root element
+wrapping millions of independent records (``<VariationArchive>``). This
+module scans the file once for record boundaries, then parses byte ranges
+of records on worker processes and merges their statistics.
+
+Both uncompressed files and BGZF-compressed files (``bgzip``) are supported;
+BGZF is block-gzip with a block index, which allows seeking to any
+uncompressed offset. Plain gzip cannot be seeked and must be recompressed
+with ``bgzip`` first.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_right
+import os
+import re
+import struct
+import zlib
+import xml.etree.ElementTree as ET
+
+from .semistructured import calculate_xml_depth, summarize_path_trie
+from .path_trie import PathTrie
+
+
+DEFAULT_RECORD_TAG = 'VariationArchive'
+
+# Size of the blocks read while scanning for record boundaries
+SCAN_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Target uncompressed size of one unit of work handed to a worker
+BATCH_BYTES = 64 * 1024 * 1024
+
+
+class PlainXmlReader:
+    """Random-access reader over an uncompressed file."""
+
+    def __init__(self, filepath: Path):
+        self.filepath = Path(filepath)
+        self.size = self.filepath.stat().st_size
+
+    def iter_chunks(self, chunk_size: int = SCAN_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the file contents in consecutive chunks."""
+        with open(self.filepath, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def read_range(self, start: int, end: int) -> bytes:
+        """Read bytes ``[start, end)``."""
+        with open(self.filepath, 'rb') as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def index_state(self) -> Optional[Tuple[List[int], List[int]]]:
+        """Plain files need no block index."""
+        return None
+
+
+class BgzfReader:
+    """
+    Random-access reader over a BGZF (block gzip) file.
+
+    Offsets are always in uncompressed coordinates; the block index maps them
+    to the compressed block that holds them.
+    """
+
+    def __init__(self, filepath: Path, index: Optional[Tuple[List[int], List[int]]] = None):
+        self.filepath = Path(filepath)
+        if index is None:
+            index = build_bgzf_index(self.filepath)
+        self.block_offsets, self.block_starts = index
+        self.size = self.block_starts[-1] if self.block_starts else 0
+
+    def _read_block(self, f, block_number: int) -> bytes:
+        f.seek(self.block_offsets[block_number])
+        block_size = self.block_offsets[block_number + 1] - self.block_offsets[block_number]
+        block = f.read(block_size)
+        xlen = struct.unpack('<H', block[10:12])[0]
+        return zlib.decompress(block[12 + xlen:-8], -15)
+
+    def iter_chunks(self, chunk_size: int = SCAN_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the decompressed contents, roughly ``chunk_size`` at a time."""
+        pending = []
+        pending_size = 0
+        with open(self.filepath, 'rb') as f:
+            for block_number in range(len(self.block_offsets) - 1):
+                data = self._read_block(f, block_number)
+                pending.append(data)
+                pending_size += len(data)
+                if pending_size >= chunk_size:
+                    yield b''.join(pending)
+                    pending = []
+                    pending_size = 0
+        if pending:
+            yield b''.join(pending)
+
+    def read_range(self, start: int, end: int) -> bytes:
+        """Read uncompressed bytes ``[start, end)``."""
+        first = bisect_right(self.block_starts, start) - 1
+        parts = []
+        with open(self.filepath, 'rb') as f:
+            block_number = first
+            while block_number < len(self.block_offsets) - 1 and self.block_starts[block_number] < end:
+                parts.append(self._read_block(f, block_number))
+                block_number += 1
+        data = b''.join(parts)
+        offset = self.block_starts[first]
+        return data[start - offset:end - offset]
+
+    def index_state(self) -> Tuple[List[int], List[int]]:
+        """Return the block index so worker processes need not rebuild it."""
+        return self.block_offsets, self.block_starts
+
+
+def is_bgzf(filepath: Path) -> bool:
+    """Check whether a file starts with a BGZF block header."""
+    with open(filepath, 'rb') as f:
+        header = f.read(16)
+    return (len(header) == 16 and header[:4] == b'\x1f\x8b\x08\x04'
+            and header[12:14] == b'BC')
+
+
+def build_bgzf_index(filepath: Path) -> Tuple[List[int], List[int]]:
+    """
+    Build the block index of a BGZF file from block headers alone.
+
+    Returns:
+        Tuple of (compressed block offsets, uncompressed block start offsets),
+        each with a trailing sentinel entry for the end of the file
+    """
+    block_offsets = []
+    block_starts = []
+    compressed_offset = 0
+    uncompressed_offset = 0
+
+    with open(filepath, 'rb') as f:
+        while True:
+            header = f.read(12)
+            if not header:
+                break
+            if len(header) < 12 or header[:4] != b'\x1f\x8b\x08\x04':
+                raise ValueError(f"{filepath} is not a valid BGZF file")
+            xlen = struct.unpack('<H', header[10:12])[0]
+            extra = f.read(xlen)
+
+            # Find the BC subfield holding the total block size
+            block_size = None
+            pos = 0
+            while pos + 4 <= len(extra):
+                subfield_id = extra[pos:pos + 2]
+                subfield_len = struct.unpack('<H', extra[pos + 2:pos + 4])[0]
+                if subfield_id == b'BC':
+                    block_size = struct.unpack('<H', extra[pos + 4:pos + 6])[0] + 1
+                pos += 4 + subfield_len
+            if block_size is None:
+                raise ValueError(f"{filepath} has a gzip block without a BGZF size field")
+
+            f.seek(compressed_offset + block_size - 4)
+            isize = struct.unpack('<I', f.read(4))[0]
+
+            block_offsets.append(compressed_offset)
+            block_starts.append(uncompressed_offset)
+            compressed_offset += block_size
+            uncompressed_offset += isize
+
+    block_offsets.append(compressed_offset)
+    block_starts.append(uncompressed_offset)
+    return block_offsets, block_starts
+
+
+def write_bgzf(source: Path, destination: Path, block_size: int = 65280) -> None:
+    """
+    Recompress an uncompressed file as BGZF, equivalent to ``bgzip``.
+
+    Args:
+        source: Uncompressed input file
+        destination: Output BGZF file
+        block_size: Uncompressed bytes per block (BGZF caps blocks at 64 KiB)
+    """
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        while True:
+            data = src.read(block_size)
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            compressed = compressor.compress(data) + compressor.flush()
+            header = struct.pack('<4BIBBH2sHH', 0x1f, 0x8b, 8, 4, 0, 0, 255, 6,
+                                 b'BC', 2, len(compressed) + 25)
+            dst.write(header + compressed)
+            dst.write(struct.pack('<II', zlib.crc32(data) & 0xffffffff, len(data)))
+            # An empty block doubles as the BGZF end-of-file marker
+            if not data:
+                break
+
+
+def open_xml_reader(filepath: Path, index: Optional[Tuple[List[int], List[int]]] = None):
+    """
+    Open a random-access reader for an uncompressed or BGZF-compressed file.
+
+    Raises:
+        ValueError: If the file is plain gzip, which cannot be seeked
+    """
+    filepath = Path(filepath)
+    if is_bgzf(filepath):
+        return BgzfReader(filepath, index)
+
+    with open(filepath, 'rb') as f:
+        if f.read(2) == b'\x1f\x8b':
+            raise ValueError(
+                f"{filepath} is plain gzip; decompress it or recompress with bgzip for random access"
+            )
+    return PlainXmlReader(filepath)
+
+
+def iter_record_boundaries(reader, record_tag: str = DEFAULT_RECORD_TAG,
+                           chunk_size: int = SCAN_CHUNK_SIZE) -> Iterator[Tuple[int, int, bytes]]:
+    """
+    Scan a file for record boundaries, keeping each record's start tag.
+
+    Records must not nest. Each record starts at ``<record_tag`` and ends just
+    after the matching ``</record_tag>`` (or the ``/>`` of an empty record).
+
+    Args:
+        reader: Reader from ``open_xml_reader``
+        record_tag: Tag name of the repeated record element
+        chunk_size: Bytes scanned per read
+
+    Yields:
+        (start, end, start_tag) for each record, with offsets in uncompressed
+        coordinates and ``start_tag`` the raw bytes of the opening tag
+    """
+    tag = re.escape(record_tag.encode())
+    pattern = re.compile(rb'<(/?)' + tag + rb'(?=[\s/>])')
+    # Keep enough of each chunk's tail to match a tag split across chunks
+    overlap = len(record_tag) + 64
+
+    chunks = reader.iter_chunks(chunk_size)
+    buffer = b''
+    buffer_offset = 0
+    open_start = None
+    open_tag = b''
+    final = False
+
+    while not final:
+        chunk = next(chunks, None)
+        if chunk is None:
+            final = True
+        else:
+            buffer += chunk
+
+        limit = len(buffer) if final else max(0, len(buffer) - overlap)
+        consumed = limit
+
+        for match in pattern.finditer(buffer):
+            if match.start() >= limit:
+                break
+            tag_end = buffer.find(b'>', match.end())
+            if tag_end == -1:
+                # Tag continues in the next chunk; rescan it from its start
+                consumed = match.start()
+                break
+
+            if match.group(1):
+                if open_start is not None:
+                    yield open_start, buffer_offset + tag_end + 1, open_tag
+                    open_start = None
+            elif buffer[tag_end - 1:tag_end] == b'/':
+                yield buffer_offset + match.start(), buffer_offset + tag_end + 1, buffer[match.start():tag_end + 1]
+            else:
+                open_start = buffer_offset + match.start()
+                open_tag = buffer[match.start():tag_end + 1]
+
+        buffer_offset += consumed
+        buffer = buffer[consumed:]
+
+
+def iter_record_spans(reader, record_tag: str = DEFAULT_RECORD_TAG,
+                      chunk_size: int = SCAN_CHUNK_SIZE) -> Iterator[Tuple[int, int]]:
+    """
+    Scan a file for record boundaries.
+
+    See ``iter_record_boundaries``.
+
+    Yields:
+        (start, end) byte offsets of each record in uncompressed coordinates
+    """
+    for start, end, _ in iter_record_boundaries(reader, record_tag, chunk_size):
+        yield start, end
+
+
+def find_record_offsets(filepath: Path, record_tag: str = DEFAULT_RECORD_TAG) -> List[Tuple[int, int]]:
+    """
+    Build the list of record byte ranges for a file.
+
+    Args:
+        filepath: Uncompressed or BGZF-compressed XML file
+        record_tag: Tag name of the repeated record element
+
+    Returns:
+        List of (start, end) byte offsets in uncompressed coordinates
+    """
+    return list(iter_record_spans(open_xml_reader(filepath), record_tag))
+
+
+def read_document_header(reader, limit: int = 65536) -> Tuple[Optional[str], bytes]:
+    """
+    Read the root tag and namespace declarations from the start of a document.
+
+    Returns:
+        Tuple of (root tag name, namespace declarations as raw attribute bytes)
+    """
+    head = reader.read_range(0, min(limit, reader.size))
+    match = re.search(rb'<([A-Za-z_][\w.:-]*)([^>]*)>', head)
+    if not match:
+        return None, b''
+
+    root_tag = match.group(1).decode().split(':')[-1]
+    namespaces = b' '.join(re.findall(rb'xmlns(?::[\w.-]+)?="[^"]*"', match.group(2)))
+    return root_tag, namespaces
+
+
+def parse_record(data: bytes, namespaces: bytes = b'') -> ET.Element:
+    """
+    Parse one record fragment.
+
+    Namespace declarations from the document root are re-applied so that
+    prefixed names inside the fragment stay bound.
+    """
+    if namespaces:
+        wrapper = ET.fromstring(b'<_wrap ' + namespaces + b'>' + data + b'</_wrap>')
+        return wrapper[0]
+    return ET.fromstring(data)
+
+
+def split_spans(spans: List[Tuple[int, int]], workers: int,
+                batch_bytes: int = BATCH_BYTES) -> List[List[Tuple[int, int]]]:
+    """
+    Split record spans into contiguous batches balanced by byte size.
+
+    At least ``workers`` batches are produced (when there are enough records)
+    and no batch is much larger than ``batch_bytes``.
+    """
+    if not spans:
+        return []
+
+    total = spans[-1][1] - spans[0][0]
+    target = max(1, min(batch_bytes, total // max(1, workers) + 1))
+
+    batches = []
+    current = []
+    current_size = 0
+    for span in spans:
+        current.append(span)
+        current_size += span[1] - span[0]
+        if current_size >= target:
+            batches.append(current)
+            current = []
+            current_size = 0
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def empty_record_stats() -> Dict[str, Any]:
+    """Return the identity element for ``merge_record_stats``."""
+    return {
+        'record_count': 0,
+        'error_count': 0,
+        'max_depth': 0,
+        'node_count': 0,
+        'tag_counts': Counter(),
+        'path_trie': PathTrie('xml').to_dict(),
+    }
+
+
+def merge_record_stats(stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-batch record statistics.
+
+    All merged quantities are sums or maxima, so the result is independent of
+    the order in which batches complete.
+    """
+    merged = empty_record_stats()
+    path_trie = PathTrie('xml')
+    for batch in stats:
+        merged['record_count'] += batch['record_count']
+        merged['error_count'] += batch['error_count']
+        merged['max_depth'] = max(merged['max_depth'], batch['max_depth'])
+        merged['node_count'] += batch['node_count']
+        merged['tag_counts'].update(batch['tag_counts'])
+        path_trie.merge(PathTrie.from_dict(batch['path_trie']))
+    merged['path_trie'] = path_trie.to_dict()
+    return merged
+
+
+def analyze_record_batch(reader, spans: List[Tuple[int, int]], namespaces: bytes = b'',
+                         record_segments: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """
+    Parse a contiguous batch of records and collect structural statistics.
+
+    Args:
+        reader: Reader from ``open_xml_reader``
+        spans: Contiguous (start, end) record spans
+        namespaces: Root namespace declarations from ``read_document_header``
+        record_segments: Path trie segments of the record element
+            (default: the record tag itself)
+
+    Returns:
+        Record statistics (see ``empty_record_stats``)
+    """
+    stats = empty_record_stats()
+    if not spans:
+        return stats
+
+    base = spans[0][0]
+    data = reader.read_range(base, spans[-1][1])
+    path_trie = PathTrie('xml')
+
+    for start, end in spans:
+        try:
+            record = parse_record(data[start - base:end - base], namespaces)
+        except ET.ParseError:
+            stats['error_count'] += 1
+            continue
+
+        stats['record_count'] += 1
+        stats['max_depth'] = max(stats['max_depth'], calculate_xml_depth(record))
+        for element in record.iter():
+            element_tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
+            stats['tag_counts'][element_tag] += 1
+            stats['node_count'] += 1
+        tag = record.tag.split('}')[-1] if '}' in record.tag else record.tag
+        path_trie.add_xml(record, record_segments or (tag,))
+
+    stats['path_trie'] = path_trie.to_dict()
+    return stats
+
+
+_worker_reader = None
+_worker_namespaces = b''
+_worker_record_segments = ()
+
+
+def _init_worker(filepath: str, index, namespaces: bytes, record_segments: Tuple[str, ...]) -> None:
+    """Open the shared reader once per worker process."""
+    global _worker_reader, _worker_namespaces, _worker_record_segments
+    _worker_reader = open_xml_reader(Path(filepath), index)
+    _worker_namespaces = namespaces
+    _worker_record_segments = record_segments
+
+
+def _analyze_batch_in_worker(spans: List[Tuple[int, int]]) -> Dict[str, Any]:
+    return analyze_record_batch(_worker_reader, spans, _worker_namespaces, _worker_record_segments)
+
+
+def analyze_xml_records(
+    filepath: Path,
+    record_tag: str = DEFAULT_RECORD_TAG,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Analyze a record-oriented XML file by parsing record ranges in parallel.
+
+    Args:
+        filepath: Uncompressed or BGZF-compressed XML file
+        record_tag: Tag name of the repeated record element
+        workers: Number of worker processes (default: CPU count); 1 runs inline
+
+    Returns:
+        Structural statistics in the same shape as ``analyze_xml_structure``,
+        with paths rooted at the document root, plus record counts
+    """
+    filepath = Path(filepath)
+    workers = workers or os.cpu_count() or 1
+
+    reader = open_xml_reader(filepath)
+    root_tag, namespaces = read_document_header(reader)
+    spans = list(iter_record_spans(reader, record_tag))
+    batches = split_spans(spans, workers)
+
+    wrapped = bool(root_tag) and root_tag != record_tag
+    record_segments = (root_tag, '/' + record_tag) if wrapped else (record_tag,)
+
+    if workers == 1 or len(batches) <= 1:
+        batch_stats = [analyze_record_batch(reader, batch, namespaces, record_segments) for batch in batches]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(filepath), reader.index_state(), namespaces, record_segments),
+        ) as executor:
+            batch_stats = list(executor.map(_analyze_batch_in_worker, batches))
+
+    merged = merge_record_stats(batch_stats)
+
+    # The records' parent is the document root (or the document itself)
+    path_trie = PathTrie.from_dict(merged['path_trie'])
+    if wrapped:
+        path_trie.add((root_tag,), occurrences=1, parent_count=1)
+    path_trie.add(record_segments, parent_count=1)
+    path_trie.mark_file()
+
+    return {
+        "filepath": str(filepath),
+        "filename": filepath.name,
+        "file_size_mb": filepath.stat().st_size / (1024 * 1024),
+        "format": "xml",
+        "root_tag": root_tag,
+        "record_tag": record_tag,
+        "record_count": merged['record_count'],
+        "record_error_count": merged['error_count'],
+        # The document root adds one level and one node above the records
+        "max_depth": merged['max_depth'] + (1 if wrapped else 0),
+        "node_count": merged['node_count'] + (1 if wrapped else 0),
+        **summarize_path_trie(path_trie),
+        "path_trie": path_trie.to_dict(),
+        "tag_frequencies": dict(sorted(merged['tag_counts'].items(), key=lambda kv: (-kv[1], kv[0]))[:20]),
+    }
@@ -0,0 +1,258 @@
+"""Binary profile format with per-field random access and columnar statistics.
+
+Wide matrices produce profiles with thousands of ``field_analyses``; as
+indented JSON, reading one field's statistics means parsing all of them.
+The binary format stores every field analysis as its own pickle of plain
+containers behind an offset table, so a reader maps the file, looks the field
+name up in the header and decodes just that field. The same analyses are also
+stored as the columns of a ``FieldTable`` in an Arrow IPC stream, so reports
+that read statistics of every field (catalog, TSV reports, plots, diff, drift)
+build the table from Arrow buffers instead of unpickling each field; the
+nested values (top values, identifiers, other keys) are unpickled per column,
+and only when a report indexes them.
+
+Layout (little-endian)::
+
+    magic (8 bytes) | header length | field count | columns length (uint64 each)
+    header: pickled {'profile': profile without field_analyses, 'field_names': [...], 'keys': [...]}
+    columns: Arrow IPC stream, one row per field; counts, floats and labels as
+        Arrow columns, nested values as binary columns of pickles
+    offsets: field count + 1 uint64, relative to the start of the field data
+    field data: one pickle per field analysis, in profile order
+
+Version 1 files (``HQPROF1``) have no columns section; their table is built
+from the decoded fields.
+
+Only plain containers, strings and numbers are written (NumPy scalars become
+Python numbers and anything else its ``str``, as ``generate_json_report``
+does with ``default=str``), and the reader refuses anything else, so a
+profile file cannot execute code when loaded. JSON export stays available
+through ``generate_json_report(read_binary_profile(path), json_path)``.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
+import builtins
+import io
+import mmap
+import pickle
+import struct
+
+import numpy as np
+import pyarrow as pa
+
+try:
+    from ..core.field_profile import (
+        FieldTable, COUNT_COLUMNS, FLOAT_COLUMNS, LABEL_COLUMNS, OBJECT_COLUMNS, object_column,
+    )
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.field_profile import (
+        FieldTable, COUNT_COLUMNS, FLOAT_COLUMNS, LABEL_COLUMNS, OBJECT_COLUMNS, object_column,
+    )
+
+
+BINARY_PROFILE_MAGIC = b'HQPROF2\x00'
+BINARY_PROFILE_SUFFIX = '.hqprof'
+
+_HEADER = struct.Struct('<8sQQQ')
+_V1_MAGIC = b'HQPROF1\x00'
+_V1_HEADER = struct.Struct('<8sQQ')
+_PLAIN_TYPES = (dict, list, tuple, str, int, float, bool, type(None), type)
+_ALLOWED_BUILTINS = {'str', 'int', 'float', 'bool'}
+
+
+class _PlainPickler(pickle.Pickler):
+    """Pickler that reduces every non-container value to a builtin number or string."""
+
+    def reducer_override(self, obj):
+        if type(obj) in _PLAIN_TYPES:
+            return NotImplemented
+        if isinstance(obj, np.generic):
+            value = obj.item()
+            return type(value), (value,)
+        return str, (str(obj),)
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves the builtins ``_PlainPickler`` can emit."""
+
+    def find_class(self, module, name):
+        if module == 'builtins' and name in _ALLOWED_BUILTINS:
+            return getattr(builtins, name)
+        raise pickle.UnpicklingError(f"Binary profiles may not reference {module}.{name}")
+
+
+def _dumps(value: Any) -> bytes:
+    buffer = io.BytesIO()
+    _PlainPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+def _loads(data) -> Any:
+    return _PlainUnpickler(io.BytesIO(data)).load()
+
+
+def _column_stream(fields: List[Dict[str, Any]]) -> bytes:
+    """Arrow IPC stream of the ``FieldTable`` columns of field analyses."""
+    table = FieldTable.from_records(fields)
+    arrays = {name: pa.array(table.columns[name]) for name in COUNT_COLUMNS + FLOAT_COLUMNS}
+    for name in LABEL_COLUMNS:
+        arrays[name] = pa.array([None if label is None else str(label) for label in table.columns[name]],
+                                type=pa.string())
+    for name in OBJECT_COLUMNS:
+        arrays[name] = pa.array([None if value is None else _dumps(value) for value in table.columns[name]],
+                                type=pa.binary())
+    batch = pa.record_batch(list(arrays.values()), names=list(arrays))
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def write_binary_profile(profile: Dict[str, Any], output_path: Path) -> None:
+    """
+    Write a profile in the binary format.
+
+    Args:
+        profile: Analysis results dictionary
+        output_path: Path to save the binary profile
+    """
+    fields = profile.get('field_analyses', [])
+    blobs = [_dumps(field) for field in fields]
+    header = _dumps({
+        'profile': {key: value for key, value in profile.items() if key != 'field_analyses'},
+        'field_names': [field.get('field_name') for field in fields],
+        'keys': list(profile),
+    })
+    columns = _column_stream(fields)
+    offsets = np.zeros(len(blobs) + 1, dtype='<u8')
+    np.cumsum([len(blob) for blob in blobs], out=offsets[1:])
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(_HEADER.pack(BINARY_PROFILE_MAGIC, len(header), len(blobs), len(columns)))
+        f.write(header)
+        f.write(columns)
+        f.write(offsets.tobytes())
+        f.writelines(blobs)
+
+
+class BinaryProfileReader:
+    """Memory-mapped reader that decodes field analyses on demand."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._file.close()
+            raise ValueError(f"{self.path} is not a binary profile")
+
+        magic = self._map[:len(BINARY_PROFILE_MAGIC)]
+        if magic == BINARY_PROFILE_MAGIC and self._map.size() >= _HEADER.size:
+            _, header_length, field_count, columns_length = _HEADER.unpack_from(self._map, 0)
+            start = _HEADER.size
+        elif magic == _V1_MAGIC and self._map.size() >= _V1_HEADER.size:
+            _, header_length, field_count = _V1_HEADER.unpack_from(self._map, 0)
+            start, columns_length = _V1_HEADER.size, None
+        else:
+            self.close()
+            raise ValueError(f"{self.path} is not a binary profile")
+
+        header = _loads(self._map[start:start + header_length])
+        self.metadata = header['profile']
+        self.field_names = header['field_names']
+        self._keys = header['keys']
+
+        start += header_length
+        self._columns = None
+        if columns_length is not None:
+            self._columns = (start, start + columns_length)
+            start += columns_length
+        self._offsets = np.frombuffer(self._map, dtype='<u8', count=field_count + 1, offset=start)
+        self._data_start = start + self._offsets.nbytes
+
+        # First field wins if a name repeats
+        self._positions = {}
+        for position, name in enumerate(self.field_names):
+            self._positions.setdefault(name, position)
+
+    def __enter__(self) -> 'BinaryProfileReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._offsets = None
+        if getattr(self, '_map', None) is not None and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self.field_names)
+
+    @property
+    def has_field_analyses(self) -> bool:
+        """Whether the profile has a ``field_analyses`` list (possibly empty)."""
+        return 'field_analyses' in self._keys
+
+    def field_table(self) -> FieldTable:
+        """
+        All field analyses as a ``FieldTable``, read from the columns section.
+
+        Count, float and label columns come straight from the Arrow buffers;
+        the nested-value columns are unpickled when first indexed. The table
+        stays usable after the reader is closed.
+        """
+        if self._columns is None:
+            return FieldTable.from_records(self.fields())
+
+        start, end = self._columns
+        # Copied out of the map, so the table does not pin the file open
+        table = pa.ipc.open_stream(self._map[start:end]).read_all()
+        columns = {name: table.column(name).to_numpy() for name in COUNT_COLUMNS + FLOAT_COLUMNS + LABEL_COLUMNS}
+
+        def loader(name):
+            return lambda: object_column([
+                None if blob is None else _loads(blob) for blob in table.column(name).to_pylist()
+            ])
+
+        return FieldTable(columns, {name: loader(name) for name in OBJECT_COLUMNS})
+
+    def field_at(self, position: int) -> Dict[str, Any]:
+        """Decode the field analysis at a position."""
+        start = self._data_start + int(self._offsets[position])
+        end = self._data_start + int(self._offsets[position + 1])
+        return _loads(self._map[start:end])
+
+    def field(self, name: str) -> Optional[Dict[str, Any]]:
+        """Decode one field analysis by field name (None if absent)."""
+        position = self._positions.get(name)
+        return None if position is None else self.field_at(position)
+
+    def fields(self, names: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Decode all field analyses, or those named, in profile order."""
+        if names is None:
+            positions = range(len(self.field_names))
+        else:
+            positions = sorted(self._positions[name] for name in names if name in self._positions)
+        for position in positions:
+            yield self.field_at(position)
+
+    def profile(self) -> Dict[str, Any]:
+        """Decode the complete profile."""
+        return {
+            key: list(self.fields()) if key == 'field_analyses' else self.metadata[key]
+            for key in self._keys
+        }
+
+
+def read_binary_profile(path: Path) -> Dict[str, Any]:
+    """Read a complete binary profile."""
+    with BinaryProfileReader(path) as reader:
+        return reader.profile()
+
@@ -1,53 +1,90 @@
 """Data dictionary export for all analyzed fields."""
 
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 import csv
 
+import numpy as np
 
-def generate_data_dictionary(all_analyses: Dict[str, Dict[str, Any]],
+try:
+    from ..core.field_profile import FieldTable
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.field_profile import FieldTable
+
+LENGTH_COLUMNS = {'min_length': 'min_length', 'max_length': 'max_length', 'mean_length': 'mean_length'}
+VALUE_COLUMNS = {'min_value': 'min', 'max_value': 'max', 'mean_value': 'mean',
+                 'median_value': 'median', 'std_value': 'std'}
+# Statistics rounded to two decimals in the dictionary
+ROUNDED_COLUMNS = {'mean_length', 'mean_value', 'median_value', 'std_value'}
+
+
+def _stat_lists(columns: Dict[str, np.ndarray], names: Dict[str, str]) -> Dict[str, List[Any]]:
+    """Dictionary columns as lists, rounded where the dictionary rounds them."""
+    return {
+        name: np.nan_to_num(columns[stat]).round(2).tolist() if name in ROUNDED_COLUMNS else columns[stat].tolist()
+        for name, stat in names.items()
+    }
+
+
+def _dictionary_rows(source_name: str, fields: FieldTable) -> List[Dict[str, Any]]:
+    """Dictionary rows of a source's fields, built column-wise from the table."""
+    columns = fields.columns
+    counts = {
+        name: np.maximum(columns[name], 0).tolist()
+        for name in ('total_count', 'non_null_count', 'null_count', 'unique_count')
+    }
+    null_percentage = np.nan_to_num(columns['null_percentage']).round(2).tolist()
+    has_lengths = (columns['min_length'] >= 0).tolist()
+    has_values = (~np.isnan(columns['min'])).tolist()
+    lengths = _stat_lists(columns, LENGTH_COLUMNS)
+    values = _stat_lists(columns, VALUE_COLUMNS)
+
+    rows = []
+    for position, field_name in enumerate(columns['field_name'].tolist()):
+        row = {
+            'source': source_name,
+            'field_name': field_name,
+            'data_type': columns['data_type'][position] or '',
+            'total_count': counts['total_count'][position],
+            'non_null_count': counts['non_null_count'][position],
+            'null_count': counts['null_count'][position],
+            'null_percentage': null_percentage[position],
+            'unique_count': counts['unique_count'][position],
+            'cardinality': columns['cardinality'][position] or '',
+            'pattern': columns['pattern'][position] or '',
+        }
+
+        # Add type-specific stats
+        if has_lengths[position]:
+            row.update((name, column[position]) for name, column in lengths.items())
+
+        if has_values[position]:
+            row.update((name, column[position]) for name, column in values.items())
+
+        rows.append(row)
+    return rows
+
+
+def generate_data_dictionary(all_analyses: Dict[str, Union[FieldTable, Dict[str, Any]]],
                             output_path: Path) -> None:
     """
     Generate CSV data dictionary from all analyses.
 
     Args:
-        all_analyses: Dictionary mapping source names to analysis results
+        all_analyses: Dictionary mapping source names to analysis results, or
+            to a ``FieldTable`` of the source's fields (as read from a profile store)
         output_path: Path to save data dictionary CSV
     """
     rows = []
 
     for source_name, analysis_data in all_analyses.items():
-        if 'field_analyses' not in analysis_data:
+        if isinstance(analysis_data, FieldTable):
+            fields = analysis_data
+        elif 'field_analyses' in analysis_data:
+            fields = FieldTable.from_records(analysis_data['field_analyses'])
+        else:
             continue
-
-        for field in analysis_data['field_analyses']:
-            row = {
-                'source': source_name,
-                'field_name': field.get('field_name', ''),
-                'data_type': field.get('data_type', ''),
-                'total_count': field.get('total_count', 0),
-                'non_null_count': field.get('non_null_count', 0),
-                'null_count': field.get('null_count', 0),
-                'null_percentage': round(field.get('null_percentage', 0), 2),
-                'unique_count': field.get('unique_count', 0),
-                'cardinality': field.get('cardinality', ''),
-                'pattern': field.get('pattern', ''),
-            }
-
-            # Add type-specific stats
-            if 'min_length' in field:
-                row['min_length'] = field['min_length']
-                row['max_length'] = field['max_length']
-                row['mean_length'] = round(field.get('mean_length', 0), 2)
-
-            if 'min' in field:
-                row['min_value'] = field['min']
-                row['max_value'] = field['max']
-                row['mean_value'] = round(field.get('mean', 0), 2)
-                row['median_value'] = round(field.get('median', 0), 2)
-                row['std_value'] = round(field.get('std', 0), 2)
-
-            rows.append(row)
+        rows.extend(_dictionary_rows(source_name, fields))
 
     # Determine all unique column names
     if not rows:
@@ -0,0 +1,155 @@
+"""HTML report with field details loaded on demand.
+
+The report page holds the file information and one collapsed section per
+chunk of fields; the field details of a chunk are written to their own file
+in ``<report stem>_chunks/`` and only loaded when the section is opened, so
+the page of a file with thousands of columns stays small. Each chunk is a JSON
+array passed to a callback (``hqFieldChunk(n, [...])``) and loaded with a
+script tag, because browsers refuse ``fetch`` of local ``file://`` paths.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List
+from datetime import datetime
+from html import escape
+import json
+import shutil
+
+from .markdown_report import FIELDS_PER_PAGE
+
+FILE_INFORMATION_KEYS = [
+    ('filepath', 'File'),
+    ('file_size_mb', 'Size (MB)'),
+    ('row_count', 'Rows'),
+    ('column_count', 'Columns'),
+    ('delimiter', 'Delimiter'),
+    ('encoding', 'Encoding'),
+    ('format', 'Format'),
+    ('max_depth', 'Max Depth'),
+    ('node_count', 'Node Count'),
+    ('unique_paths', 'Unique Paths'),
+]
+
+_PAGE_START = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Data Analysis Report: {title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 0.2em 0.5em; text-align: left; vertical-align: top; }}
+summary {{ cursor: pointer; margin: 0.3em 0; }}
+</style>
+<script>
+const FIELD_COLUMNS = [
+  ['field_name', 'Field'], ['data_type', 'Type'], ['non_null', 'Non-null'], ['unique_count', 'Unique'],
+  ['cardinality', 'Cardinality'], ['pattern', 'Pattern'], ['range', 'Range / length'], ['top_values', 'Top values'],
+];
+function hqFieldChunk(chunk, fields) {{
+  const section = document.getElementById('chunk-' + chunk);
+  const table = document.createElement('table');
+  const header = table.insertRow();
+  for (const [, label] of FIELD_COLUMNS) {{
+    const th = document.createElement('th');
+    th.textContent = label;
+    header.appendChild(th);
+  }}
+  for (const field of fields) {{
+    const row = table.insertRow();
+    for (const [key] of FIELD_COLUMNS) {{
+      row.insertCell().textContent = field[key] === null || field[key] === undefined ? '' : field[key];
+    }}
+  }}
+  section.querySelector('.loading').replaceWith(table);
+}}
+function loadChunk(details) {{
+  if (!details.open || details.dataset.loaded) return;
+  details.dataset.loaded = 'true';
+  const script = document.createElement('script');
+  script.src = details.dataset.src;
+  document.body.appendChild(script);
+}}
+</script>
+</head>
+<body>
+"""
+
+
+def _field_record(field: Dict[str, Any]) -> Dict[str, Any]:
+    """Display values of one field analysis for the chunk files."""
+    if field.get('min') is not None:
+        value_range = f"{field['min']:.2f} - {field['max']:.2f} (mean {field.get('mean') or 0:.2f})"
+    elif field.get('min_length') is not None:
+        value_range = f"{field['min_length']}-{field.get('max_length')} chars"
+    else:
+        value_range = None
+    return {
+        'field_name': field.get('field_name'),
+        'data_type': field.get('data_type'),
+        'non_null': f"{int(field.get('non_null_count') or 0):,} / {int(field.get('total_count') or 0):,} ({100 - float(field.get('null_percentage') or 0):.1f}%)",
+        'unique_count': field.get('unique_count'),
+        'cardinality': field.get('cardinality'),
+        'pattern': field.get('pattern'),
+        'range': value_range,
+        'top_values': ', '.join(f"{val['value']} ({val['count']:,})" for val in (field.get('top_values') or [])[:5]),
+    }
+
+
+def generate_html_report(analysis_data: Dict[str, Any], output_path: Path,
+                         fields_per_chunk: int = FIELDS_PER_PAGE) -> None:
+    """
+    Generate an HTML report whose field details load per chunk when expanded.
+
+    Args:
+        analysis_data: Analysis results dictionary
+        output_path: Path to save HTML report
+        fields_per_chunk: Fields per lazily loaded chunk
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    metadata = {**analysis_data.get('file_metadata', {}), **analysis_data}
+    chunks_dir = output_path.parent / f"{output_path.stem}_chunks"
+    shutil.rmtree(chunks_dir, ignore_errors=True)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(_PAGE_START.format(title=escape(str(metadata.get('filename', 'Unknown')))))
+        f.write(f"<h1>Data Analysis Report: {escape(str(metadata.get('filename', 'Unknown')))}</h1>\n")
+        f.write(f"<p><strong>Generated</strong>: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>\n")
+
+        # File information
+        f.write("<h2>File Information</h2>\n<table>\n")
+        for key, label in FILE_INFORMATION_KEYS:
+            if key in metadata:
+                f.write(f"<tr><th>{label}</th><td>{escape(str(metadata[key]))}</td></tr>\n")
+        f.write("</table>\n")
+
+        field_analyses = analysis_data.get('field_analyses', [])
+        if field_analyses:
+            chunks_dir.mkdir(parents=True)
+            f.write(f"<h2>Field Analysis</h2>\n<p>Total fields: <strong>{len(field_analyses):,}</strong></p>\n")
+            for chunk, start in enumerate(range(0, len(field_analyses), fields_per_chunk), 1):
+                fields = field_analyses[start:start + fields_per_chunk]
+                chunk_name = f"chunk-{chunk:03d}.js"
+                records = [_field_record(field) for field in fields]
+                with open(chunks_dir / chunk_name, 'w', encoding='utf-8') as chunk_file:
+                    chunk_file.write(f"hqFieldChunk({chunk}, {json.dumps(records, default=str)});\n")
+
+                first, last = fields[0].get('field_name', ''), fields[-1].get('field_name', '')
+                f.write(
+                    f'<details id="chunk-{chunk}" data-src="{escape(chunks_dir.name)}/{chunk_name}" '
+                    f'ontoggle="loadChunk(this)"><summary>Fields {start + 1:,}-{start + len(fields):,}: '
+                    f'{escape(str(first))} &hellip; {escape(str(last))}</summary>'
+                    f'<p class="loading">Loading&hellip;</p></details>\n'
+                )
+
+        paths: List[str] = analysis_data.get('paths', [])
+        if paths:
+            f.write("<h2>Structure Analysis</h2>\n<h3>Top Paths</h3>\n<ul>\n")
+            for path in paths[:20]:
+                f.write(f"<li><code>{escape(str(path))}</code></li>\n")
+            f.write("</ul>\n")
+            path_count = analysis_data.get('unique_paths', len(paths))
+            if path_count > 20:
+                f.write(f"<p><em>...and {path_count - 20} more paths</em></p>\n")
+
+        f.write("</body>\n</html>\n")
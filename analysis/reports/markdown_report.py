@@ -3,95 +3,169 @@
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
+import shutil
 
+# Field sections per page once a report is paginated
+FIELDS_PER_PAGE = 200
 
-def generate_markdown_report(analysis_data: Dict[str, Any], output_path: Path) -> None:
+
+def _field_lines(field: Dict[str, Any]) -> List[str]:
+    """Markdown section of one field analysis."""
+    # Counts are coerced because older JSON profiles hold them as strings
+    lines = []
+    lines.append(f"### {field.get('field_name') or 'Unknown'}\n")
+    lines.append(f"- **Type**: {field.get('data_type') or 'unknown'}")
+    lines.append(f"- **Non-null**: {int(field.get('non_null_count') or 0):,} / {int(field.get('total_count') or 0):,} ({100 - float(field.get('null_percentage') or 0):.1f}%)")
+    lines.append(f"- **Unique values**: {int(field.get('unique_count') or 0):,}")
+    lines.append(f"- **Cardinality**: {field.get('cardinality') or 'N/A'}")
+
+    if field.get('pattern'):
+        lines.append(f"- **Pattern**: {field['pattern']}")
+
+    # String stats
+    if field.get('min_length') is not None:
+        lines.append(f"- **Length**: {field['min_length']}-{field.get('max_length')} chars (avg: {field.get('mean_length') or 0:.1f})")
+
+    # Numeric stats
+    if field.get('min') is not None:
+        lines.append(f"- **Range**: {field['min']:.2f} - {field['max']:.2f}")
+        lines.append(f"- **Mean**: {field.get('mean') or 0:.2f} (±{field.get('std') or 0:.2f})")
+        lines.append(f"- **Median**: {field.get('median') or 0:.2f}")
+
+    # Top values
+    if field.get('top_values'):
+        lines.append("- **Top values**:")
+        for val in field['top_values'][:5]:
+            lines.append(f"  - `{val['value']}`: {val['count']:,} ({val['percentage']:.1f}%)")
+
+    lines.append("")
+    return lines
+
+
+def _write_lines(f, lines: List[str]) -> None:
+    f.writelines(f"{line}\n" for line in lines)
+
+
+def field_pages_dir(output_path: Path) -> Path:
+    """Directory holding the field pages of a paginated report."""
+    return output_path.parent / f"{output_path.stem}_fields"
+
+
+def generate_markdown_report(analysis_data: Dict[str, Any], output_path: Path,
+                             fields_per_page: int = FIELDS_PER_PAGE) -> None:
     """
     Generate markdown report from analysis data.
 
+    Sections are written as they are produced. When there are more than
+    ``fields_per_page`` fields, the field sections go to numbered pages in
+    ``<report stem>_fields/`` and the report lists the pages instead.
+
     Args:
         analysis_data: Analysis results dictionary
         output_path: Path to save markdown report
+        fields_per_page: Field sections per page of a paginated report
     """
-    lines = []
-
-    # Header
-    filename = analysis_data.get('filename', 'Unknown')
-    lines.append(f"# Data Analysis Report: {filename}\n")
-    lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    lines.append("---\n")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # File metadata
-    lines.append("## File Information\n")
-    lines.append(f"- **File**: {analysis_data.get('filepath', 'N/A')}")
-    lines.append(f"- **Size**: {analysis_data.get('file_size_mb', 0):.2f} MB")
-
-    if 'row_count' in analysis_data:
-        # Tabular data
-        lines.append(f"- **Rows**: {analysis_data.get('row_count', 0):,}")
-        lines.append(f"- **Columns**: {analysis_data.get('column_count', 0)}")
-        lines.append(f"- **Delimiter**: `{analysis_data.get('delimiter', 'N/A')}`")
-        lines.append(f"- **Encoding**: {analysis_data.get('encoding', 'N/A')}")
-    elif 'format' in analysis_data:
-        # Semi-structured data
-        lines.append(f"- **Format**: {analysis_data.get('format', 'N/A')}")
-        lines.append(f"- **Max Depth**: {analysis_data.get('max_depth', 0)}")
-        lines.append(f"- **Node Count**: {analysis_data.get('node_count', 0):,}")
-        lines.append(f"- **Unique Paths**: {analysis_data.get('unique_paths', 0)}")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        lines = []
 
-    lines.append("")
+        # Header
+        filename = analysis_data.get('filename', 'Unknown')
+        lines.append(f"# Data Analysis Report: {filename}\n")
+        lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        lines.append("---\n")
 
-    # Field-level analysis for tabular data
-    if 'field_analyses' in analysis_data:
-        lines.append("## Field Analysis\n")
-        lines.append(f"Total fields: **{len(analysis_data['field_analyses'])}**\n")
-
-        for field in analysis_data['field_analyses']:
-            field_name = field.get('field_name', 'Unknown')
-            lines.append(f"### {field_name}\n")
-            lines.append(f"- **Type**: {field.get('data_type', 'unknown')}")
-            lines.append(f"- **Non-null**: {field.get('non_null_count', 0):,} / {field.get('total_count', 0):,} ({100 - field.get('null_percentage', 0):.1f}%)")
-            lines.append(f"- **Unique values**: {field.get('unique_count', 0):,}")
-            lines.append(f"- **Cardinality**: {field.get('cardinality', 'N/A')}")
-
-            if field.get('pattern'):
-                lines.append(f"- **Pattern**: {field['pattern']}")
-
-            # String stats
-            if 'min_length' in field:
-                lines.append(f"- **Length**: {field['min_length']}-{field['max_length']} chars (avg: {field.get('mean_length', 0):.1f})")
-
-            # Numeric stats
-            if 'min' in field:
-                lines.append(f"- **Range**: {field['min']:.2f} - {field['max']:.2f}")
-                lines.append(f"- **Mean**: {field.get('mean', 0):.2f} (±{field.get('std', 0):.2f})")
-                lines.append(f"- **Median**: {field.get('median', 0):.2f}")
-
-            # Top values
-            if 'top_values' in field and field['top_values']:
-                lines.append("- **Top values**:")
-                for val in field['top_values'][:5]:
-                    lines.append(f"  - `{val['value']}`: {val['count']:,} ({val['percentage']:.1f}%)")
+        # File metadata
+        lines.append("## File Information\n")
+        lines.append(f"- **File**: {analysis_data.get('filepath', 'N/A')}")
+        lines.append(f"- **Size**: {analysis_data.get('file_size_mb', 0):.2f} MB")
 
-            lines.append("")
+        if 'row_count' in analysis_data:
+            # Tabular data
+            lines.append(f"- **Rows**: {analysis_data.get('row_count', 0):,}")
+            lines.append(f"- **Columns**: {analysis_data.get('column_count', 0)}")
+            lines.append(f"- **Delimiter**: `{analysis_data.get('delimiter', 'N/A')}`")
+            lines.append(f"- **Encoding**: {analysis_data.get('encoding', 'N/A')}")
+        elif 'format' in analysis_data:
+            # Semi-structured data
+            lines.append(f"- **Format**: {analysis_data.get('format', 'N/A')}")
+            lines.append(f"- **Max Depth**: {analysis_data.get('max_depth', 0)}")
+            lines.append(f"- **Node Count**: {analysis_data.get('node_count', 0):,}")
+            lines.append(f"- **Unique Paths**: {analysis_data.get('unique_paths', 0)}")
+            if 'file_count' in analysis_data:
+                # Corpus of many files
+                lines.append(f"- **Files**: {analysis_data.get('file_count', 0):,} ({analysis_data.get('error_count', 0):,} unparseable)")
 
-    # Structure analysis for semi-structured data
-    if 'paths' in analysis_data:
-        lines.append("## Structure Analysis\n")
-        paths = analysis_data['paths'][:20]  # Top 20 paths
-        lines.append("### Top Paths\n")
-        for path in paths:
-            lines.append(f"- `{path}`")
         lines.append("")
+        _write_lines(f, lines)
+
+        # Field-level analysis for tabular data
+        if 'field_analyses' in analysis_data:
+            field_analyses = analysis_data['field_analyses']
+            _write_lines(f, ["## Field Analysis\n", f"Total fields: **{len(field_analyses)}**\n"])
+
+            if len(field_analyses) <= fields_per_page:
+                shutil.rmtree(field_pages_dir(output_path), ignore_errors=True)
+                for field in field_analyses:
+                    _write_lines(f, _field_lines(field))
+            else:
+                _write_field_pages(f, field_analyses, output_path, fields_per_page)
+
+        # Structure analysis for semi-structured data
+        if 'paths' in analysis_data:
+            lines = ["## Structure Analysis\n"]
+            paths = analysis_data['paths'][:20]  # Top 20 paths
+            lines.append("### Top Paths\n")
+            for path in paths:
+                lines.append(f"- `{path}`")
+            lines.append("")
 
-        if len(analysis_data['paths']) > 20:
-            lines.append(f"*...and {len(analysis_data['paths']) - 20} more paths*\n")
-
-    # Write report
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+            path_count = analysis_data.get('unique_paths', len(analysis_data['paths']))
+            if path_count > 20:
+                lines.append(f"*...and {path_count - 20} more paths*\n")
+            _write_lines(f, lines)
+
+
+def _write_field_pages(f, field_analyses: List[Dict[str, Any]], output_path: Path,
+                       fields_per_page: int) -> None:
+    """Write field sections to page files and their index to the open report ``f``."""
+    pages_dir = field_pages_dir(output_path)
+    shutil.rmtree(pages_dir, ignore_errors=True)
+    pages_dir.mkdir(parents=True)
+
+    total = len(field_analyses)
+    page_count = (total + fields_per_page - 1) // fields_per_page
+    _write_lines(f, [
+        f"Field details are split into {page_count} pages of up to {fields_per_page} fields.\n",
+        "| Page | Fields | First field | Last field |",
+        "|------|--------|-------------|------------|",
+    ])
+
+    for page in range(1, page_count + 1):
+        start = (page - 1) * fields_per_page
+        chunk = field_analyses[start:start + fields_per_page]
+        page_name = f"page-{page:03d}.md"
+
+        navigation = [f"[Report](../{output_path.name})"]
+        if page > 1:
+            navigation.append(f"[Previous](page-{page - 1:03d}.md)")
+        if page < page_count:
+            navigation.append(f"[Next](page-{page + 1:03d}.md)")
+
+        with open(pages_dir / page_name, 'w', encoding='utf-8') as page_file:
+            _write_lines(page_file, [
+                f"# Fields {start + 1:,}-{start + len(chunk):,} of {total:,}\n",
+                " | ".join(navigation) + "\n",
+            ])
+            for field in chunk:
+                _write_lines(page_file, _field_lines(field))
+
+        first, last = chunk[0].get('field_name', ''), chunk[-1].get('field_name', '')
+        _write_lines(f, [
+            f"| [{page}]({pages_dir.name}/{page_name}) | {start + 1:,}-{start + len(chunk):,} | `{first}` | `{last}` |"
+        ])
+    _write_lines(f, [""])
 
 
 def generate_summary_markdown(all_analyses: Dict[str, Dict[str, Any]],
@@ -0,0 +1,317 @@
+"""
+Load every profile of a sources directory once for all reports.
+
+The report generators used to walk ``sources_dir`` and re-parse each
+``*_profile.json`` for every report. A ``ProfileCatalog`` walks the directory
+once, decodes the profiles (on a process pool when there is enough JSON to
+make it worthwhile) and hands each generator the same in-memory entries.
+
+Profiles in the directory's profile store are not decoded: their entries
+hold the stored metadata and a ``FieldTable`` built from one scan of the
+store's ``field_analyses`` table, and read the path catalogue from ``paths``.
+A stored profile is used unless its profile file was rewritten after it was
+stored. Binary ``*_profile.hqprof`` profiles are read in place of a JSON
+report of the same name, from their header and columns section. For both, the
+complete profile is only decoded for reports that ask for ``data``.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from ..core.field_profile import FieldTable
+    from ..core.path_trie import PathTrie
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.field_profile import FieldTable
+    from core.path_trie import PathTrie
+
+from .profile_store import ProfileStore, StoredProfile, STORE_FILENAME, file_signature
+from .binary_profile import BinaryProfileReader, read_binary_profile, BINARY_PROFILE_SUFFIX
+
+TABULAR_FORMATS = ['csv', 'tsv', 'txt']
+SEMI_STRUCTURED_FORMATS = ['json', 'xml']
+
+# Below this much profile JSON, starting worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _load_profile(json_path: Path) -> Dict[str, Any]:
+    with open(json_path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def iter_path_catalogue(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Return the full path catalogue of a semi-structured profile.
+
+    Profiles with a ``path_trie`` give every path with its occurrence, parent
+    and file counts; older profiles fall back to the ``paths`` list.
+    """
+    if 'path_trie' in data:
+        return list(PathTrie.from_dict(data['path_trie']).items())
+
+    return [
+        {'path': path, 'occurrences': '', 'parent_count': '', 'file_count': ''}
+        for path in data.get('paths', [])
+    ]
+
+
+def _profile_paths(source_dir: Path) -> List[Path]:
+    """Profile files below a source directory; a binary profile hides its JSON twin."""
+    binary = set(source_dir.rglob(f'*_profile{BINARY_PROFILE_SUFFIX}'))
+    json_paths = [path for path in source_dir.rglob('*_profile.json')
+                  if path.with_suffix(BINARY_PROFILE_SUFFIX) not in binary]
+    return sorted(binary.union(json_paths))
+
+
+class ProfileEntry:
+    """
+    One profile with its source and typed accessors for report columns.
+
+    ``metadata`` holds the profile's top-level values. An entry built from
+    ``metadata`` and a ``field_table`` decodes the complete profile (``data``)
+    with ``load`` on first use only.
+    """
+
+    __slots__ = ('source', 'json_path', 'metadata', '_data', '_field_table', '_load', '_load_paths',
+                 '_has_field_analyses')
+
+    def __init__(self, source: str, json_path: Path, data: Optional[Dict[str, Any]] = None,
+                 metadata: Optional[Dict[str, Any]] = None, field_table: Optional[FieldTable] = None,
+                 load: Optional[Callable[[], Dict[str, Any]]] = None,
+                 load_paths: Optional[Callable[[], List[Dict[str, Any]]]] = None):
+        self.source = source
+        self.json_path = json_path
+        self.metadata = data if metadata is None else metadata
+        self._data = data
+        self._field_table = field_table
+        self._load = load
+        self._load_paths = load_paths
+        self._has_field_analyses = field_table is not None or 'field_analyses' in self.metadata
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The complete profile, decoded on first use."""
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    @property
+    def file_metadata(self) -> Dict[str, Any]:
+        return self.metadata.get('file_metadata', {})
+
+    def get(self, key: str, default: Any = '') -> Any:
+        """Top-level profile value, falling back to ``file_metadata`` (tabular profiles)."""
+        return self.metadata.get(key, self.file_metadata.get(key, default))
+
+    @property
+    def format(self) -> Optional[str]:
+        return self.metadata.get('format')
+
+    @property
+    def filename(self) -> str:
+        return self.get('filename')
+
+    @property
+    def field_analyses(self) -> List[Dict[str, Any]]:
+        return self.data.get('field_analyses', [])
+
+    @property
+    def field_table(self) -> FieldTable:
+        """Field analyses as a ``FieldTable``, built on first use."""
+        if self._field_table is None:
+            self._field_table = FieldTable.from_records(self.field_analyses if self._has_field_analyses else [])
+        return self._field_table
+
+    @property
+    def path_catalogue(self) -> List[Dict[str, Any]]:
+        """Rows of the profile's path catalogue (see ``iter_path_catalogue``)."""
+        if self._load_paths is not None:
+            return self._load_paths()
+        return iter_path_catalogue(self.data)
+
+    @property
+    def is_tabular(self) -> bool:
+        return self.format in TABULAR_FORMATS or self._has_field_analyses
+
+    @property
+    def is_semi_structured(self) -> bool:
+        return self.format in SEMI_STRUCTURED_FORMATS
+
+    @property
+    def is_other(self) -> bool:
+        return self.format not in TABULAR_FORMATS + SEMI_STRUCTURED_FORMATS
+
+
+def _binary_entry(source: str, path: Path) -> ProfileEntry:
+    """Entry of a binary profile from its header and columns section, without decoding any field."""
+    with BinaryProfileReader(path) as reader:
+        return ProfileEntry(
+            source, path,
+            metadata=reader.metadata,
+            field_table=reader.field_table() if reader.has_field_analyses else None,
+            load=partial(read_binary_profile, path),
+        )
+
+
+def _stored_entries(store_path: Path, stored: List[StoredProfile]) -> List[ProfileEntry]:
+    """Entries of stored profiles with their field tables, from one scan of the store."""
+    with ProfileStore(store_path) as store:
+        tables = store.field_tables([row.profile_id for row in stored if row.field_count])
+    return [
+        ProfileEntry(
+            row.source, store_path.parent / row.profile_path,
+            metadata=row.metadata,
+            field_table=None if row.field_count is None else tables.get(row.profile_id, FieldTable.from_records([])),
+            load=partial(_stored_document, store_path, row.profile_path),
+            load_paths=partial(_stored_paths, store_path, row.profile_id),
+        )
+        for row in stored
+    ]
+
+
+def _stored_document(store_path: Path, profile_path: str) -> Dict[str, Any]:
+    with ProfileStore(store_path) as store:
+        return store.document(profile_path)
+
+
+def _stored_paths(store_path: Path, profile_id: int) -> List[Dict[str, Any]]:
+    with ProfileStore(store_path) as store:
+        return store.path_catalogue(profile_id)
+
+
+def _is_current(sources_dir: Path, profile_path: str, signature: Optional[str]) -> bool:
+    """Whether a stored profile is as new as its profile file (or has none)."""
+    current = file_signature(sources_dir / profile_path)
+    return current is None or current == signature
+
+
+class ProfileCatalog:
+    """All profiles of a sources directory, ordered by source and path."""
+
+    def __init__(self, entries: List[ProfileEntry]):
+        self.entries = entries
+
+    @staticmethod
+    def signatures(sources_dir: Path) -> Dict[Path, Tuple[str, str]]:
+        """
+        Source and change signature of every profile, without decoding any.
+
+        The signature is the store digest for stored profiles and the size
+        and modification time of profile files that are not stored, or were
+        rewritten after they were stored.
+
+        Returns:
+            Dictionary mapping profile paths to (source, signature)
+        """
+        sources_dir = Path(sources_dir)
+        signatures = {}
+        store_path = sources_dir / STORE_FILENAME
+        if store_path.exists():
+            with ProfileStore(store_path) as store:
+                for profile_path, (source, digest, signature) in store.digests().items():
+                    if _is_current(sources_dir, profile_path, signature):
+                        signatures[sources_dir / profile_path] = (source, digest)
+
+        for source_dir in sorted(sources_dir.iterdir()):
+            if source_dir.is_dir():
+                for path in _profile_paths(source_dir):
+                    if path not in signatures:
+                        signatures[path] = (source_dir.name, file_signature(path))
+        return signatures
+
+    @classmethod
+    def load(cls, sources_dir: Path, workers: Optional[int] = None,
+             paths: Optional[Iterable[Path]] = None) -> 'ProfileCatalog':
+        """
+        Find and decode every ``*_profile.json`` and ``*_profile.hqprof`` under ``sources_dir``.
+
+        Profiles stored in ``<sources_dir>/profiles.sqlite`` take precedence
+        over the profile file at the same path, unless the file was rewritten
+        after the profile was stored.
+
+        Args:
+            sources_dir: Path to sources directory (e.g., output/preliminary-analysis/sources)
+            workers: Number of decoding processes (default: CPU count); 1 decodes inline
+            paths: Only decode these profiles (profile file paths, as in ``signatures``)
+
+        Returns:
+            Catalog with one entry per profile
+        """
+        sources_dir = Path(sources_dir)
+        selected = None if paths is None else {Path(path) for path in paths}
+
+        stored = []
+        store_path = sources_dir / STORE_FILENAME
+        if store_path.exists():
+            profile_paths = None
+            if selected is not None:
+                profile_paths = [p.relative_to(sources_dir).as_posix() for p in selected
+                                 if p.is_relative_to(sources_dir)]
+            with ProfileStore(store_path) as store:
+                rows = [
+                    row for row in store.stored_profiles(profile_paths)
+                    if _is_current(sources_dir, row.profile_path, row.file_signature)
+                ]
+            stored = _stored_entries(store_path, rows)
+        stored_paths = {entry.json_path for entry in stored}
+
+        if selected is None:
+            located = []
+            for source_dir in sorted(sources_dir.iterdir()):
+                if source_dir.is_dir():
+                    located.extend(
+                        (source_dir.name, path) for path in _profile_paths(source_dir)
+                        if path not in stored_paths
+                    )
+        else:
+            located = [
+                (path.relative_to(sources_dir).parts[0], path) for path in sorted(selected)
+                if path not in stored_paths and path.exists()
+            ]
+
+        binary = [(source, path) for source, path in located if path.suffix == BINARY_PROFILE_SUFFIX]
+        located = [(source, path) for source, path in located if path.suffix != BINARY_PROFILE_SUFFIX]
+
+        paths = [path for _, path in located]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(paths) <= 1 or sum(p.stat().st_size for p in paths) < PARALLEL_MIN_BYTES:
+            profiles = [_load_profile(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+                profiles = list(executor.map(_load_profile, paths))
+
+        entries = stored + [ProfileEntry(source, path, data) for (source, path), data in zip(located, profiles)]
+        entries.extend(_binary_entry(source, path) for source, path in binary)
+        entries.sort(key=lambda entry: (entry.source, entry.json_path))
+        return cls(entries)
+
+    def __iter__(self) -> Iterator[ProfileEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def by_source(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Profile dictionaries grouped by source name."""
+        sources = {}
+        for entry in self.entries:
+            sources.setdefault(entry.source, []).append(entry.data)
+        return sources
+
+    def tabular(self) -> List[ProfileEntry]:
+        return [entry for entry in self.entries if entry.is_tabular]
+
+    def semi_structured(self) -> List[ProfileEntry]:
+        return [entry for entry in self.entries if entry.is_semi_structured]
+
+    def other(self) -> List[ProfileEntry]:
+        return [entry for entry in self.entries if entry.is_other]
+
+    def analyzed_filepaths(self) -> Set[Path]:
+        """Paths of the data files the profiles describe (top-level ``filepath`` only)."""
+        return {Path(entry.metadata['filepath']) for entry in self.entries if 'filepath' in entry.metadata}
@@ -0,0 +1,169 @@
+"""
+Compare the field statistics of two profile sets (two runs or releases).
+
+Both sets are loaded with ``ProfileCatalog`` (profile store, binary or JSON
+profiles; no data file is re-read), flattened into one frame of field
+statistics each from the per-profile ``FieldTable`` columns, and merge-joined
+on (source, filename, field_name). Every numeric statistic gets an old, new
+and delta column; changes past the thresholds are flagged.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from ..core.field_profile import COUNT_COLUMNS, FLOAT_COLUMNS
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.field_profile import COUNT_COLUMNS, FLOAT_COLUMNS
+
+from .profile_catalog import ProfileCatalog
+
+DIFF_KEYS = ['source', 'filename', 'field_name']
+DIFF_LABELS = ['data_type', 'cardinality', 'pattern']
+DIFF_STATISTICS = list(COUNT_COLUMNS + FLOAT_COLUMNS)
+
+# Statistic -> (flag, threshold, relative); relative thresholds are fractions of the old value
+DEFAULT_THRESHOLDS = {
+    'null_percentage': ('null_rate', 5.0, False),
+    'unique_count': ('cardinality_jump', 0.5, True),
+    'total_count': ('row_count', 0.1, True),
+    'mean': ('mean_shift', 0.1, True),
+}
+
+
+def field_frame(catalog: ProfileCatalog) -> pd.DataFrame:
+    """
+    One row of field statistics per (source, filename, field_name) of a catalog.
+
+    Missing counts are <NA> and missing floats NaN. A repeated field name within
+    a file keeps its first occurrence.
+    """
+    columns = {name: [] for name in DIFF_KEYS + DIFF_LABELS + DIFF_STATISTICS}
+    for entry in catalog.tabular():
+        table = entry.field_table
+        columns['source'].append(np.full(len(table), entry.source, dtype=object))
+        columns['filename'].append(np.full(len(table), entry.filename or entry.json_path.stem, dtype=object))
+        for name in ['field_name'] + DIFF_LABELS + DIFF_STATISTICS:
+            columns[name].append(table.columns[name])
+
+    data = {}
+    for name, arrays in columns.items():
+        if name in COUNT_COLUMNS:
+            counts = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
+            data[name] = pd.array(counts, dtype='Int64')
+            data[name][counts < 0] = pd.NA
+        elif name in FLOAT_COLUMNS:
+            data[name] = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float64)
+        else:
+            data[name] = np.concatenate(arrays) if arrays else np.empty(0, dtype=object)
+
+    return pd.DataFrame(data).drop_duplicates(DIFF_KEYS)
+
+
+def diff_field_frames(old: pd.DataFrame, new: pd.DataFrame,
+                      thresholds: Optional[Dict[str, tuple]] = None) -> pd.DataFrame:
+    """
+    Merge-join two field frames and compute deltas and change flags.
+
+    Args:
+        old: ``field_frame`` of the earlier profiles
+        new: ``field_frame`` of the later profiles
+        thresholds: Statistic -> (flag, threshold, relative) (default: DEFAULT_THRESHOLDS)
+
+    Returns:
+        Frame sorted by the join keys with ``status`` (added, removed, changed
+        or unchanged), comma-separated ``flags``, old/new labels and old, new
+        and delta columns per numeric statistic
+    """
+    thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+    merged = old.merge(new, on=DIFF_KEYS, how='outer', suffixes=('_old', '_new'), indicator=True, sort=True)
+    both = (merged['_merge'] == 'both').to_numpy()
+
+    flags = {}
+    for name in DIFF_LABELS:
+        old_label = merged[f'{name}_old'].fillna('')
+        new_label = merged[f'{name}_new'].fillna('')
+        flags[f'{name}_change'] = both & (old_label != new_label).to_numpy()
+
+    for name in DIFF_STATISTICS:
+        merged[f'{name}_delta'] = merged[f'{name}_new'] - merged[f'{name}_old']
+    for name, (flag, threshold, relative) in thresholds.items():
+        old_value = merged[f'{name}_old'].astype('float64').to_numpy()
+        change = np.abs(merged[f'{name}_delta'].astype('float64').to_numpy())
+        if relative:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                change = np.where(old_value == 0, np.where(change > 0, np.inf, 0.0), change / np.abs(old_value))
+        flags[flag] = both & (np.nan_to_num(change, nan=0.0) >= threshold)
+
+    flag_text = pd.Series('', index=merged.index)
+    for flag, mask in flags.items():
+        flag_text = flag_text.where(~mask, flag_text + ',' + flag)
+    merged['flags'] = flag_text.str.lstrip(',')
+
+    changed = np.logical_or.reduce(list(flags.values())) if flags else np.zeros(len(merged), dtype=bool)
+    merged['status'] = np.select(
+        [merged['_merge'] == 'left_only', merged['_merge'] == 'right_only', changed],
+        ['removed', 'added', 'changed'],
+        'unchanged',
+    )
+
+    ordered = DIFF_KEYS + ['status', 'flags']
+    ordered += [f'{name}_{side}' for name in DIFF_LABELS for side in ('old', 'new')]
+    ordered += [f'{name}_{side}' for name in DIFF_STATISTICS for side in ('old', 'new', 'delta')]
+    return merged[ordered].reset_index(drop=True)
+
+
+def diff_profiles(old_sources_dir: Path, new_sources_dir: Path,
+                  thresholds: Optional[Dict[str, tuple]] = None,
+                  workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Diff the field statistics of two sources directories.
+
+    Args:
+        old_sources_dir: Sources directory of the earlier run
+        new_sources_dir: Sources directory of the later run
+        thresholds: Change thresholds (default: DEFAULT_THRESHOLDS)
+        workers: Profile decoding processes (default: CPU count)
+
+    Returns:
+        Frame from ``diff_field_frames``
+    """
+    old = field_frame(ProfileCatalog.load(Path(old_sources_dir), workers=workers))
+    new = field_frame(ProfileCatalog.load(Path(new_sources_dir), workers=workers))
+    return diff_field_frames(old, new, thresholds)
+
+
+def summarize_diff(diff: pd.DataFrame) -> Dict[str, Any]:
+    """Field counts per status and per flag."""
+    flag_counts = diff['flags'][diff['flags'] != ''].str.split(',').explode().value_counts()
+    return {
+        'fields': len(diff),
+        'status': {status: int(count) for status, count in diff['status'].value_counts().sort_index().items()},
+        'flags': {flag: int(count) for flag, count in flag_counts.sort_index().items()},
+    }
+
+
+def write_profile_diff(diff: pd.DataFrame, output_path: Path) -> None:
+    """
+    Write a diff as TSV, or as JSON (summary plus one record per field) for ``.json`` paths.
+
+    Args:
+        diff: Frame from ``diff_field_frames``
+        output_path: TSV or JSON output path
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if output_path.suffix == '.json':
+        report = {
+            'summary': summarize_diff(diff),
+            'fields': json.loads(diff.to_json(orient='records')),
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        diff.to_csv(output_path, sep='\t', index=False)
@@ -0,0 +1,92 @@
+"""
+Detect distribution drift of fields between two profile sets (two runs or releases).
+
+Profiling stores a distribution sketch per field (quantiles of numeric columns,
+top-k value counts of categorical ones; see ``core.sketches``). The sketches of
+both sets are read through ``ProfileCatalog``, matched on (source, filename,
+field_name) like ``profile_diff``, and compared with the population stability
+index and a KS-style distance, so the whole corpus is checked without reading
+any data file. Fields present in only one set are left to ``profile_diff``.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+import pandas as pd
+
+try:
+    from ..core.sketches import distribution_drift
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.sketches import distribution_drift
+
+from .profile_catalog import ProfileCatalog
+from .profile_diff import DIFF_KEYS
+
+# Common rule of thumb: PSI above 0.1 is a moderate shift, above 0.2 a significant one
+PSI_THRESHOLD = 0.2
+KS_THRESHOLD = 0.1
+
+DRIFT_COLUMNS = DIFF_KEYS + [
+    'status', 'flags', 'kind', 'count_old', 'count_new', 'psi', 'ks', 'added_values', 'removed_values',
+]
+
+
+def distribution_sketches(catalog: ProfileCatalog) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+    """
+    Distribution sketches of a catalog keyed by (source, filename, field_name).
+
+    A repeated field name within a file keeps its first occurrence.
+    """
+    sketches = {}
+    for entry in catalog.tabular():
+        table = entry.field_table
+        filename = entry.filename or entry.json_path.stem
+        for name, extra in zip(table.names, table.columns['extra']):
+            sketch = extra.get('distribution_sketch') if extra else None
+            if sketch:
+                sketches.setdefault((entry.source, filename, name), sketch)
+    return sketches
+
+
+def check_drift(old_sources_dir: Path, new_sources_dir: Path,
+                psi_threshold: float = PSI_THRESHOLD,
+                ks_threshold: float = KS_THRESHOLD,
+                workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Compare the distribution sketches of the fields of two sources directories.
+
+    Args:
+        old_sources_dir: Sources directory of the earlier run
+        new_sources_dir: Sources directory of the later run
+        psi_threshold: Flag fields with at least this population stability index
+        ks_threshold: Flag fields with at least this KS-style distance
+        workers: Profile decoding processes (default: CPU count)
+
+    Returns:
+        Frame sorted by the join keys with ``status`` (drifted or stable),
+        comma-separated ``flags`` (psi, ks, vocabulary), the sketch kind and
+        counts, ``psi``, ``ks`` and the values added to or removed from a
+        complete categorical vocabulary
+    """
+    old = distribution_sketches(ProfileCatalog.load(Path(old_sources_dir), workers=workers))
+    new = distribution_sketches(ProfileCatalog.load(Path(new_sources_dir), workers=workers))
+
+    rows = []
+    for key in sorted(old.keys() & new.keys()):
+        drift = distribution_drift(old[key], new[key])
+        if drift is None:
+            continue
+        added, removed = drift.get('added_values', []), drift.get('removed_values', [])
+        flags = [
+            flag for flag, flagged in (
+                ('psi', drift['psi'] >= psi_threshold),
+                ('ks', drift['ks'] >= ks_threshold),
+                ('vocabulary', bool(added or removed)),
+            ) if flagged
+        ]
+        rows.append((
+            *key, 'drifted' if flags else 'stable', ','.join(flags), old[key]['kind'],
+            old[key]['count'], new[key]['count'], drift['psi'], drift['ks'], ','.join(added), ','.join(removed),
+        ))
+
+    return pd.DataFrame(rows, columns=DRIFT_COLUMNS)
@@ -0,0 +1,465 @@
+"""Consolidated SQLite store of file profiles.
+
+``cli.py file`` writes every profile into one database next to the per-file
+profile reports, one transaction per file, so aggregating across sources is a
+single database read instead of opening hundreds of files. The parts that
+reports scan across files are normalized into tables: file metadata, one row
+per field analysis with a column per statistic, top values and the path
+catalogue. ``ProfileCatalog`` builds every stored profile's ``FieldTable``
+from one scan of ``field_analyses``; the compact JSON document is only decoded
+by reports that need keys outside the tables, and for JSON export.
+
+Schema::
+
+    profiles(profile_id, source, profile_path UNIQUE, filepath, filename, format,
+             file_size_mb, row_count, column_count, delimiter, encoding,
+             analyzed_date, sample_size, max_depth, node_count, unique_paths,
+             metadata, field_count, file_signature, document, digest)
+    field_analyses(profile_id, position, field_name, data_type, cardinality, pattern,
+                   total_count, non_null_count, null_count, unique_count,
+                   min_length, max_length, null_percentage, mean_length,
+                   min_value, max_value, mean_value, median_value, std_value,
+                   q1_value, q3_value, identifiers, extra)
+    top_values(profile_id, field_position, rank, value, count, percentage)
+    paths(profile_id, path, occurrences, parent_count, file_count)
+
+``profile_path`` is the profile file path relative to the sources directory
+(``SOURCE/STEM/STEM_profile.json``); ``metadata`` holds the profile's
+top-level values other than lists and nested objects (plus ``file_metadata``)
+as JSON, ``field_count`` is NULL for profiles without ``field_analyses``, and
+``file_signature`` is the size and modification time of the profile file
+when the profile was stored, so a profile file rewritten since then is read
+instead of the stored copy. ``document`` is the profile as compact JSON and
+``digest`` its BLAKE2b hash, used to find profiles that changed.
+``identifiers`` and ``extra`` (the statistics without a column of their own,
+such as distribution sketches) are JSON.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import hashlib
+import json
+import sqlite3
+
+import numpy as np
+
+try:
+    from ..core.path_trie import PathTrie
+    from ..core.field_profile import (
+        FieldTable, COUNT_COLUMNS, FLOAT_COLUMNS, object_column,
+    )
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.path_trie import PathTrie
+    from core.field_profile import (
+        FieldTable, COUNT_COLUMNS, FLOAT_COLUMNS, object_column,
+    )
+
+from .json_report import generate_json_report
+
+
+STORE_FILENAME = 'profiles.sqlite'
+
+PROFILE_COLUMNS = [
+    'filepath', 'filename', 'format', 'file_size_mb', 'row_count', 'column_count', 'delimiter',
+    'encoding', 'analyzed_date', 'sample_size', 'max_depth', 'node_count', 'unique_paths',
+]
+# Stored column -> FieldTable column
+FIELD_COLUMNS = {
+    'field_name': 'field_name',
+    'data_type': 'data_type',
+    'cardinality': 'cardinality',
+    'pattern': 'pattern',
+    'total_count': 'total_count',
+    'non_null_count': 'non_null_count',
+    'null_count': 'null_count',
+    'unique_count': 'unique_count',
+    'min_length': 'min_length',
+    'max_length': 'max_length',
+    'null_percentage': 'null_percentage',
+    'mean_length': 'mean_length',
+    'min_value': 'min',
+    'max_value': 'max',
+    'mean_value': 'mean',
+    'median_value': 'median',
+    'std_value': 'std',
+    'q1_value': 'q1',
+    'q3_value': 'q3',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    profile_path TEXT NOT NULL UNIQUE,
+    filepath TEXT,
+    filename TEXT,
+    format TEXT,
+    file_size_mb REAL,
+    row_count INTEGER,
+    column_count INTEGER,
+    delimiter TEXT,
+    encoding TEXT,
+    analyzed_date TEXT,
+    sample_size INTEGER,
+    max_depth INTEGER,
+    node_count INTEGER,
+    unique_paths INTEGER,
+    metadata TEXT NOT NULL,
+    field_count INTEGER,
+    file_signature TEXT,
+    document TEXT NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS field_analyses (
+    profile_id INTEGER NOT NULL REFERENCES profiles(profile_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    field_name TEXT,
+    data_type TEXT,
+    cardinality TEXT,
+    pattern TEXT,
+    total_count INTEGER,
+    non_null_count INTEGER,
+    null_count INTEGER,
+    unique_count INTEGER,
+    min_length INTEGER,
+    max_length INTEGER,
+    null_percentage REAL,
+    mean_length REAL,
+    min_value REAL,
+    max_value REAL,
+    mean_value REAL,
+    median_value REAL,
+    std_value REAL,
+    q1_value REAL,
+    q3_value REAL,
+    identifiers TEXT,
+    extra TEXT,
+    PRIMARY KEY (profile_id, position)
+);
+CREATE TABLE IF NOT EXISTS top_values (
+    profile_id INTEGER NOT NULL REFERENCES profiles(profile_id) ON DELETE CASCADE,
+    field_position INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    value TEXT,
+    count INTEGER,
+    percentage REAL
+);
+CREATE TABLE IF NOT EXISTS paths (
+    profile_id INTEGER NOT NULL REFERENCES profiles(profile_id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    occurrences INTEGER,
+    parent_count INTEGER,
+    file_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS profiles_source ON profiles (source);
+CREATE INDEX IF NOT EXISTS field_analyses_name ON field_analyses (field_name);
+CREATE INDEX IF NOT EXISTS top_values_field ON top_values (profile_id, field_position);
+CREATE INDEX IF NOT EXISTS paths_profile ON paths (profile_id);
+"""
+
+
+def _scalar(value: Any) -> Any:
+    """SQLite-storable value; lists and dicts become JSON text."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, default=str)
+
+
+def _digest(document: str) -> str:
+    return hashlib.blake2b(document.encode()).hexdigest()
+
+
+def file_signature(path: Path) -> Optional[str]:
+    """Size and modification time of a profile file, or None when it does not exist."""
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def _profile_metadata(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Top-level values a report reads without the field analyses or path catalogue."""
+    return {
+        key: value for key, value in profile.items()
+        if key == 'file_metadata' or not isinstance(value, (dict, list))
+    }
+
+
+def _field_rows(profile_id: int, fields: List[Dict[str, Any]]) -> List[List[Any]]:
+    """``field_analyses`` rows, typed through a ``FieldTable`` (counts of older JSON reports are strings)."""
+    table = FieldTable.from_records(fields)
+    columns = []
+    for name in FIELD_COLUMNS.values():
+        values = table.columns[name].tolist()
+        if name in COUNT_COLUMNS:
+            values = [None if value < 0 else value for value in values]
+        elif name in FLOAT_COLUMNS:
+            values = [None if value != value else value for value in values]
+        else:
+            values = [_scalar(value) for value in values]
+        columns.append(values)
+    columns.append([None if value is None else _scalar(value) for value in table.columns['identifiers']])
+    columns.append([None if value is None else _scalar(value) for value in table.columns['extra']])
+    return [[profile_id, position, *row] for position, row in enumerate(zip(*columns))]
+
+
+class StoredProfile(NamedTuple):
+    """Row of the ``profiles`` table, without the document."""
+
+    profile_id: int
+    source: str
+    profile_path: str
+    metadata: Dict[str, Any]
+    field_count: Optional[int]
+    file_signature: Optional[str]
+
+
+class ProfileStore:
+    """SQLite-backed store of file profiles keyed by their profile file path."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> 'ProfileStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def write_profile(self, source: str, profile_path: str, profile: Dict[str, Any]) -> int:
+        """
+        Store a profile in one transaction, replacing an earlier one at the same path.
+
+        The signature of the profile file at ``profile_path`` (relative to the
+        store's directory), if one was written, is recorded with it.
+
+        Args:
+            source: Source name (may be empty for files outside data/sources)
+            profile_path: Profile file path relative to the sources directory
+            profile: Profile as returned by the analyzers
+
+        Returns:
+            ID of the stored profile
+        """
+        document = json.dumps(profile, separators=(',', ':'), default=str)
+        metadata = profile.get('file_metadata', {})
+        values = [_scalar(profile.get(column, metadata.get(column))) for column in PROFILE_COLUMNS]
+        fields = profile.get('field_analyses')
+
+        with self.conn:
+            self.conn.execute("DELETE FROM profiles WHERE profile_path = ?", (profile_path,))
+            cursor = self.conn.execute(
+                f"INSERT INTO profiles (source, profile_path, {', '.join(PROFILE_COLUMNS)}, "
+                f"metadata, field_count, file_signature, document, digest) "
+                f"VALUES ({', '.join('?' * (len(PROFILE_COLUMNS) + 7))})",
+                [
+                    source, profile_path, *values,
+                    json.dumps(_profile_metadata(profile), default=str),
+                    None if fields is None else len(fields),
+                    file_signature(self.db_path.parent / profile_path),
+                    document, _digest(document),
+                ],
+            )
+            profile_id = cursor.lastrowid
+
+            fields = fields or []
+            self.conn.executemany(
+                f"INSERT INTO field_analyses (profile_id, position, {', '.join(FIELD_COLUMNS)}, identifiers, extra) "
+                f"VALUES ({', '.join('?' * (len(FIELD_COLUMNS) + 4))})",
+                _field_rows(profile_id, fields),
+            )
+            self.conn.executemany(
+                "INSERT INTO top_values VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (profile_id, position, rank, _scalar(top.get('value')), top.get('count'), top.get('percentage'))
+                    for position, field in enumerate(fields)
+                    for rank, top in enumerate(field.get('top_values') or [])
+                ],
+            )
+
+            if 'path_trie' in profile:
+                path_rows = [
+                    (profile_id, entry['path'], entry['occurrences'], entry['parent_count'], entry['file_count'])
+                    for entry in PathTrie.from_dict(profile['path_trie']).items()
+                ]
+            else:
+                path_rows = [(profile_id, path, None, None, None) for path in profile.get('paths', [])]
+            self.conn.executemany("INSERT INTO paths VALUES (?, ?, ?, ?, ?)", path_rows)
+
+        return profile_id
+
+    def remove_profile(self, profile_path: str) -> None:
+        """Drop a profile and its field analyses, top values and paths."""
+        with self.conn:
+            self.conn.execute("DELETE FROM profiles WHERE profile_path = ?", (profile_path,))
+
+    def stored_profiles(self, profile_paths: Optional[Iterable[str]] = None) -> List[StoredProfile]:
+        """
+        Profile rows (metadata, field count, file signature) ordered by source and path.
+
+        Args:
+            profile_paths: Only these profiles (default: all)
+        """
+        query = ("SELECT profile_id, source, profile_path, metadata, field_count, file_signature "
+                 "FROM profiles")
+        if profile_paths is None:
+            rows = self.conn.execute(query + " ORDER BY source, profile_path")
+        else:
+            rows = sorted(
+                (row for path in profile_paths for row in self.conn.execute(query + " WHERE profile_path = ?", (path,))),
+                key=lambda row: (row[1], row[2]),
+            )
+        return [
+            StoredProfile(profile_id, source, profile_path, json.loads(metadata), field_count, signature)
+            for profile_id, source, profile_path, metadata, field_count, signature in rows
+        ]
+
+    def field_tables(self, profile_ids: Optional[Iterable[int]] = None) -> Dict[int, FieldTable]:
+        """
+        ``FieldTable`` of every stored profile with field analyses, from one scan of ``field_analyses``.
+
+        Statistics are read as columns; ``identifiers`` and ``extra`` are
+        decoded from their JSON on first access and ``top_values`` is queried
+        on first access.
+
+        Args:
+            profile_ids: Only these profiles (default: all)
+
+        Returns:
+            Dictionary mapping profile IDs to their tables (profiles whose
+            ``field_analyses`` is empty are missing)
+        """
+        query = f"SELECT profile_id, {', '.join(FIELD_COLUMNS)}, identifiers, extra FROM field_analyses"
+        if profile_ids is None:
+            rows = self.conn.execute(query + " ORDER BY profile_id, position").fetchall()
+        else:
+            rows = [
+                row for profile_id in sorted(set(profile_ids))
+                for row in self.conn.execute(query + " WHERE profile_id = ? ORDER BY position", (profile_id,))
+            ]
+        if not rows:
+            return {}
+
+        columns = list(zip(*rows))
+        ids = np.asarray(columns[0], dtype=np.int64)
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        ends = np.r_[starts[1:], len(ids)]
+
+        tables = {}
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            profile_id = int(ids[start])
+            values = {
+                name: columns[position][start:end]
+                for position, name in enumerate(FIELD_COLUMNS.values(), 1)
+            }
+            identifiers, extra = columns[-2][start:end], columns[-1][start:end]
+            tables[profile_id] = FieldTable.from_columns(values, {
+                'identifiers': _json_column(identifiers),
+                'extra': _json_column(extra),
+                'top_values': _top_values_column(self.db_path, profile_id, end - start),
+            })
+        return tables
+
+    def top_values(self, profile_id: int, field_count: int) -> np.ndarray:
+        """Top values of each field of a profile (None for fields without any)."""
+        column = [[] for _ in range(field_count)]
+        rows = self.conn.execute(
+            "SELECT field_position, value, count, percentage FROM top_values "
+            "WHERE profile_id = ? ORDER BY field_position, rank",
+            (profile_id,),
+        )
+        for position, value, count, percentage in rows:
+            column[position].append({'value': value, 'count': count, 'percentage': percentage})
+        return object_column([values or None for values in column])
+
+    def path_catalogue(self, profile_id: int) -> List[Dict[str, Any]]:
+        """Path rows of a profile (path, occurrences, parent_count, file_count), in catalogue order."""
+        rows = self.conn.execute(
+            "SELECT path, occurrences, parent_count, file_count FROM paths WHERE profile_id = ? ORDER BY rowid",
+            (profile_id,),
+        )
+        return [
+            {
+                'path': path,
+                'occurrences': '' if occurrences is None else occurrences,
+                'parent_count': '' if parent_count is None else parent_count,
+                'file_count': '' if file_count is None else file_count,
+            }
+            for path, occurrences, parent_count, file_count in rows
+        ]
+
+    def document(self, profile_path: str) -> Optional[Dict[str, Any]]:
+        """The complete stored profile, or None."""
+        row = self.conn.execute("SELECT document FROM profiles WHERE profile_path = ?", (profile_path,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def profiles(self, profile_paths: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Yield (source, profile_path, profile) ordered by source and path.
+
+        Args:
+            profile_paths: Only these profiles (default: all)
+        """
+        if profile_paths is None:
+            query = "SELECT source, profile_path, document FROM profiles ORDER BY source, profile_path"
+            rows = self.conn.execute(query)
+        else:
+            query = "SELECT source, profile_path, document FROM profiles WHERE profile_path = ?"
+            rows = sorted(row for path in profile_paths for row in self.conn.execute(query, (path,)))
+        for source, profile_path, document in rows:
+            yield source, profile_path, json.loads(document)
+
+    def digests(self) -> Dict[str, Tuple[str, str, Optional[str]]]:
+        """(source, digest, file signature) of every stored profile by profile path."""
+        query = "SELECT profile_path, source, digest, file_signature FROM profiles"
+        return {
+            profile_path: (source, digest, signature)
+            for profile_path, source, digest, signature in self.conn.execute(query)
+        }
+
+    def profile_paths(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT profile_path FROM profiles ORDER BY profile_path")]
+
+    def export_json(self, sources_dir: Path) -> int:
+        """
+        Write every stored profile back out as ``<sources_dir>/<profile_path>``
+        (with a ``.json`` suffix for binary profiles).
+
+        Returns:
+            Number of JSON reports written
+        """
+        count = 0
+        for _, profile_path, profile in self.profiles():
+            generate_json_report(profile, (Path(sources_dir) / profile_path).with_suffix('.json'))
+            count += 1
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts of the store tables."""
+        return {
+            table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('profiles', 'field_analyses', 'top_values', 'paths')
+        }
+
+
+def _json_column(texts: Tuple[Optional[str], ...]):
+    """Loader of an object column from JSON texts."""
+    return lambda: object_column([None if text is None else json.loads(text) for text in texts])
+
+
+def _top_values_column(db_path: Path, profile_id: int, field_count: int):
+    """Loader of a stored profile's top values, read when first indexed."""
+    def load():
+        with ProfileStore(db_path) as store:
+            return store.top_values(profile_id, field_count)
+    return load
@@ -3,74 +3,47 @@ Generate aggregated TSV reports from all analysis JSON files.
 """
 
 import csv
+import io
 import json
+import shutil
 from pathlib import Path
-from typing import Dict, Any, List
-
-
-def collect_analysis_files(sources_dir: Path) -> Dict[str, List[Path]]:
-    """
-    Collect all analysis JSON files organized by source.
-
-    Args:
-        sources_dir: Path to sources directory (e.g., output/preliminary-analysis/sources)
-
-    Returns:
-        Dictionary mapping source names to lists of JSON file paths
-    """
-    sources = {}
-
-    for source_dir in sources_dir.iterdir():
-        if not source_dir.is_dir():
-            continue
-
-        source_name = source_dir.name
-        json_files = []
-
-        # Find all profile JSON files
-        for json_file in source_dir.rglob("*_profile.json"):
-            json_files.append(json_file)
-
-        if json_files:
-            sources[source_name] = json_files
-
-    return sources
-
-
-def generate_files_metadata_tabular_tsv(sources_dir: Path, output_path: Path) -> None:
+from typing import Dict, Any, List, Optional, Set
+
+try:
+    from ..core.inventory import scan_inventory
+    from ..core.field_profile import FieldTable, COUNT_COLUMNS, FLOAT_COLUMNS
+    from ..core.corpus import path_coverage
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.inventory import scan_inventory
+    from core.field_profile import FieldTable, COUNT_COLUMNS, FLOAT_COLUMNS
+    from core.corpus import path_coverage
+
+from .profile_catalog import ProfileCatalog, ProfileEntry, iter_path_catalogue
+from .binary_profile import read_binary_profile, BINARY_PROFILE_SUFFIX
+
+
+def files_metadata_tabular_rows(entry: ProfileEntry) -> List[Dict[str, Any]]:
+    """Metadata row of a tabular profile (tabular by format or by presence of field_analyses)."""
+    if not entry.is_tabular:
+        return []
+    row = {'source': entry.source}
+    for key in ['filepath', 'filename', 'file_size_mb', 'row_count', 'column_count',
+                'delimiter', 'encoding', 'analyzed_date', 'sample_size']:
+        row[key] = entry.get(key)
+    return [row]
+
+
+def generate_files_metadata_tabular_tsv(sources_dir: Path, output_path: Path,
+                                        catalog: Optional[ProfileCatalog] = None) -> None:
     """
     Generate TSV with metadata for all tabular files analyzed.
 
     Columns: source, filepath, filename, file_size_mb, row_count, column_count,
              delimiter, encoding, analyzed_date, sample_size
     """
-    sources = collect_analysis_files(sources_dir)
-
-    rows = []
-    for source_name, json_files in sources.items():
-        for json_file in json_files:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+    catalog = catalog or ProfileCatalog.load(sources_dir)
 
-            # Check for tabular files - either by format or by presence of field_analyses
-            file_metadata = data.get('file_metadata', {})
-            is_tabular = (data.get('format') in ['csv', 'tsv', 'txt'] or
-                         'field_analyses' in data)
-
-            if is_tabular:
-                row = {
-                    'source': source_name,
-                    'filepath': data.get('filepath', file_metadata.get('filepath', '')),
-                    'filename': data.get('filename', file_metadata.get('filename', '')),
-                    'file_size_mb': data.get('file_size_mb', file_metadata.get('file_size_mb', '')),
-                    'row_count': data.get('row_count', file_metadata.get('row_count', '')),
-                    'column_count': data.get('column_count', file_metadata.get('column_count', '')),
-                    'delimiter': data.get('delimiter', file_metadata.get('delimiter', '')),
-                    'encoding': data.get('encoding', file_metadata.get('encoding', '')),
-                    'analyzed_date': data.get('analyzed_date', file_metadata.get('analyzed_date', '')),
-                    'sample_size': data.get('sample_size', file_metadata.get('sample_size', ''))
-                }
-                rows.append(row)
+    rows = [row for entry in catalog for row in files_metadata_tabular_rows(entry)]
 
     # Write TSV
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -81,35 +54,35 @@ def generate_files_metadata_tabular_tsv(sources_dir: Path, output_path: Path) ->
             writer.writerows(rows)
 
 
-def generate_files_metadata_json_tsv(sources_dir: Path, output_path: Path) -> None:
+def files_metadata_json_rows(entry: ProfileEntry) -> List[Dict[str, Any]]:
+    """Metadata row of a JSON/XML profile."""
+    if not entry.is_semi_structured:
+        return []
+    metadata = entry.metadata
+    return [{
+        'source': entry.source,
+        'filepath': metadata.get('filepath', ''),
+        'filename': metadata.get('filename', ''),
+        'file_size_mb': metadata.get('file_size_mb', ''),
+        'format': metadata.get('format', ''),
+        'max_depth': metadata.get('max_depth', ''),
+        'node_count': metadata.get('node_count', ''),
+        'unique_paths': metadata.get('unique_paths', ''),
+        'analyzed_date': metadata.get('analyzed_date', '')
+    }]
+
+
+def generate_files_metadata_json_tsv(sources_dir: Path, output_path: Path,
+                                     catalog: Optional[ProfileCatalog] = None) -> None:
     """
     Generate TSV with metadata for all JSON files analyzed.
 
     Columns: source, filepath, filename, file_size_mb, format, max_depth,
              node_count, unique_paths, analyzed_date
     """
-    sources = collect_analysis_files(sources_dir)
-
-    rows = []
-    for source_name, json_files in sources.items():
-        for json_file in json_files:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+    catalog = catalog or ProfileCatalog.load(sources_dir)
 
-            # Only include JSON/XML files
-            if data.get('format') in ['json', 'xml']:
-                row = {
-                    'source': source_name,
-                    'filepath': data.get('filepath', ''),
-                    'filename': data.get('filename', ''),
-                    'file_size_mb': data.get('file_size_mb', ''),
-                    'format': data.get('format', ''),
-                    'max_depth': data.get('max_depth', ''),
-                    'node_count': data.get('node_count', ''),
-                    'unique_paths': data.get('unique_paths', ''),
-                    'analyzed_date': data.get('analyzed_date', '')
-                }
-                rows.append(row)
+    rows = [row for entry in catalog for row in files_metadata_json_rows(entry)]
 
     # Write TSV
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -120,31 +93,28 @@ def generate_files_metadata_json_tsv(sources_dir: Path, output_path: Path) -> No
             writer.writerows(rows)
 
 
-def generate_files_metadata_other_tsv(sources_dir: Path, output_path: Path) -> None:
+def files_metadata_other_rows(entry: ProfileEntry) -> List[Dict[str, Any]]:
+    """Key/value rows of a profile that is neither tabular nor JSON/XML by format."""
+    if not entry.is_other:
+        return []
+    filename = entry.data.get('filename', '')
+    return [
+        {'source': entry.source, 'filename': filename, 'key': key, 'val': str(val)}
+        for key, val in entry.data.items()
+        if key not in ['filepath', 'filename']  # Don't duplicate filename
+    ]
+
+
+def generate_files_metadata_other_tsv(sources_dir: Path, output_path: Path,
+                                      catalog: Optional[ProfileCatalog] = None) -> None:
     """
     Generate TSV with metadata for other file types.
 
     Columns: source, filename, key, val
     """
-    sources = collect_analysis_files(sources_dir)
+    catalog = catalog or ProfileCatalog.load(sources_dir)
 
-    rows = []
-    for source_name, json_files in sources.items():
-        for json_file in json_files:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-
-            # Only include other file types (not tabular or json/xml)
-            if data.get('format') not in ['csv', 'tsv', 'txt', 'json', 'xml']:
-                filename = data.get('filename', '')
-                for key, val in data.items():
-                    if key not in ['filepath', 'filename']:  # Don't duplicate filename
-                        rows.append({
-                            'source': source_name,
-                            'filename': filename,
-                            'key': key,
-                            'val': str(val)
-                        })
+    rows = [row for entry in catalog for row in files_metadata_other_rows(entry)]
 
     # Write TSV
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -155,47 +125,57 @@ def generate_files_metadata_other_tsv(sources_dir: Path, output_path: Path) -> N
             writer.writerows(rows)
 
 
-def generate_files_data_tabular_tsv(sources_dir: Path, output_path: Path) -> None:
+# Field TSV column -> FieldTable column
+FIELD_ROW_COLUMNS = {
+    'field_name': 'field_name',
+    'data_type': 'data_type',
+    'null_count': 'null_count',
+    'null_percentage': 'null_percentage',
+    'cardinality': 'cardinality',
+    'unique_count': 'unique_count',
+    'min_value': 'min',
+    'max_value': 'max',
+    'mean_value': 'mean',
+    'min_length': 'min_length',
+    'max_length': 'max_length',
+    'mean_length': 'mean_length',
+}
+
+
+def _field_rows(fields: FieldTable) -> List[Dict[str, Any]]:
+    """Field statistics columns shared by the aggregated and per-file field TSVs, read column-wise."""
+    columns = []
+    for name in FIELD_ROW_COLUMNS.values():
+        values = fields.columns[name].tolist()
+        if name in COUNT_COLUMNS:
+            values = ['' if value < 0 else value for value in values]
+        elif name in FLOAT_COLUMNS:
+            values = ['' if value != value else value for value in values]
+        else:
+            values = ['' if value is None else value for value in values]
+        columns.append(values)
+    return [dict(zip(FIELD_ROW_COLUMNS, row)) for row in zip(*columns)]
+
+
+def files_data_tabular_rows(entry: ProfileEntry) -> List[Dict[str, Any]]:
+    """Field rows of a profile with field analyses."""
+    return [
+        {'source': entry.source, 'filename': entry.filename, **row}
+        for row in _field_rows(entry.field_table)
+    ]
+
+
+def generate_files_data_tabular_tsv(sources_dir: Path, output_path: Path,
+                                    catalog: Optional[ProfileCatalog] = None) -> None:
     """
     Generate TSV with field-level data for all tabular files.
 
     Columns: source, filename, field_name, data_type, null_count, null_percentage,
              cardinality, min_value, max_value, mean_value, unique_count
     """
-    sources = collect_analysis_files(sources_dir)
+    catalog = catalog or ProfileCatalog.load(sources_dir)
 
-    rows = []
-    for source_name, json_files in sources.items():
-        for json_file in json_files:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-
-            # Check for tabular files
-            file_metadata = data.get('file_metadata', {})
-            field_analyses = data.get('field_analyses', [])
-
-            if field_analyses:  # Has field analyses = tabular
-                filename = data.get('filename', file_metadata.get('filename', ''))
-
-                for field in field_analyses:
-                    # Stats are directly on field object, not nested
-                    row = {
-                        'source': source_name,
-                        'filename': filename,
-                        'field_name': field.get('field_name', ''),
-                        'data_type': field.get('data_type', ''),
-                        'null_count': field.get('null_count', ''),
-                        'null_percentage': field.get('null_percentage', ''),
-                        'cardinality': field.get('cardinality', ''),
-                        'unique_count': field.get('unique_count', ''),
-                        'min_value': field.get('min_value', ''),
-                        'max_value': field.get('max_value', ''),
-                        'mean_value': field.get('mean_value', ''),
-                        'min_length': field.get('min_length', ''),
-                        'max_length': field.get('max_length', ''),
-                        'mean_length': field.get('mean_length', '')
-                    }
-                    rows.append(row)
+    rows = [row for entry in catalog for row in files_data_tabular_rows(entry)]
 
     # Write TSV
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -206,34 +186,36 @@ def generate_files_data_tabular_tsv(sources_dir: Path, output_path: Path) -> Non
             writer.writerows(rows)
 
 
-def generate_files_data_json_tsv(sources_dir: Path, output_path: Path) -> None:
+def files_data_json_rows(profile: ProfileEntry) -> List[Dict[str, Any]]:
+    """Path rows of a JSON/XML profile."""
+    if not profile.is_semi_structured:
+        return []
+    filename = profile.metadata.get('filename', '')
+    return [
+        {
+            'source': profile.source,
+            'filename': filename,
+            'path': entry['path'],
+            'occurrences': entry['occurrences'],
+            'parent_count': entry['parent_count'],
+            'file_count': entry['file_count'],
+        }
+        for entry in profile.path_catalogue
+    ]
+
+
+def generate_files_data_json_tsv(sources_dir: Path, output_path: Path,
+                                 catalog: Optional[ProfileCatalog] = None) -> None:
     """
     Generate TSV with field-level data for all JSON files.
 
-    Columns: source, filename, path, max_depth, node_count
-    """
-    sources = collect_analysis_files(sources_dir)
+    Columns: source, filename, path, occurrences, parent_count, file_count
 
-    rows = []
-    for source_name, json_files in sources.items():
-        for json_file in json_files:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+    File-level ``max_depth`` and ``node_count`` are in files-metadata-json.
+    """
+    catalog = catalog or ProfileCatalog.load(sources_dir)
 
-            # Only include JSON/XML files
-            if data.get('format') in ['json', 'xml']:
-                filename = data.get('filename', '')
-                paths = data.get('paths', [])
-
-                for path in paths:
-                    row = {
-                        'source': source_name,
-                        'filename': filename,
-                        'path': path,
-                        'max_depth': data.get('max_depth', ''),
-                        'node_count': data.get('node_count', '')
-                    }
-                    rows.append(row)
+    rows = [row for entry in catalog for row in files_data_json_rows(entry)]
 
     # Write TSV
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -244,43 +226,36 @@ def generate_files_data_json_tsv(sources_dir: Path, output_path: Path) -> None:
             writer.writerows(rows)
 
 
-def generate_individual_field_tsv(json_path: Path, output_path: Path) -> None:
+def generate_individual_field_tsv(json_path: Path, output_path: Path,
+                                  data: Optional[Dict[str, Any]] = None,
+                                  fields: Optional[FieldTable] = None) -> None:
     """
     Generate TSV representation of a single file's analysis (for sources/SOURCE/FILE/FILENAME.tsv).
 
     For tabular files: field_name, data_type, null_count, null_percentage, cardinality, etc.
-    For JSON files: path
+    For JSON files: path, occurrences, parent_count, file_count
+
+    ``data`` is the already loaded profile; ``json_path`` is read when it is not given.
+    ``fields`` is the profile's already built ``FieldTable`` (such as
+    ``ProfileEntry.field_table``); when it has fields, ``data`` is not needed.
     """
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    if fields is None or not len(fields):
+        if data is None and json_path.suffix == BINARY_PROFILE_SUFFIX:
+            data = read_binary_profile(json_path)
+        elif data is None:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
+        # Check for tabular files (has field_analyses)
+        fields = FieldTable.from_records(data.get('field_analyses', []))
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Check for tabular files (has field_analyses)
-    field_analyses = data.get('field_analyses', [])
-
-    if field_analyses:
+    if len(fields):
         # Tabular format
-        rows = []
-
-        for field in field_analyses:
-            # Stats are directly on field object, not nested
-            row = {
-                'field_name': field.get('field_name', ''),
-                'data_type': field.get('data_type', ''),
-                'null_count': field.get('null_count', ''),
-                'null_percentage': field.get('null_percentage', ''),
-                'cardinality': field.get('cardinality', ''),
-                'unique_count': field.get('unique_count', ''),
-                'min_value': field.get('min_value', ''),
-                'max_value': field.get('max_value', ''),
-                'mean_value': field.get('mean_value', ''),
-                'min_length': field.get('min_length', ''),
-                'max_length': field.get('max_length', ''),
-                'mean_length': field.get('mean_length', ''),
-                'identifiers': ', '.join(field.get('identifiers', []))
-            }
-            rows.append(row)
+        rows = [
+            {**row, 'identifiers': ', '.join(identifiers or [])}
+            for row, identifiers in zip(_field_rows(fields), fields.columns['identifiers'])
+        ]
 
         if rows:
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
@@ -290,41 +265,52 @@ def generate_individual_field_tsv(json_path: Path, output_path: Path) -> None:
 
     elif data.get('format') in ['json', 'xml']:
         # Semi-structured format
-        paths = data.get('paths', [])
-        rows = []
-
-        for path in paths:
-            row = {
-                'path': path
-            }
-            rows.append(row)
+        rows = iter_path_catalogue(data)
 
         if rows:
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['path'], delimiter='\t')
+                writer = csv.DictWriter(f, fieldnames=['path', 'occurrences', 'parent_count', 'file_count'],
+                                        delimiter='\t')
                 writer.writeheader()
                 writer.writerows(rows)
 
 
-def generate_unable_to_analyze_tsv(data_dir: Path, sources_dir: Path, output_path: Path) -> None:
+def generate_path_coverage_tsv(corpus_profile: Dict[str, Any], output_path: Path) -> None:
+    """
+    Generate TSV of path coverage across the files of a corpus profile.
+
+    Columns: path, file_count, file_percentage (derived from the profile's ``path_trie``)
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['path', 'file_count', 'file_percentage'], delimiter='\t')
+        writer.writeheader()
+        writer.writerows(path_coverage(corpus_profile))
+
+
+def generate_unable_to_analyze_tsv(data_dir: Path, sources_dir: Path, output_path: Path,
+                                   catalog: Optional[ProfileCatalog] = None,
+                                   analyzed_files: Optional[Set[Path]] = None,
+                                   inventory_cache: Optional[Path] = None) -> None:
     """
     Generate TSV listing files that could not be analyzed.
 
     Columns: filename, path, reason
+
+    ``analyzed_files`` (the profiled data file paths) skips loading the
+    profiles; ``inventory_cache`` is the pickled file inventory of ``data_dir``.
     """
-    # Find all files in data/sources
-    all_data_files = set()
-    for filepath in data_dir.rglob('*'):
-        if filepath.is_file() and filepath.suffix in ['.tsv', '.csv', '.txt', '.json', '.xml']:
-            all_data_files.add(filepath)
+    # Find all data files (tabular, JSON or XML, possibly compressed) in data/sources
+    all_data_files = {
+        Path(entry['path']) for entry in scan_inventory(data_dir, cache_path=inventory_cache)
+        if entry['filetype']
+    }
 
     # Find all analyzed files
-    analyzed_files = set()
-    for json_file in sources_dir.rglob('*_profile.json'):
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-            if 'filepath' in data:
-                analyzed_files.add(Path(data['filepath']))
+    if analyzed_files is None:
+        catalog = catalog or ProfileCatalog.load(sources_dir)
+        analyzed_files = catalog.analyzed_filepaths()
 
     # Find unanalyzed files
     unanalyzed = all_data_files - analyzed_files
@@ -351,7 +337,145 @@ def generate_unable_to_analyze_tsv(data_dir: Path, sources_dir: Path, output_pat
             writer.writeheader()
 
 
-def generate_all_tsv_reports(sources_dir: Path, data_dir: Path, reports_dir: Path) -> None:
+# Aggregated report -> (rows of one profile, columns)
+AGGREGATED_TSV_REPORTS = {
+    'files-metadata-tabular-by-source.tsv': (
+        files_metadata_tabular_rows,
+        ['source', 'filepath', 'filename', 'file_size_mb', 'row_count', 'column_count',
+         'delimiter', 'encoding', 'analyzed_date', 'sample_size'],
+    ),
+    'files-metadata-json-by-source.tsv': (
+        files_metadata_json_rows,
+        ['source', 'filepath', 'filename', 'file_size_mb', 'format', 'max_depth',
+         'node_count', 'unique_paths', 'analyzed_date'],
+    ),
+    'files-metadata-other-by-source.tsv': (
+        files_metadata_other_rows,
+        ['source', 'filename', 'key', 'val'],
+    ),
+    'files-data-tabular-by-source.tsv': (
+        files_data_tabular_rows,
+        ['source', 'filename', 'field_name', 'data_type', 'null_count', 'null_percentage',
+         'cardinality', 'unique_count', 'min_value', 'max_value', 'mean_value',
+         'min_length', 'max_length', 'mean_length'],
+    ),
+    'files-data-json-by-source.tsv': (
+        files_data_json_rows,
+        ['source', 'filename', 'path', 'occurrences', 'parent_count', 'file_count'],
+    ),
+}
+
+REPORT_STATE_FILENAME = '.report-state.json'
+PARTITIONS_DIRNAME = '.partitions'
+REPORT_STATE_VERSION = 3  # 2: field rows fill min_value, max_value and mean_value; 3: path rows drop file-level columns
+
+
+def _field_tsv_path(json_path: Path) -> Path:
+    return json_path.parent / f"{json_path.stem.replace('_profile', '')}_fields.tsv"
+
+
+def _generate_entry_field_tsv(entry: ProfileEntry) -> None:
+    """Per-file TSV of a catalog entry; the complete profile is only decoded for a path catalogue."""
+    fields = entry.field_table
+    generate_individual_field_tsv(entry.json_path, _field_tsv_path(entry.json_path),
+                                  None if len(fields) else entry.data, fields)
+
+
+def update_all_tsv_reports(sources_dir: Path, data_dir: Path, reports_dir: Path,
+                           inventory_cache: Optional[Path] = None) -> Dict[str, int]:
+    """
+    Bring the TSV reports up to date, decoding only profiles changed since the last run.
+
+    Every profile's rows of each aggregated report are kept in a partition
+    under ``<reports_dir>/.partitions/<profile path>/``, and
+    ``<reports_dir>/.report-state.json`` records each profile's signature
+    (store digest, or size and mtime of the JSON report) and data file path.
+    New and changed profiles get their partitions and field TSV rewritten,
+    partitions of removed profiles are deleted, and the aggregated reports
+    are re-assembled from the partitions in source order.
+
+    Args:
+        sources_dir: Path to sources directory (e.g., output/preliminary-analysis/sources)
+        data_dir: Path to data directory (e.g., data/sources)
+        reports_dir: Path to reports directory (e.g., output/preliminary-analysis/reports)
+        inventory_cache: Pickled file inventory of ``data_dir``
+
+    Returns:
+        Numbers of changed, removed and unchanged profiles
+    """
+    sources_dir = Path(sources_dir)
+    reports_dir = Path(reports_dir)
+    partitions_dir = reports_dir / PARTITIONS_DIRNAME
+    state_path = reports_dir / REPORT_STATE_FILENAME
+
+    previous = {}
+    if state_path.exists():
+        state = json.loads(state_path.read_text())
+        if state.get('version') == REPORT_STATE_VERSION:
+            previous = state['profiles']
+
+    current = {
+        path.relative_to(sources_dir).as_posix(): (source, signature)
+        for path, (source, signature) in ProfileCatalog.signatures(sources_dir).items()
+    }
+    changed = [key for key, (_, signature) in current.items() if previous.get(key, {}).get('signature') != signature]
+    removed = [key for key in previous if key not in current]
+
+    profiles = {key: previous[key] for key in current if key in previous}
+    for key in removed:
+        shutil.rmtree(partitions_dir / key, ignore_errors=True)
+
+    for entry in ProfileCatalog.load(sources_dir, paths=[sources_dir / key for key in changed]):
+        key = entry.json_path.relative_to(sources_dir).as_posix()
+        partition = partitions_dir / key
+        partition.mkdir(parents=True, exist_ok=True)
+
+        row_counts = {}
+        for name, (profile_rows, fieldnames) in AGGREGATED_TSV_REPORTS.items():
+            rows = profile_rows(entry)
+            with open(partition / name, 'w', newline='', encoding='utf-8') as f:
+                csv.DictWriter(f, fieldnames=fieldnames, delimiter='\t').writerows(rows)
+            row_counts[name] = len(rows)
+
+        _generate_entry_field_tsv(entry)
+        profiles[key] = {
+            'signature': current[key][1],
+            'filepath': entry.metadata.get('filepath'),
+            'rows': row_counts,
+        }
+
+    if changed or removed or not all((reports_dir / name).exists() for name in AGGREGATED_TSV_REPORTS):
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        order = sorted(profiles, key=lambda key: (current[key][0], sources_dir / key))
+        for name, (_, fieldnames) in AGGREGATED_TSV_REPORTS.items():
+            output_path = reports_dir / name
+            keys = [key for key in order if profiles[key]['rows'].get(name)]
+            if not keys:
+                output_path.unlink(missing_ok=True)
+                continue
+
+            header = io.StringIO()
+            csv.DictWriter(header, fieldnames=fieldnames, delimiter='\t').writeheader()
+            with open(output_path, 'wb') as out:
+                out.write(header.getvalue().encode('utf-8'))
+                for key in keys:
+                    with open(partitions_dir / key / name, 'rb') as part:
+                        shutil.copyfileobj(part, out)
+
+    analyzed_files = {Path(profile['filepath']) for profile in profiles.values() if profile.get('filepath')}
+    generate_unable_to_analyze_tsv(data_dir, sources_dir, reports_dir / "unable-to-analyze.tsv",
+                                   analyzed_files=analyzed_files, inventory_cache=inventory_cache)
+
+    tmp_path = state_path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps({'version': REPORT_STATE_VERSION, 'profiles': profiles}))
+    tmp_path.replace(state_path)
+
+    return {'changed': len(changed), 'removed': len(removed), 'unchanged': len(current) - len(changed)}
+
+
+def generate_all_tsv_reports(sources_dir: Path, data_dir: Path, reports_dir: Path,
+                             catalog: Optional[ProfileCatalog] = None,
+                             inventory_cache: Optional[Path] = None) -> None:
     """
     Generate all aggregated TSV reports.
 
@@ -359,35 +483,41 @@ def generate_all_tsv_reports(sources_dir: Path, data_dir: Path, reports_dir: Pat
         sources_dir: Path to sources directory (e.g., output/preliminary-analysis/sources)
         data_dir: Path to data directory (e.g., data/sources)
         reports_dir: Path to reports directory (e.g., output/preliminary-analysis/reports)
+        catalog: Already loaded profiles (default: loaded from ``sources_dir``)
+        inventory_cache: Pickled file inventory of ``data_dir``
     """
     print("📊 Generating TSV reports...")
 
+    # Every report reads the same profiles, loaded once
+    catalog = catalog or ProfileCatalog.load(sources_dir)
+    print(f"  Loaded {len(catalog)} profiles")
+
     # Metadata reports
-    generate_files_metadata_tabular_tsv(sources_dir, reports_dir / "files-metadata-tabular-by-source.tsv")
+    generate_files_metadata_tabular_tsv(sources_dir, reports_dir / "files-metadata-tabular-by-source.tsv", catalog)
     print("  ✓ files-metadata-tabular-by-source.tsv")
 
-    generate_files_metadata_json_tsv(sources_dir, reports_dir / "files-metadata-json-by-source.tsv")
+    generate_files_metadata_json_tsv(sources_dir, reports_dir / "files-metadata-json-by-source.tsv", catalog)
     print("  ✓ files-metadata-json-by-source.tsv")
 
-    generate_files_metadata_other_tsv(sources_dir, reports_dir / "files-metadata-other-by-source.tsv")
+    generate_files_metadata_other_tsv(sources_dir, reports_dir / "files-metadata-other-by-source.tsv", catalog)
     print("  ✓ files-metadata-other-by-source.tsv")
 
     # Field data reports
-    generate_files_data_tabular_tsv(sources_dir, reports_dir / "files-data-tabular-by-source.tsv")
+    generate_files_data_tabular_tsv(sources_dir, reports_dir / "files-data-tabular-by-source.tsv", catalog)
     print("  ✓ files-data-tabular-by-source.tsv")
 
-    generate_files_data_json_tsv(sources_dir, reports_dir / "files-data-json-by-source.tsv")
+    generate_files_data_json_tsv(sources_dir, reports_dir / "files-data-json-by-source.tsv", catalog)
     print("  ✓ files-data-json-by-source.tsv")
 
     # Unable to analyze report
-    generate_unable_to_analyze_tsv(data_dir, sources_dir, reports_dir / "unable-to-analyze.tsv")
+    generate_unable_to_analyze_tsv(data_dir, sources_dir, reports_dir / "unable-to-analyze.tsv", catalog,
+                                   inventory_cache=inventory_cache)
     print("  ✓ unable-to-analyze.tsv")
 
     # Individual TSV files for each analysis
     print("  Generating individual TSV files...")
-    for json_file in sources_dir.rglob('*_profile.json'):
-        tsv_path = json_file.parent / f"{json_file.stem.replace('_profile', '')}_fields.tsv"
-        generate_individual_field_tsv(json_file, tsv_path)
+    for entry in catalog:
+        _generate_entry_field_tsv(entry)
     print("  ✓ Individual field TSVs created")
 
     print(f"✅ All TSV reports generated in {reports_dir}/")
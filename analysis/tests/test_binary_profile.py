@@ -0,0 +1,150 @@
+"""Tests for the binary profile format."""
+
+import io
+import json
+import pickle
+import struct
+
+import numpy as np
+import pytest
+from analysis.reports.binary_profile import (
+    BinaryProfileReader,
+    write_binary_profile,
+    read_binary_profile,
+)
+from analysis.core.field_profile import FieldTable, COUNT_COLUMNS, FLOAT_COLUMNS, LABEL_COLUMNS, OBJECT_COLUMNS
+from analysis.reports.profile_catalog import ProfileCatalog
+from analysis.reports.profile_diff import field_frame
+
+
+PROFILE = {
+    'file_metadata': {'filepath': 'data/sources/tcga/matrix.tsv', 'filename': 'matrix.tsv', 'row_count': 3},
+    'field_analyses': [
+        {'field_name': 'gene', 'data_type': 'string', 'top_values': [{'value': 'BRCA1', 'count': 2}]},
+        {'field_name': 'score', 'data_type': 'float', 'min': 0.5, 'max': 2.0, 'pattern': None},
+        {'field_name': 'flag', 'data_type': 'boolean', 'unique_count': 2},
+    ],
+    'identifier_coverage': {'HGNC': 1.0},
+}
+
+
+@pytest.fixture
+def profile_path(tmp_path):
+    path = tmp_path / 'matrix_profile.hqprof'
+    write_binary_profile(PROFILE, path)
+    return path
+
+
+class TestBinaryProfile:
+    """Test writing and reading binary profiles."""
+
+    def test_round_trip(self, profile_path):
+        """Test that the complete profile reads back equal and in key order."""
+        profile = read_binary_profile(profile_path)
+
+        assert profile == PROFILE
+        assert list(profile) == list(PROFILE)
+
+    def test_single_field(self, profile_path):
+        """Test that one field is decoded by name without the others."""
+        with BinaryProfileReader(profile_path) as reader:
+            assert reader.field_names == ['gene', 'score', 'flag']
+            assert reader.metadata['file_metadata']['row_count'] == 3
+            assert reader.field('score') == PROFILE['field_analyses'][1]
+            assert reader.field('missing') is None
+            assert [f['field_name'] for f in reader.fields(['flag', 'gene'])] == ['gene', 'flag']
+
+    def test_numpy_and_other_values(self, tmp_path):
+        """Test that NumPy scalars become Python numbers and other objects strings."""
+        path = tmp_path / 'values_profile.hqprof'
+        write_binary_profile({'field_analyses': [
+            {'field_name': 'x', 'mean': np.float64(1.5), 'count': np.int64(3), 'date': tmp_path},
+        ]}, path)
+
+        field = read_binary_profile(path)['field_analyses'][0]
+        assert field == {'field_name': 'x', 'mean': 1.5, 'count': 3, 'date': str(tmp_path)}
+        assert type(field['count']) is int
+
+    def test_rejects_other_files(self, tmp_path, profile_path):
+        """Test that files without the magic or with code-executing pickles are refused."""
+        (tmp_path / 'plain.hqprof').write_text(json.dumps(PROFILE))
+        with pytest.raises(ValueError):
+            BinaryProfileReader(tmp_path / 'plain.hqprof')
+
+        # Replace the last field with a pickle that would call os.system
+        buffer = io.BytesIO()
+        pickle.dump(__import__('os').system, buffer)
+        with BinaryProfileReader(profile_path) as reader:
+            start = reader._data_start + int(reader._offsets[-2])
+        data = profile_path.read_bytes()[:start] + buffer.getvalue()
+        profile_path.write_bytes(data)
+        with BinaryProfileReader(profile_path) as reader:
+            with pytest.raises(pickle.UnpicklingError):
+                reader.field('flag')
+
+
+class TestBinaryFieldTable:
+    """Test the columnar field statistics."""
+
+    def test_matches_decoded_fields(self, profile_path):
+        """Test that the table equals one built from the decoded fields, and outlives the reader."""
+        with BinaryProfileReader(profile_path) as reader:
+            table = reader.field_table()
+        expected = FieldTable.from_records(PROFILE['field_analyses'])
+
+        for name in COUNT_COLUMNS + FLOAT_COLUMNS:
+            np.testing.assert_array_equal(table.columns[name], expected.columns[name])
+        for name in LABEL_COLUMNS + OBJECT_COLUMNS:
+            assert list(table.columns[name]) == list(expected.columns[name])
+        assert table.field('gene').top_values == [{'value': 'BRCA1', 'count': 2}]
+
+    def test_nested_values_decoded_on_demand(self, profile_path):
+        """Test that nested-value columns are not unpickled until indexed."""
+        with BinaryProfileReader(profile_path) as reader:
+            table = reader.field_table()
+
+        assert 'top_values' not in table.columns
+        assert list(table.columns['null_count']) == [-1, -1, -1]
+        assert table.columns['top_values'][0] == [{'value': 'BRCA1', 'count': 2}]
+
+    def test_version_1_file(self, profile_path):
+        """Test that files without a columns section still read, building the table from the fields."""
+        data = profile_path.read_bytes()
+        magic, header_length, field_count, columns_length = struct.unpack_from('<8sQQQ', data)
+        start = struct.calcsize('<8sQQQ')
+        header = data[start:start + header_length]
+        rest = data[start + header_length + columns_length:]
+        profile_path.write_bytes(struct.pack('<8sQQ', b'HQPROF1\x00', header_length, field_count) + header + rest)
+
+        assert read_binary_profile(profile_path) == PROFILE
+        with BinaryProfileReader(profile_path) as reader:
+            assert list(reader.field_table().names) == ['gene', 'score', 'flag']
+
+
+class TestCatalogBinaryProfiles:
+    """Test that the profile catalog reads binary profiles."""
+
+    def test_binary_profile_hides_json(self, tmp_path):
+        """Test that a binary profile is used in place of a JSON report of the same name."""
+        profile_dir = tmp_path / 'tcga' / 'matrix'
+        write_binary_profile(PROFILE, profile_dir / 'matrix_profile.hqprof')
+        (profile_dir / 'matrix_profile.json').write_text(json.dumps({'field_analyses': []}))
+
+        catalog = ProfileCatalog.load(tmp_path, workers=1)
+
+        assert [entry.json_path.name for entry in catalog] == ['matrix_profile.hqprof']
+        assert catalog.tabular()[0].data == PROFILE
+        assert list(ProfileCatalog.signatures(tmp_path)) == [profile_dir / 'matrix_profile.hqprof']
+
+    def test_fields_read_without_decoding_profile(self, tmp_path):
+        """Test that field statistics and metadata come from the header and columns alone."""
+        write_binary_profile(PROFILE, tmp_path / 'tcga' / 'matrix' / 'matrix_profile.hqprof')
+
+        catalog = ProfileCatalog.load(tmp_path, workers=1)
+        frame = field_frame(catalog)
+
+        entry = catalog.tabular()[0]
+        assert list(frame['field_name']) == ['gene', 'score', 'flag']
+        assert entry.filename == 'matrix.tsv'
+        assert entry._data is None
+        assert entry.data == PROFILE
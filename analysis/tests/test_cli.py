@@ -0,0 +1,142 @@
+"""Tests for CLI commands: profile files and the profile store, and input errors."""
+
+import csv
+import json
+
+import pytest
+from click.testing import CliRunner
+from analysis.cli import cli
+from analysis.reports.profile_catalog import ProfileCatalog
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Working directory with one data file below data/sources."""
+    monkeypatch.chdir(tmp_path)
+    source_dir = tmp_path / 'data' / 'sources' / 'clinvar'
+    source_dir.mkdir(parents=True)
+    (source_dir / 't.tsv').write_text('gene\tscore\nBRCA1\t1\nTP53\t2\n')
+    return tmp_path
+
+
+def analyze(*options):
+    result = CliRunner().invoke(cli, ['file', 'data/sources/clinvar/t.tsv', '--output-dir', 'sources', '--no-plots', *options])
+    assert result.exit_code == 0, result.output
+
+
+class TestFileProfileStore:
+    """Test that re-analysing a file never leaves a stale stored profile."""
+
+    def test_profile_read_from_store(self, workspace):
+        """Test that a stored profile is read from the store tables, not its JSON file."""
+        analyze()
+
+        (entry,) = ProfileCatalog.load(workspace / 'sources', workers=1)
+        assert list(entry.field_table.names) == ['gene', 'score']
+        assert entry._data is None
+
+    def test_format_switch(self, workspace):
+        """Test that switching to a binary profile replaces the stored JSON profile."""
+        analyze()
+        analyze('--profile-format', 'binary')
+
+        catalog = ProfileCatalog.load(workspace / 'sources', workers=1)
+        assert [entry.json_path.name for entry in catalog] == ['t_profile.hqprof']
+        assert list(ProfileCatalog.signatures(workspace / 'sources')) == [
+            workspace / 'sources' / 'clinvar' / 't' / 't_profile.hqprof'
+        ]
+
+    def test_no_store_drops_stored_profile(self, workspace):
+        """Test that a --no-store run is read from its new profile file, not the store."""
+        analyze()
+        signatures = ProfileCatalog.signatures(workspace / 'sources')
+
+        (workspace / 'data' / 'sources' / 'clinvar' / 't.tsv').write_text('gene\tscore\tsig\nBRCA1\t1\tP\nTP53\t2\tB\n')
+        analyze('--no-store')
+
+        catalog = ProfileCatalog.load(workspace / 'sources', workers=1)
+        assert [entry.get('column_count') for entry in catalog] == [3]
+        assert ProfileCatalog.signatures(workspace / 'sources') != signatures
+
+
+class TestStoredFieldReports:
+    """Test that the data dictionary and field mappings read the stored field tables."""
+
+    @pytest.fixture
+    def sources(self, workspace):
+        gencc_dir = workspace / 'data' / 'sources' / 'gencc'
+        gencc_dir.mkdir()
+        (gencc_dir / 'g.tsv').write_text('gene\tclassification\nBRCA1\tDefinitive\nTP53\tLimited\n')
+        (gencc_dir / 'h.tsv').write_text('gene\tmoi\nBRCA1\tAD\n')
+        analyze()
+        for name in ('g.tsv', 'h.tsv'):
+            result = CliRunner().invoke(cli, ['file', f'data/sources/gencc/{name}', '--output-dir', 'sources',
+                                              '--no-plots'])
+            assert result.exit_code == 0, result.output
+        return workspace / 'sources'
+
+    def test_data_dictionary(self, sources, workspace):
+        """Test one row per field and source, the first file winning for repeated names."""
+        result = CliRunner().invoke(cli, ['report', 'data-dictionary', '--sources-dir', str(sources),
+                                          '--output', 'dictionary.csv'])
+        assert result.exit_code == 0, result.output
+
+        with open(workspace / 'dictionary.csv', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [(row['source'], row['field_name']) for row in rows] == [
+            ('clinvar', 'gene'), ('clinvar', 'score'),
+            ('gencc', 'gene'), ('gencc', 'classification'), ('gencc', 'moi'),
+        ]
+        gene = rows[2]
+        assert (gene['total_count'], gene['null_count'], gene['null_percentage']) == ('2', '0', '0.0')
+        assert rows[1]['min_value'] == '1.0' and rows[1]['min_length'] == ''
+
+    def test_field_mapping(self, sources, workspace):
+        """Test that shared field names are suggested across sources."""
+        result = CliRunner().invoke(cli, ['cross-source', 'field-mapping', '--sources-dir', str(sources),
+                                          '--output', 'mappings.tsv'])
+        assert result.exit_code == 0, result.output
+
+        with open(workspace / 'mappings.tsv', newline='') as f:
+            rows = list(csv.DictReader(f, delimiter='\t'))
+        assert ('clinvar', 'gene', 'gencc', 'gene') in {
+            (row['source1'], row['field1'], row['source2'], row['field2']) for row in rows
+        }
+
+
+class TestPaths:
+    """Test listing the path catalogue of a profile."""
+
+    @pytest.mark.parametrize('profile_format, suffix', [('json', '.json'), ('binary', '.hqprof')])
+    def test_profile_formats(self, workspace, profile_format, suffix):
+        """Test that JSON and binary profiles list the same catalogue."""
+        (workspace / 'data' / 'sources' / 'clinvar' / 'r.json').write_text('{"items": [{"a": 1}, {"b": 2}]}')
+        runner = CliRunner()
+        analyzed = runner.invoke(cli, ['file', 'data/sources/clinvar/r.json', '--output-dir', 'sources',
+                                       '--no-plots', '--profile-format', profile_format])
+        assert analyzed.exit_code == 0, analyzed.output
+
+        result = runner.invoke(cli, ['paths', f'sources/clinvar/r/r_profile{suffix}'])
+
+        assert result.exit_code == 0, result.output
+        assert 'items[].b\t1\t' in result.output
+
+
+class TestShredErrors:
+    """Test that malformed shred inputs are reported instead of raising."""
+
+    @pytest.mark.parametrize('name, content', [
+        ('truncated.xml', b'<r><rec><a>1</a></rec><rec>'),
+        ('truncated.json', b'{"r": [{"a": 1}, {"a": '),
+        ('broken.xml.gz', b'\x1f\x8b\x08\x00broken'),
+    ])
+    def test_malformed_input(self, tmp_path, name, content):
+        """Test that parse and decompression errors exit with an error message."""
+        (tmp_path / name).write_bytes(content)
+        config = tmp_path / 'config.json'
+        config.write_text(json.dumps({'record_path': 'r/rec', 'columns': {'a': 'r/rec/a'}}))
+
+        result = CliRunner().invoke(cli, ['shred', str(config), str(tmp_path / name), str(tmp_path / 'out.parquet')])
+
+        assert result.exit_code == 1
+        assert '❌ Error:' in result.output
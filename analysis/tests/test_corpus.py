@@ -0,0 +1,122 @@
+"""Tests for parallel corpus analysis."""
+
+import pytest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from analysis.core.corpus import (
+    expand_corpus_pattern,
+    profile_structure,
+    merge_structure_profiles,
+    analyze_corpus,
+    path_coverage,
+)
+from analysis.core.path_trie import PathTrie
+
+
+def trie_of(xml_content):
+    """Serialized path trie of an XML string."""
+    return PathTrie.from_xml(ET.fromstring(xml_content)).to_dict()
+
+
+@pytest.fixture
+def xml_corpus(tmp_path):
+    """Create a small corpus of per-case XML files."""
+    corpus_dir = tmp_path / "biospecimen"
+    for i in range(4):
+        case_dir = corpus_dir / f"case-{i}"
+        case_dir.mkdir(parents=True)
+        extra = "<drug>x</drug>" if i % 2 == 0 else ""
+        (case_dir / f"case-{i}.xml").write_text(
+            f"<patient><id>{i}</id><sample><type>tumor</type></sample>{extra}</patient>"
+        )
+    (corpus_dir / "notes.txt").write_text("not part of the corpus")
+    return corpus_dir
+
+
+class TestExpandCorpusPattern:
+    """Test corpus file discovery."""
+
+    def test_glob_pattern(self, xml_corpus):
+        """Test that a recursive glob finds all XML files."""
+        files = expand_corpus_pattern(str(xml_corpus / "**" / "*.xml"))
+        assert len(files) == 4
+        assert files == sorted(files)
+
+    def test_directory(self, xml_corpus):
+        """Test that a directory expands to its JSON/XML files only."""
+        files = expand_corpus_pattern(str(xml_corpus))
+        assert len(files) == 4
+        assert all(f.suffix == '.xml' for f in files)
+
+
+class TestProfileStructure:
+    """Test per-file structural profiling."""
+
+    def test_xml_profile(self, xml_corpus):
+        """Test structural statistics of one XML file."""
+        result = profile_structure(xml_corpus / "case-0" / "case-0.xml")
+
+        assert result["format"] == "xml"
+        assert result["root_tag"] == "patient"
+        assert result["node_count"] == 5
+        assert "patient/sample/type" in PathTrie.from_dict(result["path_trie"])
+
+    def test_parse_error(self, tmp_path):
+        """Test that malformed files report an error instead of raising."""
+        bad = tmp_path / "bad.xml"
+        bad.write_text("<patient><id>")
+        result = profile_structure(bad)
+        assert "error" in result
+
+
+class TestMergeStructureProfiles:
+    """Test merging of per-file statistics."""
+
+    def test_path_coverage(self):
+        """Test that path coverage counts files containing each path."""
+        profiles = [
+            {"filepath": "b.xml", "format": "xml", "root_tag": "r", "max_depth": 1,
+             "node_count": 2, "path_trie": trie_of("<r><a/></r>")},
+            {"filepath": "a.xml", "format": "xml", "root_tag": "r", "max_depth": 2,
+             "node_count": 4, "path_trie": trie_of("<r><b><c/><c/></b></r>")},
+        ]
+        result = merge_structure_profiles(profiles)
+
+        coverage = {entry["path"]: entry for entry in path_coverage(result)}
+        assert coverage["r"]["file_count"] == 2
+        assert coverage["r"]["file_percentage"] == 100
+        assert coverage["r/a"]["file_count"] == 1
+        assert result["max_depth"] == 2
+        assert result["node_count"] == 6
+        assert result["unique_paths"] == 4
+        assert PathTrie.from_dict(result["path_trie"]).get("r/b/c")["occurrences"] == 2
+
+    def test_errors_counted(self):
+        """Test that unparseable files are reported separately."""
+        profiles = [
+            {"filepath": "a.xml", "error": "bad"},
+            {"filepath": "b.xml", "format": "xml", "root_tag": "r", "max_depth": 0,
+             "node_count": 1, "path_trie": trie_of("<r/>")},
+        ]
+        result = merge_structure_profiles(profiles)
+
+        assert result["file_count"] == 2
+        assert result["error_count"] == 1
+        assert path_coverage(result)[0]["file_percentage"] == 100
+
+
+class TestAnalyzeCorpus:
+    """Test end-to-end corpus analysis."""
+
+    def test_parallel_matches_inline(self, xml_corpus):
+        """Test that the process pool gives the same result as inline analysis."""
+        files = expand_corpus_pattern(str(xml_corpus))
+
+        inline = analyze_corpus(files, workers=1)
+        parallel = analyze_corpus(files, workers=2, chunksize=1)
+
+        assert inline == parallel
+        coverage = {entry["path"]: entry["file_count"] for entry in path_coverage(inline)}
+        assert coverage["patient/drug"] == 2
+        assert coverage["patient/id"] == 4
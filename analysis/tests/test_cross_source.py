@@ -8,9 +8,14 @@ from analysis.core.cross_source import (
     calculate_overlap,
     calculate_field_name_similarity,
     suggest_field_mappings,
+    build_field_name_index,
+    find_candidate_field_pairs,
     analyze_identifier_coverage,
+    calculate_identifier_row_coverage,
     analyze_cross_source,
 )
+import pandas as pd
+from analysis.core.tabular import calculate_identifier_coverage
 
 
 class TestExtractGenes:
@@ -297,6 +302,58 @@ class TestSuggestFieldMappings:
         assert len(mappings) == 0
 
 
+class TestFieldNameIndex:
+    """Test n-gram TF-IDF candidate generation for field mapping."""
+
+    def test_candidates_skip_unrelated_names(self):
+        """Test that only names sharing n-grams become candidates."""
+        names1 = ['gene_symbol', 'patient_id']
+        names2 = ['GeneSymbol', 'Hugo_Symbol', 'tumor_stage']
+        index = build_field_name_index(sorted(set(names1 + names2)))
+
+        candidates = find_candidate_field_pairs(index, names1, names2, min_cosine=0.2, block_size=1)
+        pairs = {(name1, name2) for name1, name2, _ in candidates}
+
+        assert ('gene_symbol', 'GeneSymbol') in pairs
+        assert ('gene_symbol', 'Hugo_Symbol') in pairs
+        assert ('patient_id', 'tumor_stage') not in pairs
+        assert all(0.2 <= cosine <= 1.0 + 1e-9 for _, _, cosine in candidates)
+
+    def test_identical_names_have_cosine_one(self):
+        """Test that rows are L2-normalized."""
+        index = build_field_name_index(['gene_symbol', 'disease'])
+
+        candidates = find_candidate_field_pairs(index, ['gene_symbol'], ['gene_symbol'])
+
+        assert candidates[0][2] == pytest.approx(1.0)
+
+    def test_indexed_matches_exhaustive(self):
+        """Test that indexed suggestions are the all-pairs result restricted to candidates."""
+        names = ['gene_symbol', 'gene_id', 'hgnc_id', 'disease_name', 'disease_id',
+                 'mondo_id', 'clinical_significance', 'review_status', 'variant_type']
+        sources_data = {
+            'source1': {'field_analyses': [
+                {'field_name': name, 'data_type': 'string'} for name in names
+            ]},
+            'source2': {'field_analyses': [
+                {'field_name': name.upper(), 'data_type': 'string'} for name in reversed(names)
+            ] + [{'field_name': 'GeneSymbols', 'data_type': 'string'}]},
+        }
+
+        exhaustive = suggest_field_mappings(sources_data, similarity_threshold=0.7, method='exhaustive')
+        indexed = suggest_field_mappings(sources_data, similarity_threshold=0.7)
+        any_shared_ngram = suggest_field_mappings(sources_data, similarity_threshold=0.7, min_cosine=1e-9)
+
+        assert any_shared_ngram == exhaustive
+        assert all(mapping in exhaustive for mapping in indexed)
+        assert {m['confidence'] for m in indexed if m['field1'].upper() == m['field2']} == {'high'}
+
+    def test_unknown_method(self):
+        """Test that an unknown method is rejected."""
+        with pytest.raises(ValueError):
+            suggest_field_mappings({}, method='bogus')
+
+
 class TestAnalyzeIdentifierCoverage:
     """Test identifier coverage analysis."""
 
@@ -326,6 +383,57 @@ class TestAnalyzeIdentifierCoverage:
         assert coverage['dbsnp_ids']['source1'] is False
         assert coverage['dbsnp_ids']['source2'] is True
 
+    def test_row_coverage_marks_presence(self):
+        """Test that profiled row coverage also marks a type as present."""
+        sources_data = {
+            'source1': {
+                'field_analyses': [{'field_name': 'gene', 'pattern': None}],
+                'identifier_coverage': {'row_count': 10, 'types': {'hgnc_ids': {'rows': 3}}},
+            },
+        }
+
+        assert analyze_identifier_coverage(sources_data)['hgnc_ids']['source1'] is True
+
+
+def coverage_profile(filepath, values):
+    df = pd.DataFrame({'hgnc_id': values})
+    return {
+        'file_metadata': {'filepath': filepath},
+        'identifier_coverage': calculate_identifier_coverage(df, [{'field_name': 'hgnc_id', 'pattern': 'HGNC ID'}]),
+    }
+
+
+class TestCalculateIdentifierRowCoverage:
+    """Test quantitative identifier coverage across sources."""
+
+    def test_rows_and_resolvable_fraction(self):
+        """Test row fractions and the share of values found in other sources."""
+        gencc_ids = [f'HGNC:{i}' for i in range(100)] + [None] * 100
+        clinvar_ids = [f'HGNC:{i}' for i in range(50, 250)]
+        source_profiles = {
+            'gencc': [coverage_profile('gencc/gencc.tsv', gencc_ids)],
+            'clinvar': [coverage_profile('clinvar/variant_summary.txt', clinvar_ids)],
+            'orphanet': [coverage_profile('orphanet/genes.tsv', ['none'] * 5)],
+        }
+
+        entries = {e['source']: e for e in calculate_identifier_row_coverage(source_profiles)}
+
+        assert entries['orphanet']['rows'] == 0
+        assert entries['orphanet']['resolvable_fraction'] == 0.0
+        assert (entries['gencc']['rows'], entries['gencc']['row_count']) == (100, 200)
+        assert entries['gencc']['fraction'] == 0.5
+        assert entries['gencc']['file'] == 'gencc.tsv'
+        assert entries['gencc']['resolvable_fraction'] == pytest.approx(0.5, abs=0.15)
+        assert entries['clinvar']['resolvable_fraction'] == pytest.approx(0.25, abs=0.1)
+
+    def test_single_source_is_not_resolvable(self):
+        """Test that a type carried by one source has no resolvable fraction."""
+        entries = calculate_identifier_row_coverage({
+            'gencc': [coverage_profile('gencc/gencc.tsv', ['HGNC:1', 'HGNC:2'])],
+        })
+
+        assert entries[0]['resolvable_fraction'] is None
+
 
 class TestAnalyzeCrossSource:
     """Test complete cross-source analysis."""
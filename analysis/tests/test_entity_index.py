@@ -0,0 +1,100 @@
+"""Tests for the SQLite entity location index."""
+
+import pandas as pd
+import pytest
+from analysis.core.entity_index import EntityIndex
+from analysis.core.tabular import analyze_tabular_file
+
+
+PROFILE = {
+    'field_analyses': [
+        {'field_name': 'gene_symbol', 'pattern': None},
+        {'field_name': 'rsid', 'pattern': 'dbSNP rsID'},
+        {'field_name': 'notes', 'pattern': None},
+    ],
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    with EntityIndex(tmp_path / 'entities.sqlite') as entity_index:
+        yield entity_index
+
+
+class TestEntityIndex:
+    """Test indexing and lookups."""
+
+    def test_lookup_returns_rows(self, index):
+        """Test that lookups return every row offset of a value."""
+        df = pd.DataFrame({
+            'gene_symbol': ['BRCA1', 'TP53', None, 'BRCA1', 'lower'],
+            'rsid': ['rs1', 'rs2', 'rs1', None, 'x'],
+            'notes': ['BRCA1'] * 5,
+        })
+
+        written = index.index_dataframe(df, PROFILE, 'clinvar', 'clinvar/variant_summary.txt')
+        hits = index.lookup('BRCA1')
+
+        assert written == 4
+        assert hits == [{
+            'entity_type': 'genes',
+            'kind': 'symbols',
+            'source': 'clinvar',
+            'filepath': 'clinvar/variant_summary.txt',
+            'column': 'gene_symbol',
+            'row_count': 2,
+            'rows': [0, 3],
+        }]
+        assert index.lookup('rs1', entity_type='variants')[0]['rows'] == [0, 2]
+        assert index.lookup('lower') == []
+        assert index.lookup('BRCA1', entity_type='diseases') == []
+
+    def test_multiple_sources(self, index):
+        """Test that one value is located across sources, ordered by source."""
+        index.index_dataframe(pd.DataFrame({'gene_symbol': ['BRCA1']}), PROFILE, 'gencc', 'gencc/gencc.tsv')
+        index.index_dataframe(pd.DataFrame({'gene_symbol': ['TP53', 'BRCA1']}), PROFILE, 'clinvar', 'clinvar/v.txt')
+
+        hits = index.lookup('BRCA1', include_rows=False)
+
+        assert [(h['source'], h['row_count']) for h in hits] == [('clinvar', 1), ('gencc', 1)]
+        assert 'rows' not in hits[0]
+        assert index.stats() == {'files': 2, 'entities': 2, 'occurrences': 3}
+
+    def test_reindexing_replaces_file(self, index):
+        """Test that re-profiling a file replaces its occurrences."""
+        index.index_dataframe(pd.DataFrame({'gene_symbol': ['BRCA1', 'TP53']}), PROFILE, 'gencc', 'gencc/g.tsv')
+        index.index_dataframe(pd.DataFrame({'gene_symbol': ['EGFR', 'TP53']}), PROFILE, 'gencc', 'gencc/g.tsv')
+
+        assert index.lookup('BRCA1') == []
+        assert index.lookup('TP53')[0]['rows'] == [1]
+        assert index.stats()['files'] == 1
+
+        index.remove_file('gencc/g.tsv')
+        assert index.lookup('EGFR') == []
+        assert index.stats()['files'] == 0
+
+    def test_persists_across_connections(self, tmp_path):
+        """Test that the index is readable after reopening."""
+        path = tmp_path / 'entities.sqlite'
+        with EntityIndex(path) as entity_index:
+            entity_index.index_dataframe(pd.DataFrame({'gene_symbol': ['BRCA1']}), PROFILE, 's', 's/a.tsv')
+
+        with EntityIndex(path) as entity_index:
+            assert entity_index.lookup('BRCA1')[0]['filepath'] == 's/a.tsv'
+
+
+class TestIndexWhileProfiling:
+    """Test building the index from analyze_tabular_file."""
+
+    def test_analyze_tabular_file_fills_index(self, tmp_path, monkeypatch, index):
+        """Test that profiling a file adds its entity locations."""
+        monkeypatch.chdir(tmp_path)
+        data_path = tmp_path / 'data' / 'sources' / 'gencc' / 'gencc.tsv'
+        data_path.parent.mkdir(parents=True)
+        data_path.write_text("gene_symbol\tdisease_title\nBRCA1\tBreast cancer\nTP53\tLi-Fraumeni syndrome\n")
+
+        analyze_tabular_file(data_path.relative_to(tmp_path), entity_index=index)
+
+        gene = index.lookup('TP53')[0]
+        assert (gene['source'], gene['filepath'], gene['rows']) == ('gencc', 'gencc/gencc.tsv', [1])
+        assert index.lookup('Breast cancer')[0]['entity_type'] == 'diseases'
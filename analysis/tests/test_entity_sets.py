@@ -0,0 +1,189 @@
+"""Tests for full-value entity set extraction."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from analysis.core.cross_source import calculate_overlap, analyze_cross_source
+from analysis.core.entity_sets import (
+    EntityInterner,
+    select_entity_columns,
+    resolve_data_path,
+    extract_entity_sets,
+    extract_source_entity_sets,
+    merge_entity_sets,
+    calculate_id_overlap,
+    save_entity_sets,
+    load_entity_sets,
+)
+
+
+PROFILE = {
+    'file_metadata': {'filepath': 'src/data.tsv', 'delimiter': '\t', 'encoding': 'utf-8'},
+    'field_analyses': [
+        {'field_name': 'gene_symbol', 'pattern': None},
+        {'field_name': 'hgnc_id', 'pattern': 'HGNC ID'},
+        {'field_name': 'disease_name', 'pattern': None},
+        {'field_name': 'notes', 'pattern': None},
+    ],
+}
+
+
+def write_tsv(path, rows):
+    pd.DataFrame(rows, columns=['gene_symbol', 'hgnc_id', 'disease_name', 'notes']).to_csv(
+        path, sep='\t', index=False
+    )
+    return path
+
+
+class TestEntityInterner:
+    """Test string interning."""
+
+    def test_ids_are_shared_and_sorted(self):
+        """Test that the same string always gets the same ID."""
+        interner = EntityInterner()
+        first = interner.intern(['BRCA2', 'BRCA1', 'BRCA2'])
+        second = interner.intern(['TP53', 'BRCA1'])
+
+        assert list(first) == [0, 1]
+        assert list(second) == [1, 2]
+        assert interner.values(second) == ['BRCA1', 'TP53']
+        assert list(interner.lookup(['TP53', 'UNKNOWN'])) == [2]
+
+
+class TestSelectEntityColumns:
+    """Test entity column selection."""
+
+    def test_uses_field_names_and_patterns(self):
+        """Test that columns are selected like the extract_* functions."""
+        columns = select_entity_columns(PROFILE)
+
+        assert columns['gene_symbol'] == [('genes', 'symbols')]
+        assert ('genes', 'hgnc_ids') in columns['hgnc_id']
+        assert columns['disease_name'] == [('diseases', 'names')]
+        assert 'notes' not in columns
+
+    def test_prefers_parquet_mirror(self, tmp_path):
+        """Test that an existing Parquet mirror is read instead of the source."""
+        assert resolve_data_path(PROFILE, tmp_path / 'data') == tmp_path / 'data' / 'src' / 'data.tsv'
+
+        mirror = tmp_path / 'mirror' / 'src' / 'data.tsv.parquet'
+        mirror.parent.mkdir(parents=True)
+        mirror.touch()
+        assert resolve_data_path(PROFILE, tmp_path / 'data', tmp_path / 'mirror') == mirror
+
+
+class TestExtractEntitySets:
+    """Test streaming extraction."""
+
+    def test_collects_all_values_across_chunks(self, tmp_path):
+        """Test that every distinct value is collected, not just top values."""
+        rows = [[f'GENE{i}', f'HGNC:{i}', f'Disease number {i % 50}', 'x'] for i in range(500)]
+        rows.append(['lowercase', 'not-an-id', 'MONDO:1', 'x'])
+        path = write_tsv(tmp_path / 'data.tsv', rows)
+
+        interner = EntityInterner()
+        sets = extract_entity_sets(path, PROFILE, interner, chunksize=64)
+
+        symbols = sets['genes']['symbols']
+        assert len(symbols) == 500
+        assert np.all(np.diff(symbols) > 0)
+        assert 'lowercase' not in interner.values(symbols)
+        assert len(sets['genes']['hgnc_ids']) == 500
+        assert len(sets['diseases']['names']) == 50
+        assert len(sets['variants']['dbsnp_ids']) == 0
+
+    def test_reads_parquet_mirror(self, tmp_path):
+        """Test that Parquet mirrors give the same sets as the source file."""
+        rows = [['BRCA1', 'HGNC:1100', 'Breast cancer', 'x'], ['TP53', None, None, 'y']]
+        tsv = write_tsv(tmp_path / 'data.tsv', rows)
+        parquet = tmp_path / 'data.tsv.parquet'
+        pd.read_csv(tsv, sep='\t', dtype=str).to_parquet(parquet)
+
+        interner = EntityInterner()
+        from_tsv = extract_entity_sets(tsv, PROFILE, interner)
+        from_parquet = extract_entity_sets(parquet, PROFILE, interner)
+
+        for entity_type, kinds in from_tsv.items():
+            for kind, ids in kinds.items():
+                assert np.array_equal(ids, from_parquet[entity_type][kind])
+
+    def test_source_sets_merge_files(self, tmp_path):
+        """Test that files of one source are unioned and missing files reported."""
+        data_dir = tmp_path / 'data'
+        (data_dir / 'src').mkdir(parents=True)
+        write_tsv(data_dir / 'src' / 'a.tsv', [['BRCA1', None, None, None]])
+        write_tsv(data_dir / 'src' / 'b.tsv', [['TP53', None, None, None]])
+
+        profile_a = dict(PROFILE, file_metadata=dict(PROFILE['file_metadata'], filepath='src/a.tsv'))
+        profile_b = dict(PROFILE, file_metadata=dict(PROFILE['file_metadata'], filepath='src/b.tsv'))
+        profile_c = dict(PROFILE, file_metadata=dict(PROFILE['file_metadata'], filepath='src/c.tsv'))
+
+        interner = EntityInterner()
+        source_sets, missing = extract_source_entity_sets(
+            {'src': [profile_a, profile_b, profile_c]}, interner, data_dir
+        )
+
+        assert interner.values(source_sets['src']['genes']['symbols']) == ['BRCA1', 'TP53']
+        assert missing == [data_dir / 'src' / 'c.tsv']
+
+
+class TestCalculateIdOverlap:
+    """Test overlap on interned ID arrays."""
+
+    def test_matches_set_overlap(self):
+        """Test that ID overlap equals the set-based calculation."""
+        string_sets = {
+            'source1': {'BRCA1', 'BRCA2', 'TP53'},
+            'source2': {'BRCA1', 'EGFR'},
+            'source3': {'TP53', 'EGFR', 'KRAS'},
+        }
+        interner = EntityInterner()
+        id_sets = {source: interner.intern(sorted(values)) for source, values in string_sets.items()}
+
+        assert calculate_id_overlap(id_sets) == calculate_overlap(string_sets)
+
+    def test_merge_unions_sets(self):
+        """Test that merging unions each kind."""
+        interner = EntityInterner()
+        a = {'genes': {'symbols': interner.intern(['A', 'B'])}}
+        b = {'genes': {'symbols': interner.intern(['B', 'C'])}}
+
+        merged = merge_entity_sets([a, b])
+
+        assert interner.values(merged['genes']['symbols']) == ['A', 'B', 'C']
+        assert len(merged['variants']['hgvs']) == 0
+
+    def test_analyze_cross_source_uses_entity_sets(self):
+        """Test that full entity sets replace top-value overlaps."""
+        interner = EntityInterner()
+        entity_sets = {
+            'source1': merge_entity_sets([{'genes': {'symbols': interner.intern(['A', 'B', 'C'])}}]),
+            'source2': merge_entity_sets([{'genes': {'symbols': interner.intern(['B', 'C', 'D'])}}]),
+        }
+        sources_data = {'source1': {'field_analyses': []}, 'source2': {'field_analyses': []}}
+
+        result = analyze_cross_source(sources_data, entity_sets=entity_sets)
+
+        overlap = result['gene_overlap']['pairwise_overlaps']['source1_vs_source2']
+        assert overlap['intersection_count'] == 2
+        assert result['gene_overlap']['total_unique_entities'] == 4
+        assert result['disease_overlap'] == {}
+
+
+class TestSaveEntitySets:
+    """Test persistence of entity sets."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that saved sets and vocabulary load back unchanged."""
+        interner = EntityInterner()
+        source_sets = {
+            'src': merge_entity_sets([{'genes': {'symbols': interner.intern(['BRCA1', 'TP53'])}}]),
+        }
+        path = tmp_path / 'entity_sets.npz'
+
+        save_entity_sets(path, source_sets, interner)
+        loaded_sets, loaded_interner = load_entity_sets(path)
+
+        assert loaded_interner.vocabulary == interner.vocabulary
+        assert np.array_equal(loaded_sets['src']['genes']['symbols'], source_sets['src']['genes']['symbols'])
+        assert loaded_interner.values(loaded_sets['src']['genes']['symbols']) == ['BRCA1', 'TP53']
@@ -0,0 +1,87 @@
+"""Tests for slotted and array-backed field profiles."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from analysis.core.field_profile import FieldProfile, FieldTable
+from analysis.core.tabular import analyze_field
+from analysis.reports.json_report import generate_json_report
+
+
+FIELDS = [
+    {
+        'field_name': 'gene', 'total_count': 4, 'non_null_count': '3', 'null_count': '1',
+        'null_percentage': 25.0, 'unique_count': 2, 'cardinality': 'low', 'data_type': 'string',
+        'min_length': 4, 'max_length': 5, 'mean_length': 4.33,
+        'top_values': [{'value': 'BRCA1', 'count': 2, 'percentage': 50.0}],
+        'pattern': 'Gene Symbol', 'value_sketch': {'k': 1},
+    },
+    {
+        'field_name': 'score', 'total_count': 4, 'non_null_count': 4, 'null_count': 0,
+        'null_percentage': 0.0, 'unique_count': 4, 'cardinality': 'unique', 'data_type': 'float',
+        'min': 0.5, 'max': 2.0, 'mean': 1.25, 'skewness': 0,
+    },
+    {'field_name': 'flag', 'data_type': 'boolean', 'true_count': 3},
+]
+
+
+class TestFieldProfile:
+    """Test the single-field record."""
+
+    def test_from_dict(self):
+        """Test typed attributes, numeric-string counts and extra keys."""
+        profile = FieldProfile.from_dict(FIELDS[0])
+
+        assert profile.null_count == 1 and profile.non_null_count == 3
+        assert profile.pattern == 'Gene Symbol'
+        assert profile.min is None
+        assert profile.top_values[0]['value'] == 'BRCA1'
+        assert profile.extra == {'value_sketch': {'k': 1}}
+        assert not hasattr(profile, '__dict__')
+
+    def test_to_dict(self):
+        """Test that present statistics round-trip."""
+        for analysis in FIELDS[1:]:
+            assert FieldProfile.from_dict(analysis).to_dict() == analysis
+
+    def test_from_json_report(self, tmp_path):
+        """Test that analyze_field counts are stored as JSON numbers and read back typed."""
+        series = pd.Series(['BRCA1', 'TP53', None, 'BRCA1'])
+        generate_json_report({'field': analyze_field(series, 'gene')}, tmp_path / 'field.json')
+        stored = json.loads((tmp_path / 'field.json').read_text())['field']
+
+        profile = FieldProfile.from_dict(stored)
+        assert (stored['null_count'], stored['unique_count']) == (1, 2)
+        assert (profile.null_count, profile.unique_count, profile.cardinality) == (1, 2, 'low')
+
+
+class TestFieldTable:
+    """Test the struct-of-arrays table."""
+
+    @pytest.fixture
+    def table(self):
+        return FieldTable.from_records(FIELDS)
+
+    def test_columns(self, table):
+        """Test per-statistic arrays with missing-value markers."""
+        assert len(table) == 3
+        assert list(table.names) == ['gene', 'score', 'flag']
+        assert table.columns['null_count'].dtype == np.int64
+        assert list(table.columns['null_count']) == [1, 0, -1]
+        np.testing.assert_array_equal(table.columns['max'], [np.nan, 2.0, np.nan])
+        assert list(table.columns['pattern']) == ['Gene Symbol', None, None]
+
+    def test_rows(self, table):
+        """Test that rows come back as field profiles."""
+        assert table[1] == FieldProfile.from_dict(FIELDS[1])
+        assert table.field('flag').extra == {'true_count': 3}
+        assert table.field('missing') is None
+        assert table.to_records()[1] == FIELDS[1]
+
+    def test_label_counts(self, table):
+        """Test label counts in order of first appearance, with missing labels named."""
+        assert table.label_counts('data_type') == {'string': 1, 'float': 1, 'boolean': 1}
+        assert table.label_counts('cardinality') == {'low': 1, 'unique': 1, 'unknown': 1}
+        assert FieldTable.from_records([]).label_counts('data_type') == {}
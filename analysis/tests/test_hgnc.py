@@ -0,0 +1,133 @@
+"""Tests for HGNC identifier resolution."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from analysis.core.hgnc import HgncResolver, load_hgnc_resolver, default_cache_path
+from analysis.core.entity_sets import EntityInterner, extract_entity_sets
+
+
+HGNC_TSV = (
+    "hgnc_id\tsymbol\tname\tlocus_group\talias_symbol\tprev_symbol\tentrez_id\tensembl_gene_id\n"
+    "HGNC:1100\tBRCA1\tBRCA1 DNA repair associated\tprotein-coding gene\tRNF53|BRCC1\t\t672\tENSG00000012048\n"
+    "HGNC:1101\tBRCA2\tBRCA2 DNA repair associated\tprotein-coding gene\tFAD|BRCC2\tFANCD1\t675\tENSG00000139618\n"
+    "HGNC:11998\tTP53\ttumor protein p53\tprotein-coding gene\tp53|LFS1\t\t7157\tENSG00000141510\n"
+    "HGNC:3430\tERBB2\terb-b2 receptor tyrosine kinase 2\tprotein-coding gene\t\"NEU|HER2\"\tNGL\t2064\tENSG00000141736\n"
+    "HGNC:9001\tGENEA\tmade up\tprotein-coding gene\tSHARED\t\t\t\n"
+    "HGNC:9002\tGENEB\tmade up\tprotein-coding gene\tSHARED\t\t\t\n"
+)
+
+
+@pytest.fixture
+def hgnc_path(tmp_path):
+    path = tmp_path / 'hgnc_complete_set.txt'
+    path.write_text(HGNC_TSV)
+    return path
+
+
+class TestHgncResolver:
+    """Test identifier lookups."""
+
+    def test_resolves_every_identifier_type(self, hgnc_path):
+        """Test symbols, aliases, previous symbols and external IDs."""
+        resolver = HgncResolver.from_tsv(hgnc_path)
+
+        result = resolver.resolve(['brca1', 'FANCD1', 'HER2', 'HGNC:11998', '672', 'ENSG00000141510.17'])
+
+        assert result['symbol'].tolist() == ['BRCA1', 'BRCA2', 'ERBB2', 'TP53', 'BRCA1', 'TP53']
+        assert result['match_type'].tolist() == [
+            'symbol', 'prev_symbol', 'alias_symbol', 'hgnc_id', 'entrez_id', 'ensembl_gene_id'
+        ]
+
+    def test_ambiguous_and_unresolved(self, hgnc_path):
+        """Test that shared aliases, unknown values and nulls do not resolve."""
+        resolver = HgncResolver.from_tsv(hgnc_path)
+
+        result = resolver.resolve(pd.Series(['SHARED', 'NOPE', None]))
+
+        assert result['match_type'].tolist() == ['ambiguous', 'unresolved', 'unresolved']
+        assert result['hgnc_id'].tolist() == [None, None, None]
+
+    def test_bare_number_is_not_hgnc_id(self, hgnc_path):
+        """Test that a bare number is looked up as an Entrez ID only."""
+        resolver = HgncResolver.from_tsv(hgnc_path)
+
+        assert resolver.resolve_one('1100')['match_type'] == 'unresolved'
+        assert resolver.resolve_one('675')['symbol'] == 'BRCA2'
+
+    def test_repeated_values_are_cached(self, hgnc_path):
+        """Test that each distinct value is looked up once."""
+        resolver = HgncResolver.from_tsv(hgnc_path)
+
+        result = resolver.resolve(np.array(['TP53', 'p53'] * 1000, dtype=object))
+        resolver.resolve(['TP53'])
+
+        assert set(result['hgnc_id']) == {'HGNC:11998'}
+        info = resolver.cache_info()
+        assert info.misses == 2
+        assert info.hits == 1
+
+    def test_prefix_search(self, hgnc_path):
+        """Test prefix search over symbols and aliases."""
+        resolver = HgncResolver.from_tsv(hgnc_path)
+
+        matches = resolver.search_prefix('brc')
+
+        assert [m['key'] for m in matches] == ['BRCA1', 'BRCA2', 'BRCC1', 'BRCC2']
+        assert matches[2]['symbol'] == 'BRCA1'
+        assert len(resolver.search_prefix('brc', limit=1)) == 1
+
+
+class TestLoadHgncResolver:
+    """Test the pickled index cache."""
+
+    def test_cache_is_written_and_reused(self, hgnc_path, monkeypatch):
+        """Test that a second load uses the pickled index."""
+        resolver = load_hgnc_resolver(hgnc_path)
+        assert default_cache_path(hgnc_path).exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("TSV re-parsed despite a valid cache")
+
+        monkeypatch.setattr(HgncResolver, 'from_tsv', fail)
+        reloaded = load_hgnc_resolver(hgnc_path)
+
+        assert len(reloaded) == len(resolver)
+        assert reloaded.resolve_one('HER2')['symbol'] == 'ERBB2'
+
+    def test_stale_cache_is_rebuilt(self, hgnc_path):
+        """Test that editing the TSV invalidates the cache."""
+        load_hgnc_resolver(hgnc_path)
+        with open(hgnc_path, 'a') as f:
+            f.write("HGNC:3236\tEGFR\tepidermal growth factor receptor\tprotein-coding gene\tERBB\t\t1956\t\n")
+
+        assert load_hgnc_resolver(hgnc_path).resolve_one('ERBB')['symbol'] == 'EGFR'
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a TSV without HGNC columns is rejected."""
+        path = tmp_path / 'other.tsv'
+        path.write_text("a\tb\n1\t2\n")
+
+        with pytest.raises(ValueError):
+            HgncResolver.from_tsv(path)
+
+
+class TestEntitySetsWithResolver:
+    """Test canonical gene symbols in entity extraction."""
+
+    def test_aliases_match_across_sources(self, hgnc_path, tmp_path):
+        """Test that aliases and previous symbols intern to the approved symbol."""
+        profile = {'field_analyses': [{'field_name': 'gene_symbol', 'pattern': None}]}
+        first = tmp_path / 'a.tsv'
+        second = tmp_path / 'b.tsv'
+        first.write_text("gene_symbol\nBRCA2\nHER2\nNOVEL1\n")
+        second.write_text("gene_symbol\nFANCD1\nERBB2\np53\n")
+
+        resolver = HgncResolver.from_tsv(hgnc_path)
+        interner = EntityInterner()
+        genes1 = extract_entity_sets(first, profile, interner, resolver=resolver)['genes']['symbols']
+        genes2 = extract_entity_sets(second, profile, interner, resolver=resolver)['genes']['symbols']
+
+        assert interner.values(np.intersect1d(genes1, genes2)) == ['BRCA2', 'ERBB2']
+        assert sorted(interner.values(genes1)) == ['BRCA2', 'ERBB2', 'NOVEL1']
+        assert 'TP53' in interner.values(genes2)
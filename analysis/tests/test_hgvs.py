@@ -0,0 +1,93 @@
+"""Tests for the vectorized HGVS parser."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from analysis.core.hgvs import HGVS_ERROR_CODES, parse_hgvs, hgvs_keys, summarize_hgvs
+
+
+class TestParseHgvs:
+    """Test component extraction and error codes."""
+
+    def test_clinvar_name(self):
+        """Test accession, version, gene and intronic offset."""
+        row = parse_hgvs(['NM_000059.4(BRCA2):c.68-7T>A']).iloc[0]
+
+        assert (row['reference'], row['version'], row['gene'], row['coordinate_type']) == \
+            ('NM_000059', 4, 'BRCA2', 'c')
+        assert (row['start'], row['start_offset'], row['end'], row['end_offset']) == (68, -7, 68, -7)
+        assert (row['edit_type'], row['ref'], row['alt'], row['error']) == ('sub', 'T', 'A', 'ok')
+
+    def test_edit_types(self):
+        """Test bare, range, UTR and protein-annotated expressions."""
+        parsed = parse_hgvs([
+            'c.35G>A',
+            'NM_007294.4(BRCA1):c.5266dup (p.Gln1756fs)',
+            'NC_000017.11:g.43045705_43045707delinsTT',
+            'c.*23_*25del',
+            'c.100_101insAG',
+            'c.-12+1C>T',
+        ])
+
+        assert parsed['edit_type'].tolist() == ['sub', 'dup', 'delins', 'del', 'ins', 'sub']
+        assert parsed['error_code'].tolist() == [0] * 6
+        assert parsed['reference'].isna().tolist() == [True, False, False, True, True, True]
+        assert parsed.loc[2, ['start', 'end', 'alt']].tolist() == [43045705, 43045707, 'TT']
+        assert parsed.loc[3, ['start_utr3', 'end_utr3']].tolist() == [True, True]
+        assert parsed.loc[5, ['start', 'start_offset']].tolist() == [-12, 1]
+
+    def test_error_codes(self):
+        """Test that the first failing stage names the error and components stay null."""
+        parsed = parse_hgvs(['', None, 'BRCA2 exon 3', 'p.Gly12Asp', 'c.(100_200)del', 'c.35G>', 'c.100insA'])
+
+        assert parsed['error'].tolist() == [
+            'empty', 'empty', 'no_coordinate_type', 'unsupported', 'unsupported', 'bad_edit', 'bad_edit'
+        ]
+        assert parsed['error_code'].dtype == np.int8
+        assert parsed['start'].isna().all()
+        assert parsed['edit_type'].isna().all()
+
+    def test_input_types(self):
+        """Test that Arrow, NumPy and pandas inputs give the same result."""
+        values = ['c.35G>A', 'NM_000059.3:c.68-7T>A', None]
+        expected = parse_hgvs(values)
+
+        for converted in (pa.chunked_array([values[:1], values[1:]]), np.array(values, dtype=object),
+                          pd.Series(values)):
+            pd.testing.assert_frame_equal(parse_hgvs(converted), expected)
+
+
+class TestHgvsKeys:
+    """Test canonical keys."""
+
+    def test_keys_drop_gene_and_version(self):
+        """Test that differently written expressions share a key."""
+        parsed = parse_hgvs([
+            'NM_000059.4(BRCA2):c.68-7T>A', 'NM_000059.3:c.68-7t>a', 'c.*23_*25del',
+            'c.100_101insAG', 'c.5266dup (p.Gln1756fs)', 'p.Gly12Asp',
+        ])
+
+        assert hgvs_keys(parsed).tolist() == [
+            'NM_000059:c.68-7T>A', 'NM_000059:c.68-7T>A', 'c.*23_*25del',
+            'c.100_101insAG', 'c.5266dup', None,
+        ]
+
+    def test_keys_with_version(self):
+        """Test that the accession version is kept on request."""
+        parsed = parse_hgvs(['NM_000059.4(BRCA2):c.68-7T>A', 'c.35G>A'])
+
+        assert hgvs_keys(parsed, include_version=True).tolist() == ['NM_000059.4:c.68-7T>A', 'c.35G>A']
+
+
+class TestSummarizeHgvs:
+    """Test the field profile summary."""
+
+    def test_summary(self):
+        """Test fractions and counts, ignoring nulls."""
+        summary = summarize_hgvs(pd.Series(['c.35G>A', 'g.10del', 'p.Gly12Asp', 'c.1A>T', None]))
+
+        assert summary['parsed_fraction'] == 0.75
+        assert summary['coordinate_types'] == {'c': 2, 'g': 1}
+        assert summary['edit_types'] == {'sub': 2, 'del': 1}
+        assert summary['errors'] == {'unsupported': 1}
+        assert set(HGVS_ERROR_CODES) >= set(summary['errors'])
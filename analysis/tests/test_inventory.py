@@ -0,0 +1,108 @@
+"""Tests for the cached file inventory."""
+
+import gzip
+import os
+
+import pytest
+from analysis.core.inventory import detect_compression, detect_file_type, scan_inventory
+from analysis.core.file_discovery import discover_files
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    base = tmp_path / 'sources'
+    case = base / 'tcga' / '0b3c8e2a-uuid'
+    case.mkdir(parents=True)
+    (base / 'gencc').mkdir()
+    (base / 'gencc' / 'submissions.tsv').write_text("a\tb\n1\t2\n")
+    (case / 'clinical.xml').write_text('<root/>')
+    (case / 'biospecimen').write_bytes(gzip.compress(b'<?xml version="1.0"?><root/>'))
+    (case / 'README.md').write_text('# notes, with a comma\n')
+    return base
+
+
+class TestDetectFileType:
+    """Test magic-byte and extension based type detection."""
+
+    def test_compression_magic(self):
+        """Test gzip, BGZF, bzip2 and zip magic numbers."""
+        bgzf_header = b'\x1f\x8b\x08\x04' + b'\x00' * 4 + b'\x00\xff' + b'\x06\x00' + b'BC\x02\x00'
+        assert detect_compression(gzip.compress(b'x')) == 'gzip'
+        assert detect_compression(bgzf_header) == 'bgzf'
+        assert detect_compression(b'BZh91AY') == 'bzip2'
+        assert detect_compression(b'PK\x03\x04') == 'zip'
+        assert detect_compression(b'col1\tcol2') is None
+
+    def test_extension_inside_compression_suffix(self, tmp_path):
+        """Test that .gz files are typed by content magic and inner extension."""
+        real = tmp_path / 'variants.tsv.gz'
+        real.write_bytes(gzip.compress(b'a\tb\n'))
+        fake = tmp_path / 'data.txt.gz'
+        fake.write_text('not compressed')
+
+        assert detect_file_type(real) == ('tabular', 'gzip')
+        assert detect_file_type(fake) == ('tabular', None)
+
+    def test_sniffed_content(self, tmp_path):
+        """Test that extension-less files are typed from their decompressed content."""
+        (tmp_path / 'record').write_bytes(gzip.compress(b'  {"id": 1}'))
+        (tmp_path / 'table.gz').write_bytes(gzip.compress(b'gene,score\nBRCA1,1\n'))
+        (tmp_path / 'blob').write_bytes(b'\x00\x01\x02')
+        (tmp_path / 'notes.md').write_text('a,b\n')
+
+        assert detect_file_type(tmp_path / 'record') == ('json', 'gzip')
+        assert detect_file_type(tmp_path / 'table.gz') == ('tabular', 'gzip')
+        assert detect_file_type(tmp_path / 'blob') == (None, None)
+        assert detect_file_type(tmp_path / 'notes.md') == (None, None)
+
+
+class TestScanInventory:
+    """Test the walk and its persisted cache."""
+
+    def test_entries(self, data_dir):
+        """Test that every file is listed with stat fields and type."""
+        entries = {os.path.basename(e['path']): e for e in scan_inventory(data_dir, workers=4)}
+
+        assert set(entries) == {'submissions.tsv', 'clinical.xml', 'biospecimen', 'README.md'}
+        assert (entries['biospecimen']['filetype'], entries['biospecimen']['compression']) == ('xml', 'gzip')
+        assert entries['README.md']['filetype'] is None
+        assert entries['submissions.tsv']['size'] == 8
+        assert entries['submissions.tsv']['inode'] == os.stat(data_dir / 'gencc' / 'submissions.tsv').st_ino
+
+    def test_cache_skips_unchanged_directories(self, data_dir, tmp_path, monkeypatch):
+        """Test that a rescan only inspects files in directories that changed."""
+        cache_path = tmp_path / 'inventory.pkl'
+        first = scan_inventory(data_dir, cache_path=cache_path)
+
+        import analysis.core.inventory as inventory
+        detected = []
+        original = inventory.detect_file_type
+        monkeypatch.setattr(inventory, 'detect_file_type', lambda path: detected.append(path.name) or original(path))
+
+        assert scan_inventory(data_dir, cache_path=cache_path) == first
+        assert detected == []
+
+        (data_dir / 'gencc' / 'curations.csv').write_text("a,b\n")
+        second = scan_inventory(data_dir, cache_path=cache_path)
+
+        assert detected == ['curations.csv']
+        assert len(second) == len(first) + 1
+
+        scan_inventory(data_dir, cache_path=cache_path, refresh=True)
+        assert len(detected) == 1 + len(second)
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing data directory gives an empty inventory."""
+        assert scan_inventory(tmp_path / 'missing') == []
+
+
+class TestDiscoverFilesFromInventory:
+    """Test discovery on top of the inventory."""
+
+    def test_extensionless_compressed_files(self, data_dir):
+        """Test that gzip files without a data extension are discovered by content."""
+        files = {os.path.basename(f['filepath']): f for f in discover_files(str(data_dir))}
+
+        assert set(files) == {'submissions.tsv', 'clinical.xml', 'biospecimen'}
+        assert files['biospecimen']['compression'] == 'gzip'
+        assert files['clinical.xml']['source'] == 'tcga'
@@ -0,0 +1,77 @@
+"""Tests for the streaming markdown and HTML reports."""
+
+import json
+
+from analysis.reports.markdown_report import generate_markdown_report
+from analysis.reports.html_report import generate_html_report
+
+
+def make_profile(field_count):
+    return {
+        'filename': 'matrix.tsv',
+        'field_analyses': [
+            {
+                'field_name': f'GENE{i}', 'data_type': 'float', 'total_count': 10, 'non_null_count': '9',
+                'null_percentage': 10.0, 'unique_count': 9, 'cardinality': 'medium',
+                'min': 0.0, 'max': float(i), 'mean': 1.0, 'std': 0.5, 'median': 1.0,
+            }
+            for i in range(field_count)
+        ],
+    }
+
+
+class TestMarkdownReport:
+    """Test inline and paginated field sections."""
+
+    def test_inline_fields(self, tmp_path):
+        """Test that files up to one page keep their field sections in the report."""
+        output_path = tmp_path / 'matrix_profile.md'
+        generate_markdown_report(make_profile(3), output_path, fields_per_page=3)
+
+        report = output_path.read_text()
+        assert '### GENE2' in report
+        assert '- **Non-null**: 9 / 10 (90.0%)' in report
+        assert not (tmp_path / 'matrix_profile_fields').exists()
+
+    def test_paginated_fields(self, tmp_path):
+        """Test that wide files get page files linked from an index table."""
+        output_path = tmp_path / 'matrix_profile.md'
+        generate_markdown_report(make_profile(5), output_path, fields_per_page=2)
+
+        report = output_path.read_text()
+        pages = sorted(path.name for path in (tmp_path / 'matrix_profile_fields').iterdir())
+        assert pages == ['page-001.md', 'page-002.md', 'page-003.md']
+        assert '### GENE0' not in report
+        assert '| [3](matrix_profile_fields/page-003.md) | 5-5 | `GENE4` | `GENE4` |' in report
+
+        page = (tmp_path / 'matrix_profile_fields' / 'page-002.md').read_text()
+        assert page.startswith('# Fields 3-4 of 5')
+        assert '[Previous](page-001.md) | [Next](page-003.md)' in page
+        assert '### GENE3' in page and '### GENE4' not in page
+
+        # Shrinking below one page removes the pages
+        generate_markdown_report(make_profile(2), output_path, fields_per_page=2)
+        assert not (tmp_path / 'matrix_profile_fields').exists()
+
+
+class TestHtmlReport:
+    """Test the HTML report with lazily loaded chunks."""
+
+    def test_chunks(self, tmp_path):
+        """Test that field details are written per chunk and only referenced from the page."""
+        output_path = tmp_path / 'matrix_profile.html'
+        profile = make_profile(5)
+        profile['field_analyses'][0]['field_name'] = '<b>gene</b>'
+        generate_html_report(profile, output_path, fields_per_chunk=2)
+
+        page = output_path.read_text()
+        assert page.count('<details id="chunk-') == 3
+        assert 'data-src="matrix_profile_chunks/chunk-003.js"' in page
+        assert '&lt;b&gt;gene&lt;/b&gt;' in page and '<b>gene</b>' not in page
+        assert '90.0%' not in page
+
+        chunk = (tmp_path / 'matrix_profile_chunks' / 'chunk-002.js').read_text()
+        assert chunk.startswith('hqFieldChunk(2, ')
+        records = json.loads(chunk[len('hqFieldChunk(2, '):-3])
+        assert [record['field_name'] for record in records] == ['GENE2', 'GENE3']
+        assert records[1]['range'] == '0.00 - 3.00 (mean 1.00)'
@@ -0,0 +1,169 @@
+"""Tests for disease-name matching to MONDO."""
+
+import numpy as np
+import pytest
+from analysis.core.mondo import (
+    MondoMatcher,
+    normalize_disease_name,
+    parse_mondo_obo,
+    load_mondo_matcher,
+    default_cache_path,
+)
+from analysis.core.entity_sets import EntityInterner, extract_entity_sets
+
+
+MONDO_OBO = '''format-version: 1.2
+ontology: mondo
+
+[Term]
+id: MONDO:0007254
+name: breast cancer
+synonym: "breast carcinoma" EXACT []
+synonym: "carcinoma of breast" EXACT []
+synonym: "malignant breast tumor" RELATED []
+
+[Term]
+id: MONDO:0004975
+name: Alzheimer disease
+synonym: "Alzheimer's disease" EXACT []
+
+[Term]
+id: MONDO:0007739
+name: Huntington disease
+synonym: "Huntington's chorea" EXACT []
+
+[Term]
+id: MONDO:0018997
+name: Noonan syndrome
+
+[Term]
+id: MONDO:0000001
+name: obsolete thing
+is_obsolete: true
+
+[Term]
+id: MONDO:0000002
+name: shared one
+synonym: "twin name" EXACT []
+
+[Term]
+id: MONDO:0000003
+name: shared two
+synonym: "twin name" EXACT []
+
+[Typedef]
+id: part_of
+name: part of
+'''
+
+
+@pytest.fixture
+def mondo_path(tmp_path):
+    path = tmp_path / 'mondo.obo'
+    path.write_text(MONDO_OBO)
+    return path
+
+
+class TestNormalization:
+    """Test name normalization and OBO parsing."""
+
+    def test_normalize_disease_name(self):
+        """Test case, accents, punctuation and stop words."""
+        assert normalize_disease_name("Carcinoma of the Breast") == 'carcinoma breast'
+        assert normalize_disease_name("Alzheimer's disease") == 'alzheimer disease'
+        assert normalize_disease_name("Sjögren-syndrome") == 'sjogren syndrome'
+
+    def test_parse_obo(self, mondo_path):
+        """Test that obsolete terms, non-exact synonyms and typedefs are skipped."""
+        terms = {term_id: (label, synonyms) for term_id, label, synonyms in parse_mondo_obo(mondo_path)}
+
+        assert 'MONDO:0000001' not in terms
+        assert terms['MONDO:0007254'] == ('breast cancer', ['breast carcinoma', 'carcinoma of breast'])
+        assert len(terms) == 6
+
+
+class TestMondoMatcher:
+    """Test exact and fuzzy matching."""
+
+    def test_exact_matches(self, mondo_path):
+        """Test label and synonym matches after normalization."""
+        matcher = MondoMatcher.from_file(mondo_path)
+
+        result = matcher.match(['Breast carcinoma', 'carcinoma of the breast', 'ALZHEIMERS DISEASE', None])
+
+        assert result['mondo_id'].tolist() == ['MONDO:0007254', 'MONDO:0007254', 'MONDO:0004975', None]
+        assert result['match_type'].tolist() == ['exact', 'exact', 'fuzzy', 'unmatched']
+
+    def test_fuzzy_matches(self, mondo_path):
+        """Test misspellings and word order through blocked fuzzy scoring."""
+        matcher = MondoMatcher.from_file(mondo_path)
+
+        result = matcher.match(['Alzheimers disease', 'breast carcinomas', 'syndrome Noonan', 'Huntingtons chorea'])
+
+        assert result['mondo_id'].tolist() == ['MONDO:0004975', 'MONDO:0007254', 'MONDO:0018997', 'MONDO:0007739']
+        assert set(result['match_type']) == {'fuzzy'}
+        assert (result['score'] >= 85).all()
+
+    def test_unmatched_and_ambiguous(self, mondo_path):
+        """Test that unrelated names stay unmatched and shared synonyms are ambiguous."""
+        matcher = MondoMatcher.from_file(mondo_path)
+
+        result = matcher.match(['kidney stones', 'Twin name', 'breast'])
+
+        assert result['match_type'].tolist() == ['unmatched', 'ambiguous', 'unmatched']
+        assert result['mondo_id'].isna().all()
+        assert matcher.match(['breast'], min_score=0)['mondo_id'][0] == 'MONDO:0007254'
+
+    def test_many_names(self, mondo_path):
+        """Test that repeated names are matched once and broadcast."""
+        matcher = MondoMatcher.from_file(mondo_path)
+
+        result = matcher.match(np.array(['Noonan syndrome', 'breast carcinomas'] * 5000, dtype=object))
+
+        assert len(result) == 10000
+        assert set(result['mondo_id']) == {'MONDO:0018997', 'MONDO:0007254'}
+
+
+class TestLoadMondoMatcher:
+    """Test the pickled terms cache."""
+
+    def test_cache_is_written_and_reused(self, mondo_path, monkeypatch):
+        """Test that a second load does not re-parse the OBO file."""
+        load_mondo_matcher(mondo_path)
+        assert default_cache_path(mondo_path).exists()
+
+        import analysis.core.mondo as mondo
+
+        def fail(*args, **kwargs):
+            raise AssertionError("OBO re-parsed despite a valid cache")
+
+        monkeypatch.setattr(mondo, 'parse_mondo_obo', fail)
+        assert len(load_mondo_matcher(mondo_path)) == 6
+
+    def test_tsv_labels(self, tmp_path):
+        """Test the id/label/synonyms TSV format."""
+        path = tmp_path / 'mondo_labels.tsv'
+        path.write_text("id\tlabel\tsynonyms\nMONDO:0007254\tbreast cancer\tbreast carcinoma|mammary cancer\n")
+
+        assert load_mondo_matcher(path).match(['Mammary cancer'])['mondo_id'][0] == 'MONDO:0007254'
+
+
+class TestEntitySetsWithMatcher:
+    """Test MONDO-canonical disease names in entity extraction."""
+
+    def test_names_match_across_sources(self, mondo_path, tmp_path):
+        """Test that differently written names intern to the same label and MONDO ID."""
+        profile = {'field_analyses': [{'field_name': 'disease_name', 'pattern': None}]}
+        first = tmp_path / 'a.tsv'
+        second = tmp_path / 'b.tsv'
+        first.write_text("disease_name\nBreast carcinoma\nRare thing X\n")
+        second.write_text("disease_name\nbreast cancer\nNoonan Syndrome\n")
+
+        matcher = MondoMatcher.from_file(mondo_path)
+        interner = EntityInterner()
+        sets1 = extract_entity_sets(first, profile, interner, disease_matcher=matcher)['diseases']
+        sets2 = extract_entity_sets(second, profile, interner, disease_matcher=matcher)['diseases']
+
+        assert interner.values(np.intersect1d(sets1['names'], sets2['names'])) == ['breast cancer']
+        assert sorted(interner.values(sets1['names'])) == ['Rare thing X', 'breast cancer']
+        assert interner.values(sets2['mondo_ids']) == ['MONDO:0007254', 'MONDO:0018997']
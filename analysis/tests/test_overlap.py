@@ -0,0 +1,97 @@
+"""Tests for N-way bitset overlap."""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+from analysis.core.entity_sets import EntityInterner, merge_entity_sets
+from analysis.core.overlap import (
+    build_source_bitsets,
+    compute_overlap_regions,
+    analyze_entity_overlap,
+)
+
+
+def regions_by_sources(result):
+    return {tuple(region['sources']): region for region in result['regions']}
+
+
+class TestComputeOverlapRegions:
+    """Test intersection region counting."""
+
+    def test_three_source_venn(self):
+        """Test exclusive and intersection counts of a three-way Venn diagram."""
+        id_sets = {
+            'gencc': np.array([0, 1, 2, 3]),
+            'clingen': np.array([2, 3, 4]),
+            'clinvar': np.array([3, 4, 5, 6]),
+        }
+
+        result = compute_overlap_regions(build_source_bitsets(id_sets, 8), 8)
+        regions = regions_by_sources(result)
+
+        assert result['total_unique_entities'] == 7
+        assert result['source_counts'] == {'gencc': 4, 'clingen': 3, 'clinvar': 4}
+        assert regions[('gencc',)]['exclusive_count'] == 2
+        assert regions[('gencc', 'clingen')]['exclusive_count'] == 1
+        assert regions[('gencc', 'clingen', 'clinvar')]['exclusive_count'] == 1
+        assert regions[('gencc', 'clingen')]['intersection_count'] == 2
+        assert regions[('clinvar',)]['intersection_count'] == 4
+        assert ('gencc', 'clinvar') not in regions
+
+    def test_matches_python_sets(self):
+        """Test all regions of five random sources against set arithmetic."""
+        rng = random.Random(7)
+        sources = ['gencc', 'clingen', 'clinvar', 'cbioportal', 'tcga']
+        universe = 2000
+        sets = {source: set(rng.sample(range(universe), rng.randint(200, 1200))) for source in sources}
+        id_sets = {source: np.array(sorted(ids)) for source, ids in sets.items()}
+
+        result = compute_overlap_regions(build_source_bitsets(id_sets, universe), universe)
+        regions = regions_by_sources(result)
+
+        for degree in range(1, len(sources) + 1):
+            for members in itertools.combinations(sources, degree):
+                inside = set.intersection(*(sets[s] for s in members))
+                others = set().union(*(sets[s] for s in sources if s not in members))
+                exclusive = inside - others
+                if exclusive:
+                    assert regions[members]['exclusive_count'] == len(exclusive)
+                    assert regions[members]['intersection_count'] == len(inside)
+                else:
+                    assert members not in regions
+
+        assert sum(r['exclusive_count'] for r in result['regions']) == len(set().union(*sets.values()))
+
+    def test_too_many_sources(self):
+        """Test that more sources than mask bits is rejected."""
+        bitsets = build_source_bitsets({f's{i}': np.array([0]) for i in range(65)}, 1)
+
+        with pytest.raises(ValueError):
+            compute_overlap_regions(bitsets, 1)
+
+
+class TestAnalyzeEntityOverlap:
+    """Test overlap over extracted entity sets."""
+
+    def test_per_kind_regions(self):
+        """Test that each entity kind gets its own regions and empty sources are dropped."""
+        interner = EntityInterner()
+        source_sets = {
+            'gencc': merge_entity_sets([{
+                'genes': {'symbols': interner.intern(['BRCA1', 'TP53'])},
+                'diseases': {'names': interner.intern(['Breast cancer'])},
+            }]),
+            'clinvar': merge_entity_sets([{
+                'genes': {'symbols': interner.intern(['TP53', 'EGFR'])},
+            }]),
+        }
+
+        results = analyze_entity_overlap(source_sets, len(interner))
+        genes = regions_by_sources(results['genes']['symbols'])
+
+        assert genes[('gencc', 'clinvar')]['exclusive_count'] == 1
+        assert results['diseases']['names']['sources'] == ['gencc']
+        assert 'variants' not in results
+        assert list(analyze_entity_overlap(source_sets, len(interner), ['diseases'])) == ['diseases']
@@ -0,0 +1,102 @@
+"""Tests for the path frequency trie."""
+
+import json
+import pytest
+import xml.etree.ElementTree as ET
+
+from analysis.core.path_trie import PathTrie
+from analysis.core.semistructured import extract_xml_paths, extract_json_paths
+
+
+XML_DOC = """<release>
+  <record><gene>A</gene><gene>B</gene><name>x</name></record>
+  <record><name>y</name></record>
+  <record/>
+</release>"""
+
+
+@pytest.fixture
+def xml_trie():
+    return PathTrie.from_xml(ET.fromstring(XML_DOC))
+
+
+class TestFromXML:
+    """Test building tries from XML."""
+
+    def test_paths_match_extract_xml_paths(self, xml_trie):
+        """Test that the trie catalogues the same paths as extract_xml_paths."""
+        assert set(xml_trie.paths()) == extract_xml_paths(ET.fromstring(XML_DOC))
+
+    def test_counts(self, xml_trie):
+        """Test occurrence, parent and file counts."""
+        gene = xml_trie.get("release/record/gene")
+        assert gene["occurrences"] == 2
+        assert gene["parent_count"] == 1
+        assert gene["file_count"] == 1
+
+        name = xml_trie.get("release/record/name")
+        assert name["occurrences"] == 2
+        assert name["parent_count"] == 2
+
+        assert xml_trie.get("release/record")["occurrences"] == 3
+        assert xml_trie.get("release")["parent_count"] == 1
+
+
+class TestFromJSON:
+    """Test building tries from JSON."""
+
+    def test_paths_match_extract_json_paths(self):
+        """Test that JSON paths follow the extract_json_paths conventions."""
+        data = {"rows": [[1, 2], [3]], "meta": {"version": 1}}
+        assert set(PathTrie.from_json(data).paths()) == extract_json_paths(data)
+
+    def test_visits_all_array_elements(self):
+        """Test that keys only present in later array elements are catalogued."""
+        data = {"items": [{"a": 1}, {"a": 2, "b": 3}]}
+        trie = PathTrie.from_json(data)
+
+        assert trie.get("items[].b")["occurrences"] == 1
+        assert trie.get("items[].a")["parent_count"] == 2
+        assert trie.get("items[]")["occurrences"] == 2
+
+
+class TestQueries:
+    """Test prefix and membership queries."""
+
+    def test_prefix_query(self, xml_trie):
+        """Test that prefix queries return only the matching branch."""
+        assert xml_trie.paths("release/record/") == ["release/record/gene", "release/record/name"]
+        assert xml_trie.paths("release/record/g") == ["release/record/gene"]
+        assert xml_trie.paths("other") == []
+
+    def test_contains_and_len(self, xml_trie):
+        """Test membership and size."""
+        assert "release/record/gene" in xml_trie
+        assert "release/record/ge" not in xml_trie
+        assert len(xml_trie) == 4
+
+
+class TestMergeAndSerialize:
+    """Test merging and compact serialization."""
+
+    def test_merge_counts_files(self, xml_trie):
+        """Test that merging tries sums file counts."""
+        other = PathTrie.from_xml(ET.fromstring("<release><record><gene/></record></release>"))
+        merged = PathTrie().merge(xml_trie).merge(other)
+
+        assert merged.get("release/record/gene")["file_count"] == 2
+        assert merged.get("release/record/name")["file_count"] == 1
+        assert merged.get("release/record/gene")["occurrences"] == 3
+
+    def test_round_trip(self, xml_trie):
+        """Test that serialization preserves every path and count."""
+        data = json.loads(json.dumps(xml_trie.to_dict()))
+        restored = PathTrie.from_dict(data)
+
+        assert list(restored.items()) == list(xml_trie.items())
+        assert restored.format == "xml"
+
+    def test_serialization_stores_segments_once(self, xml_trie):
+        """Test that full path strings are not stored."""
+        data = xml_trie.to_dict()
+        assert data["segments"] == ["release", "/record", "/gene", "/name"]
@@ -0,0 +1,40 @@
+"""Tests for the pickled reference-file caches."""
+
+import os
+
+from analysis.core.pickle_cache import cache_signature, read_pickle_cache, write_pickle_cache
+
+
+class TestPickleCache:
+    """Test signature checks and fallbacks of the shared cache helpers."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a payload is returned for the signature it was written with."""
+        source = tmp_path / 'hgnc.tsv'
+        source.write_text('symbol\nBRCA1\n')
+        signature = cache_signature(source, 1)
+
+        write_pickle_cache(tmp_path / 'hgnc.tsv.pkl', signature, ({'BRCA1': [0]}, [('HGNC:1100', 'BRCA1')]))
+
+        assert read_pickle_cache(tmp_path / 'hgnc.tsv.pkl', signature) == ({'BRCA1': [0]}, [('HGNC:1100', 'BRCA1')])
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['hgnc.tsv', 'hgnc.tsv.pkl']
+
+    def test_stale_signature(self, tmp_path):
+        """Test that a changed source file or cache version invalidates the cache."""
+        source = tmp_path / 'mondo.obo'
+        source.write_text('[Term]\n')
+        signature = cache_signature(source, 1)
+        write_pickle_cache(tmp_path / 'mondo.obo.pkl', signature, ['term'])
+
+        source.write_text('[Term]\nid: MONDO:0000001\n')
+        os.utime(source, ns=(0, 0))
+
+        assert read_pickle_cache(tmp_path / 'mondo.obo.pkl', cache_signature(source, 1)) is None
+        assert read_pickle_cache(tmp_path / 'mondo.obo.pkl', (2, *signature[1:])) is None
+
+    def test_missing_or_corrupt_cache(self, tmp_path):
+        """Test that unreadable caches are treated as missing."""
+        assert read_pickle_cache(tmp_path / 'missing.pkl', (1, 0, 0)) is None
+
+        (tmp_path / 'corrupt.pkl').write_bytes(b'not a pickle')
+        assert read_pickle_cache(tmp_path / 'corrupt.pkl', (1, 0, 0)) is None
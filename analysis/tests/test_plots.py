@@ -0,0 +1,76 @@
+"""Tests for the cached plot pipeline."""
+
+import matplotlib.image as mpimg
+import pytest
+from analysis.visualizations.plots import (
+    generate_all_plots,
+    plan_plots,
+    render_plots,
+    MAX_BAR_FIELDS,
+)
+
+
+def make_profile(field_count, null_percentage=10.0):
+    return {
+        'file_metadata': {'filename': 'matrix.tsv'},
+        'field_analyses': [
+            {
+                'field_name': f'GENE{i}',
+                'data_type': 'float' if i % 2 else 'string',
+                'cardinality': 'high',
+                'null_percentage': null_percentage,
+            }
+            for i in range(field_count)
+        ],
+    }
+
+
+class TestPlotCache:
+    """Test that plots are rendered only when their input changes."""
+
+    def test_unchanged_plots_skipped(self, tmp_path):
+        """Test that a second run renders nothing and a changed input re-renders one plot."""
+        viz_dir = tmp_path / 'visualizations'
+        profile = make_profile(5)
+
+        assert generate_all_plots(profile, viz_dir) == 3
+        assert generate_all_plots(profile, viz_dir) == 0
+
+        changed = make_profile(5, null_percentage=50.0)
+        assert [name for name, *_ in plan_plots(changed, viz_dir)] == ['null_percentages.png']
+        assert generate_all_plots(changed, viz_dir, force=True) == 3
+
+    def test_missing_image_rerendered(self, tmp_path):
+        """Test that a deleted image is rendered again despite its recorded digest."""
+        viz_dir = tmp_path / 'visualizations'
+        generate_all_plots(make_profile(5), viz_dir)
+        (viz_dir / 'cardinality_distribution.png').unlink()
+
+        assert generate_all_plots(make_profile(5), viz_dir) == 1
+        assert (viz_dir / 'cardinality_distribution.png').exists()
+
+    def test_no_field_analyses(self, tmp_path):
+        """Test that semi-structured profiles have no plots."""
+        assert plan_plots({'format': 'json'}, tmp_path) == []
+
+
+class TestRenderPlots:
+    """Test batched rendering."""
+
+    def test_process_pool(self, tmp_path):
+        """Test that plans of several profiles render on a pool and record digests."""
+        plans = []
+        for name in ('a', 'b'):
+            plans.extend(plan_plots(make_profile(3), tmp_path / name))
+
+        assert render_plots(plans, workers=2) == 6
+        assert all((tmp_path / name / 'data_type_distribution.png').exists() for name in ('a', 'b'))
+        assert plan_plots(make_profile(3), tmp_path / 'a') == []
+
+    @pytest.mark.parametrize('field_count', [MAX_BAR_FIELDS, 5000])
+    def test_wide_files_bounded(self, tmp_path, field_count):
+        """Test that the null percentage figure does not grow past the aggregated view."""
+        generate_all_plots(make_profile(field_count), tmp_path)
+
+        height = mpimg.imread(tmp_path / 'null_percentages.png').shape[0]
+        assert height < 2000
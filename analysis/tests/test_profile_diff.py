@@ -0,0 +1,108 @@
+"""Tests for diffing the field statistics of two analysis runs."""
+
+import json
+
+import pandas as pd
+import pytest
+from analysis.reports.profile_diff import (
+    DEFAULT_THRESHOLDS,
+    diff_profiles,
+    summarize_diff,
+    write_profile_diff,
+)
+
+
+def field(name, null_percentage=0.0, unique_count=100, data_type='string', total_count=1000):
+    return {
+        'field_name': name, 'data_type': data_type, 'total_count': total_count,
+        'null_percentage': null_percentage, 'unique_count': unique_count, 'cardinality': 'high',
+    }
+
+
+def write_run(sources_dir, fields):
+    profile_dir = sources_dir / 'clinvar' / 'variant_summary'
+    profile_dir.mkdir(parents=True)
+    profile = {
+        'file_metadata': {'filepath': 'clinvar/variant_summary.txt', 'filename': 'variant_summary.txt'},
+        'field_analyses': fields,
+    }
+    with open(profile_dir / 'variant_summary_profile.json', 'w') as f:
+        json.dump(profile, f)
+    return sources_dir
+
+
+@pytest.fixture
+def runs(tmp_path):
+    old = write_run(tmp_path / 'old', [
+        field('GeneSymbol'),
+        field('Chromosome'),
+        field('ReviewStatus', null_percentage=1.0),
+        field('Origin', unique_count=10),
+        field('Assembly'),
+    ])
+    new = write_run(tmp_path / 'new', [
+        field('GeneSymbol', null_percentage=2.0),
+        field('Chromosome', data_type='integer'),
+        field('ReviewStatus', null_percentage=12.5),
+        field('Origin', unique_count=40),
+        field('OriginSimple'),
+    ])
+    return old, new
+
+
+class TestProfileDiff:
+    """Test the merge-join of two runs."""
+
+    def test_statuses_and_flags(self, runs):
+        """Test added, removed and changed fields with their flags."""
+        diff = diff_profiles(*runs, workers=1).set_index('field_name')
+
+        assert diff.loc['Assembly', 'status'] == 'removed'
+        assert diff.loc['OriginSimple', 'status'] == 'added'
+        assert diff.loc['GeneSymbol', 'status'] == 'unchanged'
+        assert diff.loc['Chromosome', 'flags'] == 'data_type_change'
+        assert diff.loc['ReviewStatus', 'flags'] == 'null_rate'
+        assert diff.loc['ReviewStatus', 'null_percentage_delta'] == 11.5
+        assert diff.loc['Origin', 'flags'] == 'cardinality_jump'
+        assert diff.loc['Origin', 'unique_count_delta'] == 30
+        assert pd.isna(diff.loc['Assembly', 'unique_count_new'])
+
+    def test_thresholds(self, runs):
+        """Test that looser thresholds stop flagging smaller shifts."""
+        thresholds = {**DEFAULT_THRESHOLDS, 'null_percentage': ('null_rate', 20.0, False)}
+        diff = diff_profiles(*runs, thresholds=thresholds, workers=1).set_index('field_name')
+
+        assert diff.loc['ReviewStatus', 'status'] == 'unchanged'
+        assert diff.loc['Origin', 'status'] == 'changed'
+
+    def test_summary(self, runs):
+        """Test field counts per status and flag."""
+        summary = summarize_diff(diff_profiles(*runs, workers=1))
+
+        assert summary['fields'] == 6
+        assert summary['status'] == {'added': 1, 'changed': 3, 'removed': 1, 'unchanged': 1}
+        assert summary['flags'] == {'cardinality_jump': 1, 'data_type_change': 1, 'null_rate': 1}
+
+
+class TestWriteProfileDiff:
+    """Test the TSV and JSON outputs."""
+
+    def test_tsv(self, runs, tmp_path):
+        """Test one row per field with the join keys first."""
+        output_path = tmp_path / 'out' / 'profile_diff.tsv'
+        write_profile_diff(diff_profiles(*runs, workers=1), output_path)
+
+        written = pd.read_csv(output_path, sep='\t')
+        assert list(written.columns[:5]) == ['source', 'filename', 'field_name', 'status', 'flags']
+        assert set(written['filename']) == {'variant_summary.txt'}
+        assert len(written) == 6
+
+    def test_json(self, runs, tmp_path):
+        """Test the summary plus per-field records."""
+        output_path = tmp_path / 'profile_diff.json'
+        write_profile_diff(diff_profiles(*runs, workers=1), output_path)
+
+        report = json.loads(output_path.read_text())
+        assert report['summary']['fields'] == 6
+        removed = next(record for record in report['fields'] if record['field_name'] == 'Assembly')
+        assert removed['status'] == 'removed' and removed['unique_count_new'] is None
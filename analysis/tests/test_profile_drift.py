@@ -0,0 +1,58 @@
+"""Tests for distribution drift checks between two analysis runs."""
+
+import json
+
+import numpy as np
+import pandas as pd
+from analysis.core.tabular import analyze_field
+from analysis.reports.profile_drift import check_drift
+
+
+def write_run(sources_dir, columns):
+    profile_dir = sources_dir / 'clinvar' / 'variant_summary'
+    profile_dir.mkdir(parents=True)
+    profile = {
+        'file_metadata': {'filepath': 'clinvar/variant_summary.txt', 'filename': 'variant_summary.txt'},
+        'field_analyses': [analyze_field(series, name) for name, series in columns.items()],
+    }
+    with open(profile_dir / 'variant_summary_profile.json', 'w') as f:
+        json.dump(profile, f, default=str)
+    return sources_dir
+
+
+class TestCheckDrift:
+    """Test drift checks from stored sketches."""
+
+    def test_drifted_fields(self, tmp_path):
+        """Test that shifted proportions, values and vocabularies are flagged and stable fields are not."""
+        rng = np.random.default_rng(0)
+        significance = ['Pathogenic'] * 500 + ['Benign'] * 500
+        old = write_run(tmp_path / 'old', {
+            'ClinicalSignificance': pd.Series(significance),
+            'Score': pd.Series(rng.normal(0, 1, 1000)),
+            'Stable': pd.Series(rng.normal(0, 1, 1000)),
+            'Assembly': pd.Series(['GRCh38'] * 1000),
+        })
+        new = write_run(tmp_path / 'new', {
+            'ClinicalSignificance': pd.Series(significance[:200] + ['Uncertain significance'] * 300 + significance[500:]),
+            'Score': pd.Series(rng.normal(1, 1, 1000)),
+            'Stable': pd.Series(rng.normal(0, 1, 1000)),
+        })
+
+        drift = check_drift(old, new, workers=1).set_index('field_name')
+
+        assert list(drift.index) == ['ClinicalSignificance', 'Score', 'Stable']
+        assert drift.loc['ClinicalSignificance', 'flags'] == 'psi,ks,vocabulary'
+        assert drift.loc['ClinicalSignificance', 'added_values'] == 'Uncertain significance'
+        assert drift.loc['ClinicalSignificance', 'kind'] == 'top_k'
+        assert drift.loc['Score', 'status'] == 'drifted'
+        assert drift.loc['Stable', 'status'] == 'stable'
+
+    def test_thresholds(self, tmp_path):
+        """Test that a higher PSI threshold and KS threshold let a moderate shift pass."""
+        rng = np.random.default_rng(1)
+        old = write_run(tmp_path / 'old', {'Score': pd.Series(rng.normal(0, 1, 5000))})
+        new = write_run(tmp_path / 'new', {'Score': pd.Series(rng.normal(0.3, 1, 5000))})
+
+        assert check_drift(old, new, workers=1).loc[0, 'status'] == 'drifted'
+        assert check_drift(old, new, psi_threshold=1.0, ks_threshold=0.5, workers=1).loc[0, 'status'] == 'stable'
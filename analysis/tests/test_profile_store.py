@@ -0,0 +1,138 @@
+"""Tests for the consolidated SQLite profile store."""
+
+import json
+import os
+
+import pytest
+from analysis.core.field_profile import FieldTable
+from analysis.reports.profile_store import ProfileStore, STORE_FILENAME
+from analysis.reports.profile_catalog import ProfileCatalog
+
+
+TABULAR_PROFILE = {
+    'file_metadata': {
+        'filepath': 'gencc/gencc-submissions.tsv',
+        'filename': 'gencc-submissions.tsv',
+        'row_count': 3,
+        'column_count': 2,
+    },
+    'field_analyses': [
+        {
+            'field_name': 'gene_symbol',
+            'data_type': 'string',
+            'null_count': 0,
+            'top_values': [{'value': 'BRCA1', 'count': 2, 'percentage': 66.7},
+                           {'value': 'TP53', 'count': 1, 'percentage': 33.3}],
+            'identifiers': ['HGNC'],
+        },
+        {'field_name': 'score', 'data_type': 'float', 'min': 0.5, 'max': 2.0, 'mean': 1.25},
+    ],
+}
+
+JSON_PROFILE = {
+    'filepath': 'data/sources/clingen/actionability.json',
+    'filename': 'actionability.json',
+    'format': 'json',
+    'max_depth': 3,
+    'paths': ['rows', 'rows[]'],
+}
+
+GENCC_PATH = 'gencc/gencc-submissions/gencc-submissions_profile.json'
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ProfileStore(tmp_path / STORE_FILENAME) as profile_store:
+        profile_store.write_profile('gencc', 'gencc/gencc-submissions/gencc-submissions_profile.json',
+                                    TABULAR_PROFILE)
+        profile_store.write_profile('clingen', 'clingen/actionability/actionability_profile.json', JSON_PROFILE)
+        yield profile_store
+
+
+class TestProfileStore:
+    """Test writing, querying and exporting profiles."""
+
+    def test_metadata_columns(self, store):
+        """Test that file metadata is queryable next to the stored documents."""
+        assert store.stats() == {'profiles': 2, 'field_analyses': 2, 'top_values': 2, 'paths': 2}
+        assert store.conn.execute("SELECT row_count FROM profiles WHERE source = 'gencc'").fetchone() == (3,)
+        assert store.conn.execute("SELECT max_depth FROM profiles WHERE source = 'clingen'").fetchone() == (3,)
+
+    def test_rewrite_replaces_profile(self, store):
+        """Test that re-profiling a file replaces its row instead of duplicating it."""
+        path = 'gencc/gencc-submissions/gencc-submissions_profile.json'
+        rewritten = {**TABULAR_PROFILE, 'field_analyses': TABULAR_PROFILE['field_analyses'][1:]}
+        store.write_profile('gencc', path, rewritten)
+
+        assert store.stats() == {'profiles': 2, 'field_analyses': 1, 'top_values': 0, 'paths': 2}
+        assert list(store.profiles([path])) == [('gencc', path, rewritten)]
+
+        store.remove_profile(path)
+        assert store.profile_paths() == ['clingen/actionability/actionability_profile.json']
+        assert store.stats()['field_analyses'] == 0
+
+    def test_field_tables(self, store):
+        """Test that the field_analyses scan gives the same table as the decoded profile."""
+        (profile_id, table), = store.field_tables().items()
+        expected = FieldTable.from_records(TABULAR_PROFILE['field_analyses'])
+
+        assert [row.profile_id for row in store.stored_profiles([GENCC_PATH])] == [profile_id]
+        assert table.to_records() == expected.to_records()
+        assert list(table.columns['null_count']) == [0, -1]
+
+    def test_path_catalogue(self, store):
+        """Test that the paths of a profile without a path trie are listed without counts."""
+        (row,) = store.stored_profiles(['clingen/actionability/actionability_profile.json'])
+
+        assert row.field_count is None
+        assert [entry['path'] for entry in store.path_catalogue(row.profile_id)] == ['rows', 'rows[]']
+
+    def test_export_json(self, store, tmp_path):
+        """Test that stored profiles round-trip to per-file JSON reports."""
+        assert store.export_json(tmp_path / 'export') == 2
+
+        exported = tmp_path / 'export' / 'gencc' / 'gencc-submissions' / 'gencc-submissions_profile.json'
+        assert json.loads(exported.read_text()) == TABULAR_PROFILE
+
+
+class TestCatalogFromStore:
+    """Test that the profile catalog reads stored profiles."""
+
+    def test_store_and_json_profiles_combined(self, store, tmp_path):
+        """Test that stored profiles win over older files and JSON-only profiles are still found."""
+        older = tmp_path / 'gencc' / 'gencc-submissions' / 'gencc-submissions_profile.json'
+        older.parent.mkdir(parents=True)
+        older.write_text(json.dumps({'field_analyses': []}))
+        store.write_profile('gencc', GENCC_PATH, TABULAR_PROFILE)
+        extra = tmp_path / 'hpo' / 'genes' / 'genes_profile.json'
+        extra.parent.mkdir(parents=True)
+        extra.write_text(json.dumps({'format': 'json', 'filename': 'genes.json'}))
+
+        catalog = ProfileCatalog.load(tmp_path, workers=1)
+
+        assert [entry.source for entry in catalog] == ['clingen', 'gencc', 'hpo']
+        entry = catalog.tabular()[0]
+        assert entry.json_path == older
+        assert list(entry.field_table.names) == ['gene_symbol', 'score']
+        assert entry._data is None
+        assert entry.data == TABULAR_PROFILE
+
+    def test_newer_profile_file_wins(self, store, tmp_path):
+        """Test that a profile file rewritten after it was stored replaces the stored copy."""
+        newer = tmp_path / GENCC_PATH
+        newer.parent.mkdir(parents=True)
+        newer.write_text(json.dumps({'field_analyses': [{'field_name': 'submitter'}]}))
+        os.utime(newer, ns=(0, 10 ** 18))
+
+        catalog = ProfileCatalog.load(tmp_path, workers=1)
+
+        assert list(catalog.tabular()[0].field_table.names) == ['submitter']
+        assert ProfileCatalog.signatures(tmp_path)[newer][1] != store.digests()[GENCC_PATH][1]
+
+    def test_semi_structured_rows_from_store(self, store, tmp_path):
+        """Test that the path report reads the stored paths table."""
+        catalog = ProfileCatalog.load(tmp_path, workers=1)
+        entry = catalog.semi_structured()[0]
+
+        assert [row['path'] for row in entry.path_catalogue] == ['rows', 'rows[]']
+        assert entry._data is None
@@ -0,0 +1,85 @@
+"""Tests for the random-access XML record index."""
+
+import pytest
+from pathlib import Path
+
+from analysis.core.record_index import (
+    build_record_index,
+    default_index_path,
+    RecordIndex,
+    lookup_record,
+    lookup_record_bytes,
+)
+from analysis.core.xml_split import write_bgzf
+from analysis.tests.test_xml_split import make_release
+
+
+@pytest.fixture
+def release_xml(tmp_path):
+    path = tmp_path / "release.xml"
+    path.write_text(make_release(40))
+    return path
+
+
+class TestBuildRecordIndex:
+    """Test index construction."""
+
+    def test_default_location(self, release_xml):
+        """Test that the index is written next to the XML file."""
+        index_path = build_record_index(release_xml)
+        assert index_path == default_index_path(release_xml)
+        assert index_path.exists()
+
+    def test_entries_sorted(self, release_xml):
+        """Test that every record is indexed in key order."""
+        index = RecordIndex(build_record_index(release_xml))
+        keys = list(index.entries['key'])
+
+        assert len(index) == 40
+        assert keys == sorted(keys)
+
+    def test_missing_key_attribute(self, tmp_path):
+        """Test that records without a key are rejected."""
+        path = tmp_path / "nokey.xml"
+        path.write_text("<r><VariationArchive>x</VariationArchive></r>")
+        with pytest.raises(ValueError, match="Accession"):
+            build_record_index(path)
+
+
+class TestLookupRecord:
+    """Test record lookups."""
+
+    def test_lookup_returns_record(self, release_xml):
+        """Test that a lookup parses exactly the requested record."""
+        build_record_index(release_xml)
+        record = lookup_record(release_xml, "VCV000000017")
+
+        assert record.tag == "VariationArchive"
+        assert record.get("Accession") == "VCV000000017"
+
+    def test_version_suffix(self, release_xml):
+        """Test that versioned accessions resolve to the record."""
+        build_record_index(release_xml)
+        assert lookup_record(release_xml, "VCV000000005.2").get("Accession") == "VCV000000005"
+
+    def test_unknown_key(self, release_xml):
+        """Test that unknown keys return None."""
+        build_record_index(release_xml)
+        assert lookup_record(release_xml, "VCV999999999") is None
+        assert lookup_record(release_xml, "VCV0000000000000000001") is None
+
+    def test_bgzf_lookup(self, release_xml, tmp_path):
+        """Test lookups into a BGZF-compressed file."""
+        compressed = tmp_path / "release.xml.gz"
+        write_bgzf(release_xml, compressed, block_size=200)
+        build_record_index(compressed)
+
+        plain = lookup_record_bytes(release_xml, ["VCV000000031"], build_record_index(release_xml))
+        assert lookup_record_bytes(compressed, ["VCV000000031"]) == plain
+
+    def test_stale_index(self, release_xml):
+        """Test that an index built for a different file is rejected."""
+        build_record_index(release_xml)
+        release_xml.write_text(make_release(41))
+        with pytest.raises(ValueError, match="stale"):
+            lookup_record(release_xml, "VCV000000001")
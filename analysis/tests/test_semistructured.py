@@ -6,6 +6,7 @@ import tempfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from analysis.core.path_trie import PathTrie
 from analysis.core.semistructured import (
     parse_json,
     parse_xml,
@@ -19,6 +20,7 @@ from analysis.core.semistructured import (
     analyze_json_structure,
     analyze_xml_structure,
     analyze_semistructured_file,
+    PATH_PREVIEW_LIMIT,
 )
 
 
@@ -225,6 +227,22 @@ class TestAnalyzeStructures:
         assert result["unique_paths"] >= 3
         assert "person" in result["paths"]
 
+    def test_json_paths_are_a_preview(self):
+        """Test that wide JSON keeps a capped path list and the full catalogue only in the trie."""
+        data = {f"field{i:03d}": i for i in range(PATH_PREVIEW_LIMIT + 10)}
+        result = analyze_json_structure(data)
+
+        assert len(result["paths"]) == PATH_PREVIEW_LIMIT
+        assert result["unique_paths"] == PATH_PREVIEW_LIMIT + 10
+        assert len(list(PathTrie.from_dict(result["path_trie"]).items())) == PATH_PREVIEW_LIMIT + 10
+
+    def test_paths_agree_with_catalogue(self):
+        """Test that paths of later list items are counted like the trie counts them."""
+        result = analyze_json_structure({'items': [{'a': 1}, {'b': 2, 'c': {'d': 3}}]})
+
+        assert result["unique_paths"] == 6
+        assert result["paths"] == [entry["path"] for entry in PathTrie.from_dict(result["path_trie"]).items()]
+
     def test_analyze_xml_structure(self):
         """Test XML structure analysis."""
         xml_content = '<root><person><name>test</name></person></root>'
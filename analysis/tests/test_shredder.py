@@ -0,0 +1,138 @@
+"""Tests for config-driven XML/JSON shredding."""
+
+import gzip
+import json
+import pytest
+import pyarrow.parquet as pq
+import pyarrow as pa
+from pathlib import Path
+
+from analysis.core.shredder import (
+    load_shred_config,
+    iter_xml_records,
+    iter_json_records,
+    shred_file,
+)
+from analysis.core.semistructured import parse_xml, extract_xml_paths
+
+
+CLINVAR_XML = """<?xml version="1.0"?>
+<ClinVarVariationRelease>
+  <VariationArchive Accession="VCV000000001" VariationType="single nucleotide variant">
+    <ClassifiedRecord><GeneList><Gene Symbol="BRCA1"/><Gene Symbol="NBR2"/></GeneList></ClassifiedRecord>
+  </VariationArchive>
+  <VariationArchive Accession="VCV000000002" VariationType="Deletion">
+    <ClassifiedRecord><GeneList/></ClassifiedRecord>
+  </VariationArchive>
+  <VariationArchive Accession="VCV000000003" VariationType="Duplication">
+    <ClassifiedRecord><GeneList><Gene Symbol="TP53"/></GeneList></ClassifiedRecord>
+  </VariationArchive>
+</ClinVarVariationRelease>
+"""
+
+CLINVAR_CONFIG = {
+    "record_path": "ClinVarVariationRelease/VariationArchive",
+    "columns": {
+        "accession": "ClinVarVariationRelease/VariationArchive/@Accession",
+        "variation_type": "ClinVarVariationRelease/VariationArchive/@VariationType",
+        "gene_symbol": "ClinVarVariationRelease/VariationArchive/ClassifiedRecord/GeneList/Gene/@Symbol",
+    },
+    "row_group_size": 2,
+}
+
+
+@pytest.fixture
+def clinvar_xml(tmp_path):
+    path = tmp_path / "vcv.xml"
+    path.write_text(CLINVAR_XML)
+    return path
+
+
+class TestLoadShredConfig:
+    """Test config validation."""
+
+    def test_load_from_file(self, tmp_path):
+        """Test loading a config from a JSON file."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(CLINVAR_CONFIG))
+        assert load_shred_config(path)["record_path"] == CLINVAR_CONFIG["record_path"]
+
+    def test_missing_key(self):
+        """Test that missing keys are reported."""
+        with pytest.raises(ValueError, match="columns"):
+            load_shred_config({"record_path": "a"})
+
+    def test_column_outside_record(self):
+        """Test that column paths must be inside the record path."""
+        with pytest.raises(ValueError, match="not inside"):
+            load_shred_config({"record_path": "a/b", "columns": {"x": "a/c"}})
+
+
+class TestIterRecords:
+    """Test streaming record iteration."""
+
+    def test_xml_records(self, clinvar_xml):
+        """Test that each record element is yielded once."""
+        accessions = [r.get("Accession") for r in iter_xml_records(clinvar_xml, CLINVAR_CONFIG["record_path"])]
+        assert accessions == ["VCV000000001", "VCV000000002", "VCV000000003"]
+
+    def test_json_records(self, tmp_path):
+        """Test streaming array elements from a JSON file."""
+        path = tmp_path / "actionability.json"
+        path.write_text(json.dumps({"columns": ["gene"], "rows": [["BRCA1"], ["TP53"]]}))
+        assert list(iter_json_records(path, "rows[]")) == [["BRCA1"], ["TP53"]]
+
+    def test_paths_match_profile_paths(self, clinvar_xml):
+        """Test that config paths are the ones extract_xml_paths reports."""
+        profile_paths = extract_xml_paths(parse_xml(clinvar_xml))
+        assert CLINVAR_CONFIG["record_path"] in profile_paths
+        assert "ClinVarVariationRelease/VariationArchive/ClassifiedRecord/GeneList/Gene" in profile_paths
+
+
+class TestShredFile:
+    """Test end-to-end shredding."""
+
+    def test_xml_to_parquet(self, clinvar_xml, tmp_path):
+        """Test shredding XML into Parquet row groups."""
+        output = tmp_path / "vcv.parquet"
+        result = shred_file(clinvar_xml, CLINVAR_CONFIG, output)
+
+        assert result["record_count"] == 3
+        assert result["row_groups"] == 2
+        assert pq.ParquetFile(output).num_row_groups == 2
+
+        table = pq.read_table(output).to_pydict()
+        assert table["accession"] == ["VCV000000001", "VCV000000002", "VCV000000003"]
+        assert table["gene_symbol"] == ["BRCA1|NBR2", None, "TP53"]
+
+    def test_gzip_input(self, clinvar_xml, tmp_path):
+        """Test that compressed input is streamed transparently."""
+        compressed = tmp_path / "vcv.xml.gz"
+        compressed.write_bytes(gzip.compress(clinvar_xml.read_bytes()))
+        result = shred_file(compressed, CLINVAR_CONFIG, tmp_path / "vcv.parquet")
+        assert result["record_count"] == 3
+
+    def test_json_to_arrow(self, tmp_path):
+        """Test shredding positional JSON rows into an Arrow IPC file."""
+        path = tmp_path / "actionability.json"
+        path.write_text(json.dumps({
+            "columns": ["gene", "disease"],
+            "rows": [["BRCA1", "breast cancer"], ["TP53", "Li-Fraumeni"]],
+        }))
+        config = {"record_path": "rows[]", "columns": {"gene": "rows[][0]", "disease": "rows[][1]"}}
+        output = tmp_path / "actionability.arrow"
+
+        shred_file(path, config, output)
+
+        with pa.memory_map(str(output)) as source:
+            table = pa.ipc.open_file(source).read_all().to_pydict()
+        assert table == {"gene": ["BRCA1", "TP53"], "disease": ["breast cancer", "Li-Fraumeni"]}
+
+    def test_json_nested_keys(self, tmp_path):
+        """Test dotted key paths inside JSON records."""
+        path = tmp_path / "records.json"
+        path.write_text(json.dumps({"data": [{"gene": {"symbol": "BRCA1"}, "ids": [1, 2]}]}))
+        config = {"record_path": "data[]", "columns": {"symbol": "data[].gene.symbol", "ids": "data[].ids[]"}}
+
+        shred_file(path, config, tmp_path / "out.parquet")
+        assert pq.read_table(tmp_path / "out.parquet").to_pydict() == {"symbol": ["BRCA1"], "ids": ["1|2"]}
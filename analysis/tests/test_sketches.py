@@ -0,0 +1,222 @@
+"""Tests for MinHash/HyperLogLog column sketches."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from analysis.core.tabular import analyze_field
+from analysis.core.sketches import (
+    compute_value_sketch,
+    decode_value_sketch,
+    merge_value_sketches,
+    estimate_overlap,
+    hash_values,
+    hll_registers,
+    hll_estimate,
+    collect_column_sketches,
+    rank_value_overlaps,
+    compute_quantile_sketch,
+    compute_top_k_sketch,
+    distribution_drift,
+    DISTRIBUTION_TOP_K,
+)
+
+
+def values(start, stop, prefix='GENE'):
+    return pd.Series([f'{prefix}{i}' for i in range(start, stop)])
+
+
+class TestValueSketch:
+    """Test sketch computation and estimates."""
+
+    def test_sketch_is_json_serializable(self):
+        """Test that sketches survive a JSON round trip."""
+        sketch = compute_value_sketch(pd.Series(['BRCA1', 'TP53', None, 'BRCA1', ' ']))
+
+        assert sketch['distinct_count'] == 2
+        assert json.loads(json.dumps(sketch)) == sketch
+
+    def test_empty_column(self):
+        """Test that an all-null column has no sketch."""
+        assert compute_value_sketch(pd.Series([None, None])) is None
+
+    def test_sketch_is_deterministic(self):
+        """Test that the same values give the same sketch in any order."""
+        series = values(0, 500)
+
+        assert compute_value_sketch(series) == compute_value_sketch(series.sample(frac=1, random_state=1))
+
+    def test_hll_estimate(self):
+        """Test HyperLogLog accuracy on small and large sets."""
+        assert hll_estimate(hll_registers(hash_values(values(0, 50)))) == pytest.approx(50, rel=0.05)
+        assert hll_estimate(hll_registers(hash_values(values(0, 50000)))) == pytest.approx(50000, rel=0.1)
+
+    def test_overlap_estimates(self):
+        """Test Jaccard and containment estimates against exact values."""
+        big = decode_value_sketch(compute_value_sketch(values(0, 4000)))
+        small = decode_value_sketch(compute_value_sketch(values(1000, 2000)))
+        unrelated = decode_value_sketch(compute_value_sketch(values(0, 1000, prefix='rs')))
+
+        overlap = estimate_overlap(small, big)
+
+        assert overlap['jaccard'] == pytest.approx(0.25, abs=0.1)
+        assert overlap['containment_1'] == pytest.approx(1.0, abs=0.2)
+        assert overlap['containment_2'] == pytest.approx(0.25, abs=0.1)
+        assert estimate_overlap(small, unrelated)['jaccard'] < 0.05
+
+    def test_merge_is_union(self):
+        """Test that merging sketches equals the sketch of the union."""
+        merged = merge_value_sketches([
+            compute_value_sketch(values(0, 600)),
+            compute_value_sketch(values(400, 1000)),
+        ])
+        union = compute_value_sketch(values(0, 1000))
+
+        assert merged['minhash'] == union['minhash']
+        assert merged['hll'] == union['hll']
+        assert merged['distinct_count'] == pytest.approx(1000, rel=0.1)
+
+    def test_analyze_field_stores_sketch(self):
+        """Test that string fields carry a value sketch in their profile."""
+        stats = analyze_field(pd.Series(['BRCA1', 'TP53', 'EGFR']), 'gene_symbol')
+
+        assert stats['value_sketch']['distinct_count'] == 3
+
+
+class TestRankValueOverlaps:
+    """Test join discovery from stored sketches."""
+
+    def make_profile(self, filename, columns):
+        return {
+            'file_metadata': {'filename': filename},
+            'field_analyses': [
+                {'field_name': name, 'value_sketch': compute_value_sketch(series)}
+                for name, series in columns.items()
+            ],
+        }
+
+    def test_finds_differently_named_join_columns(self):
+        """Test that GeneSymbol/gene_symbol/Hugo_Symbol are linked by values, not names."""
+        source_profiles = {
+            'clinvar': [self.make_profile('variant_summary.txt', {
+                'GeneSymbol': values(0, 3000),
+                'RS# (dbSNP)': values(0, 3000, prefix='rs'),
+            })],
+            'gencc': [self.make_profile('gencc.tsv', {
+                'gene_symbol': values(0, 800),
+                'disease_title': values(0, 200, prefix='Disease '),
+            })],
+            'cbioportal': [self.make_profile('data_mutations.txt', {
+                'Hugo_Symbol': values(200, 1200),
+                'Tumor_Sample_Barcode': values(0, 300, prefix='TCGA-'),
+            })],
+        }
+
+        pairs = rank_value_overlaps(collect_column_sketches(source_profiles))
+        linked = {frozenset([p['field1'], p['field2']]) for p in pairs}
+
+        assert frozenset(['GeneSymbol', 'gene_symbol']) in linked
+        assert frozenset(['GeneSymbol', 'Hugo_Symbol']) in linked
+        assert frozenset(['gene_symbol', 'Hugo_Symbol']) in linked
+        assert not any('disease_title' in link or 'RS# (dbSNP)' in link for link in linked)
+        assert all(p['source1'] != p['source2'] for p in pairs)
+
+        scores = [max(p['containment_1'], p['containment_2']) for p in pairs]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_merges_field_across_files(self):
+        """Test that one field split over several files is ranked as one column."""
+        source_profiles = {
+            'tcga': [
+                self.make_profile('a.tsv', {'gene': values(0, 500)}),
+                self.make_profile('b.tsv', {'gene': values(500, 1000)}),
+            ],
+        }
+
+        columns = collect_column_sketches(source_profiles)
+
+        assert len(columns) == 1
+        assert columns[0]['file'] == '2 files'
+        assert columns[0]['sketch']['distinct_count'] == pytest.approx(1000, rel=0.1)
+
+    def test_skips_low_cardinality_columns(self):
+        """Test that columns below min_distinct are ignored."""
+        columns = [
+            {'source': 's1', 'field': 'flag', 'sketch': compute_value_sketch(pd.Series(['Y', 'N']))},
+            {'source': 's2', 'field': 'flag', 'sketch': compute_value_sketch(pd.Series(['Y', 'N']))},
+        ]
+
+        assert rank_value_overlaps(columns) == []
+        assert len(rank_value_overlaps(columns, min_distinct=1)) == 1
+
+
+class TestDistributionSketch:
+    """Test quantile and top-k sketches and the drift measures between them."""
+
+    @staticmethod
+    def normal(shift, seed):
+        return pd.Series(np.random.default_rng(seed).normal(shift, 1, 20000))
+
+    @staticmethod
+    def labels(**counts):
+        return pd.Series([label for label, count in counts.items() for _ in range(count)]).value_counts()
+
+    def test_sketches_are_json_serializable(self):
+        """Test that both sketch kinds survive a JSON round trip."""
+        quantiles = compute_quantile_sketch(pd.Series([3.0, 1.0, 2.0]))
+        top_k = compute_top_k_sketch(pd.Series([f'v{i % 30}' for i in range(300)]).value_counts())
+
+        assert json.loads(json.dumps(quantiles)) == quantiles
+        assert json.loads(json.dumps(top_k)) == top_k
+        assert len(top_k['values']) == DISTRIBUTION_TOP_K
+        assert top_k['other'] == 100
+        assert compute_quantile_sketch(pd.Series([], dtype=float)) is None
+
+    def test_quantile_drift(self):
+        """Test PSI and KS distance against a known shift of a normal distribution."""
+        old = compute_quantile_sketch(self.normal(0, seed=1))
+
+        same = distribution_drift(old, compute_quantile_sketch(self.normal(0, seed=2)))
+        shifted = distribution_drift(old, compute_quantile_sketch(self.normal(0.5, seed=3)))
+
+        assert same['psi'] < 0.01 and same['ks'] < 0.03
+        # KS distance of N(0, 1) and N(0.5, 1) is 2 * Phi(0.25) - 1
+        assert shifted['ks'] == pytest.approx(0.197, abs=0.02)
+        assert shifted['psi'] > 0.2
+
+    def test_point_masses(self):
+        """Test that repeated quantiles of a mostly constant column keep their mass."""
+        zeros = compute_quantile_sketch(pd.Series([0] * 80 + list(range(1, 21))))
+        fewer_zeros = compute_quantile_sketch(pd.Series([0] * 40 + list(range(1, 61))))
+
+        assert distribution_drift(zeros, zeros) == {'psi': 0.0, 'ks': 0.0}
+        assert distribution_drift(zeros, fewer_zeros)['ks'] == pytest.approx(0.4, abs=0.05)
+
+    def test_top_k_drift(self):
+        """Test proportion shifts and vocabulary changes of a categorical column."""
+        old = compute_top_k_sketch(self.labels(Pathogenic=50, Benign=50))
+        new = compute_top_k_sketch(self.labels(Pathogenic=70, Benign=20, Uncertain=10))
+
+        drift = distribution_drift(old, new)
+        assert drift['ks'] == pytest.approx(0.3)
+        assert drift['psi'] > 0.2
+        assert drift['added_values'] == ['Uncertain'] and drift['removed_values'] == []
+
+    def test_incomplete_top_k(self):
+        """Test that vocabulary changes are only reported when the top-k covers every value."""
+        old = compute_top_k_sketch(pd.Series([f'v{i}' for i in range(100)]).value_counts())
+        new = compute_top_k_sketch(pd.Series([f'w{i}' for i in range(100)]).value_counts())
+
+        assert 'added_values' not in distribution_drift(old, new)
+
+    def test_kind_mismatch(self):
+        """Test that a column that changed type has no drift measure."""
+        assert distribution_drift(compute_quantile_sketch(pd.Series([1.0])), compute_top_k_sketch(self.labels(a=1))) is None
+
+    def test_analyze_field_stores_distribution_sketch(self):
+        """Test that string, numeric and boolean fields carry a distribution sketch."""
+        assert analyze_field(pd.Series(['BRCA1', 'TP53', 'BRCA1']), 'gene')['distribution_sketch']['counts'] == [2, 1]
+        assert analyze_field(pd.Series([1.5, 2.5, None]), 'score')['distribution_sketch']['count'] == 2
+        assert analyze_field(pd.Series(['yes', 'no', 'yes']), 'flag')['distribution_sketch']['values'] == ['true', 'false']
+
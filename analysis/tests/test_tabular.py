@@ -16,6 +16,7 @@ from analysis.core.tabular import (
     detect_encoding,
     infer_delimiter,
     classify_cardinality,
+    calculate_identifier_coverage,
 )
 
 
@@ -253,3 +254,30 @@ class TestFileUtilities:
             assert delimiter == ','
         finally:
             os.unlink(temp_path)
+
+
+class TestCalculateIdentifierCoverage:
+    """Test per-file identifier row coverage."""
+
+    def test_counts_rows_with_any_matching_column(self):
+        """Test that a row counts once even when several columns match."""
+        df = pd.DataFrame({
+            'hgnc_id': ['HGNC:1100', 'HGNC:11998', None, 'unknown', 'HGNC:1101'],
+            'prev_hgnc_id': [None, 'HGNC:11998', 'HGNC:5', None, None],
+            'rsid': ['rs1', 'rs2', 'rs3', 'rs4', 'rs5'],
+        })
+        field_analyses = [
+            {'field_name': 'hgnc_id', 'pattern': 'HGNC ID'},
+            {'field_name': 'prev_hgnc_id', 'pattern': 'HGNC ID'},
+            {'field_name': 'rsid', 'pattern': 'dbSNP rsID'},
+        ]
+
+        coverage = calculate_identifier_coverage(df, field_analyses)
+
+        assert coverage['row_count'] == 5
+        assert coverage['types']['hgnc_ids']['rows'] == 4
+        assert coverage['types']['hgnc_ids']['fraction'] == 0.8
+        assert coverage['types']['hgnc_ids']['columns'] == ['hgnc_id', 'prev_hgnc_id']
+        assert coverage['types']['hgnc_ids']['value_sketch']['distinct_count'] == 4
+        assert coverage['types']['dbsnp_ids']['rows'] == 5
+        assert 'mondo_ids' not in coverage['types']
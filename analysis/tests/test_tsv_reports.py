@@ -7,8 +7,8 @@ import json
 import pytest
 import tempfile
 from pathlib import Path
+from analysis.reports.profile_catalog import ProfileCatalog
 from analysis.reports.tsv_reports import (
-    collect_analysis_files,
     generate_files_metadata_tabular_tsv,
     generate_files_metadata_json_tsv,
     generate_files_metadata_other_tsv,
@@ -16,7 +16,8 @@ from analysis.reports.tsv_reports import (
     generate_files_data_json_tsv,
     generate_individual_field_tsv,
     generate_unable_to_analyze_tsv,
-    generate_all_tsv_reports
+    generate_all_tsv_reports,
+    update_all_tsv_reports,
 )
 
 
@@ -113,26 +114,6 @@ def temp_data_dir(tmp_path):
     return data_dir
 
 
-class TestCollectAnalysisFiles:
-    """Tests for collect_analysis_files function."""
-
-    def test_collect_from_organized_sources(self, temp_sources_dir):
-        """Test collecting analysis files from organized source directories."""
-        sources = collect_analysis_files(temp_sources_dir)
-
-        assert "gencc" in sources
-        assert "clingen" in sources
-        assert len(sources["gencc"]) == 1
-        assert len(sources["clingen"]) == 1
-        assert sources["gencc"][0].name == "gencc-submissions_profile.json"
-        assert sources["clingen"][0].name == "clinical-actionability-adult-flat_profile.json"
-
-    def test_collect_empty_directory(self, tmp_path):
-        """Test collecting from empty directory returns empty dict."""
-        sources = collect_analysis_files(tmp_path)
-        assert sources == {}
-
-
 class TestGenerateFilesMetadataTabularTSV:
     """Tests for generate_files_metadata_tabular_tsv function."""
 
@@ -301,8 +282,8 @@ class TestGenerateFilesDataJSONTSV:
             assert 'source' in headers
             assert 'filename' in headers
             assert 'path' in headers
-            assert 'max_depth' in headers
-            assert 'node_count' in headers
+            assert 'max_depth' not in headers
+            assert 'node_count' not in headers
 
     def test_includes_all_paths(self, temp_sources_dir, tmp_path):
         """Test that all JSON paths are included."""
@@ -495,3 +476,108 @@ class TestDataQuality:
             for i, line in enumerate(lines[1:], start=2):
                 line_tabs = line.count('\t')
                 assert line_tabs == header_tabs, f"Line {i} has {line_tabs} tabs, expected {header_tabs}"
+
+
+class TestProfileCatalog:
+    """Tests for loading profiles once for all reports."""
+
+    def test_entries_and_views(self, temp_sources_dir):
+        """Test that profiles are grouped by source and classified by format."""
+        catalog = ProfileCatalog.load(temp_sources_dir, workers=1)
+
+        assert len(catalog) == 2
+        assert [entry.source for entry in catalog] == ['clingen', 'gencc']
+        assert [entry.filename for entry in catalog.tabular()] == ['gencc-submissions.tsv']
+        assert [entry.source for entry in catalog.semi_structured()] == ['clingen']
+        assert catalog.tabular()[0].get('row_count') == 24124
+        assert list(catalog.by_source()) == ['clingen', 'gencc']
+
+    def test_profile_paths(self, temp_sources_dir):
+        """Test that each source's profile files are found below its directory."""
+        catalog = ProfileCatalog.load(temp_sources_dir, workers=1)
+
+        assert {entry.source: entry.json_path.name for entry in catalog} == {
+            'clingen': 'clinical-actionability-adult-flat_profile.json',
+            'gencc': 'gencc-submissions_profile.json',
+        }
+
+    def test_empty_directory(self, tmp_path):
+        """Test that a directory without profiles gives an empty catalog."""
+        assert len(ProfileCatalog.load(tmp_path, workers=1)) == 0
+
+    def test_parallel_decoding(self, temp_sources_dir, monkeypatch):
+        """Test that the process pool gives the same entries as inline decoding."""
+        import analysis.reports.profile_catalog as profile_catalog
+        monkeypatch.setattr(profile_catalog, 'PARALLEL_MIN_BYTES', 0)
+
+        parallel = ProfileCatalog.load(temp_sources_dir, workers=2)
+        inline = ProfileCatalog.load(temp_sources_dir, workers=1)
+
+        assert [entry.data for entry in parallel] == [entry.data for entry in inline]
+
+    def test_reports_read_each_profile_once(self, temp_sources_dir, temp_data_dir, tmp_path, monkeypatch):
+        """Test that generating all reports decodes every profile a single time."""
+        import analysis.reports.profile_catalog as profile_catalog
+        loaded = []
+        original = profile_catalog._load_profile
+
+        def counting_load(json_path):
+            loaded.append(json_path)
+            return original(json_path)
+
+        monkeypatch.setattr(profile_catalog, '_load_profile', counting_load)
+        generate_all_tsv_reports(temp_sources_dir, temp_data_dir, tmp_path / "reports")
+
+        assert len(loaded) == 2
+        assert (tmp_path / "reports" / "files-data-json-by-source.tsv").exists()
+
+
+class TestUpdateAllTsvReports:
+    """Tests for incremental report regeneration."""
+
+    def test_matches_full_generation(self, temp_sources_dir, temp_data_dir, tmp_path):
+        """Test that assembled partitions equal a full rebuild."""
+        generate_all_tsv_reports(temp_sources_dir, temp_data_dir, tmp_path / "full")
+        counts = update_all_tsv_reports(temp_sources_dir, temp_data_dir, tmp_path / "incremental")
+
+        assert counts == {'changed': 2, 'removed': 0, 'unchanged': 0}
+        for report in sorted((tmp_path / "full").glob('*.tsv')):
+            assert (tmp_path / "incremental" / report.name).read_bytes() == report.read_bytes()
+
+    def test_only_changed_profiles_are_read(self, temp_sources_dir, temp_data_dir, tmp_path, monkeypatch):
+        """Test that a re-analyzed profile is the only one decoded and its rows are replaced."""
+        reports_dir = tmp_path / "reports"
+        update_all_tsv_reports(temp_sources_dir, temp_data_dir, reports_dir)
+
+        profile_path = temp_sources_dir / "gencc" / "gencc-submissions" / "gencc-submissions_profile.json"
+        data = json.loads(profile_path.read_text())
+        data['field_analyses'] = data['field_analyses'][:1]
+        profile_path.write_text(json.dumps(data))
+
+        import analysis.reports.profile_catalog as profile_catalog
+        loaded = []
+        original = profile_catalog._load_profile
+        monkeypatch.setattr(profile_catalog, '_load_profile', lambda path: loaded.append(path) or original(path))
+
+        counts = update_all_tsv_reports(temp_sources_dir, temp_data_dir, reports_dir)
+
+        assert counts == {'changed': 1, 'removed': 0, 'unchanged': 1}
+        assert loaded == [profile_path]
+        with open(reports_dir / "files-data-tabular-by-source.tsv") as f:
+            assert [row['field_name'] for row in csv.DictReader(f, delimiter='\t')] == ['uuid']
+
+        assert update_all_tsv_reports(temp_sources_dir, temp_data_dir, reports_dir)['changed'] == 0
+        assert len(loaded) == 1
+
+    def test_removed_profiles_drop_their_rows(self, temp_sources_dir, temp_data_dir, tmp_path):
+        """Test that deleting a profile removes its rows and partitions."""
+        reports_dir = tmp_path / "reports"
+        update_all_tsv_reports(temp_sources_dir, temp_data_dir, reports_dir)
+
+        (temp_sources_dir / "clingen" / "clinical-actionability" /
+         "clinical-actionability-adult-flat_profile.json").unlink()
+        counts = update_all_tsv_reports(temp_sources_dir, temp_data_dir, reports_dir)
+
+        assert counts == {'changed': 0, 'removed': 1, 'unchanged': 1}
+        assert not (reports_dir / "files-data-json-by-source.tsv").exists()
+        assert not any((reports_dir / ".partitions" / "clingen").rglob('*.tsv'))
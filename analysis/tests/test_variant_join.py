@@ -0,0 +1,157 @@
+"""Tests for the sort-based variant join."""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+from analysis.core.variant_join import (
+    VARIANT_PRESETS,
+    pack_locus,
+    unpack_locus,
+    normalize_variants,
+    join_variant_files,
+)
+
+
+CLINVAR_HEADER = "#AlleleID\tAssembly\tChromosome\tPositionVCF\tReferenceAlleleVCF\tAlternateAlleleVCF\n"
+MAF_HEADER = "#version 2.4\nHugo_Symbol\tNCBI_Build\tChromosome\tStart_Position\tReference_Allele\tTumor_Seq_Allele2\n"
+
+
+def write_clinvar(path, variants):
+    with open(path, 'w') as f:
+        f.write(CLINVAR_HEADER)
+        for i, (assembly, chrom, pos, ref, alt) in enumerate(variants):
+            f.write(f"{i}\t{assembly}\t{chrom}\t{pos}\t{ref}\t{alt}\n")
+
+
+def write_maf(path, variants):
+    with open(path, 'w') as f:
+        f.write(MAF_HEADER)
+        for assembly, chrom, pos, ref, alt in variants:
+            f.write(f"GENE\t{assembly}\tchr{chrom}\t{pos}\t{ref}\t{alt}\n")
+
+
+class TestLocusKeys:
+    """Test packed locus keys."""
+
+    def test_round_trip_and_order(self):
+        """Test that keys unpack and sort by assembly, chromosome, position."""
+        keys = pack_locus(np.array([2, 1, 1]), np.array([1, 23, 1]), np.array([5, 7, 248956422]))
+
+        assert [tuple(map(int, parts)) for parts in zip(*unpack_locus(keys))] == [
+            (2, 1, 5), (1, 23, 7), (1, 1, 248956422)
+        ]
+        assert np.argsort(keys).tolist() == [2, 1, 0]
+
+
+class TestNormalizeVariants:
+    """Test normalization of each source layout."""
+
+    def test_maf_and_vcf_indels_match(self):
+        """Test that MAF '-' alleles and VCF anchored alleles give the same records."""
+        vcf = pd.DataFrame({
+            'Assembly': ['GRCh38', 'GRCh38', 'GRCh38'],
+            'Chromosome': ['17', '17', '17'],
+            'PositionVCF': ['100', '200', '300'],
+            'ReferenceAlleleVCF': ['AT', 'C', 'G'],
+            'AlternateAlleleVCF': ['A', 'CGG', 'A'],
+        })
+        maf = pd.DataFrame({
+            'NCBI_Build': ['GRCh38', 'GRCh38', 'GRCh38'],
+            'Chromosome': ['chr17', 'chr17', 'chr17'],
+            'Start_Position': ['101', '200', '300'],
+            'Reference_Allele': ['T', '-', 'G'],
+            'Tumor_Seq_Allele2': ['-', 'GG', 'A'],
+        })
+
+        vcf_records, _ = normalize_variants(vcf, VARIANT_PRESETS['clinvar'])
+        maf_records, _ = normalize_variants(maf, VARIANT_PRESETS['maf'])
+
+        assert vcf_records.tolist() == maf_records.tolist()
+
+    def test_invalid_rows_are_counted(self):
+        """Test that missing positions, unknown contigs and builds are dropped."""
+        df = pd.DataFrame({
+            'Assembly': ['GRCh38', 'GRCh38', 'NCBI36', 'GRCh37'],
+            'Chromosome': ['1', 'Un', '1', 'X'],
+            'PositionVCF': ['-1', '10', '10', '10'],
+            'ReferenceAlleleVCF': ['na', 'A', 'A', 'A'],
+            'AlternateAlleleVCF': ['na', 'G', 'G', 'G'],
+        })
+
+        records, invalid = normalize_variants(df, VARIANT_PRESETS['clinvar'])
+
+        assert invalid == 3
+        assert [tuple(map(int, parts)) for parts in zip(*unpack_locus(records['locus']))] == [(1, 23, 10)]
+
+    def test_clingen_hgvs_expressions(self):
+        """Test that genomic substitutions are parsed once per assembly."""
+        df = pd.DataFrame({'HGVS Expressions': [
+            'NM_000277.2:c.1A>G, NC_000012.12:g.102917130T>C, NC_000012.11:g.103310908T>C',
+            'NM_000277.2:c.1066-11G>A',
+        ]})
+
+        records, invalid = normalize_variants(df, VARIANT_PRESETS['clingen'])
+        assemblies, chromosomes, positions = unpack_locus(records['locus'])
+
+        assert invalid == 1
+        assert sorted(zip(assemblies.tolist(), chromosomes.tolist(), positions.tolist())) == [
+            (1, 12, 103310908), (2, 12, 102917130)
+        ]
+
+
+class TestJoinVariantFiles:
+    """Test the external sort and merge join."""
+
+    def test_counts_match_set_arithmetic(self, tmp_path):
+        """Test join counts against Python sets with many small runs and blocks."""
+        rng = random.Random(3)
+        bases = 'ACGT'
+        universe = set()
+        while len(universe) < 3000:
+            ref = rng.choice(bases)
+            alt = rng.choice([b for b in bases if b != ref])
+            universe.add((rng.choice(['GRCh37', 'GRCh38']), str(rng.randint(1, 3)), rng.randint(1, 2000), ref, alt))
+        universe = sorted(universe)
+        left = rng.sample(universe, 1800)
+        right = rng.sample(universe, 1500)
+        write_clinvar(tmp_path / 'variant_summary.txt', left)
+        write_maf(tmp_path / 'mutations.maf', right * 2)
+
+        result = join_variant_files(
+            tmp_path / 'variant_summary.txt', tmp_path / 'mutations.maf', 'clinvar', 'maf',
+            chunksize=400, block_size=64, tmp_dir=tmp_path,
+        )
+
+        matched = len(set(left) & set(right))
+        assert result['matched_variants'] == matched
+        assert result['left_only_variants'] == len(left) - matched
+        assert result['right_only_variants'] == len(right) - matched
+        assert result['matched_right_records'] == 2 * matched
+        assert result['matched_pairs'] == 2 * matched
+        assert result['right']['rows'] == 3000
+        assert list(tmp_path.glob('variant-join-*')) == []
+
+    def test_homopolymer_indels_join(self, tmp_path):
+        """Test that anchored VCF and MAF spellings of homopolymer indels join on the same locus."""
+        write_clinvar(tmp_path / 'variant_summary.txt', [
+            ('GRCh38', '1', 100, 'AA', 'A'),
+            ('GRCh38', '1', 100, 'A', 'AA'),
+        ])
+        write_maf(tmp_path / 'mutations.maf', [
+            ('GRCh38', '1', 101, 'A', '-'),
+            ('GRCh38', '1', 100, '-', 'A'),
+        ])
+
+        result = join_variant_files(
+            tmp_path / 'variant_summary.txt', tmp_path / 'mutations.maf', 'clinvar', 'maf', tmp_dir=tmp_path,
+        )
+
+        assert result['matched_variants'] == 2
+        assert result['left_only_variants'] == result['right_only_variants'] == 0
+
+    def test_unknown_format(self, tmp_path):
+        """Test that an unknown preset is rejected."""
+        with pytest.raises(ValueError):
+            join_variant_files(tmp_path / 'a', tmp_path / 'b', 'clinvar', 'vcf')
@@ -0,0 +1,167 @@
+"""Tests for record-boundary splitting of large XML files."""
+
+import pytest
+from pathlib import Path
+
+from analysis.core.xml_split import (
+    open_xml_reader,
+    iter_record_spans,
+    find_record_offsets,
+    split_spans,
+    write_bgzf,
+    is_bgzf,
+    BgzfReader,
+    PlainXmlReader,
+    merge_record_stats,
+    analyze_record_batch,
+    analyze_xml_records,
+)
+
+
+def make_release(count):
+    """Build a small ClinVar-like release document."""
+    records = []
+    for i in range(count):
+        genes = ''.join(f'<Gene Symbol="G{j}"/>' for j in range(i % 3))
+        records.append(
+            f'<VariationArchive Accession="VCV{i:09d}" xsi:type="x">'
+            f'<ClassifiedRecord><GeneList>{genes}</GeneList></ClassifiedRecord>'
+            f'</VariationArchive>\n'
+        )
+    return (
+        '<?xml version="1.0"?>\n'
+        '<ClinVarVariationRelease xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+        + ''.join(records)
+        + '</ClinVarVariationRelease>\n'
+    )
+
+
+@pytest.fixture
+def release_xml(tmp_path):
+    path = tmp_path / "release.xml"
+    path.write_text(make_release(50))
+    return path
+
+
+@pytest.fixture
+def release_bgzf(release_xml, tmp_path):
+    path = tmp_path / "release.xml.gz"
+    write_bgzf(release_xml, path, block_size=256)
+    return path
+
+
+class TestRecordSpans:
+    """Test record boundary scanning."""
+
+    def test_spans_cover_records(self, release_xml):
+        """Test that each span is exactly one record."""
+        spans = find_record_offsets(release_xml)
+        data = release_xml.read_bytes()
+
+        assert len(spans) == 50
+        for start, end in spans:
+            record = data[start:end]
+            assert record.startswith(b'<VariationArchive ')
+            assert record.endswith(b'</VariationArchive>')
+
+    def test_small_chunks(self, release_xml):
+        """Test that tags split across scan chunks are still found."""
+        reader = open_xml_reader(release_xml)
+        assert list(iter_record_spans(reader, chunk_size=7)) == find_record_offsets(release_xml)
+
+    def test_ignores_prefix_tags(self, tmp_path):
+        """Test that tags sharing the record tag as a prefix are not boundaries."""
+        path = tmp_path / "prefix.xml"
+        path.write_text('<r><VariationArchiveInfo/><VariationArchive>a</VariationArchive></r>')
+        assert len(find_record_offsets(path)) == 1
+
+
+class TestBgzf:
+    """Test BGZF random access."""
+
+    def test_detects_bgzf(self, release_xml, release_bgzf):
+        """Test BGZF detection and reader selection."""
+        assert is_bgzf(release_bgzf)
+        assert not is_bgzf(release_xml)
+        assert isinstance(open_xml_reader(release_bgzf), BgzfReader)
+        assert isinstance(open_xml_reader(release_xml), PlainXmlReader)
+
+    def test_read_range_matches_plain(self, release_xml, release_bgzf):
+        """Test that uncompressed offsets read the same bytes."""
+        plain = open_xml_reader(release_xml)
+        bgzf = open_xml_reader(release_bgzf)
+
+        assert bgzf.size == plain.size
+        for start, end in [(0, 10), (250, 700), (1000, plain.size)]:
+            assert bgzf.read_range(start, end) == plain.read_range(start, end)
+
+    def test_spans_match_plain(self, release_xml, release_bgzf):
+        """Test that record offsets agree between plain and BGZF files."""
+        assert find_record_offsets(release_bgzf) == find_record_offsets(release_xml)
+
+    def test_rejects_plain_gzip(self, release_xml, tmp_path):
+        """Test that non-seekable gzip is rejected with a clear error."""
+        import gzip
+        path = tmp_path / "plain.xml.gz"
+        path.write_bytes(gzip.compress(release_xml.read_bytes()))
+        with pytest.raises(ValueError, match="bgzip"):
+            open_xml_reader(path)
+
+
+class TestSplitSpans:
+    """Test batching of record spans."""
+
+    def test_batches_are_contiguous(self):
+        """Test that batches keep record order and cover every record."""
+        spans = [(i * 10, i * 10 + 8) for i in range(100)]
+        batches = split_spans(spans, workers=4)
+
+        assert len(batches) >= 4
+        assert [span for batch in batches for span in batch] == spans
+
+    def test_empty(self):
+        """Test that no records give no batches."""
+        assert split_spans([], workers=4) == []
+
+
+class TestAnalyzeXmlRecords:
+    """Test parallel record analysis."""
+
+    def test_merge_is_order_independent(self, release_xml):
+        """Test that merged statistics do not depend on batch order."""
+        reader = open_xml_reader(release_xml)
+        spans = find_record_offsets(release_xml)
+        namespaces = b'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+        stats = [analyze_record_batch(reader, batch, namespaces) for batch in split_spans(spans, 5)]
+
+        assert merge_record_stats(stats) == merge_record_stats(list(reversed(stats)))
+
+    def test_parallel_matches_inline(self, release_xml):
+        """Test that worker processes produce the same profile as inline parsing."""
+        inline = analyze_xml_records(release_xml, workers=1)
+        parallel = analyze_xml_records(release_xml, workers=3)
+
+        assert inline == parallel
+        assert inline["record_count"] == 50
+        assert inline["record_error_count"] == 0
+        assert inline["root_tag"] == "ClinVarVariationRelease"
+        assert "ClinVarVariationRelease/VariationArchive/ClassifiedRecord/GeneList/Gene" in inline["paths"]
+
+    def test_bgzf_matches_plain(self, release_xml, release_bgzf):
+        """Test that BGZF input gives the same statistics as plain input."""
+        plain = analyze_xml_records(release_xml, workers=2)
+        bgzf = analyze_xml_records(release_bgzf, workers=2)
+
+        for key in ["record_count", "node_count", "max_depth", "paths", "tag_frequencies"]:
+            assert plain[key] == bgzf[key]
+
+    def test_path_trie_matches_whole_document(self, release_xml):
+        """Test that the merged record trie equals the trie of the parsed file."""
+        from analysis.core.semistructured import parse_xml
+        from analysis.core.path_trie import PathTrie
+
+        expected = PathTrie.from_xml(parse_xml(release_xml)).to_dict()
+        result = analyze_xml_records(release_xml, workers=3)
+        assert result["path_trie"] == expected
+        assert "path_record_counts" not in result
+        assert result["unique_paths"] == len(list(PathTrie.from_dict(expected).items()))
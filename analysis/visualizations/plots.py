@@ -1,34 +1,66 @@
-"""Visualization generation using matplotlib."""
-
+"""Visualization generation using matplotlib.
+
+Each standard plot is rendered from a small input (field names and null
+percentages, or label counts) taken from the profile's ``FieldTable``. The
+blake2b digest of that input is recorded in ``.plots.json`` next to the
+images, and ``plan_plots`` leaves out plots whose digest and image are
+unchanged, so re-profiling a file or re-running ``cli.py plots`` only renders
+what changed. ``render_plots`` renders the remaining plots on a process pool.
+
+Files with more than ``MAX_BAR_FIELDS`` fields get an aggregated null
+percentage view (a histogram and a heatmap of fields in column order) whose
+figure size does not grow with the field count.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import json
+import math
+import os
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    from ..core.field_profile import FieldTable
+except ImportError:  # Imported as a top-level package by cli.py
+    from core.field_profile import FieldTable
 
-def plot_null_percentages(analysis_data: Dict[str, Any], output_path: Path) -> None:
-    """
-    Generate bar chart of null percentages for all fields.
 
-    Args:
-        analysis_data: Analysis results with field_analyses
-        output_path: Path to save plot image
-    """
-    if 'field_analyses' not in analysis_data:
-        return
+PLOTS_VERSION = 1
+PLOT_STATE_FILENAME = '.plots.json'
+
+# One bar per field up to this many fields; wider files get the aggregated view
+MAX_BAR_FIELDS = 60
+# Heatmap cells per row in the aggregated view
+MAX_HEATMAP_WIDTH = 200
+
+
+def _save(output_path: Path) -> None:
+    plt.tight_layout()
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    plt.savefig(output_path, dpi=100, bbox_inches='tight')
+    plt.close()
+
+
+def _null_percentage_inputs(fields: FieldTable) -> Tuple[List[str], List[float]]:
+    return fields.names.tolist(), np.nan_to_num(fields.columns['null_percentage']).tolist()
 
-    fields = analysis_data['field_analyses']
-    if not fields:
+
+def _render_null_percentages(inputs: Tuple[List[str], List[float]], output_path: Path) -> None:
+    field_names, null_pcts = inputs
+    if len(field_names) > MAX_BAR_FIELDS:
+        _render_null_percentage_summary(null_pcts, output_path)
         return
 
-    # Extract data
-    field_names = [f.get('field_name', '')[:30] for f in fields]  # Truncate long names
-    null_pcts = [f.get('null_percentage', 0) for f in fields]
+    field_names = [name[:30] for name in field_names]  # Truncate long names
 
     # Create plot
-    fig, ax = plt.subplots(figsize=(12, max(6, len(fields) * 0.3)))
+    fig, ax = plt.subplots(figsize=(12, max(6, len(field_names) * 0.3)))
 
     y_pos = np.arange(len(field_names))
     ax.barh(y_pos, null_pcts, color='steelblue')
@@ -42,35 +74,35 @@ def plot_null_percentages(analysis_data: Dict[str, Any], output_path: Path) -> N
     # Add grid
     ax.grid(axis='x', alpha=0.3)
 
-    plt.tight_layout()
+    _save(output_path)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
 
+def _render_null_percentage_summary(null_pcts: List[float], output_path: Path) -> None:
+    """Histogram and heatmap of null percentages for files too wide for one bar per field."""
+    values = np.asarray(null_pcts, dtype=np.float64)
+    width = min(MAX_HEATMAP_WIDTH, math.ceil(math.sqrt(len(values))))
+    grid = np.full(math.ceil(len(values) / width) * width, np.nan)
+    grid[:len(values)] = values
+    grid = grid.reshape(-1, width)
 
-def plot_cardinality_distribution(analysis_data: Dict[str, Any],
-                                  output_path: Path) -> None:
-    """
-    Generate pie chart of cardinality distribution.
+    fig, (hist_ax, heat_ax) = plt.subplots(1, 2, figsize=(14, 6))
 
-    Args:
-        analysis_data: Analysis results with field_analyses
-        output_path: Path to save plot image
-    """
-    if 'field_analyses' not in analysis_data:
-        return
+    hist_ax.hist(values, bins=np.linspace(0, 100, 21), color='steelblue')
+    hist_ax.set_xlabel('Null Percentage (%)')
+    hist_ax.set_ylabel('Fields')
+    hist_ax.set_title(f'Null Percentages of {len(values):,} Fields')
+    hist_ax.grid(axis='y', alpha=0.3)
 
-    fields = analysis_data['field_analyses']
-    if not fields:
-        return
+    image = heat_ax.imshow(grid, aspect='auto', interpolation='nearest', cmap='viridis', vmin=0, vmax=100)
+    heat_ax.set_title(f'Null Percentage by Field ({width} fields per row, column order)')
+    heat_ax.set_xlabel('Field offset in row')
+    heat_ax.set_ylabel(f'Field index / {width}')
+    fig.colorbar(image, ax=heat_ax, label='Null Percentage (%)')
 
-    # Count cardinality types
-    cardinality_counts = {}
-    for field in fields:
-        card = field.get('cardinality', 'unknown')
-        cardinality_counts[card] = cardinality_counts.get(card, 0) + 1
+    _save(output_path)
 
+
+def _render_cardinality_distribution(cardinality_counts: Dict[str, int], output_path: Path) -> None:
     # Create plot
     fig, ax = plt.subplots(figsize=(8, 6))
 
@@ -82,35 +114,10 @@ def plot_cardinality_distribution(analysis_data: Dict[str, Any],
            startangle=90)
     ax.set_title('Field Cardinality Distribution')
 
-    plt.tight_layout()
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
-
-
-def plot_data_type_distribution(analysis_data: Dict[str, Any],
-                                output_path: Path) -> None:
-    """
-    Generate bar chart of data type distribution.
-
-    Args:
-        analysis_data: Analysis results with field_analyses
-        output_path: Path to save plot image
-    """
-    if 'field_analyses' not in analysis_data:
-        return
-
-    fields = analysis_data['field_analyses']
-    if not fields:
-        return
+    _save(output_path)
 
-    # Count data types
-    type_counts = {}
-    for field in fields:
-        dtype = field.get('data_type', 'unknown')
-        type_counts[dtype] = type_counts.get(dtype, 0) + 1
 
+def _render_data_type_distribution(type_counts: Dict[str, int], output_path: Path) -> None:
     # Create plot
     fig, ax = plt.subplots(figsize=(10, 6))
 
@@ -123,11 +130,75 @@ def plot_data_type_distribution(analysis_data: Dict[str, Any],
     ax.set_title('Field Data Type Distribution')
     ax.grid(axis='y', alpha=0.3)
 
-    plt.tight_layout()
+    _save(output_path)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+
+# Standard plot file name -> (input extractor, renderer)
+STANDARD_PLOTS = {
+    'null_percentages.png': (_null_percentage_inputs, _render_null_percentages),
+    'cardinality_distribution.png': (lambda fields: fields.label_counts('cardinality'),
+                                     _render_cardinality_distribution),
+    'data_type_distribution.png': (lambda fields: fields.label_counts('data_type'),
+                                   _render_data_type_distribution),
+}
+
+
+def _plot_fields(analysis_data: Dict[str, Any], fields: Optional[FieldTable]) -> Optional[FieldTable]:
+    if fields is None:
+        if 'field_analyses' not in analysis_data:
+            return None
+        fields = FieldTable.from_records(analysis_data['field_analyses'])
+    return fields if len(fields) else None
+
+
+def plot_null_percentages(analysis_data: Dict[str, Any], output_path: Path,
+                          fields: Optional[FieldTable] = None) -> None:
+    """
+    Generate bar chart of null percentages for all fields.
+
+    Files with more than ``MAX_BAR_FIELDS`` fields get a histogram and
+    heatmap of the null percentages instead.
+
+    Args:
+        analysis_data: Analysis results with field_analyses
+        output_path: Path to save plot image
+        fields: Field analyses as a table, if already built
+    """
+    fields = _plot_fields(analysis_data, fields)
+    if fields is not None:
+        _render_null_percentages(_null_percentage_inputs(fields), output_path)
+
+
+def plot_cardinality_distribution(analysis_data: Dict[str, Any],
+                                  output_path: Path,
+                                  fields: Optional[FieldTable] = None) -> None:
+    """
+    Generate pie chart of cardinality distribution.
+
+    Args:
+        analysis_data: Analysis results with field_analyses
+        output_path: Path to save plot image
+        fields: Field analyses as a table, if already built
+    """
+    fields = _plot_fields(analysis_data, fields)
+    if fields is not None:
+        _render_cardinality_distribution(fields.label_counts('cardinality'), output_path)
+
+
+def plot_data_type_distribution(analysis_data: Dict[str, Any],
+                                output_path: Path,
+                                fields: Optional[FieldTable] = None) -> None:
+    """
+    Generate bar chart of data type distribution.
+
+    Args:
+        analysis_data: Analysis results with field_analyses
+        output_path: Path to save plot image
+        fields: Field analyses as a table, if already built
+    """
+    fields = _plot_fields(analysis_data, fields)
+    if fields is not None:
+        _render_data_type_distribution(fields.label_counts('data_type'), output_path)
 
 
 def plot_numeric_histogram(field_data: Dict[str, Any], output_path: Path) -> None:
@@ -170,17 +241,92 @@ def plot_numeric_histogram(field_data: Dict[str, Any], output_path: Path) -> Non
     plt.close()
 
 
-def generate_all_plots(analysis_data: Dict[str, Any], output_dir: Path) -> None:
+def _read_plot_state(output_dir: Path) -> Dict[str, str]:
+    state_path = output_dir / PLOT_STATE_FILENAME
+    if not state_path.exists():
+        return {}
+    try:
+        state = json.loads(state_path.read_text())
+    except ValueError:
+        return {}
+    return state.get('digests', {}) if state.get('version') == PLOTS_VERSION else {}
+
+
+def plan_plots(analysis_data: Dict[str, Any], output_dir: Path, force: bool = False,
+               fields: Optional[FieldTable] = None) -> List[Tuple[str, Any, Path, str]]:
+    """
+    Standard plots of one analysis whose input changed since they were rendered.
+
+    Args:
+        analysis_data: Analysis results
+        output_dir: Directory the plots are saved to
+        force: Plan every plot, even if unchanged
+        fields: Field analyses as a table, if already built
+
+    Returns:
+        List of (plot file name, render input, output directory, input digest)
+    """
+    fields = _plot_fields(analysis_data, fields)
+    if fields is None:
+        return []
+
+    output_dir = Path(output_dir)
+    rendered = {} if force else _read_plot_state(output_dir)
+    plans = []
+    for name, (extract_inputs, _) in STANDARD_PLOTS.items():
+        inputs = extract_inputs(fields)
+        digest = blake2b(json.dumps([PLOTS_VERSION, name, inputs]).encode(), digest_size=16).hexdigest()
+        if rendered.get(name) == digest and (output_dir / name).exists():
+            continue
+        plans.append((name, inputs, output_dir, digest))
+    return plans
+
+
+def _render_plan(plan: Tuple[str, Any, Path, str]) -> None:
+    name, inputs, output_dir, _ = plan
+    STANDARD_PLOTS[name][1](inputs, output_dir / name)
+
+
+def render_plots(plans: List[Tuple[str, Any, Path, str]], workers: int = 1) -> int:
+    """
+    Render planned plots and record their input digests.
+
+    Args:
+        plans: Plots from ``plan_plots`` (of any number of analyses)
+        workers: Rendering processes (default: 1, render inline; None: CPU count)
+
+    Returns:
+        Number of plots rendered
     """
-    Generate all standard plots for an analysis.
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(plans) <= 1:
+        for plan in plans:
+            _render_plan(plan)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(plans))) as executor:
+            list(executor.map(_render_plan, plans))
+
+    digests = {}
+    for name, _, output_dir, digest in plans:
+        digests.setdefault(output_dir, {})[name] = digest
+    for output_dir, rendered in digests.items():
+        state = {**_read_plot_state(output_dir), **rendered}
+        (output_dir / PLOT_STATE_FILENAME).write_text(json.dumps({'version': PLOTS_VERSION, 'digests': state}))
+
+    return len(plans)
+
+
+def generate_all_plots(analysis_data: Dict[str, Any], output_dir: Path, force: bool = False) -> int:
+    """
+    Generate all standard plots for an analysis, skipping unchanged ones.
 
     Args:
         analysis_data: Analysis results
         output_dir: Directory to save plots
+        force: Render every plot, even if its input is unchanged
+
+    Returns:
+        Number of plots rendered
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate plots
-    plot_null_percentages(analysis_data, output_dir / 'null_percentages.png')
-    plot_cardinality_distribution(analysis_data, output_dir / 'cardinality_distribution.png')
-    plot_data_type_distribution(analysis_data, output_dir / 'data_type_distribution.png')
+    return render_plots(plan_plots(analysis_data, output_dir, force))